@@ -4,9 +4,65 @@ Supports Claude API with mock mode for testing.
 """
 
 import os
-from typing import Optional, Dict, Any
+import asyncio
+import time
+from typing import Optional, Dict, Any, Callable, Iterator, List, Union
 from anthropic import Anthropic, AsyncAnthropic
 from config.settings import settings
+from src.tools.llm.token_counter import get_token_counter, split_tokens
+
+
+class MockStreamer:
+    """Replays text as a token stream at a fixed rate."""
+    
+    def __init__(self, tokens_per_second: float = 200.0, tokens_per_chunk: int = 4):
+        """
+        Initialize streamer.
+        
+        Args:
+            tokens_per_second: Emission rate (0 = no delay)
+            tokens_per_chunk: Tokens per emitted text delta
+        """
+        self.tokens_per_second = tokens_per_second
+        self.tokens_per_chunk = max(1, tokens_per_chunk)
+    
+    def chunks(self, text: str) -> Iterator[str]:
+        """Split text into text deltas of tokens_per_chunk tokens."""
+        pieces = split_tokens(text)
+        for i in range(0, len(pieces), self.tokens_per_chunk):
+            yield "".join(pieces[i:i + self.tokens_per_chunk])
+    
+    @property
+    def chunk_delay(self) -> float:
+        """Seconds between deltas."""
+        return self.tokens_per_chunk / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+    
+    def stream(self, text: str, on_text: Optional[Callable[[str], Any]] = None) -> str:
+        """
+        Emit text delta by delta (blocking).
+        
+        Args:
+            text: Full text to replay
+            on_text: Called with each delta
+            
+        Returns:
+            The full text
+        """
+        for delta in self.chunks(text):
+            if self.chunk_delay:
+                time.sleep(self.chunk_delay)
+            if on_text:
+                on_text(delta)
+        return text
+    
+    async def astream(self, text: str, on_text: Optional[Callable[[str], Any]] = None) -> str:
+        """Emit text delta by delta (async)."""
+        for delta in self.chunks(text):
+            if self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+            if on_text:
+                on_text(delta)
+        return text
 
 
 class LLMConfig:
@@ -20,6 +76,19 @@ class LLMConfig:
         self.max_tokens = settings.llm_max_tokens
         self.is_mock = settings.is_mock_mode
         
+        # Local token estimates, calibrated on real usage
+        self.token_counter = get_token_counter()
+        
+        # Token stream replay for mock mode
+        self.mock_streamer = MockStreamer(settings.mock_stream_tokens_per_second)
+        
+        # Batch mode: calls are collected into Message Batches (created lazily)
+        self.batch_mode = settings.llm_batch_mode
+        self._batch_collector = None
+        
+        # Model router for calls that carry a routing decision (created lazily)
+        self._model_router = None
+        
         # Initialize clients (lazy loading)
         self._client: Optional[Anthropic] = None
         self._async_client: Optional[AsyncAnthropic] = None
@@ -46,6 +115,39 @@ class LLMConfig:
                 self._async_client = AsyncAnthropic(api_key=self.api_key)
         return self._async_client
     
+    @property
+    def batch_collector(self) -> Any:
+        """Get the batch collector (batch mode only)."""
+        if self._batch_collector is None and self.batch_mode:
+            from src.tools.llm.batch import create_batch_collector
+            self._batch_collector = create_batch_collector()
+        return self._batch_collector
+    
+    @property
+    def model_router(self) -> Any:
+        """Get the model router used for routed calls."""
+        if self._model_router is None:
+            from src.tools.llm.model_router import get_model_router
+            self._model_router = get_model_router()
+        return self._model_router
+    
+    def enable_batch_mode(self, collector: Any = None) -> None:
+        """
+        Route create_message() through Message Batches.
+        
+        Args:
+            collector: BatchCollector (default: one created from settings)
+        """
+        self.batch_mode = True
+        self._batch_collector = collector
+    
+    def disable_batch_mode(self) -> None:
+        """Close the batch collector and go back to per-call requests."""
+        if self._batch_collector is not None:
+            self._batch_collector.close()
+        self.batch_mode = False
+        self._batch_collector = None
+    
     def get_default_params(self) -> Dict[str, Any]:
         """Get default LLM parameters."""
         return {
@@ -57,7 +159,8 @@ class LLMConfig:
     def create_message(
         self,
         messages: list,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        choice: Any = None,
         **kwargs
     ) -> Any:
         """
@@ -65,12 +168,21 @@ class LLMConfig:
         
         Args:
             messages: List of message dicts
-            system: System prompt
+            system: System prompt (string, or content blocks with cache_control)
+            choice: ModelChoice from the model router; the call goes to its
+                model and is retried on its fallback if that is overloaded
             **kwargs: Additional parameters
             
         Returns:
             API response
         """
+        if choice is not None:
+            return self.model_router.call(self.create_message, choice, messages=messages, system=system, **kwargs)
+        
+        if self.batch_mode:
+            # Blocks until the batch holding this call ends
+            return self.batch_collector.create_message(messages, system, **kwargs)
+        
         if self.is_mock:
             return self._mock_response(messages, system)
         
@@ -80,15 +192,17 @@ class LLMConfig:
         if system:
             params["system"] = system
         
-        return self.client.messages.create(
+        response = self.client.messages.create(
             messages=messages,
             **params
         )
+        self._observe_usage(messages, system, response)
+        return response
     
     async def acreate_message(
         self,
         messages: list,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
         **kwargs
     ) -> Any:
         """
@@ -96,12 +210,16 @@ class LLMConfig:
         
         Args:
             messages: List of message dicts
-            system: System prompt
+            system: System prompt (string, or content blocks with cache_control)
             **kwargs: Additional parameters
             
         Returns:
             API response
         """
+        if self.batch_mode:
+            # Wait for the batch off the event loop
+            return await asyncio.to_thread(self.batch_collector.create_message, messages, system, **kwargs)
+        
         if self.is_mock:
             return self._mock_response(messages, system)
         
@@ -111,18 +229,115 @@ class LLMConfig:
         if system:
             params["system"] = system
         
-        return await self.async_client.messages.create(
+        response = await self.async_client.messages.create(
             messages=messages,
             **params
         )
+        self._observe_usage(messages, system, response)
+        return response
+    
+    def stream_message(
+        self,
+        messages: list,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        on_text: Optional[Callable[[str], Any]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Create a message, streaming text deltas as they arrive (sync).
+        
+        Args:
+            messages: List of message dicts
+            system: System prompt (string, or content blocks with cache_control)
+            on_text: Called with each text delta
+            **kwargs: Additional parameters
+            
+        Returns:
+            Final message, same shape as create_message()
+        """
+        if self.is_mock:
+            response = self._mock_response(messages, system)
+            self.mock_streamer.stream(response.content[0].text, on_text)
+            return response
+        
+        params = self.get_default_params()
+        params.update(kwargs)
+        
+        if system:
+            params["system"] = system
+        
+        with self.client.messages.stream(messages=messages, **params) as stream:
+            for text in stream.text_stream:
+                if on_text:
+                    on_text(text)
+            response = stream.get_final_message()
+        self._observe_usage(messages, system, response)
+        return response
+    
+    async def astream_message(
+        self,
+        messages: list,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        on_text: Optional[Callable[[str], Any]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Create a message, streaming text deltas as they arrive (async).
+        
+        Args:
+            messages: List of message dicts
+            system: System prompt (string, or content blocks with cache_control)
+            on_text: Called with each text delta
+            **kwargs: Additional parameters
+            
+        Returns:
+            Final message, same shape as acreate_message()
+        """
+        if self.is_mock:
+            response = self._mock_response(messages, system)
+            await self.mock_streamer.astream(response.content[0].text, on_text)
+            return response
+        
+        params = self.get_default_params()
+        params.update(kwargs)
+        
+        if system:
+            params["system"] = system
+        
+        async with self.async_client.messages.stream(messages=messages, **params) as stream:
+            async for text in stream.text_stream:
+                if on_text:
+                    on_text(text)
+            response = await stream.get_final_message()
+        self._observe_usage(messages, system, response)
+        return response
+    
+    def estimate_input_tokens(self, messages: list, system: Any = None) -> int:
+        """Estimate input tokens of a request without calling the API."""
+        return self.token_counter.count_messages(messages, system, self.model)
+    
+    def _observe_usage(self, messages: list, system: Any, response: Any) -> None:
+        """Calibrate the token counter against the usage the API reported."""
+        usage = getattr(response, "usage", None)
+        input_tokens = getattr(usage, "input_tokens", None)
+        if isinstance(input_tokens, int):
+            # With prompt caching, input_tokens counts only the uncached part
+            input_tokens += (getattr(usage, "cache_read_input_tokens", None) or 0) + (
+                getattr(usage, "cache_creation_input_tokens", None) or 0
+            )
+            self.token_counter.calibrate(
+                messages, system, input_tokens, getattr(response, "model", None) or self.model
+            )
     
-    def _mock_response(self, messages: list, system: Optional[str] = None) -> Any:
+    def _mock_response(self, messages: list, system: Any = None) -> Any:
         """Generate mock response for testing."""
         from types import SimpleNamespace
         
         # Extract last user message
         user_msg = next((m for m in reversed(messages) if m["role"] == "user"), {})
         content = user_msg.get("content", "")
+        if isinstance(content, list):
+            content = " ".join(b.get("text", "") for b in content if isinstance(b, dict))
         
         # Generate simple mock response
         mock_text = f"Mock response for: {content[:100]}..."
@@ -135,7 +350,10 @@ class LLMConfig:
             content=[SimpleNamespace(type="text", text=mock_text)],
             model=self.model,
             stop_reason="end_turn",
-            usage=SimpleNamespace(input_tokens=100, output_tokens=50)
+            usage=SimpleNamespace(
+                input_tokens=self.estimate_input_tokens(messages, system),
+                output_tokens=self.token_counter.count(mock_text, self.model),
+            )
         )
 
 
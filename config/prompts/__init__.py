@@ -0,0 +1,15 @@
+"""
+Prompt templates and registry.
+"""
+
+from .registry import (
+    PromptTemplate,
+    PromptRegistry,
+    get_prompt_registry,
+)
+
+__all__ = [
+    "PromptTemplate",
+    "PromptRegistry",
+    "get_prompt_registry",
+]
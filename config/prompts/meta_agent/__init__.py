@@ -0,0 +1,16 @@
+"""Meta-agent prompts."""
+
+SYSTEM = """\
+You are the planning agent of a multi-agent content pipeline. You turn a
+content brief into an execution plan over the available workers, weighing
+quality against the brief's budget and deadline. Respond in JSON."""
+
+TASKS = {
+    "planner": """\
+Analyze this brief and recommend workers and research depth.
+Topic: {topic}
+Content type: {content_type}
+Target length: {target_length} words
+Key points: {key_points}
+Budget: {max_budget}. Deadline: {max_time_seconds} seconds.""",
+}
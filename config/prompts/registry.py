@@ -0,0 +1,256 @@
+"""
+Prompt Registry - Precompiled prompt templates with prompt caching.
+
+Templates live in the config/prompts packages. Each package defines a
+SYSTEM prompt shared by its workers and TASKS, per-worker user message
+templates. All templates are parsed once at startup into literal/field
+parts, so rendering is a single join.
+
+Requests are laid out stable-first for Anthropic prompt caching:
+
+1. Phase system prompt (identical for every worker in the phase)
+2. Shared research context (identical for workers given the same context)
+3. Worker task (the only per-call text)
+
+Blocks 1 and 2 get `cache_control` breakpoints once the prefix is long
+enough to be cached, so workers sharing research pay the cache-read
+price for it instead of full input price.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import importlib
+import string
+import threading
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import get_settings
+from src.tools.llm.token_counter import TokenCounter, get_token_counter
+
+
+# Packages scanned for SYSTEM / TASKS
+PROMPT_PACKAGES = [
+    "config.prompts.meta_agent",
+    "config.prompts.workers.research",
+    "config.prompts.workers.analysis",
+    "config.prompts.workers.writing",
+    "config.prompts.workers.quality",
+]
+
+# Shortest prefix (tokens) Anthropic will cache, by model family
+MIN_CACHEABLE_TOKENS = {
+    "claude-3-5-haiku": 2048,
+    "claude-3-haiku": 2048,
+}
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def min_cacheable_tokens(model: str) -> int:
+    """Shortest cacheable prompt prefix for a model."""
+    for prefix, tokens in MIN_CACHEABLE_TOKENS.items():
+        if model.startswith(prefix):
+            return tokens
+    return DEFAULT_MIN_CACHEABLE_TOKENS
+
+
+class PromptTemplate:
+    """
+    Template compiled to alternating literal and field parts.
+    """
+
+    _formatter = string.Formatter()
+
+    def __init__(self, name: str, source: str):
+        """
+        Compile a template.
+
+        Args:
+            name: Template name
+            source: Template text with {field} placeholders ({{ }} escapes)
+
+        Raises:
+            ValueError: If a placeholder uses a format spec or conversion
+        """
+        self.name = name
+        self.source = source
+        self._parts: List[Tuple[str, Optional[str]]] = []
+        for literal, field, spec, conversion in self._formatter.parse(source):
+            if spec or conversion:
+                raise ValueError(f"Template '{name}': format specs are not supported ({{{field}}})")
+            self._parts.append((literal, field or None))
+        self.fields = frozenset(f for _, f in self._parts if f)
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """
+        Render with variables (extra variables are ignored).
+
+        Args:
+            variables: Placeholder values
+
+        Returns:
+            Rendered text
+
+        Raises:
+            ValueError: If a placeholder has no value
+        """
+        missing = self.fields.difference(variables)
+        if missing:
+            raise ValueError(f"Template '{self.name}' missing variables: {sorted(missing)}")
+        return "".join(
+            literal + (_to_text(variables[field]) if field else "")
+            for literal, field in self._parts
+        )
+
+
+class PromptRegistry:
+    """
+    Registry of compiled prompts, keyed by worker or agent name.
+    """
+
+    def __init__(
+        self,
+        packages: Optional[List[str]] = None,
+        caching_enabled: bool = True,
+        model: Optional[str] = None,
+        token_counter: Optional[TokenCounter] = None,
+    ):
+        """
+        Load and compile all prompts.
+
+        Args:
+            packages: Prompt packages to load (default: PROMPT_PACKAGES)
+            caching_enabled: Add cache_control breakpoints to stable prefixes
+            model: Target model (default: settings.llm_model)
+            token_counter: Counter for prefix sizes (default: global counter)
+
+        Raises:
+            ValueError: If two packages define the same task name
+        """
+        self.caching_enabled = caching_enabled
+        self.model = model or get_settings().llm_model
+        self.min_cache_tokens = min_cacheable_tokens(self.model)
+        self.token_counter = token_counter or get_token_counter()
+
+        self._tasks: Dict[str, PromptTemplate] = {}
+        self._systems: Dict[str, str] = {}
+        for package in packages or PROMPT_PACKAGES:
+            module = importlib.import_module(package)
+            system = getattr(module, "SYSTEM", "")
+            for name, source in getattr(module, "TASKS", {}).items():
+                if name in self._tasks:
+                    raise ValueError(f"Duplicate prompt '{name}' in {package}")
+                self._tasks[name] = PromptTemplate(name, source)
+                self._systems[name] = system
+
+        self._lock = threading.Lock()
+        self.stats = {"renders": 0, "cached_prefixes": 0, "cacheable_tokens": 0}
+
+    def has(self, name: str) -> bool:
+        """Check if a prompt exists."""
+        return name in self._tasks
+
+    def get(self, name: str) -> PromptTemplate:
+        """
+        Get a compiled task template.
+
+        Raises:
+            KeyError: If the prompt doesn't exist
+        """
+        return self._tasks[name]
+
+    def list_prompts(self) -> List[str]:
+        """Names of all prompts."""
+        return list(self._tasks)
+
+    def build_request(
+        self,
+        name: str,
+        variables: Dict[str, Any],
+        shared_context: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build create_message() arguments for a prompt.
+
+        Args:
+            name: Prompt name (worker ID or agent name)
+            variables: Task placeholder values
+            shared_context: Research context shared across workers
+
+        Returns:
+            Dict with "system" (content blocks), "messages" and
+            "cacheable_tokens" (prefix tokens marked for caching); pop
+            the latter before passing the rest to create_message()
+
+        Raises:
+            KeyError: If the prompt doesn't exist
+            ValueError: If a placeholder has no value
+        """
+        task = self._tasks[name].render(variables)
+
+        system: List[Dict[str, Any]] = []
+        for text in (self._systems[name], shared_context and f"Research context:\n\n{shared_context}"):
+            if text:
+                system.append({"type": "text", "text": text})
+
+        # A breakpoint caches everything before it, so mark every stable
+        # block whose prefix is long enough; the last mark covers the most.
+        prefix_tokens = 0
+        cacheable_tokens = 0
+        if self.caching_enabled:
+            for block in system:
+                prefix_tokens += self.token_counter.count(block["text"], self.model)
+                if prefix_tokens >= self.min_cache_tokens:
+                    block["cache_control"] = CACHE_CONTROL
+                    cacheable_tokens = prefix_tokens
+
+        with self._lock:
+            self.stats["renders"] += 1
+            if cacheable_tokens:
+                self.stats["cached_prefixes"] += 1
+                self.stats["cacheable_tokens"] += cacheable_tokens
+
+        return {
+            "system": system,
+            "messages": [{"role": "user", "content": task}],
+            "cacheable_tokens": cacheable_tokens,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dict with prompt count and render/caching counters
+        """
+        return {"prompts": len(self._tasks), **self.stats}
+
+
+def _to_text(value: Any) -> str:
+    """Placeholder value as prompt text (lists become comma-separated)."""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value) or "none"
+    if value is None:
+        return "none"
+    if isinstance(value, Enum):
+        return str(value.value).replace("_", " ")
+    return str(value)
+
+
+def create_prompt_registry() -> PromptRegistry:
+    """Create the prompt registry from settings."""
+    return PromptRegistry(caching_enabled=get_settings().prompt_caching_enabled)
+
+
+# Global instance
+prompt_registry = create_prompt_registry()
+
+
+# Helper functions
+def get_prompt_registry() -> PromptRegistry:
+    """Get the prompt registry instance."""
+    return prompt_registry
@@ -0,0 +1,18 @@
+"""
+Worker prompts.
+
+Each phase package defines SYSTEM (shared by every worker in the phase,
+so it forms a cacheable prefix) and TASKS (per-worker user message
+templates with {placeholders}).
+"""
+
+# Appended to writing and quality system prompts
+STYLE_GUIDE = """\
+Style guide:
+- Match the requested tone and audience; default to clear, professional prose.
+- Lead with the most important point; keep paragraphs to 2-4 sentences.
+- Prefer concrete figures, dates and named sources over generalities.
+- Attribute every non-obvious claim to a source from the research context.
+- Never invent sources, quotes, statistics or URLs.
+- Use Markdown headings (##) for sections and plain lists for enumerations.
+- Avoid filler phrases, hedging stacks and repeated conclusions."""
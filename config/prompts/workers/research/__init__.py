@@ -0,0 +1,31 @@
+"""Research worker prompts."""
+
+SYSTEM = """\
+You are a research worker in a multi-agent content pipeline. Your job is
+to find accurate, current and relevant sources for a content brief.
+
+Return sources as a JSON list of objects with title, url, snippet and
+relevance_score (0-1). Prefer primary sources, reputable publications
+and recent material. Do not summarize beyond the snippet; downstream
+workers synthesize."""
+
+TASKS = {
+    "web_search_worker": """\
+Search the web for: {topic}
+Key points to cover: {key_points}
+Return up to {max_results} results.""",
+    "academic_search_worker": """\
+Find peer-reviewed papers and preprints on: {topic}
+Key points to cover: {key_points}
+Return up to {max_results} results with authors and year in the title.""",
+    "news_search_worker": """\
+Find recent news coverage of: {topic}
+Key points to cover: {key_points}
+Return up to {max_results} results, newest first.""",
+    "web_scraping_worker": """\
+Extract the main content of these pages relevant to {topic}:
+{sources_to_include}""",
+    "social_media_worker": """\
+Find notable social media discussion and sentiment about: {topic}
+Return up to {max_results} representative posts.""",
+}
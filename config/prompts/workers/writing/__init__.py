@@ -0,0 +1,27 @@
+"""Writing worker prompts."""
+
+from config.prompts.workers import STYLE_GUIDE
+
+SYSTEM = """\
+You are a writing worker in a multi-agent content pipeline. You write
+from the research and analysis in the shared research context only.
+
+""" + STYLE_GUIDE
+
+TASKS = {
+    "article_writer_worker": """\
+Write the full piece on "{topic}". Format: {content_type}.
+Tone: {tone}. Audience: {target_audience}. Length: about {target_length} words.
+Key points to cover: {key_points}
+Keywords: {keywords}""",
+    "section_writer_worker": """\
+Write the "{section_title}" section of the {content_type} on "{topic}".
+Tone: {tone}. Length: about {section_length} words.""",
+    "introduction_writer_worker": """\
+Write the introduction of the {content_type} on "{topic}" so that it hooks {target_audience}.
+Tone: {tone}. Length: about {section_length} words.""",
+    "conclusion_writer_worker": """\
+Write the conclusion of the {content_type} on "{topic}", summarizing the key points:
+{key_points}
+Tone: {tone}. Length: about {section_length} words.""",
+}
@@ -1,9 +1,16 @@
 """
 Worker Registry - Defines all available workers for the system.
 Each worker is a specialized agent that performs specific tasks.
+
+Lookups by category, capability, tool and parallelism are served from
+immutable indexes rebuilt whenever workers are registered, and
+cost/time/value estimates are memoized until the registry or the
+learned metrics change.
 """
 
-from typing import List, Dict, Any, Optional
+import math
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from enum import Enum
 from pydantic import BaseModel, Field
 
@@ -51,10 +58,32 @@ class WorkerDefinition(BaseModel):
     can_run_parallel: bool = Field(default=False, description="Can run in parallel with others")
     estimated_cost: float = Field(default=0.01, ge=0.0, description="Estimated cost in USD")
     estimated_time_seconds: int = Field(default=30, ge=1, description="Estimated time in seconds")
+    quality_contribution: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Relative value of this worker's output to final quality"
+    )
+    alternatives: List[str] = Field(
+        default_factory=list,
+        description="Cheaper workers that can stand in for this one under a tight budget"
+    )
+    split_into: List[str] = Field(
+        default_factory=list,
+        description="Workers that can produce this worker's output as parallel parts"
+    )
     
     # Configuration
     default_temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     default_max_tokens: int = Field(default=2000, ge=1)
+    max_input_tokens: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Input token budget for packed research context (None = no packing)"
+    )
+    model_tier: Optional[str] = Field(
+        default=None,
+        description="Model routing hint: fast, balanced, strong (None = by output size)"
+    )
     
     # Tools needed
     tools_required: List[str] = Field(default_factory=list, description="Tools this worker needs")
@@ -80,6 +109,7 @@ RESEARCH_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.02,
         estimated_time_seconds=15,
+        quality_contribution=1.0,
         default_temperature=0.3,
         default_max_tokens=500,
         tools_required=["tavily_search", "serper_search"]
@@ -97,6 +127,7 @@ RESEARCH_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.01,
         estimated_time_seconds=20,
+        quality_contribution=0.8,
         default_temperature=0.3,
         default_max_tokens=500,
         tools_required=["arxiv_search", "pubmed_search"]
@@ -114,6 +145,7 @@ RESEARCH_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.01,
         estimated_time_seconds=15,
+        quality_contribution=0.6,
         default_temperature=0.3,
         default_max_tokens=500,
         tools_required=["news_api"]
@@ -131,6 +163,7 @@ RESEARCH_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.03,
         estimated_time_seconds=25,
+        quality_contribution=0.5,
         default_temperature=0.3,
         default_max_tokens=1000,
         tools_required=["firecrawl", "beautifulsoup"]
@@ -148,6 +181,7 @@ RESEARCH_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.02,
         estimated_time_seconds=20,
+        quality_contribution=0.3,
         default_temperature=0.5,
         default_max_tokens=500,
         tools_required=["twitter_api", "reddit_api"]
@@ -172,8 +206,12 @@ ANALYSIS_WORKERS = [
         can_run_parallel=False,
         estimated_cost=0.05,
         estimated_time_seconds=45,
+        quality_contribution=1.0,
+        alternatives=["summarization_worker"],
         default_temperature=0.7,
         default_max_tokens=3000,
+        max_input_tokens=12000,
+        model_tier="strong",
         tools_required=["llm"]
     ),
     
@@ -189,8 +227,11 @@ ANALYSIS_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.03,
         estimated_time_seconds=30,
+        quality_contribution=0.7,
         default_temperature=0.5,
         default_max_tokens=1000,
+        max_input_tokens=8000,
+        model_tier="fast",
         tools_required=["llm"]
     ),
     
@@ -206,8 +247,11 @@ ANALYSIS_WORKERS = [
         can_run_parallel=False,
         estimated_cost=0.04,
         estimated_time_seconds=40,
+        quality_contribution=0.6,
+        alternatives=["summarization_worker"],
         default_temperature=0.6,
         default_max_tokens=2000,
+        max_input_tokens=8000,
         tools_required=["llm"]
     ),
     
@@ -223,8 +267,11 @@ ANALYSIS_WORKERS = [
         can_run_parallel=False,
         estimated_cost=0.04,
         estimated_time_seconds=40,
+        quality_contribution=0.6,
+        alternatives=["summarization_worker"],
         default_temperature=0.6,
         default_max_tokens=2500,
+        max_input_tokens=8000,
         tools_required=["llm"]
     ),
 ]
@@ -247,8 +294,13 @@ WRITING_WORKERS = [
         can_run_parallel=False,
         estimated_cost=0.08,
         estimated_time_seconds=60,
+        quality_contribution=2.0,
+        alternatives=["section_writer_worker"],
+        split_into=["introduction_writer_worker", "section_writer_worker", "conclusion_writer_worker"],
         default_temperature=0.7,
         default_max_tokens=4000,
+        max_input_tokens=12000,
+        model_tier="strong",
         tools_required=["llm"]
     ),
     
@@ -264,8 +316,10 @@ WRITING_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.04,
         estimated_time_seconds=40,
+        quality_contribution=1.2,
         default_temperature=0.7,
         default_max_tokens=2000,
+        max_input_tokens=6000,
         tools_required=["llm"]
     ),
     
@@ -281,8 +335,10 @@ WRITING_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.02,
         estimated_time_seconds=25,
+        quality_contribution=0.5,
         default_temperature=0.8,
         default_max_tokens=800,
+        max_input_tokens=3000,
         tools_required=["llm"]
     ),
     
@@ -298,8 +354,10 @@ WRITING_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.02,
         estimated_time_seconds=25,
+        quality_contribution=0.5,
         default_temperature=0.7,
         default_max_tokens=800,
+        max_input_tokens=3000,
         tools_required=["llm"]
     ),
 ]
@@ -322,6 +380,7 @@ QUALITY_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.05,
         estimated_time_seconds=50,
+        quality_contribution=0.8,
         default_temperature=0.3,
         default_max_tokens=2000,
         tools_required=["llm", "web_search"]
@@ -339,6 +398,7 @@ QUALITY_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.04,
         estimated_time_seconds=40,
+        quality_contribution=1.0,
         default_temperature=0.5,
         default_max_tokens=3000,
         tools_required=["llm"]
@@ -356,6 +416,7 @@ QUALITY_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.03,
         estimated_time_seconds=35,
+        quality_contribution=0.4,
         default_temperature=0.5,
         default_max_tokens=1500,
         tools_required=["llm"]
@@ -373,6 +434,7 @@ QUALITY_WORKERS = [
         can_run_parallel=True,
         estimated_cost=0.02,
         estimated_time_seconds=30,
+        quality_contribution=0.5,
         default_temperature=0.3,
         default_max_tokens=1500,
         tools_required=["llm"]
@@ -387,11 +449,43 @@ QUALITY_WORKERS = [
 class WorkerRegistry:
     """Central registry for all workers."""
     
-    def __init__(self):
-        """Initialize worker registry."""
+    def __init__(self, metrics_store: Optional[Any] = None):
+        """
+        Initialize worker registry.
+        
+        Args:
+            metrics_store: Learned worker metrics (default: global store
+                when learned_estimates_enabled)
+        """
         self.workers: Dict[str, WorkerDefinition] = {}
+        self._metrics_store = metrics_store
+        self._lock = threading.Lock()
+        # Bumped on every registration change
+        self.version = 0
+        
+        # Immutable indexes, replaced wholesale on registration
+        self._by_category: Dict[str, Tuple[WorkerDefinition, ...]] = {}
+        self._by_capability: Dict[str, Tuple[WorkerDefinition, ...]] = {}
+        self._by_tool: Dict[str, Tuple[WorkerDefinition, ...]] = {}
+        self._parallel: Tuple[WorkerDefinition, ...] = ()
+        self._parallel_ids: FrozenSet[str] = frozenset()
+        
+        # Memoized estimates and the (registry, store) versions they hold for
+        self._estimates: Dict[Tuple, float] = {}
+        self._estimates_version: Tuple = ()
+        
         self._register_all_workers()
     
+    @property
+    def metrics_store(self) -> Optional[Any]:
+        """Learned worker metrics, or None when static estimates are used."""
+        if self._metrics_store is None:
+            from config.settings import get_settings
+            if get_settings().learned_estimates_enabled:
+                from src.meta_agent.metrics_store import get_metrics_store
+                self._metrics_store = get_metrics_store()
+        return self._metrics_store
+    
     def _register_all_workers(self) -> None:
         """Register all workers."""
         all_workers = (
@@ -401,8 +495,88 @@ class WorkerRegistry:
             QUALITY_WORKERS
         )
         
-        for worker in all_workers:
-            self.workers[worker.id] = worker
+        self.register_all(all_workers)
+    
+    # =========================================================================
+    # REGISTRATION
+    # =========================================================================
+    
+    def register(self, worker: WorkerDefinition, replace: bool = False) -> None:
+        """
+        Register a worker (e.g. from a plugin).
+        
+        Args:
+            worker: Worker definition
+            replace: Replace an existing worker with the same ID
+            
+        Raises:
+            ValueError: If the ID is taken and replace is False
+        """
+        self.register_all([worker], replace=replace)
+    
+    def register_all(self, workers: Iterable[WorkerDefinition], replace: bool = False) -> None:
+        """
+        Register several workers at once (indexes are rebuilt once).
+        
+        Args:
+            workers: Worker definitions
+            replace: Replace existing workers with the same IDs
+            
+        Raises:
+            ValueError: If an ID is taken and replace is False
+        """
+        workers = list(workers)
+        with self._lock:
+            if not replace:
+                taken = [w.id for w in workers if w.id in self.workers]
+                if taken:
+                    raise ValueError(f"Workers already registered: {', '.join(taken)}")
+            updated = dict(self.workers)
+            for worker in workers:
+                updated[worker.id] = worker
+            self._publish(updated)
+    
+    def unregister(self, worker_id: str) -> bool:
+        """
+        Remove a worker.
+        
+        Args:
+            worker_id: Worker ID
+            
+        Returns:
+            True if the worker was registered
+        """
+        with self._lock:
+            if worker_id not in self.workers:
+                return False
+            updated = dict(self.workers)
+            del updated[worker_id]
+            self._publish(updated)
+            return True
+    
+    def _publish(self, workers: Dict[str, WorkerDefinition]) -> None:
+        """Rebuild the indexes for a new worker set and swap everything in."""
+        by_category: Dict[str, List[WorkerDefinition]] = {}
+        by_capability: Dict[str, List[WorkerDefinition]] = {}
+        by_tool: Dict[str, List[WorkerDefinition]] = {}
+        for worker in workers.values():
+            by_category.setdefault(worker.category, []).append(worker)
+            for capability in dict.fromkeys(worker.capabilities):
+                by_capability.setdefault(capability, []).append(worker)
+            for tool in dict.fromkeys(worker.tools_required):
+                by_tool.setdefault(tool, []).append(worker)
+        
+        self._by_category = {key: tuple(value) for key, value in by_category.items()}
+        self._by_capability = {key: tuple(value) for key, value in by_capability.items()}
+        self._by_tool = {key: tuple(value) for key, value in by_tool.items()}
+        self._parallel = tuple(w for w in workers.values() if w.can_run_parallel)
+        self._parallel_ids = frozenset(w.id for w in self._parallel)
+        self.workers = workers
+        self.version += 1
+    
+    # =========================================================================
+    # LOOKUPS
+    # =========================================================================
     
     def get_worker(self, worker_id: str) -> Optional[WorkerDefinition]:
         """Get worker by ID."""
@@ -410,15 +584,23 @@ class WorkerRegistry:
     
     def get_workers_by_category(self, category: WorkerCategory) -> List[WorkerDefinition]:
         """Get all workers in a category."""
-        return [w for w in self.workers.values() if w.category == category]
+        return list(self._by_category.get(category, ()))
     
     def get_workers_by_capability(self, capability: WorkerCapability) -> List[WorkerDefinition]:
         """Get all workers with a specific capability."""
-        return [w for w in self.workers.values() if capability in w.capabilities]
+        return list(self._by_capability.get(capability, ()))
+    
+    def get_workers_by_tool(self, tool: str) -> List[WorkerDefinition]:
+        """Get all workers that need a specific tool."""
+        return list(self._by_tool.get(tool, ()))
     
     def get_parallel_workers(self) -> List[WorkerDefinition]:
         """Get all workers that can run in parallel."""
-        return [w for w in self.workers.values() if w.can_run_parallel]
+        return list(self._parallel)
+    
+    def is_parallel(self, worker_id: str) -> bool:
+        """Check whether a worker can run in parallel with others."""
+        return worker_id in self._parallel_ids
     
     def list_all_workers(self) -> List[WorkerDefinition]:
         """List all registered workers."""
@@ -432,49 +614,139 @@ class WorkerRegistry:
         """Get all worker IDs."""
         return list(self.workers.keys())
     
-    def estimate_total_cost(self, worker_ids: List[str]) -> float:
-        """Estimate total cost for a list of workers."""
+    def estimate_worker_cost(self, worker_id: str, percentile: Optional[float] = None) -> float:
+        """
+        Estimate the cost of one worker call.
+        
+        Args:
+            worker_id: Worker ID
+            percentile: Percentile of observed costs (None = recent average)
+            
+        Returns:
+            Learned cost once the worker has enough executions, else its
+            static estimate
+        """
+        def compute() -> float:
+            store = self.metrics_store
+            learned = store.cost(worker_id, percentile) if store is not None else None
+            return learned if learned is not None else self.workers[worker_id].estimated_cost
+        
+        return self._memoized(("cost", worker_id, percentile), compute)
+    
+    def estimate_worker_time(self, worker_id: str, percentile: Optional[float] = None) -> float:
+        """
+        Estimate the latency of one worker call.
+        
+        Args:
+            worker_id: Worker ID
+            percentile: Percentile of observed latencies (None = recent average)
+            
+        Returns:
+            Learned latency in seconds once the worker has enough
+            executions, else its static estimate
+        """
+        def compute() -> float:
+            store = self.metrics_store
+            learned = store.latency(worker_id, percentile) if store is not None else None
+            return learned if learned is not None else float(self.workers[worker_id].estimated_time_seconds)
+        
+        return self._memoized(("time", worker_id, percentile), compute)
+    
+    def estimate_worker_value(self, worker_id: str) -> float:
+        """
+        Estimate what a worker contributes to final quality.
+        
+        Args:
+            worker_id: Worker ID
+            
+        Returns:
+            Static quality contribution, scaled by the learned success
+            rate once the worker has enough executions
+        """
+        def compute() -> float:
+            value = self.workers[worker_id].quality_contribution
+            store = self.metrics_store
+            success_rate = store.success_rate(worker_id) if store is not None else None
+            return value * success_rate if success_rate is not None else value
+        
+        return self._memoized(("value", worker_id), compute)
+    
+    def estimates_version(self) -> Tuple:
+        """
+        Version of everything estimates depend on.
+        
+        Changes whenever workers are (un)registered or the metrics store
+        records an execution (or is swapped), so anything derived from
+        estimates can be cached against it.
+        
+        Returns:
+            (registry version, store identity, store version)
+        """
+        store = self.metrics_store
+        return (self.version, id(store), store.version if store is not None else None)
+    
+    def _memoized(self, key: Tuple, compute: Callable[[], float]) -> float:
+        """
+        Estimate from the memo, computing it on a miss.
+        
+        The memo is dropped whenever estimates_version() changes.
+        """
+        version = self.estimates_version()
+        if version != self._estimates_version:
+            self._estimates = {}
+            self._estimates_version = version
+        value = self._estimates.get(key)
+        if value is None:
+            value = self._estimates[key] = compute()
+        return value
+    
+    def estimate_total_cost(self, worker_ids: List[str], percentile: Optional[float] = None) -> float:
+        """
+        Estimate total cost for a list of workers.
+        
+        Args:
+            worker_ids: List of worker IDs
+            percentile: Percentile of observed costs (None = recent average)
+            
+        Returns:
+            Estimated cost in USD
+        """
         return sum(
-            self.workers[wid].estimated_cost 
-            for wid in worker_ids 
+            self.estimate_worker_cost(wid, percentile)
+            for wid in worker_ids
             if wid in self.workers
         )
     
-    def estimate_total_time(self, worker_ids: List[str], parallel: bool = False) -> int:
+    def estimate_total_time(
+        self,
+        worker_ids: List[str],
+        parallel: bool = False,
+        percentile: Optional[float] = None,
+    ) -> int:
         """
         Estimate total time for a list of workers.
         
         Args:
             worker_ids: List of worker IDs
             parallel: If True, parallel-capable workers run simultaneously
+            percentile: Percentile of observed latencies (None = recent average)
             
         Returns:
-            Estimated time in seconds
+            Estimated time in seconds (rounded up)
         """
+        known = [wid for wid in worker_ids if wid in self.workers]
         if not parallel:
             # Sequential execution
-            return sum(
-                self.workers[wid].estimated_time_seconds
-                for wid in worker_ids
-                if wid in self.workers
-            )
+            return math.ceil(sum(self.estimate_worker_time(wid, percentile) for wid in known))
         
         # Parallel execution (max of parallel workers, sum of sequential)
-        parallel_workers = [wid for wid in worker_ids if self.workers.get(wid, None) and self.workers[wid].can_run_parallel]
-        sequential_workers = [wid for wid in worker_ids if wid not in parallel_workers]
+        parallel_workers = [wid for wid in known if wid in self._parallel_ids]
+        sequential_workers = [wid for wid in known if wid not in parallel_workers]
         
-        if parallel_workers:
-            parallel_time = max([self.workers[wid].estimated_time_seconds for wid in parallel_workers])
-        else:
-            parallel_time = 0
-
-        # Calculate sequential time (sum of sequential workers)
-        if sequential_workers:
-            sequential_time = sum([self.workers[wid].estimated_time_seconds for wid in sequential_workers])
-        else:
-            sequential_time = 0        
+        parallel_time = max((self.estimate_worker_time(wid, percentile) for wid in parallel_workers), default=0)
+        sequential_time = sum(self.estimate_worker_time(wid, percentile) for wid in sequential_workers)
         
-        return parallel_time + sequential_time
+        return math.ceil(parallel_time + sequential_time)
 
 
 # Global registry instance
@@ -494,4 +766,9 @@ def get_worker(worker_id: str) -> Optional[WorkerDefinition]:
 
 def list_workers() -> List[WorkerDefinition]:
     """List all workers."""
-    return worker_registry.list_all_workers()
\ No newline at end of file
+    return worker_registry.list_all_workers()
+
+
+def register_worker(worker: WorkerDefinition, replace: bool = False) -> None:
+    """Register a worker with the global registry."""
+    worker_registry.register(worker, replace=replace)
\ No newline at end of file
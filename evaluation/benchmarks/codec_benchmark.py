@@ -0,0 +1,160 @@
+"""
+Codec Benchmark - Compare codec formats against pydantic's JSON path.
+
+Measures encode/decode throughput and payload size (raw and
+zstd-compressed) for AgentState and FinalOutput. Rows:
+- model_dump_json: bare pydantic-core JSON, no envelope (the floor)
+- dict+json: model_dump() re-serialized by a generic JSON encoder, the
+  path a dict-based envelope takes
+- codec:<fmt>: the schema codec in each available format
+
+The codec's json format should match model_dump_json and beat dict+json.
+
+Usage:
+    python evaluation/benchmarks/codec_benchmark.py [--iterations N]
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import argparse
+import json
+import time
+from typing import Callable, Dict, List, Any
+
+from pydantic import BaseModel
+
+from src.meta_agent.schemas import Brief, ContentType, AgentState, Task, TaskStatus
+from src.meta_agent.planner import PlannerAgent
+from src.meta_agent.orchestrator import OrchestratorAgent
+from src.meta_agent.merger import MergerAgent
+from src.storage.blob.blob_store import compress
+from src.utils.codec import SchemaCodec, FORMAT_JSON, FORMAT_MSGPACK, msgpack
+
+
+def build_sample_state() -> AgentState:
+    """Build a realistic, fully-populated AgentState."""
+    brief = Brief(
+        topic="Impact of large language models on scientific research",
+        content_type=ContentType.ARTICLE,
+        target_length=3500,
+        key_points=["Literature review", "Hypothesis generation", "Reproducibility"],
+        keywords=["LLM", "science", "research automation"],
+    )
+    state = AgentState(brief=brief)
+
+    plan = PlannerAgent().create_plan(state)
+    state.plan = plan
+    OrchestratorAgent().execute_plan(state, plan)
+    state.quality_score = 0.88  # Supervisor scale (0-1)
+    state.completeness_score = 0.9
+
+    # Pad with a realistic volume of history and tasks
+    for i in range(50):
+        state.add_agent_action("Benchmark", f"action_{i}", {"index": i, "note": "x" * 40})
+        state.all_tasks.append(Task(
+            task_id=f"task_bench_{i}",
+            worker_id="web_search_worker",
+            step_id="step_1",
+            plan_id=plan.plan_id,
+            input_data={"query": f"query {i}", "max_results": 10},
+            status=TaskStatus.COMPLETED,
+        ))
+    return state
+
+
+def _time_it(fn: Callable[[], Any], iterations: int) -> float:
+    """Return operations per second for fn."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed if elapsed > 0 else float("inf")
+
+
+def benchmark_model(model: BaseModel, iterations: int) -> List[Dict[str, Any]]:
+    """
+    Benchmark all available formats for one model.
+
+    Args:
+        model: Model instance to serialize
+        iterations: Iterations per measurement
+
+    Returns:
+        Result rows (format, encode ops/s, decode ops/s, size, compressed size)
+    """
+    model_cls = type(model)
+    rows = []
+
+    def row(fmt: str, encode: Callable[[], bytes], decode: Callable[[bytes], Any]) -> None:
+        payload = encode()
+        rows.append({
+            "format": fmt,
+            "encode_ops": _time_it(encode, iterations),
+            "decode_ops": _time_it(lambda: decode(payload), iterations),
+            "size": len(payload),
+            "compressed": len(compress(payload)),
+        })
+
+    # Floor: bare pydantic JSON
+    row(
+        "model_dump_json",
+        lambda: model.model_dump_json().encode("utf-8"),
+        model_cls.model_validate_json,
+    )
+    # Dict path: python-mode dump, re-serialized
+    row(
+        "dict+json",
+        lambda: json.dumps(model.model_dump(), default=str).encode("utf-8"),
+        lambda payload: model_cls.model_validate(json.loads(payload)),
+    )
+
+    formats = [FORMAT_JSON]
+    if msgpack is not None:
+        formats.append(FORMAT_MSGPACK)
+
+    for fmt in formats:
+        codec = SchemaCodec(default_format=fmt)
+        row(f"codec:{fmt}", lambda codec=codec: codec.encode(model), codec.decode)
+
+    return rows
+
+
+def print_results(name: str, rows: List[Dict[str, Any]]) -> None:
+    """Print a results table relative to the model_dump_json floor."""
+    baseline = rows[0]
+    print(f"\n{name}")
+    print(
+        f"{'Format':<16} {'Encode/s':>9} {'vs floor':>8} {'Decode/s':>9} {'vs floor':>8} "
+        f"{'Size (B)':>9} {'zstd (B)':>9}"
+    )
+    print("-" * 74)
+    for row in rows:
+        print(
+            f"{row['format']:<16} {row['encode_ops']:>9.0f} {row['encode_ops'] / baseline['encode_ops']:>7.2f}x "
+            f"{row['decode_ops']:>9.0f} {row['decode_ops'] / baseline['decode_ops']:>7.2f}x "
+            f"{row['size']:>9} {row['compressed']:>9}"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark workflow model codecs")
+    parser.add_argument("--iterations", type=int, default=500, help="Iterations per measurement")
+    args = parser.parse_args()
+
+    state = build_sample_state()
+    final_output = MergerAgent().merge(state)
+
+    print(f"\n{'='*60}")
+    print(f"📦 Codec Benchmark ({args.iterations} iterations)")
+    print(f"{'='*60}")
+
+    print_results("AgentState", benchmark_model(state, args.iterations))
+    print_results("FinalOutput", benchmark_model(final_output, args.iterations))
+    print()
+
+
+if __name__ == "__main__":
+    main()
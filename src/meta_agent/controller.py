@@ -28,6 +28,10 @@ from src.meta_agent.schemas import (
     WorkflowPhase,
 )
 from config.settings import get_settings
+from src.utils.event_stream import get_event_stream
+from src.utils.singleflight import SingleFlight
+from src.storage.blob import get_blob_store
+from src.storage.cache.result_cache import ResultCache, create_result_cache, MISS, SHARED
 
 
 class ControllerAgent:
@@ -39,9 +43,21 @@ class ControllerAgent:
     produce the final output.
     """
     
-    def __init__(self):
-        """Initialize controller."""
+    def __init__(self, result_cache: Optional[ResultCache] = None):
+        """
+        Initialize controller.
+        
+        Args:
+            result_cache: Cache of final outputs by brief (default: from
+                settings, None when disabled)
+        """
         self.settings = get_settings()
+        self.event_stream = get_event_stream()
+        self.blob_store = get_blob_store()
+        self.flight = SingleFlight()
+        if result_cache is None and self.settings.result_cache_enabled:
+            result_cache = create_result_cache()
+        self.result_cache = result_cache
         self.request_count = 0
     
     def execute(self, brief: Brief) -> FinalOutput:
@@ -60,6 +76,61 @@ class ControllerAgent:
         # Generate request ID
         request_id = self._generate_request_id()
         
+        # Repeated briefs are served from cache; identical briefs already
+        # in flight share that run's output
+        ran = []
+        
+        def run() -> FinalOutput:
+            ran.append(True)
+            return self._run(brief, request_id)
+        
+        try:
+            if self.result_cache is not None:
+                final_output, outcome = self.result_cache.get_or_compute(
+                    brief, run, refresh=lambda: self._refresh(brief)
+                )
+            else:
+                final_output, shared = self.flight.do_shared(brief.fingerprint(), run)
+                outcome = SHARED if shared else MISS
+        except Exception as e:
+            if not ran:
+                self.event_stream.close_channel(request_id, {"status": "failed", "error": str(e)})
+            raise
+        
+        if ran:
+            return final_output
+        
+        print(f"🔗 Controller: Request {request_id} served from {outcome} run {final_output.request_id}")
+        self.event_stream.close_channel(request_id, {
+            "status": "completed",
+            "served_from": outcome,
+            "source_request_id": final_output.request_id,
+        })
+        served = final_output.model_copy(update={"request_id": brief.request_id or request_id}, deep=True)
+        if outcome != SHARED:
+            served.system_notes.append(f"Served from cache (generated {served.generated_at:%Y-%m-%d %H:%M} UTC)")
+        return served
+    
+    def _refresh(self, brief: Brief) -> FinalOutput:
+        """Re-run a cached brief under a new request ID (background refresh)."""
+        return self._run(brief.model_copy(update={"request_id": None}), self._generate_request_id())
+    
+    def _run(self, brief: Brief, request_id: str) -> FinalOutput:
+        """
+        Run the workflow for a brief.
+        
+        Args:
+            brief: User's brief/request
+            request_id: Request ID
+            
+        Returns:
+            FinalOutput with generated article and metadata
+            
+        Raises:
+            Exception: If workflow fails
+        """
+        # Workers offload blobs under the brief's own request ID when it has one
+        run_key = brief.request_id or request_id
         try:
             # Log start
             print(f"\n{'='*60}")
@@ -82,6 +153,11 @@ class ControllerAgent:
             print(f"   Time: {final_output.metrics.total_duration_seconds:.1f}s")
             print(f"{'='*60}\n")
             
+            # End the request's progress stream; the final output holds
+            # resolved content, so the run's blobs can go
+            self.event_stream.close_channel(request_id, {"status": "completed"})
+            self.blob_store.release(run_key)
+            
             return final_output
             
         except Exception as e:
@@ -98,6 +174,11 @@ class ControllerAgent:
                 error_message=str(e),
                 failed_at_phase=WorkflowPhase.INITIALIZED,
             )
+            self.event_stream.close_channel(request_id, {
+                "status": "failed",
+                "error": error_result.error_message,
+            })
+            self.blob_store.release(run_key)
             
             raise Exception(f"Workflow failed: {error_result.error_message}")
     
@@ -0,0 +1,182 @@
+"""
+Critical Path - Plan makespan over the step dependency DAG.
+
+Summing step times assumes every step waits for the one before it.
+Steps only wait for their depends_on steps, so independent steps
+overlap, while a concurrency limit stops a wide parallel step from
+running all of its workers at once.
+
+- critical_path: longest chain of steps through the DAG (lower bound
+  on wall time, ignoring the concurrency limit)
+- makespan: predicted wall time, from list scheduling worker runs on
+  max_concurrency slots, longest remaining path first
+
+Worker runs inside a PARALLEL step start together; inside a SEQUENTIAL
+step each waits for the previous one.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import heapq
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from src.meta_agent.schemas import PlanStep, ExecutionMode
+
+
+def step_duration(step: PlanStep, worker_time: Callable[[str], float]) -> float:
+    """
+    Wall time of a step with unlimited concurrency.
+
+    Args:
+        step: Plan step
+        worker_time: Latency of a worker in seconds
+
+    Returns:
+        Max over parallel workers, sum over sequential ones
+    """
+    times = [worker_time(wid) for wid in step.worker_ids]
+    if not times:
+        return 0.0
+    return max(times) if step.execution_mode == ExecutionMode.PARALLEL else sum(times)
+
+
+def topological_order(steps: Sequence[PlanStep]) -> List[PlanStep]:
+    """
+    Order steps so every step comes after its dependencies.
+
+    Dependencies on step IDs not in the plan are ignored.
+
+    Args:
+        steps: Plan steps
+
+    Returns:
+        Steps in dependency order (plan order among independent steps)
+
+    Raises:
+        ValueError: If the dependencies form a cycle
+    """
+    by_id = {step.step_id: step for step in steps}
+    waiting = {step.step_id: {dep for dep in step.depends_on if dep in by_id} for step in steps}
+    ordered: List[PlanStep] = []
+    while len(ordered) < len(steps):
+        ready = [step for step in steps if step.step_id in waiting and not waiting[step.step_id]]
+        if not ready:
+            raise ValueError(f"Plan steps have a dependency cycle: {sorted(waiting)}")
+        for step in ready:
+            del waiting[step.step_id]
+            for deps in waiting.values():
+                deps.discard(step.step_id)
+        ordered.extend(ready)
+    return ordered
+
+
+def critical_path(
+    steps: Sequence[PlanStep],
+    worker_time: Callable[[str], float],
+) -> Tuple[float, List[str]]:
+    """
+    Longest chain of dependent steps.
+
+    Args:
+        steps: Plan steps
+        worker_time: Latency of a worker in seconds
+
+    Returns:
+        (length in seconds, step IDs along the path)
+    """
+    finish: Dict[str, float] = {}
+    previous: Dict[str, str] = {}
+    for step in topological_order(steps):
+        start = 0.0
+        for dep in step.depends_on:
+            if dep in finish and finish[dep] > start:
+                start, previous[step.step_id] = finish[dep], dep
+        finish[step.step_id] = start + step_duration(step, worker_time)
+
+    if not finish:
+        return 0.0, []
+    last = max(finish, key=finish.get)
+    path = [last]
+    while path[-1] in previous:
+        path.append(previous[path[-1]])
+    return finish[last], path[::-1]
+
+
+def worker_tasks(steps: Sequence[PlanStep]) -> Tuple[List[str], List[List[int]]]:
+    """
+    Worker runs of a plan as a task graph.
+
+    Args:
+        steps: Plan steps
+
+    Returns:
+        (worker ID of each task, predecessor task indexes of each task),
+        with tasks in a topological order
+    """
+    worker_ids: List[str] = []
+    predecessors: List[List[int]] = []
+    step_tails: Dict[str, List[int]] = {}
+    for step in topological_order(steps):
+        entry = [task for dep in step.depends_on for task in step_tails.get(dep, [])]
+        tails = []
+        for worker_id in step.worker_ids:
+            worker_ids.append(worker_id)
+            predecessors.append(list(entry))
+            task = len(worker_ids) - 1
+            if step.execution_mode == ExecutionMode.PARALLEL:
+                tails.append(task)
+            else:
+                entry, tails = [task], [task]
+        step_tails[step.step_id] = tails or entry
+    return worker_ids, predecessors
+
+
+def makespan(
+    steps: Sequence[PlanStep],
+    worker_time: Callable[[str], float],
+    max_concurrency: int,
+) -> float:
+    """
+    Predicted wall time of a plan under a concurrency limit.
+
+    Args:
+        steps: Plan steps
+        worker_time: Latency of a worker in seconds
+        max_concurrency: Worker runs allowed at once
+
+    Returns:
+        Seconds until the last worker run finishes
+    """
+    worker_ids, predecessors = worker_tasks(steps)
+    durations = [worker_time(worker_id) for worker_id in worker_ids]
+    if not durations:
+        return 0.0
+
+    successors: List[List[int]] = [[] for _ in durations]
+    for task, preds in enumerate(predecessors):
+        for pred in preds:
+            successors[pred].append(task)
+
+    # Priority: longest path from a task to the end (tasks are in topological order)
+    remaining = list(durations)
+    for task in range(len(durations) - 1, -1, -1):
+        if successors[task]:
+            remaining[task] += max(remaining[s] for s in successors[task])
+
+    blocked = [len(preds) for preds in predecessors]
+    ready = [(-remaining[task], task) for task in range(len(durations)) if not blocked[task]]
+    heapq.heapify(ready)
+    running: List[Tuple[float, int]] = []
+    now = 0.0
+    while ready or running:
+        while ready and len(running) < max_concurrency:
+            _, task = heapq.heappop(ready)
+            heapq.heappush(running, (now + durations[task], task))
+        now, task = heapq.heappop(running)
+        for successor in successors[task]:
+            blocked[successor] -= 1
+            if not blocked[successor]:
+                heapq.heappush(ready, (-remaining[successor], successor))
+    return now
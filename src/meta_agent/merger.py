@@ -15,7 +15,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 
 from src.meta_agent.schemas import (
@@ -26,6 +26,8 @@ from src.meta_agent.schemas import (
     ExecutionMetrics,
     Source,
 )
+from src.storage.blob import get_blob_store
+from src.tools.llm.token_counter import get_token_counter
 
 
 class MergerAgent:
@@ -39,6 +41,8 @@ class MergerAgent:
     def __init__(self):
         """Initialize merger."""
         self.merge_count = 0
+        self.blob_store = get_blob_store()
+        self.token_counter = get_token_counter()
     
     def merge(self, state: AgentState) -> FinalOutput:
         """
@@ -99,8 +103,10 @@ class MergerAgent:
         writing_results = state.writing_results or {}
         brief = state.brief
         
-        # Extract content
-        content = writing_results.get("content", self._generate_default_content(state))
+        # Extract content (resolved from blob store only here, where it is needed)
+        content = self.blob_store.resolve(writing_results.get("content"))
+        if content is None:
+            content = self._generate_default_content(state)
         word_count = writing_results.get("word_count", brief.target_length or 2000)
         
         # Create article
@@ -164,6 +170,20 @@ class MergerAgent:
         all_sources = research_results.get("all_sources", [])
         
         for i, source_text in enumerate(all_sources[:15], 1):  # Limit to 15
+            source_text = self.blob_store.resolve(source_text)
+            if isinstance(source_text, dict):
+                # Structured source (e.g. served from the knowledge base)
+                content = source_text.get("content") or ""
+                source = Source(
+                    source_id=f"source_{i}",
+                    title=source_text.get("title") or content[:200],
+                    url=source_text.get("url") or f"https://example.com/source/{i}",
+                    source_type=source_text.get("source_type", "web"),
+                    relevance_score=0.85,
+                    excerpt=content[:300] or None,
+                )
+                sources.append(source)
+                continue
             source = Source(
                 source_id=f"source_{i}",
                 title=source_text,
@@ -202,6 +222,7 @@ class MergerAgent:
         
         # Get worker list
         workers_used = list(state.cost_by_worker.keys())
+        input_tokens, output_tokens = self._estimate_tokens(state)
         
         # Create metrics
         metrics = ExecutionMetrics(
@@ -213,9 +234,9 @@ class MergerAgent:
             total_tasks=len(state.all_tasks),
             successful_tasks=len(state.completed_tasks),
             failed_tasks=len(state.failed_tasks),
-            total_tokens=self._estimate_tokens(state),
-            input_tokens=self._estimate_tokens(state) // 3,
-            output_tokens=self._estimate_tokens(state) * 2 // 3,
+            total_tokens=input_tokens + output_tokens,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
             iterations=state.iteration,
             re_planning_count=len(state.previous_plans),
         )
@@ -276,7 +297,11 @@ The implications of these findings extend across multiple domains, affecting var
     
     def _extract_sections(self, writing_results: Dict[str, Any]) -> List[Dict[str, str]]:
         """Extract sections from writing results."""
-        sections = writing_results.get("sections", [])
+        sections = self.blob_store.resolve(writing_results.get("sections", []))
+        sections = [
+            {k: self.blob_store.resolve(v) for k, v in s.items()} if isinstance(s, dict) else s
+            for s in sections
+        ]
         
         if not sections:
             # Default sections
@@ -390,22 +415,48 @@ The implications of these findings extend across multiple domains, affecting var
         
         return warnings
     
-    def _estimate_tokens(self, state: AgentState) -> int:
-        """Estimate total tokens used."""
-        # Simple estimation based on operations
-        base_tokens = 1000  # Base overhead
+    def _estimate_tokens(self, state: AgentState) -> Tuple[int, int]:
+        """
+        Estimate tokens used from the content each worker saw and produced.
         
-        if state.research_results:
-            base_tokens += 2000
-        if state.analysis_results:
-            base_tokens += 1500
-        if state.writing_results:
-            word_count = state.writing_results.get("word_count", 0)
-            base_tokens += word_count * 1.3  # Words to tokens ratio
-        if state.quality_results:
-            base_tokens += 1000
+        Planning reads the brief once; every worker call pays for its
+        rendered prompt (or the brief plus its packed context);
+        its output is counted from the produced text, or from its word
+        count when only a blob reference or summary is available.
         
-        return int(base_tokens)
+        Args:
+            state: Final agent state
+            
+        Returns:
+            (input tokens, output tokens)
+        """
+        counter = self.token_counter
+        brief = state.brief
+        brief_tokens = counter.count(
+            "\n".join([brief.topic, brief.target_audience or "", *brief.key_points, *brief.keywords])
+        ) if brief else 0
+        
+        input_tokens = brief_tokens
+        output_tokens = 0
+        for phase_results in (
+            state.research_results,
+            state.analysis_results,
+            state.writing_results,
+            state.quality_results,
+        ):
+            if not phase_results:
+                continue
+            for result in phase_results.get("results") or [phase_results]:
+                if not isinstance(result, dict) or result.get("from_knowledge_base"):
+                    continue
+                input_tokens += result.get("prompt_tokens") or brief_tokens + result.get("context_tokens", 0)
+                text = self.blob_store.resolve(result.get("content"))
+                output_tokens += max(
+                    counter.count(text) if isinstance(text, str) else 0,
+                    counter.tokens_for_words(result.get("word_count", 0)),
+                )
+        
+        return input_tokens, output_tokens
 
 
 # Global instance
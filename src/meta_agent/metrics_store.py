@@ -0,0 +1,296 @@
+"""
+Metrics Store - Learned per-worker latency and cost.
+
+The registry's estimated_cost / estimated_time_seconds are guesses. The
+store records every worker execution and learns, per worker:
+- WorkerMetrics (counts, averages, min/max, confidence)
+- EWMA of latency and cost (recent expectation)
+- Fixed-bucket histograms of latency and cost (percentiles, e.g. p95)
+
+The registry serves learned estimates once a worker has min_samples
+observations and falls back to its static definition before that.
+Every recorded execution bumps version, so consumers caching estimates
+know when to recompute.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.meta_agent.schemas import WorkerMetrics
+from config.settings import get_settings
+
+
+# Histogram upper bounds: latency in seconds, cost in USD
+LATENCY_BUCKETS = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0,
+    45.0, 60.0, 90.0, 120.0, 180.0, 300.0, 600.0,
+)
+COST_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.0075, 0.01, 0.015, 0.02, 0.03, 0.04,
+    0.05, 0.075, 0.1, 0.15, 0.2, 0.3, 0.5, 1.0, 2.0,
+)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram with interpolated percentiles.
+
+    Memory is constant per worker regardless of how many executions are
+    recorded.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        """
+        Initialize histogram.
+
+        Args:
+            bounds: Ascending bucket upper bounds (a final overflow bucket is added)
+        """
+        self.bounds = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate a percentile.
+
+        Interpolates linearly inside the bucket holding the rank, clamped
+        to the observed min/max.
+
+        Args:
+            q: Percentile (0-100)
+
+        Returns:
+            Estimated value, or None if empty
+        """
+        if not self.count:
+            return None
+        rank = q / 100.0 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                value = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(value, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+class WorkerStats:
+    """Everything learned about one worker."""
+
+    def __init__(self, worker_id: str):
+        self.metrics = WorkerMetrics(worker_id=worker_id)
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.cost = Histogram(COST_BUCKETS)
+        self.latency_ewma: Optional[float] = None
+        self.cost_ewma: Optional[float] = None
+
+
+class MetricsStore:
+    """
+    Live per-worker latency and cost metrics.
+    """
+
+    def __init__(self, alpha: float = 0.2, min_samples: int = 5):
+        """
+        Initialize store.
+
+        Args:
+            alpha: EWMA weight of each new observation
+            min_samples: Observations needed before estimates are served
+        """
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self._workers: Dict[str, WorkerStats] = {}
+        self._lock = threading.Lock()
+        self.version = 0
+
+    def record(
+        self,
+        worker_id: str,
+        duration: float,
+        cost: float,
+        success: bool = True,
+        tokens: int = 0,
+        confidence: Optional[float] = None,
+    ) -> None:
+        """
+        Record a worker execution.
+
+        Args:
+            worker_id: Worker that ran
+            duration: Wall time in seconds
+            cost: Cost in USD
+            success: Whether it succeeded
+            tokens: Tokens used
+            confidence: Worker's confidence score, if any
+        """
+        with self._lock:
+            stats = self._workers.get(worker_id)
+            if stats is None:
+                stats = self._workers[worker_id] = WorkerStats(worker_id)
+            stats.metrics.record_execution(success, duration, cost, tokens, confidence)
+            stats.latency.observe(duration)
+            stats.cost.observe(cost)
+            stats.latency_ewma = self._ewma(stats.latency_ewma, duration)
+            stats.cost_ewma = self._ewma(stats.cost_ewma, cost)
+            self.version += 1
+
+    def _ewma(self, previous: Optional[float], value: float) -> float:
+        return value if previous is None else (1 - self.alpha) * previous + self.alpha * value
+
+    # =========================================================================
+    # ESTIMATES
+    # =========================================================================
+
+    def latency(self, worker_id: str, percentile: Optional[float] = None) -> Optional[float]:
+        """
+        Learned latency of a worker.
+
+        Args:
+            worker_id: Worker ID
+            percentile: Percentile (0-100), or None for the EWMA
+
+        Returns:
+            Seconds, or None below min_samples
+        """
+        stats = self._ready(worker_id)
+        if stats is None:
+            return None
+        return stats.latency_ewma if percentile is None else stats.latency.percentile(percentile)
+
+    def cost(self, worker_id: str, percentile: Optional[float] = None) -> Optional[float]:
+        """
+        Learned cost of a worker.
+
+        Args:
+            worker_id: Worker ID
+            percentile: Percentile (0-100), or None for the EWMA
+
+        Returns:
+            USD, or None below min_samples
+        """
+        stats = self._ready(worker_id)
+        if stats is None:
+            return None
+        return stats.cost_ewma if percentile is None else stats.cost.percentile(percentile)
+
+    def success_rate(self, worker_id: str) -> Optional[float]:
+        """
+        Learned success rate of a worker.
+
+        Returns:
+            Fraction of successful executions, or None below min_samples
+        """
+        stats = self._ready(worker_id)
+        if stats is None:
+            return None
+        return stats.metrics.successful_executions / stats.metrics.total_executions
+
+    def histograms(self, worker_id: str) -> Optional[Tuple[Histogram, Histogram]]:
+        """
+        Learned distributions of a worker.
+
+        Returns:
+            (latency histogram, cost histogram), or None below min_samples
+        """
+        stats = self._ready(worker_id)
+        if stats is None:
+            return None
+        return stats.latency, stats.cost
+
+    def _ready(self, worker_id: str) -> Optional[WorkerStats]:
+        stats = self._workers.get(worker_id)
+        if stats is None or stats.latency.count < self.min_samples:
+            return None
+        return stats
+
+    def get_metrics(self, worker_id: str) -> Optional[WorkerMetrics]:
+        """Get a worker's aggregate metrics."""
+        stats = self._workers.get(worker_id)
+        return stats.metrics if stats else None
+
+    def summary(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Latency and cost distribution of a worker.
+
+        Returns:
+            Dict with sample count, EWMA, mean and p50/p95/p99, or None
+        """
+        stats = self._workers.get(worker_id)
+        if stats is None:
+            return None
+        return {
+            "samples": stats.latency.count,
+            "success_rate": stats.metrics.successful_executions / stats.metrics.total_executions,
+            "latency": {
+                "ewma": stats.latency_ewma,
+                "mean": stats.latency.mean,
+                "p50": stats.latency.percentile(50),
+                "p95": stats.latency.percentile(95),
+                "p99": stats.latency.percentile(99),
+            },
+            "cost": {
+                "ewma": stats.cost_ewma,
+                "mean": stats.cost.mean,
+                "p50": stats.cost.percentile(50),
+                "p95": stats.cost.percentile(95),
+            },
+        }
+
+    def reset(self) -> None:
+        """Forget all observations."""
+        with self._lock:
+            self._workers.clear()
+            self.version += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dict with version, workers observed and executions recorded
+        """
+        return {
+            "version": self.version,
+            "workers": len(self._workers),
+            "executions": sum(s.latency.count for s in self._workers.values()),
+        }
+
+
+def create_metrics_store() -> MetricsStore:
+    """Create a metrics store from settings."""
+    settings = get_settings()
+    return MetricsStore(alpha=settings.metrics_ewma_alpha, min_samples=settings.metrics_min_samples)
+
+
+# Global instance
+metrics_store = create_metrics_store()
+
+
+# Helper functions
+def get_metrics_store() -> MetricsStore:
+    """Get the metrics store instance."""
+    return metrics_store
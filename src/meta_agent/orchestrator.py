@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import time
+import uuid
 
 from src.meta_agent.schemas import (
     Plan,
@@ -31,6 +32,30 @@ from src.meta_agent.schemas import (
     AgentState,
 )
 from config.worker_registry import get_worker_registry
+from config.settings import get_settings
+from src.storage.blob import get_blob_store
+from src.storage.vector import SourceRetriever, KnowledgeBase, get_knowledge_base
+from src.storage.vector.knowledge_base import WORKER_SOURCE_TYPES
+from src.utils.text import source_content, source_text
+from src.tools.search import SourceDeduplicator, EvidenceIndex
+from src.tools.llm.context_packer import get_context_packer
+from src.tools.llm.model_router import ModelRouter, get_model_router
+from src.meta_agent.metrics_store import MetricsStore, get_metrics_store
+from src.workers.executor import get_worker_executor
+from src.utils.event_stream import EventStream, get_event_stream
+
+
+# Workers that receive top-k source chunks for the topic (vector search)
+EVIDENCE_WORKERS = {"content_synthesizer_worker"}
+
+# Workers that receive per-claim evidence passages for the draft (BM25)
+CLAIM_WORKERS = {"fact_checker_worker", "citation_manager_worker"}
+
+# Tokens of a worker's input budget kept for instructions and the brief
+PROMPT_RESERVE_TOKENS = 1000
+
+# Phases whose workers stream partial output to state and the event stream
+STREAMING_PHASES = {"writing"}
 
 
 class OrchestratorAgent:
@@ -41,10 +66,61 @@ class OrchestratorAgent:
     worker execution to complete all tasks.
     """
     
-    def __init__(self):
-        """Initialize orchestrator."""
+    def __init__(
+        self,
+        task_queue: Optional[Any] = None,
+        remote_timeout_seconds: float = 300.0,
+        evidence_top_k: int = 8,
+        evidence_per_claim: int = 3,
+        knowledge_base: Optional[KnowledgeBase] = None,
+        event_stream: Optional[EventStream] = None,
+        model_router: Optional[ModelRouter] = None,
+        metrics_store: Optional[MetricsStore] = None,
+    ):
+        """
+        Initialize orchestrator.
+        
+        Args:
+            task_queue: Distributed task queue (e.g. RedisTaskQueue).
+                None = execute workers in-process.
+            remote_timeout_seconds: Max wait for remote results per dispatch
+            evidence_top_k: Source chunks retrieved for evidence workers
+            evidence_per_claim: Passages retrieved per claim for claim workers
+            knowledge_base: Cross-run source corpus (default: global one
+                when knowledge_base_enabled)
+            event_stream: Progress event bus (default: global one); events
+                are published on the brief's request_id (or the plan ID)
+            model_router: Per-worker model router (default: global one
+                when model_routing_enabled)
+            metrics_store: Learned worker latency/cost (default: global one)
+        """
         self.registry = get_worker_registry()
+        self.blob_store = get_blob_store()
+        self.context_packer = get_context_packer()
+        self.executor = get_worker_executor()
+        self.event_stream = event_stream or get_event_stream()
+        self.metrics_store = metrics_store or get_metrics_store()
+        self.task_queue = task_queue
+        self.remote_timeout_seconds = remote_timeout_seconds
+        self.evidence_top_k = evidence_top_k
+        self.evidence_per_claim = evidence_per_claim
         self.execution_count = 0
+        
+        settings = get_settings()
+        if knowledge_base is None and settings.knowledge_base_enabled:
+            knowledge_base = get_knowledge_base()
+        self.knowledge_base = knowledge_base
+        self.kb_min_sources = settings.knowledge_base_min_sources
+        
+        if model_router is None and settings.model_routing_enabled:
+            model_router = get_model_router()
+        self.model_router = model_router
+        
+        # Per-plan source indexes, built after research
+        self._retrievers: Dict[str, SourceRetriever] = {}
+        self._evidence_indexes: Dict[str, EvidenceIndex] = {}
+        # Worker calls left per plan, for the router's budget share
+        self._remaining_workers: Dict[str, int] = {}
     
     def execute_plan(self, state: AgentState, plan: Plan) -> AgentState:
         """
@@ -66,6 +142,7 @@ class OrchestratorAgent:
         
         self.execution_count += 1
         execution_start = time.time()
+        self._remaining_workers[plan.plan_id] = sum(len(step.worker_ids) for step in plan.steps)
         
         # Execute each step
         for i, step in enumerate(plan.steps, 1):
@@ -85,6 +162,8 @@ class OrchestratorAgent:
             
             # Update state with results
             state = self._update_state_with_results(state, step, step_result)
+            if step.phase == "research":
+                self._index_sources(state, plan)
             
             # Mark step complete
             step.status = StepStatus.COMPLETED
@@ -93,6 +172,16 @@ class OrchestratorAgent:
             print(f"   ✅ Step completed")
             print()
         
+        self._retrievers.pop(plan.plan_id, None)
+        self._evidence_indexes.pop(plan.plan_id, None)
+        self._remaining_workers.pop(plan.plan_id, None)
+        if not state.brief.request_id:
+            # Plan-keyed channels belong to this run; request channels
+            # are closed by the controller (or expire when idle)
+            self.event_stream.close_channel(plan.plan_id, {"status": "executed"})
+        if self.knowledge_base is not None:
+            self.knowledge_base.save()
+        
         # Calculate execution time
         execution_time = time.time() - execution_start
         
@@ -172,10 +261,14 @@ class OrchestratorAgent:
         # In Sprint 1: Mock parallel execution
         # In Sprint 2+: Use asyncio or threading for real parallelization
         
-        results = []
-        for worker_id in step.worker_ids:
-            result = self._execute_worker(state, worker_id, step.phase, step.step_id, plan.plan_id)
-            results.append(result)
+        if self.task_queue is not None:
+            # Distributed: enqueue all workers at once, remote nodes run them concurrently
+            results = self._execute_remote(state, step.worker_ids, step, plan)
+        else:
+            results = []
+            for worker_id in step.worker_ids:
+                result = self._execute_worker(state, worker_id, step.phase, step.step_id, plan.plan_id)
+                results.append(result)
         
         # Aggregate results
         aggregated = self._aggregate_results(results, step.phase)
@@ -197,8 +290,11 @@ class OrchestratorAgent:
         
         results = []
         for worker_id in step.worker_ids:
-            result = self._execute_worker(state, worker_id, step.phase, step.step_id, plan.plan_id)
-            results.append(result)
+            if self.task_queue is not None:
+                results.extend(self._execute_remote(state, [worker_id], step, plan))
+            else:
+                result = self._execute_worker(state, worker_id, step.phase, step.step_id, plan.plan_id)
+                results.append(result)
         
         # Aggregate results
         aggregated = self._aggregate_results(results, step.phase)
@@ -231,16 +327,58 @@ class OrchestratorAgent:
             print(f"      ❌ Worker not found: {worker_id}")
             return {"status": "failed", "error": f"Worker {worker_id} not found"}
         
-        print(f"      🔧 {worker_id}")
+        # Research: answer from past runs when the knowledge base covers it
+        known = self._query_knowledge_base(state, worker_id, phase)
+        if known is not None and len(known) >= self.kb_min_sources:
+            print(f"      📚 {worker_id} (knowledge base: {len(known)} sources)")
+            result = self._knowledge_base_result(worker_id, known)
+            cost, duration = 0.0, 0.0
+        else:
+            print(f"      🔧 {worker_id}")
+            
+            choice = self._route_model(state, worker_def, plan_id)
+            
+            # Simulate execution time
+            started = time.time()
+            time.sleep(0.1)
+            
+            # Create mock result based on phase
+            context = self._build_context(state, worker_id, plan_id)
+            max_results = self._research_depth(known)
+            if phase in STREAMING_PHASES:
+                result = self._stream_worker(state, worker_def, phase, context, plan_id)
+            else:
+                result = self._create_mock_result(state, worker_def, phase, context, max_results)
+            result = self._apply_knowledge(state, worker_id, result, known)
+            cost, duration = self.executor.call_cost(worker_def, max_results), time.time() - started
+            
+            if choice is not None:
+                result["model"] = choice.model
+                cost *= self.model_router.cost_multiplier(choice.model, worker_def)
+                self.model_router.record_outcome(choice.model, worker_id, duration, result.get("confidence"))
+            
+            self.metrics_store.record(
+                worker_id, duration, cost,
+                success=result.get("status") == "success",
+                confidence=result.get("confidence"),
+            )
         
-        # Simulate execution time
-        time.sleep(0.1)
+        if plan_id in self._remaining_workers:
+            self._remaining_workers[plan_id] = max(1, self._remaining_workers[plan_id] - 1)
         
-        # Create mock result based on phase
-        result = self._create_mock_result(state, worker_def, phase)
+        # Store large payloads out-of-line; state keeps only references
+        result = self.blob_store.offload(result, owner=self._channel(state, plan_id))
         
         # Track cost
-        state.add_cost(worker_id, worker_def.estimated_cost)
+        state.add_cost(worker_id, cost)
+        
+        state.partial_outputs.pop(worker_id, None)
+        self.event_stream.publish(self._channel(state, plan_id), "worker_completed", {
+            "worker_id": worker_id,
+            "phase": phase,
+            "status": result.get("status"),
+            "duration_seconds": duration,
+        })
         
         # Create task record
         task = Task(
@@ -255,15 +393,142 @@ class OrchestratorAgent:
         
         # Add to state
         state.all_tasks.append(task)
-        state.completed_tasks.append(task)
+        state.completed_tasks.append(TaskResult(
+            task_id=task.task_id,
+            worker_id=worker_id,
+            success=result.get("status") == "success",
+            output=result,
+            duration_seconds=duration,
+            cost=cost,
+        ))
         
         return result
     
+    def _execute_remote(
+        self,
+        state: AgentState,
+        worker_ids: List[str],
+        step: PlanStep,
+        plan: Plan
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute workers through the distributed task queue.
+        
+        Enqueues one task per worker and waits on the plan's reply
+        stream. Workers whose results don't arrive in time are
+        recorded as failed. Models are routed here, as for in-process
+        workers, and sent with the task.
+        
+        Args:
+            state: Current state
+            worker_ids: Workers to dispatch
+            step: Current step
+            plan: Current plan
+            
+        Returns:
+            Worker results in worker_ids order
+        """
+        reply_to = self.task_queue.reply_stream(plan.plan_id)
+        tasks = []
+        known_sources: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+        choices: Dict[str, Optional[Any]] = {}
+        local_results: Dict[str, Dict[str, Any]] = {}
+        for worker_id in worker_ids:
+            known = self._query_knowledge_base(state, worker_id, step.phase)
+            if known is not None and len(known) >= self.kb_min_sources:
+                # Covered by the knowledge base: no need to go remote
+                local_results[worker_id] = self._execute_worker(
+                    state, worker_id, step.phase, step.step_id, plan.plan_id
+                )
+                continue
+            known_sources[worker_id] = known
+            
+            input_data = {"phase": step.phase, "brief": state.brief.model_dump(mode="json")}
+            context = self._build_context(state, worker_id, plan.plan_id)
+            if context is not None:
+                input_data["context"] = context
+            max_results = self._research_depth(known)
+            if max_results is not None:
+                input_data["max_results"] = max_results
+            worker_def = self.registry.get_worker(worker_id)
+            choices[worker_id] = self._route_model(state, worker_def, plan.plan_id) if worker_def else None
+            if choices[worker_id] is not None:
+                input_data["model"] = choices[worker_id].model
+            task = Task(
+                task_id=f"task_{worker_id}_{uuid.uuid4().hex[:12]}",
+                step_id=step.step_id,
+                plan_id=plan.plan_id,
+                worker_id=worker_id,
+                input_data=input_data,
+                status=TaskStatus.PENDING,
+                priority=TaskPriority.MEDIUM,
+            )
+            self.task_queue.enqueue(task, reply_to)
+            tasks.append(task)
+            print(f"      📤 {worker_id} → queue")
+        
+        replies = self.task_queue.wait_for_results(
+            reply_to, [t.task_id for t in tasks], self.remote_timeout_seconds
+        ) if tasks else {}
+        
+        remote_results: Dict[str, Dict[str, Any]] = {}
+        for task in tasks:
+            task_result = replies.get(task.task_id)
+            if plan.plan_id in self._remaining_workers:
+                self._remaining_workers[plan.plan_id] = max(1, self._remaining_workers[plan.plan_id] - 1)
+            if task_result is None:
+                task.mark_failed("Timed out waiting for remote worker")
+                state.all_tasks.append(task)
+                state.failed_tasks.append(task)
+                state.add_error(f"{task.worker_id}: timed out waiting for remote worker")
+                remote_results[task.worker_id] = {
+                    "status": "failed", "worker_id": task.worker_id, "error": task.error
+                }
+                continue
+            
+            result = dict(task_result.output or {})
+            cost = task_result.cost
+            choice = choices[task.worker_id]
+            if choice is not None:
+                result["model"] = choice.model
+                cost *= self.model_router.cost_multiplier(choice.model, self.registry.get_worker(task.worker_id))
+                self.model_router.record_outcome(
+                    choice.model, task.worker_id, task_result.duration_seconds, result.get("confidence")
+                )
+            if task_result.success:
+                result = self._apply_knowledge(state, task.worker_id, result, known_sources[task.worker_id])
+            # Store large payloads out-of-line; state keeps only references
+            result = self.blob_store.offload(result, owner=self._channel(state, plan.plan_id))
+            if task_result.success:
+                task.mark_completed(result, cost)
+                state.add_cost(task.worker_id, cost)
+                state.completed_tasks.append(task_result.model_copy(update={"output": result, "cost": cost}))
+            else:
+                task.mark_failed(task_result.error or "Remote worker failed")
+                state.failed_tasks.append(task)
+                state.add_error(f"{task.worker_id}: {task.error}")
+            task.duration_seconds = task_result.duration_seconds
+            self.metrics_store.record(
+                task.worker_id, task_result.duration_seconds, cost,
+                success=task_result.success,
+                confidence=(task_result.output or {}).get("confidence"),
+            )
+            state.all_tasks.append(task)
+            remote_results[task.worker_id] = result
+        
+        if tasks:
+            # Late replies recreate the stream; the queue expires it
+            self.task_queue.delete_reply_stream(reply_to)
+        
+        return [local_results.get(w) or remote_results[w] for w in worker_ids]
+    
     def _create_mock_result(
         self,
         state: AgentState,
         worker_def: Any,
-        phase: str
+        phase: str,
+        context: Optional[List[Dict[str, Any]]] = None,
+        max_results: Optional[int] = None
         ) -> Dict[str, Any]:
         
         """
@@ -273,64 +538,285 @@ class OrchestratorAgent:
             state: Current state
             worker_def: Worker definition
             phase: Current phase
+            context: Retrieved source chunks (evidence workers only)
+            max_results: Sources a research worker asks for (None = default)
             
         Returns:
             Mock result
         """
-        topic = state.brief.topic
+        return self.executor.create_result(worker_def, phase, state.brief, context, max_results)
+    
+    def _route_model(self, state: AgentState, worker_def: Any, plan_id: str) -> Optional[Any]:
+        """
+        Pick the model for a worker call.
         
-        if phase == "research":
-            return {
-                "status": "success",
-                "worker_id": worker_def.id,  # ← CHANGED: worker_id → id
-                "sources": [
-                    f"Source 1 about {topic}",
-                    f"Source 2 about {topic}",
-                    f"Source 3 about {topic}",
-                ],
-                "summary": f"Research findings about {topic}...",
-                "confidence": 0.85,
-            }
+        The router sees what the request has spent so far and how many
+        worker calls remain, so it can downgrade late calls to stay
+        within the brief's budget and deadline.
         
-        elif phase == "analysis":
-            return {
-                "status": "success",
-                "worker_id": worker_def.id,  # ← CHANGED
-                "key_insights": [
-                    f"Insight 1 about {topic}",
-                    f"Insight 2 about {topic}",
-                ],
-                "themes": ["theme1", "theme2"],
-                "confidence": 0.88,
-            }
+        Args:
+            state: Current state
+            worker_def: Worker about to run
+            plan_id: Current plan ID
+            
+        Returns:
+            ModelChoice, or None when routing is disabled
+        """
+        if self.model_router is None:
+            return None
+        choice = self.model_router.route(
+            worker_def,
+            state.brief,
+            spent_cost=state.total_cost,
+            elapsed_seconds=(datetime.utcnow() - state.started_at).total_seconds(),
+            remaining_workers=self._remaining_workers.get(plan_id, 1),
+        )
+        print(f"         model: {choice.model} ({choice.reason})")
+        return choice
+    
+    def _stream_worker(
+        self,
+        state: AgentState,
+        worker_def: Any,
+        phase: str,
+        context: Optional[List[Dict[str, Any]]],
+        plan_id: str
+    ) -> Dict[str, Any]:
+        """
+        Run a worker whose output is streamed as it is written.
         
-        elif phase == "writing":
-            return {
-                "status": "success",
-                "worker_id": worker_def.id,  # ← CHANGED
-                "content": f"Article content about {topic}...",
-                "word_count": state.brief.target_length or 2000,
-                "sections": ["Introduction", "Main Content", "Conclusion"],
-            }
+        Each text delta is appended to state.partial_outputs and
+        published as a "partial_output" event, so the UI and downstream
+        consumers see the draft before the worker finishes.
         
-        elif phase == "quality":
-            return {
-                "status": "success",
-                "worker_id": worker_def.id,  # ← CHANGED
-                "quality_score": 88.0,
-                "issues_found": 2,
-                "suggestions": [
-                    "Add more examples",
-                    "Improve transitions"
-                ],
-            }
+        Args:
+            state: Current state
+            worker_def: Worker definition
+            phase: Current phase
+            context: Source context for the worker
+            plan_id: Current plan ID
+            
+        Returns:
+            Worker result
+        """
+        channel = self._channel(state, plan_id)
         
-        else:
-            return {
-                "status": "success",
-                "worker_id": worker_def.id,  # ← CHANGED
-                "result": f"Result from {phase}",
-            }
+        def on_text(text: str) -> None:
+            state.append_partial_output(worker_def.id, text)
+            self.event_stream.publish(channel, "partial_output", {
+                "worker_id": worker_def.id,
+                "phase": phase,
+                "text": text,
+            })
+        
+        return self.executor.stream_result(worker_def, phase, state.brief, context, on_text)
+    
+    def _channel(self, state: AgentState, plan_id: str) -> str:
+        """Event stream channel for a run."""
+        return state.brief.request_id or plan_id
+    
+    def _query_knowledge_base(
+        self,
+        state: AgentState,
+        worker_id: str,
+        phase: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up fresh sources for a research worker.
+        
+        Args:
+            state: Current state
+            worker_id: Research worker about to run
+            phase: Current phase
+            
+        Returns:
+            Fresh relevant sources, or None if the worker isn't a
+            source-producing research worker or the KB is disabled
+        """
+        source_type = WORKER_SOURCE_TYPES.get(worker_id)
+        if self.knowledge_base is None or phase != "research" or source_type is None:
+            return None
+        query = " ".join([state.brief.topic] + state.brief.key_points)
+        return self.knowledge_base.query(query, k=self.kb_min_sources, source_type=source_type)
+    
+    def _research_depth(self, known: Optional[List[Dict[str, Any]]]) -> Optional[int]:
+        """
+        Sources a research worker should ask its provider for.
+        
+        With partial knowledge base coverage only the missing sources
+        are fetched, so the call costs a fraction of a full one.
+        
+        Args:
+            known: Sources the knowledge base already had (None = not applicable)
+            
+        Returns:
+            Gap to kb_min_sources, or None for a full-depth call
+        """
+        if not known:
+            return None
+        return max(1, self.kb_min_sources - len(known))
+    
+    def _knowledge_base_result(self, worker_id: str, known: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build a research result entirely from knowledge base sources.
+        
+        Args:
+            worker_id: Research worker
+            known: Sources from the knowledge base
+            
+        Returns:
+            Result in the research worker output shape
+        """
+        return {
+            "status": "success",
+            "worker_id": worker_id,
+            "sources": [self._kb_source(s) for s in known],
+            "summary": f"{len(known)} sources from knowledge base",
+            "confidence": round(sum(s["score"] for s in known) / len(known), 2),
+            "from_knowledge_base": True,
+        }
+    
+    def _apply_knowledge(
+        self,
+        state: AgentState,
+        worker_id: str,
+        result: Dict[str, Any],
+        known: Optional[List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Store freshly fetched sources and merge them with known ones.
+        
+        New sources go into the knowledge base. With partial coverage
+        the worker was only asked for the missing sources (see
+        _research_depth()), so the result is the known sources plus
+        the new ones that aren't duplicates of them.
+        
+        Args:
+            state: Current state
+            worker_id: Research worker that ran
+            result: Worker result
+            known: Sources the knowledge base already had (None = not applicable)
+            
+        Returns:
+            Result with merged sources
+        """
+        if known is None or result.get("status") != "success":
+            return result
+        
+        fetched = result.get("sources", [])
+        self.knowledge_base.add_sources(
+            fetched, source_type=WORKER_SOURCE_TYPES[worker_id], worker_id=worker_id, topic=state.brief.topic
+        )
+        if not known:
+            return result
+        
+        known_texts = {s["content"] for s in known}
+        gap = [s for s in fetched if source_content(s) not in known_texts]
+        return {**result, "sources": [self._kb_source(s) for s in known] + gap}
+    
+    def _kb_source(self, source: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a knowledge base row to a worker source dict."""
+        return {
+            "title": source["title"],
+            "url": source["url"],
+            "content": source["content"],
+            "source_type": source["source_type"],
+        }
+    
+    def _index_sources(self, state: AgentState, plan: Plan) -> None:
+        """
+        Index research sources for evidence retrieval.
+        
+        Args:
+            state: State with research results
+            plan: Current plan
+        """
+        sources = self.blob_store.resolve_deep(state.research_results.get("all_sources", []))
+        retriever = self._retrievers.setdefault(plan.plan_id, SourceRetriever())
+        indexed = retriever.index_sources(sources)
+        passages = self._evidence_indexes.setdefault(plan.plan_id, EvidenceIndex()).add_sources(sources)
+        print(f"   🔎 Indexed {indexed} source chunks, {passages} evidence passages")
+    
+    def _build_context(
+        self,
+        state: AgentState,
+        worker_id: str,
+        plan_id: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Build the source context a worker receives.
+        
+        The synthesizer gets the top-k chunks for the topic and key
+        points. The fact checker and citation manager get the top
+        passages for each claim in the draft. Other workers with an
+        input-token budget get research packed into that budget.
+        
+        Args:
+            state: Current state
+            worker_id: Worker about to run
+            plan_id: Current plan ID
+            
+        Returns:
+            Ranked chunks (claim workers: tagged with their claim), or
+            None if the worker takes no source context
+        """
+        if worker_id in CLAIM_WORKERS and plan_id in self._evidence_indexes:
+            drafts = [
+                self.blob_store.resolve(r.get("content"))
+                for r in state.writing_results.get("results", [])
+                if r.get("content")
+            ]
+            content = " ".join(str(d) for d in drafts if d) or state.brief.topic
+            return [
+                {**passage, "claim": item["claim"], "chunk_id": passage["passage_id"]}
+                for item in self._evidence_indexes[plan_id].evidence_for(content, self.evidence_per_claim)
+                for passage in item["passages"]
+            ]
+        
+        retriever = self._retrievers.get(plan_id)
+        if worker_id in EVIDENCE_WORKERS and retriever is not None:
+            query = " ".join([state.brief.topic] + state.brief.key_points)
+            return retriever.retrieve(query, k=self.evidence_top_k)
+        
+        worker_def = self.registry.get_worker(worker_id)
+        if worker_def and worker_def.max_input_tokens and state.research_results:
+            return self._pack_research(state, plan_id, worker_def.max_input_tokens)
+        
+        return None
+    
+    def _pack_research(self, state: AgentState, plan_id: str, max_input_tokens: int) -> List[Dict[str, Any]]:
+        """
+        Pack research sources into a worker's input budget.
+        
+        Chunks are scored against the outline: topic, key points and
+        the analysis phase's insights and themes.
+        
+        Args:
+            state: Current state
+            plan_id: Current plan ID (its retriever's indexes are reused)
+            max_input_tokens: Worker input budget
+            
+        Returns:
+            Selected chunks, best first
+        """
+        outline = [state.brief.topic] + list(state.brief.key_points)
+        for result in state.analysis_results.get("results", []):
+            outline.extend(str(i) for i in result.get("key_insights", []))
+            outline.extend(str(t) for t in result.get("themes", []))
+        
+        # Reuse the plan's indexed chunks; only runs without one re-chunk
+        retriever = self._retrievers.get(plan_id)
+        sources = [] if retriever is not None else self.blob_store.resolve_deep(
+            state.research_results.get("all_sources", [])
+        )
+        packed = self.context_packer.pack(
+            sources, outline, max(0, max_input_tokens - PROMPT_RESERVE_TOKENS), retriever
+        )
+        print(
+            f"      📦 Packed {len(packed.chunks)}/{packed.candidate_chunks} chunks "
+            f"({packed.tokens_used}/{packed.budget_tokens} tokens)"
+        )
+        return packed.chunks
     
     def _aggregate_results(self, results: List[Dict[str, Any]], phase: str) -> Dict[str, Any]:
         """
@@ -360,8 +846,10 @@ class OrchestratorAgent:
             all_sources = []
             for r in successful:
                 all_sources.extend(r.get("sources", []))
-            aggregated["all_sources"] = all_sources
-            aggregated["total_sources"] = len(all_sources)
+            unique_sources = self._dedupe_sources(all_sources)
+            aggregated["all_sources"] = unique_sources
+            aggregated["total_sources"] = len(unique_sources)
+            aggregated["duplicates_removed"] = len(all_sources) - len(unique_sources)
         
         elif phase == "quality":
             scores = [r.get("quality_score", 0) for r in successful]
@@ -369,6 +857,29 @@ class OrchestratorAgent:
         
         return aggregated
     
+    def _dedupe_sources(self, sources: List[Any]) -> List[Any]:
+        """
+        Drop sources that duplicate an earlier one.
+        
+        Matches canonical URLs, identical content and near-duplicate
+        content (MinHash/LSH), so each document is scraped, summarized
+        and cited once.
+        
+        Args:
+            sources: Sources from all research workers (may hold blob refs)
+            
+        Returns:
+            Unique sources, first occurrence kept
+        """
+        deduplicator = SourceDeduplicator()
+        unique = []
+        for position, source in enumerate(sources):
+            resolved = self.blob_store.resolve_deep(source)
+            url = resolved.get("url") if isinstance(resolved, dict) else None
+            if deduplicator.check(str(position), source_text(resolved), url) is None:
+                unique.append(source)
+        return unique
+    
     def _update_state_with_results(
         self,
         state: AgentState,
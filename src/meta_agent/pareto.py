@@ -0,0 +1,133 @@
+"""
+Pareto Plans - Cost / latency / quality trade-offs for one brief.
+
+A single optimized plan serves one trade-off. Product tiers want the
+fastest, the cheapest and the best plan for the same brief, so the
+strategy enumerates candidate plans and keeps the Pareto front: plans no
+other plan beats on cost, makespan and quality at once.
+
+Candidates are combined step by step. Each step's variants are pruned
+to their own front first, and partial plans are pruned again after every
+step, with cost, time and quality summed along the way. Summed time is
+exact for the planner's chained steps; final candidates are re-scored
+with the real makespan before the last pruning.
+"""
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+# Tiers callers can pick
+FASTEST = "fastest"
+CHEAPEST = "cheapest"
+BEST = "best"
+TIERS = (FASTEST, CHEAPEST, BEST)
+
+# Partial plans kept between steps
+MAX_PARTIAL_PLANS = 2000
+
+# (cost, time, quality, item)
+Scored = Tuple[float, float, float, Any]
+
+
+class PlanCandidate:
+    """A plan with its estimated cost, makespan and quality."""
+
+    __slots__ = ("plan", "cost", "makespan", "quality")
+
+    def __init__(self, plan: Any, cost: float, makespan: float, quality: float):
+        self.plan = plan
+        self.cost = cost
+        self.makespan = makespan
+        self.quality = quality
+
+    def __repr__(self) -> str:
+        return f"PlanCandidate(cost=${self.cost:.3f}, makespan={self.makespan:.0f}s, quality={self.quality:.2f})"
+
+
+def pareto_front(items: Sequence[Scored]) -> List[Scored]:
+    """
+    Items not dominated on (lower cost, lower time, higher quality).
+
+    Exact duplicates keep their first occurrence.
+
+    Args:
+        items: (cost, time, quality, item) tuples
+
+    Returns:
+        Non-dominated items, by ascending cost
+    """
+    ordered = sorted(items, key=lambda entry: (entry[0], entry[1], -entry[2]))
+    front: List[Scored] = []
+    for entry in ordered:
+        cost, time, quality, _ = entry
+        # Everything kept so far costs no more than this entry
+        if not any(kept[1] <= time and kept[2] >= quality for kept in front):
+            front.append(entry)
+    return front
+
+
+def combine_steps(
+    step_options: Sequence[Sequence[Scored]],
+    max_partial: int = MAX_PARTIAL_PLANS,
+) -> List[Tuple[float, float, float, List[Any]]]:
+    """
+    Pareto-optimal combinations of one option per step.
+
+    Args:
+        step_options: Per step, its (cost, time, quality, option) variants
+        max_partial: Partial plans kept between steps; beyond this the
+            front is thinned evenly by cost
+
+    Returns:
+        (summed cost, summed time, summed quality, options per step)
+    """
+    partial: List[Tuple[float, float, float, List[Any]]] = [(0.0, 0.0, 0.0, [])]
+    for options in step_options:
+        options = pareto_front(options)
+        combined = [
+            (cost + o_cost, time + o_time, quality + o_quality, chosen + [option])
+            for cost, time, quality, chosen in partial
+            for o_cost, o_time, o_quality, option in options
+        ]
+        partial = pareto_front(combined)
+        if len(partial) > max_partial:
+            stride = len(partial) / max_partial
+            partial = [partial[int(i * stride)] for i in range(max_partial)]
+    return partial
+
+
+def pick_tier(
+    candidates: Sequence[PlanCandidate],
+    tier: str,
+    max_cost: float = float("inf"),
+    max_time: float = float("inf"),
+) -> PlanCandidate:
+    """
+    Pick a candidate for a product tier.
+
+    Candidates within the limits are preferred; if none fit, the tier
+    is picked from all of them.
+
+    Args:
+        candidates: Plan candidates (non-empty)
+        tier: FASTEST, CHEAPEST or BEST
+        max_cost: Budget limit
+        max_time: Time limit (seconds)
+
+    Returns:
+        Fastest (then best, cheapest), cheapest (then best, fastest) or
+        best (then fastest, cheapest) candidate
+
+    Raises:
+        ValueError: If the tier is unknown
+    """
+    keys: Dict[str, Callable[[PlanCandidate], Tuple]] = {
+        FASTEST: lambda c: (c.makespan, -c.quality, c.cost),
+        CHEAPEST: lambda c: (c.cost, -c.quality, c.makespan),
+        BEST: lambda c: (-c.quality, c.makespan, c.cost),
+    }
+    if tier not in keys:
+        raise ValueError(f"Unknown tier: {tier}. Choose from {', '.join(TIERS)}")
+
+    fitting = [c for c in candidates if c.cost <= max_cost and c.makespan <= max_time]
+    return min(fitting or candidates, key=keys[tier])
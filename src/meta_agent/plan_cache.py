@@ -0,0 +1,214 @@
+"""
+Plan Cache - Reuse optimized plans across briefs of the same shape.
+
+Planning (brief analysis, worker selection, step layout) and strategy
+optimization depend only on a handful of brief features, not on the
+topic text. Briefs with the same shape get the same optimized plan, so
+it is built once and cloned for every later brief of that shape.
+
+Shape:
+- content type, target-length bucket, key point count (capped), whether
+  sources are given and the topic is long
+- fact-checking / SEO flags
+- budget class and time class
+
+Budget and time classes are ranges, so a cached plan is only served if
+its estimates fit the brief's actual budget and deadline. Entries also
+record the registry's estimates_version(); registering or unregistering
+workers, or learning from an execution, turns them into misses.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import bisect
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from src.meta_agent.schemas import Brief, BriefAnalysis, Plan
+from config.worker_registry import WorkerRegistry, get_worker_registry
+
+
+# Upper bounds of the budget (USD) and time (seconds) classes
+BUDGET_CLASSES = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
+TIME_CLASSES = (120, 300, 600, 1200, 3600)
+
+# Key point counts above this share a shape
+MAX_KEY_POINTS = 4
+
+# Topics longer than this plan as more complex
+LONG_TOPIC_CHARS = 50
+
+
+def brief_shape(brief: Brief, length_bucket: int = 1000) -> Tuple:
+    """
+    Features of a brief that planning depends on.
+
+    Args:
+        brief: User brief
+        length_bucket: Target-length granularity (words); buckets are
+            (n*bucket, (n+1)*bucket], so e.g. 3000 and 3001 differ
+
+    Returns:
+        Hashable shape
+    """
+    max_budget = brief.max_budget if brief.max_budget is not None else float("inf")
+    max_time = brief.max_time_seconds if brief.max_time_seconds is not None else float("inf")
+    return (
+        getattr(brief.content_type, "value", brief.content_type),
+        (brief.target_length - 1) // length_bucket if brief.target_length else None,
+        min(len(brief.key_points), MAX_KEY_POINTS),
+        bool(brief.sources_to_include),
+        len(brief.topic) > LONG_TOPIC_CHARS,
+        brief.enable_fact_checking,
+        brief.enable_seo_optimization,
+        bisect.bisect_left(BUDGET_CLASSES, max_budget),
+        bisect.bisect_left(TIME_CLASSES, max_time),
+    )
+
+
+def clone_plan(plan: Plan, **update: Any) -> Plan:
+    """
+    Copy a plan for reuse.
+
+    Steps are shallow-copied with fresh lists; everything else in a
+    fresh plan is immutable, so this is much cheaper than deepcopy.
+
+    Args:
+        plan: Plan to copy
+        **update: Fields to override (plan_id, brief_id, ...)
+
+    Returns:
+        Independent plan
+    """
+    steps = [
+        step.model_copy(update={"worker_ids": list(step.worker_ids), "depends_on": list(step.depends_on)})
+        for step in plan.steps
+    ]
+    return plan.model_copy(update={"steps": steps, **update})
+
+
+class PlanCache:
+    """
+    LRU cache of optimized plans by brief shape.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        length_bucket: int = 1000,
+        registry: Optional[WorkerRegistry] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Shapes kept before LRU eviction
+            length_bucket: Target-length granularity of shapes (words)
+            registry: Worker registry plans are estimated from (default:
+                global registry)
+        """
+        self.max_entries = max_entries
+        self.length_bucket = length_bucket
+        self.registry = registry or get_worker_registry()
+        self._entries: "OrderedDict[Tuple, Tuple[Plan, BriefAnalysis, Tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "rejected": 0, "stale": 0}
+        self._by_content_type: Dict[str, Dict[str, int]] = {}
+
+    def get(self, brief: Brief, plan_id: str) -> Optional[Tuple[Plan, BriefAnalysis]]:
+        """
+        Look up a plan for a brief's shape.
+
+        Args:
+            brief: User brief
+            plan_id: ID for the cloned plan
+
+        Returns:
+            (cloned plan, analysis) or None on a miss, if worker
+            estimates changed since the plan was cached, or if it does
+            not fit the brief's budget/deadline
+        """
+        shape = brief_shape(brief, self.length_bucket)
+        version = self.registry.estimates_version()
+        with self._lock:
+            entry = self._entries.get(shape)
+            if entry is not None and entry[2] != version:
+                del self._entries[shape]
+                self.stats["stale"] += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(shape)
+
+        if entry is not None and not self._fits(entry[0], brief):
+            self.stats["rejected"] += 1
+            entry = None
+        self._count(shape[0], entry is not None)
+        if entry is None:
+            return None
+
+        plan, analysis, _ = entry
+        brief_id = brief.request_id or "unknown"
+        return (
+            clone_plan(plan, plan_id=plan_id, brief_id=brief_id, created_at=datetime.utcnow()),
+            analysis.model_copy(update={"brief_id": brief_id, "sub_topics": brief.key_points[:3]}),
+        )
+
+    def put(self, brief: Brief, plan: Plan, analysis: BriefAnalysis) -> None:
+        """
+        Store an optimized plan for a brief's shape.
+
+        Args:
+            brief: Brief the plan was built for
+            plan: Optimized plan (copied, so later execution cannot change it)
+            analysis: Brief analysis behind the plan
+        """
+        shape = brief_shape(brief, self.length_bucket)
+        version = self.registry.estimates_version()
+        with self._lock:
+            self._entries[shape] = (clone_plan(plan), analysis.model_copy(), version)
+            self._entries.move_to_end(shape)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all plans."""
+        with self._lock:
+            self._entries.clear()
+
+    def _fits(self, plan: Plan, brief: Brief) -> bool:
+        """Check a cached plan's estimates against the brief's limits."""
+        return (
+            (brief.max_budget is None or plan.estimated_total_cost <= brief.max_budget)
+            and (brief.max_time_seconds is None or plan.estimated_total_time <= brief.max_time_seconds)
+        )
+
+    def _count(self, content_type: str, hit: bool) -> None:
+        self.stats["hits" if hit else "misses"] += 1
+        counts = self._by_content_type.setdefault(content_type, {"hits": 0, "misses": 0})
+        counts["hits" if hit else "misses"] += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit/miss counters, overall and per-content-type hit
+            rates, and entry count
+        """
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "hit_rate_by_content_type": {
+                content_type: counts["hits"] / (counts["hits"] + counts["misses"])
+                for content_type, counts in self._by_content_type.items()
+            },
+        }
@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import math
 import uuid
 
 from src.meta_agent.schemas import (
@@ -27,7 +28,15 @@ from src.meta_agent.schemas import (
     StepStatus,
     AgentState,
 )
+from src.meta_agent.plan_cache import PlanCache
+from src.meta_agent.strategy import get_strategy
 from config.worker_registry import get_worker_registry
+from config.settings import get_settings
+from src.tools.llm.token_counter import get_token_counter
+
+
+# Tokens of one research source as seen by the writer
+SOURCE_TOKENS = 400
 
 
 class PlannerAgent:
@@ -39,9 +48,19 @@ class PlannerAgent:
     them into steps.
     """
     
-    def __init__(self):
-        """Initialize planner."""
+    def __init__(self, plan_cache: Optional[PlanCache] = None):
+        """
+        Initialize planner.
+        
+        Args:
+            plan_cache: Cache of optimized plans by brief shape (default:
+                from settings, None when disabled)
+        """
         self.registry = get_worker_registry()
+        settings = get_settings()
+        if plan_cache is None and settings.plan_cache_enabled:
+            plan_cache = PlanCache(max_entries=settings.plan_cache_size, registry=self.registry)
+        self.plan_cache = plan_cache
         self.plan_count = 0
     
     def create_plan(self, state: AgentState) -> Plan:
@@ -103,6 +122,37 @@ class PlannerAgent:
         
         return plan
     
+    def create_optimized_plan(self, state: AgentState, strategy: Any = None) -> Plan:
+        """
+        Create a strategy-optimized plan, reusing one for the same brief shape.
+        
+        Args:
+            state: Current workflow state
+            strategy: Strategy agent (default: global strategy)
+            
+        Returns:
+            Optimized execution plan
+        """
+        brief = state.brief
+        if self.plan_cache is not None:
+            cached = self.plan_cache.get(brief, self._generate_plan_id())
+            if cached is not None:
+                plan, analysis = cached
+                state.brief_analysis = analysis.model_copy(update={
+                    "estimated_cost": self._estimate_brief_cost(
+                        brief, analysis.estimated_research_depth, len(analysis.recommended_workers)
+                    ),
+                })
+                print(f"📝 Planner: Reusing cached plan ({plan.total_steps} steps) as {plan.plan_id}")
+                return plan
+        
+        strategy = strategy or get_strategy()
+        plan = strategy.optimize_plan(state, self.create_plan(state))
+        
+        if self.plan_cache is not None:
+            self.plan_cache.put(brief, plan, state.brief_analysis)
+        return plan
+    
     def create_replan(
         self,
         state: AgentState,
@@ -175,6 +225,13 @@ class PlannerAgent:
         # Determine if multi-hop needed
         requires_multi_hop = complexity > 0.7 or len(brief.key_points) > 3
         
+        recommended_workers = [
+            "web_search_worker",
+            "article_writer_worker",
+            "fact_checker_worker"
+        ]
+        estimated_cost = self._estimate_brief_cost(brief, research_depth, len(recommended_workers))
+        
         analysis = BriefAnalysis(
             brief_id=brief.request_id or "unknown",
             complexity_score=complexity,
@@ -186,22 +243,45 @@ class PlannerAgent:
                 "content_generation",
                 "fact_check"
             ],
-            recommended_workers=[
-                "web_search_worker",
-                "article_writer_worker",
-                "fact_checker_worker"
-            ],
+            recommended_workers=recommended_workers,
             recommended_approach="Standard research → write → verify workflow",
-            estimated_cost=0.15,
+            estimated_cost=estimated_cost,
             estimated_time_seconds=120,
         )
         
         print(f"   Complexity: {complexity:.2f}")
         print(f"   Research depth: {research_depth} sources")
         print(f"   Multi-hop: {requires_multi_hop}")
+        print(f"   Estimated cost: ${estimated_cost:.4f}")
         
         return analysis
     
+    def _estimate_brief_cost(self, brief: Brief, research_depth: int, worker_calls: int) -> float:
+        """
+        Estimate LLM cost of a brief from token counts.
+        
+        Every worker call reads the brief; the writer also reads the
+        research (SOURCE_TOKENS per source) and the fact checker reads
+        the draft back.
+        
+        Args:
+            brief: User brief
+            research_depth: Number of sources to research
+            worker_calls: Number of LLM-backed worker calls
+            
+        Returns:
+            Estimated cost in USD
+        """
+        counter = get_token_counter()
+        brief_tokens = counter.count(
+            "\n".join([brief.topic, brief.target_audience or "", *brief.key_points, *brief.keywords])
+        )
+        draft_tokens = counter.tokens_for_words(brief.target_length or 2000)
+        
+        input_tokens = worker_calls * brief_tokens + research_depth * SOURCE_TOKENS + draft_tokens
+        output_tokens = draft_tokens
+        return round(counter.estimate_cost(input_tokens, output_tokens, get_settings().llm_model), 4)
+    
     def _select_workers(
         self,
         brief: Brief,
@@ -366,24 +446,17 @@ class PlannerAgent:
         Returns:
             Plan step
         """
-        # Calculate estimates from workers
-        total_cost = 0.0
-        total_time = 0
-        
-        for worker_id in worker_ids:
-            worker_def = self.registry.get_worker(worker_id)
-            if worker_def:
-                total_cost += worker_def.estimated_cost
-                total_time += worker_def.estimated_time_seconds
+        # Calculate estimates from workers (learned once observed)
+        known = [wid for wid in worker_ids if self.registry.get_worker(wid)]
+        total_cost = self.registry.estimate_total_cost(known)
+        times = [self.registry.estimate_worker_time(wid) for wid in known]
         
         # If parallel, time is max not sum
         if execution_mode == ExecutionMode.PARALLEL and len(worker_ids) > 1:
-            times = []
-            for worker_id in worker_ids:
-                worker_def = self.registry.get_worker(worker_id)
-                if worker_def:
-                    times.append(worker_def.estimated_time_seconds)
-            total_time = max(times) if times else total_time
+            total_time = max(times, default=0.0)
+        else:
+            total_time = sum(times)
+        total_time = max(1, math.ceil(total_time))
         
         return PlanStep(
             step_id=step_id,
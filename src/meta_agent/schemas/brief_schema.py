@@ -3,6 +3,9 @@ Brief Schema - User input structure.
 Represents the user's request/brief for content generation.
 """
 
+import hashlib
+import json
+import re
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -103,6 +106,41 @@ class Brief(BaseModel):
         """Remove empty key points."""
         return [kp.strip() for kp in v if kp.strip()]
     
+    def fingerprint(self, length_bucket: int = 1) -> str:
+        """
+        Canonical hash of what the brief asks for.
+        
+        Briefs differing only in case, whitespace, list order or metadata
+        (user, request ID, timestamp, budget and time limits) get the same
+        fingerprint, so concurrent duplicates can share one execution.
+        
+        Args:
+            length_bucket: Word-count granularity; target lengths in the
+                same bucket fingerprint alike (1 = exact length)
+        
+        Returns:
+            Hex SHA-256 digest
+        """
+        def norm(text: Optional[str]) -> str:
+            return re.sub(r"\s+", " ", (text or "").strip().lower())
+        
+        canonical = {
+            "topic": norm(self.topic),
+            "content_type": getattr(self.content_type, "value", self.content_type),
+            "target_length": (
+                self.target_length // length_bucket * length_bucket if self.target_length else None
+            ),
+            "tone": getattr(self.tone, "value", self.tone),
+            "target_audience": norm(self.target_audience),
+            "key_points": sorted({norm(kp) for kp in self.key_points}),
+            "sources_to_include": sorted({s.strip() for s in self.sources_to_include}),
+            "keywords": sorted({norm(kw) for kw in self.keywords}),
+            "enable_fact_checking": self.enable_fact_checking,
+            "enable_seo_optimization": self.enable_seo_optimization,
+            "citation_style": norm(self.citation_style),
+        }
+        return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+    
     class Config:
         use_enum_values = True
 
@@ -101,6 +101,10 @@ class AgentState(BaseModel):
         default_factory=dict,
         description="Results from quality workers"
     )
+    partial_outputs: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Text streamed so far by each worker (cleared when it completes)"
+    )
     
     # =========================================================================
     # EVALUATION & FEEDBACK
@@ -195,6 +199,10 @@ class AgentState(BaseModel):
         else:
             self.cost_by_worker[worker_id] = cost
     
+    def append_partial_output(self, worker_id: str, text: str) -> None:
+        """Append streamed text for a worker."""
+        self.partial_outputs[worker_id] = self.partial_outputs.get(worker_id, "") + text
+    
     def add_error(self, error: str) -> None:
         """Add an error."""
         self.errors.append(f"[{datetime.utcnow().isoformat()}] {error}")
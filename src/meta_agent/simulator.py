@@ -0,0 +1,245 @@
+"""
+Plan Simulator - Monte Carlo latency and cost of a plan.
+
+Point estimates hide variance: a plan whose mean fits the deadline can
+still miss it one run in five. The simulator replays a plan thousands
+of times with worker latencies and costs drawn from their distributions
+and reports percentiles, so planner/strategy rule changes can be judged
+on p50/p95 before they ship.
+
+Each replay is a discrete-event simulation of the task graph (see
+critical_path.worker_tasks), scheduled like critical_path.makespan:
+whenever a slot frees up, it takes the ready worker run with the
+longest remaining path, so a slot only idles when nothing is ready.
+Which runs are ready depends on each replay's sampled latencies, so
+the dispatch order differs between replays. All replays advance
+together as NumPy arrays, one dispatch at a time.
+
+Worker distributions, in order of preference:
+- given explicitly
+- learned histograms from the metrics store
+- lognormal around the registry's static estimate
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.meta_agent.schemas import Plan
+from src.meta_agent.critical_path import worker_tasks
+from src.meta_agent.metrics_store import Histogram
+from config.worker_registry import WorkerRegistry, get_worker_registry
+from config.settings import get_settings
+
+
+# Draws n samples from a distribution
+Sampler = Callable[[np.random.Generator, int], np.ndarray]
+
+# Spread (lognormal sigma) assumed around static estimates
+DEFAULT_SPREAD = 0.25
+
+# Percentiles reported by simulate()
+PERCENTILES = (50, 90, 95, 99)
+
+
+def lognormal_sampler(mean: float, sigma: float = DEFAULT_SPREAD) -> Sampler:
+    """
+    Lognormal distribution with a given mean.
+
+    Args:
+        mean: Mean of the distribution
+        sigma: Standard deviation of the underlying normal
+
+    Returns:
+        Sampler
+    """
+    if mean <= 0:
+        return lambda rng, n: np.zeros(n)
+    mu = np.log(mean) - sigma ** 2 / 2
+    return lambda rng, n: rng.lognormal(mu, sigma, n)
+
+
+def histogram_sampler(histogram: Histogram) -> Sampler:
+    """
+    Distribution of a fixed-bucket histogram.
+
+    Picks a bucket by its count, then a uniform value inside the bucket,
+    clamped to the observed min/max.
+
+    Args:
+        histogram: Non-empty histogram
+
+    Returns:
+        Sampler
+    """
+    counts = np.asarray(histogram.counts, dtype=float)
+    bounds = np.asarray(histogram.bounds, dtype=float)
+    lower = np.clip(np.concatenate(([0.0], bounds)), histogram.min, histogram.max)
+    upper = np.clip(np.concatenate((bounds, [histogram.max])), histogram.min, histogram.max)
+    probabilities = counts / counts.sum()
+
+    def sample(rng: np.random.Generator, n: int) -> np.ndarray:
+        buckets = rng.choice(len(counts), size=n, p=probabilities)
+        return rng.uniform(lower[buckets], upper[buckets])
+
+    return sample
+
+
+class WorkerDistribution:
+    """Latency (seconds) and cost (USD) distribution of one worker."""
+
+    __slots__ = ("latency", "cost")
+
+    def __init__(self, latency: Sampler, cost: Sampler):
+        self.latency = latency
+        self.cost = cost
+
+    @classmethod
+    def fixed(cls, latency: float, cost: float) -> "WorkerDistribution":
+        """Distribution that always takes the same time and cost."""
+        return cls(lambda rng, n: np.full(n, float(latency)), lambda rng, n: np.full(n, float(cost)))
+
+
+class PlanSimulator:
+    """
+    Monte Carlo simulator of plan latency and cost.
+    """
+
+    def __init__(
+        self,
+        distributions: Optional[Dict[str, WorkerDistribution]] = None,
+        max_concurrency: Optional[int] = None,
+        runs: Optional[int] = None,
+        spread: float = DEFAULT_SPREAD,
+        seed: Optional[int] = None,
+        registry: Optional[WorkerRegistry] = None,
+    ):
+        """
+        Initialize simulator.
+
+        Args:
+            distributions: Worker distributions overriding learned/static ones
+            max_concurrency: Worker runs allowed at once (default: from settings)
+            runs: Replays per simulation (default: from settings)
+            spread: Lognormal sigma around static estimates
+            seed: Random seed (same seed, same percentiles)
+            registry: Worker registry (default: global registry)
+        """
+        settings = get_settings()
+        self.distributions = dict(distributions or {})
+        self.max_concurrency = max_concurrency or settings.max_concurrent_tasks
+        self.runs = runs or settings.simulation_runs
+        self.spread = spread
+        self.seed = seed
+        self.registry = registry or get_worker_registry()
+
+    def distribution(self, worker_id: str) -> WorkerDistribution:
+        """
+        Distribution used for a worker.
+
+        Args:
+            worker_id: Worker ID
+
+        Returns:
+            Explicit, learned or static-estimate distribution (zero
+            latency and cost for unregistered workers)
+        """
+        if worker_id in self.distributions:
+            return self.distributions[worker_id]
+
+        worker = self.registry.get_worker(worker_id)
+        if worker is None:
+            return WorkerDistribution.fixed(0.0, 0.0)
+
+        store = self.registry.metrics_store
+        learned = store.histograms(worker_id) if store is not None else None
+        if learned is not None:
+            latency, cost = learned
+            return WorkerDistribution(histogram_sampler(latency), histogram_sampler(cost))
+
+        return WorkerDistribution(
+            lognormal_sampler(worker.estimated_time_seconds, self.spread),
+            lognormal_sampler(worker.estimated_cost, self.spread),
+        )
+
+    def sample(self, plan: Plan, runs: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Replay a plan.
+
+        Args:
+            plan: Plan to simulate
+            runs: Replays (default: self.runs)
+
+        Returns:
+            (makespan per replay, total cost per replay)
+        """
+        runs = runs or self.runs
+        rng = np.random.default_rng(self.seed)
+        worker_ids, predecessors = worker_tasks(plan.steps)
+        if not worker_ids:
+            return np.zeros(runs), np.zeros(runs)
+
+        distributions = {wid: self.distribution(wid) for wid in set(worker_ids)}
+        latency = np.column_stack([distributions[wid].latency(rng, runs) for wid in worker_ids])
+        cost = np.column_stack([distributions[wid].cost(rng, runs) for wid in worker_ids])
+
+        # Priority: longest remaining path (by mean latency) first
+        tasks = len(worker_ids)
+        means = latency.mean(axis=0)
+        remaining = means.copy()
+        for task in range(tasks - 1, -1, -1):
+            for pred in predecessors[task]:
+                remaining[pred] = max(remaining[pred], means[pred] + remaining[task])
+        rank = np.empty(tasks)
+        rank[sorted(range(tasks), key=lambda task: (-remaining[task], task))] = np.arange(tasks)
+
+        rows = np.arange(runs)
+        finish = np.full((runs, tasks), np.inf)  # inf = not dispatched yet
+        slots = np.zeros((runs, self.max_concurrency))
+        for _ in range(tasks):
+            # Fill the earliest free slot with the run that can start
+            # soonest, highest priority among runs ready by then
+            slot = slots.argmin(axis=1)
+            free = slots[rows, slot]
+            ready = np.column_stack([
+                finish[:, predecessors[task]].max(axis=1) if predecessors[task] else np.zeros(runs)
+                for task in range(tasks)
+            ])
+            start = np.maximum(ready, free[:, None])
+            start[np.isfinite(finish)] = np.inf
+            earliest = start.min(axis=1, keepdims=True)
+            task = np.where(start == earliest, rank, np.inf).argmin(axis=1)
+            finish[rows, task] = earliest[:, 0] + latency[rows, task]
+            slots[rows, slot] = finish[rows, task]
+
+        return finish.max(axis=1), cost.sum(axis=1)
+
+    def simulate(self, plan: Plan, runs: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Latency and cost percentiles of a plan.
+
+        Args:
+            plan: Plan to simulate
+            runs: Replays (default: self.runs)
+
+        Returns:
+            Dict with runs, and mean/p50/p90/p95/p99 of latency (seconds)
+            and cost (USD)
+        """
+        latency, cost = self.sample(plan, runs)
+        return {
+            "runs": len(latency),
+            "latency": _summarize(latency),
+            "cost": _summarize(cost),
+        }
+
+
+def _summarize(values: np.ndarray) -> Dict[str, float]:
+    summary = {"mean": float(values.mean())}
+    for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES), strict=True):
+        summary[f"p{q}"] = float(value)
+    return summary
@@ -13,8 +13,9 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-import copy
-from typing import List, Dict, Any, Tuple
+import math
+from itertools import combinations
+from typing import List, Dict, Any, FrozenSet, Tuple
 from datetime import datetime
 
 from src.meta_agent.schemas import (
@@ -23,7 +24,24 @@ from src.meta_agent.schemas import (
     ExecutionMode,
     AgentState,
 )
+from src.meta_agent.plan_cache import clone_plan
+from src.meta_agent.worker_selection import Choice, cheapest_selection, select_workers
+from src.meta_agent.critical_path import critical_path, makespan
+from src.meta_agent.simulator import PlanSimulator
+from src.meta_agent.pareto import TIERS, PlanCandidate, combine_steps, pareto_front, pick_tier
 from config.worker_registry import get_worker_registry
+from config.settings import get_settings
+
+
+# Workers considered per step when enumerating plan variants
+# (2^8 - 1 = 255 subsets at most)
+MAX_VARIANT_POOL = 8
+
+# Workers the brief asks for by flag (added by the planner)
+FLAG_WORKERS = {
+    "enable_fact_checking": "fact_checker_worker",
+    "enable_seo_optimization": "seo_optimizer_worker",
+}
 
 
 class StrategyAgent:
@@ -37,6 +55,12 @@ class StrategyAgent:
     def __init__(self):
         """Initialize strategy agent."""
         self.registry = get_worker_registry()
+        settings = get_settings()
+        # Plan against tail latency/cost, not the average
+        self.percentile = settings.estimate_percentile
+        # Worker runs the orchestrator allows at once
+        self.max_concurrency = settings.max_concurrent_tasks
+        self.simulator = PlanSimulator(max_concurrency=self.max_concurrency, registry=self.registry)
     
     def optimize_plan(self, state: AgentState, plan: Plan) -> Plan:
         """
@@ -67,7 +91,7 @@ class StrategyAgent:
         print(f"   Estimated time: {plan.estimated_total_time}s")
         
         # Optimization strategies
-        optimized_plan = copy.deepcopy(plan)
+        optimized_plan = self._apply_learned_estimates(clone_plan(plan))
         
         # 1. Optimize for parallel execution
         optimized_plan = self._optimize_parallelization(optimized_plan)
@@ -75,12 +99,14 @@ class StrategyAgent:
         # 2. Check budget constraint
         if optimized_plan.estimated_total_cost > max_budget:
             print(f"\n⚠️  Budget exceeded! Optimizing for cost...")
-            optimized_plan = self._optimize_for_cost(optimized_plan, max_budget)
+            optimized_plan = self._optimize_for_cost(optimized_plan, max_budget, self._required_workers(brief))
         
-        # 3. Check time constraint
-        if optimized_plan.estimated_total_time > max_time:
+        # 3. Check time constraint (predicted makespan, not summed steps)
+        if self._plan_time(optimized_plan) > max_time:
             print(f"\n⚠️  Time exceeded! Optimizing for time...")
-            optimized_plan = self._optimize_for_time(optimized_plan, max_time)
+            optimized_plan = self._optimize_for_time(
+                optimized_plan, max_time, max_budget, self._required_workers(brief)
+            )
         
         # 4. Add optimization notes
         optimization_notes = self._generate_optimization_notes(plan, optimized_plan)
@@ -101,6 +127,219 @@ class StrategyAgent:
         
         return optimized_plan
     
+    def plan_frontier(self, state: AgentState, plan: Plan) -> List[PlanCandidate]:
+        """
+        Enumerate Pareto-optimal variants of a plan.
+        
+        Every step may use any non-empty subset of its workers, their
+        alternatives and split parts, and the other registry workers of
+        its phase, as long as it keeps the workers the brief requires.
+        Variants no other variant beats on cost, makespan and quality at
+        once are kept (see pareto).
+        
+        Args:
+            state: Current workflow state (its brief decides which
+                workers are required)
+            plan: Plan to vary
+            
+        Returns:
+            Plan candidates by ascending cost
+        """
+        required = self._required_workers(state.brief)
+        base = self._apply_learned_estimates(clone_plan(plan))
+        combined = combine_steps([self._step_variants(step, required) for step in base.steps])
+        
+        scored = []
+        for _, _, quality, steps in combined:
+            candidate = clone_plan(base.model_copy(update={"steps": steps}))
+            span = makespan(candidate.steps, self._task_time, self.max_concurrency)
+            candidate.estimated_total_cost = sum(step.estimated_cost for step in candidate.steps)
+            candidate.estimated_total_time = max(1, math.ceil(span))
+            candidate.parallel_steps = sum(
+                1 for step in candidate.steps if step.execution_mode == ExecutionMode.PARALLEL
+            )
+            scored.append((candidate.estimated_total_cost, span, quality, candidate))
+        
+        return [
+            PlanCandidate(candidate, cost, span, quality)
+            for cost, span, quality, candidate in pareto_front(scored)
+        ]
+    
+    def plan_tiers(self, state: AgentState, plan: Plan) -> Dict[str, Plan]:
+        """
+        Fastest, cheapest and best variants of a plan.
+        
+        Tiers are picked from the plan frontier, preferring variants
+        within the brief's budget and deadline.
+        
+        Args:
+            state: Current workflow state
+            plan: Plan to vary
+            
+        Returns:
+            Dict mapping tier to plan
+        """
+        frontier = self.plan_frontier(state, plan)
+        brief = state.brief
+        max_budget = brief.max_budget or float('inf')
+        max_time = brief.max_time_seconds or float('inf')
+        
+        print(f"\n🎚️  Strategy: {len(frontier)} Pareto-optimal plans")
+        tiers = {}
+        for tier in TIERS:
+            chosen = pick_tier(frontier, tier, max_budget, max_time)
+            tier_plan = clone_plan(chosen.plan)
+            tier_plan.optimization_notes = (
+                f"{tier.capitalize()} tier: ${chosen.cost:.2f}, {tier_plan.estimated_total_time}s, "
+                f"quality {chosen.quality:.1f} (1 of {len(frontier)} Pareto-optimal plans)"
+            )
+            print(f"   {tier_plan.optimization_notes}")
+            tiers[tier] = tier_plan
+        
+        return tiers
+    
+    def _required_workers(self, brief: Any) -> FrozenSet[str]:
+        """Workers the brief's flags make mandatory."""
+        return frozenset(worker_id for flag, worker_id in FLAG_WORKERS.items() if getattr(brief, flag, False))
+    
+    def _step_variants(
+        self,
+        step: PlanStep,
+        required: FrozenSet[str] = frozenset()
+    ) -> List[Tuple[float, float, float, PlanStep]]:
+        """
+        Every worker subset of a step, scored.
+        
+        Workers that declare alternatives or split parts produce the
+        step's core output, and required workers were asked for by the
+        brief, so each variant keeps them, one of their alternatives, or
+        all of their parts.
+        
+        Args:
+            step: Plan step
+            required: Worker IDs the brief requires
+            
+        Returns:
+            (cost, time, quality, variant step) for each valid subset
+        """
+        pool = self._variant_pool(step)
+        if not pool:
+            return [(step.estimated_cost, float(step.estimated_time_seconds), 0.0, step)]
+        unknown = [wid for wid in step.worker_ids if not self.registry.get_worker(wid)]
+        core = [
+            worker for worker in map(self.registry.get_worker, step.worker_ids)
+            if worker and (worker.alternatives or worker.split_into or worker.id in required)
+        ]
+        
+        variants = []
+        for size in range(1, len(pool) + 1):
+            for worker_ids in combinations(pool, size):
+                if not all(
+                    worker.id in worker_ids
+                    or any(wid in worker_ids for wid in worker.alternatives)
+                    or (worker.split_into and all(wid in worker_ids for wid in worker.split_into))
+                    for worker in core
+                ):
+                    continue
+                worker_ids = list(worker_ids)
+                parallel = step.execution_mode == ExecutionMode.PARALLEL or all(
+                    map(self.registry.is_parallel, worker_ids)
+                )
+                execution_mode = (ExecutionMode.PARALLEL if parallel else ExecutionMode.SEQUENTIAL).value
+                variant = step.model_copy(update={
+                    "worker_ids": worker_ids + unknown,
+                    "execution_mode": execution_mode,
+                    "estimated_cost": self._known_cost(worker_ids),
+                    "estimated_time_seconds": self._step_time(worker_ids, execution_mode),
+                })
+                span = makespan([variant], self._task_time, self.max_concurrency)
+                variants.append((variant.estimated_cost, span, self._known_value(worker_ids), variant))
+        return variants
+    
+    def _variant_pool(self, step: PlanStep) -> List[str]:
+        """
+        Workers a step's variants draw from.
+        
+        The step's own workers come first, then their alternatives and
+        split parts, then the most valuable per dollar of the other
+        workers in the step's phase, up to MAX_VARIANT_POOL.
+        
+        Args:
+            step: Plan step
+            
+        Returns:
+            Registered worker IDs
+        """
+        pool = [wid for wid in step.worker_ids if self.registry.get_worker(wid)]
+        related = [
+            wid
+            for worker_id in list(pool)
+            for wid in self.registry.get_worker(worker_id).alternatives + self.registry.get_worker(worker_id).split_into
+        ]
+        same_phase = sorted(
+            (w.id for w in self.registry.get_workers_by_category(step.phase)),
+            key=lambda wid: -self.registry.estimate_worker_value(wid) / max(self._worker_cost(wid), 1e-6),
+        )
+        for worker_id in related + same_phase:
+            if len(pool) >= MAX_VARIANT_POOL:
+                break
+            if worker_id not in pool and self.registry.get_worker(worker_id):
+                pool.append(worker_id)
+        return pool
+    
+    def _apply_learned_estimates(self, plan: Plan) -> Plan:
+        """
+        Re-estimate steps from observed worker metrics.
+        
+        Steps whose workers have enough recorded executions get the
+        percentile (p95 by default) cost and latency; others keep the
+        planner's static estimates.
+        
+        Args:
+            plan: Plan to re-estimate (modified in place)
+            
+        Returns:
+            The plan
+        """
+        store = self.registry.metrics_store
+        if store is None:
+            return plan
+        
+        for step in plan.steps:
+            known = [wid for wid in step.worker_ids if self.registry.get_worker(wid)]
+            if not any(store.latency(wid) is not None for wid in known):
+                continue
+            step.estimated_cost = self.registry.estimate_total_cost(known, self.percentile)
+            step.estimated_time_seconds = self._step_time(known, step.execution_mode)
+        
+        plan.estimated_total_cost = sum(step.estimated_cost for step in plan.steps)
+        plan.estimated_total_time = self._plan_time(plan)
+        return plan
+    
+    def _worker_time(self, worker_id: str) -> float:
+        """Planning latency of a worker (learned percentile or static)."""
+        return self.registry.estimate_worker_time(worker_id, self.percentile)
+    
+    def _worker_cost(self, worker_id: str) -> float:
+        """Planning cost of a worker (learned percentile or static)."""
+        return self.registry.estimate_worker_cost(worker_id, self.percentile)
+    
+    def _step_time(self, worker_ids: List[str], execution_mode: str) -> int:
+        """Step latency: max over parallel workers, sum over sequential ones."""
+        times = [self._worker_time(wid) for wid in worker_ids]
+        if not times:
+            return 1
+        total = max(times) if execution_mode == ExecutionMode.PARALLEL else sum(times)
+        return max(1, math.ceil(total))
+    
+    def _task_time(self, worker_id: str) -> float:
+        """Planning latency of a worker, 0 for unregistered ones."""
+        return self._worker_time(worker_id) if self.registry.get_worker(worker_id) else 0.0
+    
+    def _plan_time(self, plan: Plan) -> int:
+        """Predicted makespan of a plan under the concurrency limit."""
+        return max(1, math.ceil(makespan(plan.steps, self._task_time, self.max_concurrency)))
+    
     def _optimize_parallelization(self, plan: Plan) -> Plan:
         """
         Optimize parallel execution where possible.
@@ -117,35 +356,39 @@ class StrategyAgent:
         for step in plan.steps:
             if len(step.worker_ids) > 1:
                 # Check if all workers can run in parallel
-                can_parallelize = all(
-                    self.registry.get_worker(wid).can_run_parallel
-                    for wid in step.worker_ids
-                )
+                can_parallelize = all(map(self.registry.is_parallel, step.worker_ids))
                 
                 if can_parallelize and step.execution_mode == ExecutionMode.SEQUENTIAL:
                     print(f"   Converting {step.phase} to parallel execution")
-                    step.execution_mode = ExecutionMode.PARALLEL
+                    step.execution_mode = ExecutionMode.PARALLEL.value
                     
                     # Recalculate time (max instead of sum)
-                    times = [
-                        self.registry.get_worker(wid).estimated_time_seconds
-                        for wid in step.worker_ids
-                    ]
-                    step.estimated_time_seconds = max(times) if times else step.estimated_time_seconds
+                    step.estimated_time_seconds = self._step_time(step.worker_ids, step.execution_mode)
         
         # Recalculate total time
-        plan.estimated_total_time = sum(
-            step.estimated_time_seconds for step in plan.steps
-        )
+        plan.estimated_total_time = self._plan_time(plan)
         
         return plan
-    def _optimize_for_cost(self, plan: Plan, max_budget: float) -> Plan:
+    
+    def _optimize_for_cost(
+        self,
+        plan: Plan,
+        max_budget: float,
+        required: FrozenSet[str] = frozenset()
+    ) -> Plan:
         """
         Optimize plan to meet budget constraint.
         
+        Picks the highest-value set of workers that fits the budget:
+        each worker can be kept, dropped or swapped for a cheaper
+        alternative, and every step keeps at least one worker (see
+        worker_selection). Workers the brief requires are kept or
+        swapped, never dropped.
+        
         Args:
             plan: Original plan
             max_budget: Maximum budget allowed
+            required: Worker IDs the brief requires
             
         Returns:
             Optimized plan
@@ -153,75 +396,104 @@ class StrategyAgent:
         print(f"   Target budget: ${max_budget:.2f}")
         print(f"   Current cost: ${plan.estimated_total_cost:.2f}")
         
-        # Strategy: Remove least essential workers
-        # Priority: quality > writing > analysis > research
-        
-        # Calculate current total cost
-        current_cost = sum(step.estimated_cost for step in plan.steps)
-        plan.estimated_total_cost = current_cost
-        
-        # Keep removing workers until within budget
-        while plan.estimated_total_cost > max_budget:
-            removed = False
-            
-            # Try to remove from quality phase first
-            for step in plan.steps:
-                if step.phase == "quality" and len(step.worker_ids) > 1:
-                    # Remove one quality worker
-                    removed_worker = step.worker_ids.pop()
-                    worker_def = self.registry.get_worker(removed_worker)
-                    
-                    print(f"   Removed worker: {removed_worker}")
-                    print(f"   Saved: ${worker_def.estimated_cost:.2f}")
-                    
-                    # Recalculate step cost
-                    step.estimated_cost -= worker_def.estimated_cost
-                    
-                    # Recalculate total cost
-                    current_cost = sum(s.estimated_cost for s in plan.steps)
-                    plan.estimated_total_cost = current_cost
-                    
-                    print(f"   New total cost: ${plan.estimated_total_cost:.2f}")
-                    
-                    removed = True
-                    break  # Exit inner loop to recalculate
+        groups, must_fill = zip(*(self._slot_choices(step, required) for step in plan.steps), strict=True)
+        selection = select_workers(groups, max_budget, required=must_fill)
+        if selection is None:
+            # Nothing fits: fall back to the cheapest plan possible
+            print(f"   ⚠️  Cannot reduce cost further")
+            selection = cheapest_selection(groups, must_fill)
+        _, _, selected = selection
+        
+        for step, slots, chosen in zip(plan.steps, groups, selected, strict=True):
+            if not slots:
+                continue
+            original = [wid for wid in step.worker_ids if self.registry.get_worker(wid)]
+            removed = [wid for wid in original if wid not in chosen]
+            added = [wid for wid in chosen if wid not in original]
+            if not removed:
+                continue
             
-            # If still over budget and nothing removed, try research phase
-            if not removed and plan.estimated_total_cost > max_budget:
-                for step in plan.steps:
-                    if step.phase == "research" and len(step.worker_ids) > 1:
-                        removed_worker = step.worker_ids.pop()
-                        worker_def = self.registry.get_worker(removed_worker)
-                        
-                        print(f"   Removed worker: {removed_worker}")
-                        print(f"   Saved: ${worker_def.estimated_cost:.2f}")
-                        
-                        step.estimated_cost -= worker_def.estimated_cost
-                        current_cost = sum(s.estimated_cost for s in plan.steps)
-                        plan.estimated_total_cost = current_cost
-                        
-                        print(f"   New total cost: ${plan.estimated_total_cost:.2f}")
-                        
-                        removed = True
-                        break
+            for worker_id in removed:
+                print(f"   Removed worker: {worker_id}")
+            for worker_id in added:
+                print(f"   Added alternative: {worker_id}")
             
-            # If nothing can be removed, exit to avoid infinite loop
-            if not removed:
-                print(f"   ⚠️  Cannot reduce cost further")
-                break
+            unknown = [wid for wid in step.worker_ids if wid not in original]
+            step.worker_ids = chosen + unknown
+            step.estimated_cost = self.registry.estimate_total_cost(chosen, self.percentile)
+            step.estimated_time_seconds = self._step_time(chosen, step.execution_mode)
+        
+        plan.estimated_total_cost = sum(step.estimated_cost for step in plan.steps)
+        plan.estimated_total_time = self._plan_time(plan)
+        print(f"   New total cost: ${plan.estimated_total_cost:.2f}")
         
         if plan.estimated_total_cost <= max_budget:
             print(f"   ✅ Within budget!")
         
         return plan
     
-    def _optimize_for_time(self, plan: Plan, max_time: int) -> Plan:
+    def _slot_choices(
+        self,
+        step: PlanStep,
+        required: FrozenSet[str] = frozenset()
+    ) -> Tuple[List[List[Choice]], List[bool]]:
+        """
+        Choices for each registered worker of a step.
+        
+        A worker can be kept or replaced by one of its alternatives that
+        is not already in the step (each alternative stands in for at
+        most one worker). A split part is not an alternative on its own:
+        a lone section writer doesn't replace an article writer.
+        
+        Args:
+            step: Plan step
+            required: Worker IDs the brief requires (their slots must be filled)
+            
+        Returns:
+            (per worker, the (worker_id, cost, value) choices;
+            per worker, whether its slot must be filled)
+        """
+        known = [wid for wid in step.worker_ids if self.registry.get_worker(wid)]
+        claimed = set(known)
+        slots = []
+        for worker_id in known:
+            worker = self.registry.get_worker(worker_id)
+            options = [worker_id]
+            for alternative in worker.alternatives:
+                if alternative in worker.split_into:
+                    continue
+                if alternative not in claimed and self.registry.get_worker(alternative):
+                    claimed.add(alternative)
+                    options.append(alternative)
+            slots.append([
+                (wid, self._worker_cost(wid), self.registry.estimate_worker_value(wid))
+                for wid in options
+            ])
+        return slots, [worker_id in required for worker_id in known]
+    
+    def _optimize_for_time(
+        self,
+        plan: Plan,
+        max_time: int,
+        max_budget: float = float('inf'),
+        required: FrozenSet[str] = frozenset()
+    ) -> Plan:
         """
         Optimize plan to meet time constraint.
         
+        Repeatedly applies the transformation that shortens the predicted
+        makespan (see critical_path) at the least quality cost per second
+        saved, until the plan meets max_time or nothing helps:
+        - parallelize a sequential step
+        - split a writer into parallel section writers
+        - swap a worker for a faster alternative
+        - drop a worker from a step that keeps others
+        
         Args:
             plan: Original plan
             max_time: Maximum time allowed (seconds)
+            max_budget: Transformations may not push cost above this
+            required: Worker IDs the brief requires (never swapped or dropped)
             
         Returns:
             Optimized plan
@@ -229,31 +501,124 @@ class StrategyAgent:
         print(f"   Target time: {max_time}s")
         print(f"   Current time: {plan.estimated_total_time}s")
         
-        # Strategy: Enable more parallel execution
-        # For Sprint 1, mock optimization
-        
-        # Try to parallelize more steps
-        for step in plan.steps:
-            if step.execution_mode == ExecutionMode.SEQUENTIAL:
-                # Check if can be parallelized
-                if len(step.worker_ids) > 0:
-                    workers = [self.registry.get_worker(wid) for wid in step.worker_ids]
-                    if all(w.can_run_parallel for w in workers if w):
-                        step.execution_mode = ExecutionMode.PARALLEL
-                        
-                        # Recalculate time
-                        times = [w.estimated_time_seconds for w in workers if w]
-                        step.estimated_time_seconds = max(times) if times else step.estimated_time_seconds
-                        
-                        print(f"   Parallelized {step.phase}")
+        current = makespan(plan.steps, self._task_time, self.max_concurrency)
+        while current > max_time:
+            best = None
+            for description, index, worker_ids, execution_mode in self._time_moves(plan, required):
+                step = plan.steps[index]
+                changed = step.model_copy(update={"worker_ids": worker_ids, "execution_mode": execution_mode})
+                steps = plan.steps[:index] + [changed] + plan.steps[index + 1:]
+                saved = current - makespan(steps, self._task_time, self.max_concurrency)
+                extra_cost = self._known_cost(worker_ids) - self._known_cost(step.worker_ids)
+                if saved <= 0 or plan.estimated_total_cost + extra_cost > max_budget:
+                    continue
+                value_lost = self._known_value(step.worker_ids) - self._known_value(worker_ids)
+                rank = (max(0.0, value_lost) / saved, -saved)
+                if best is None or rank < best[0]:
+                    best = (rank, description, index, worker_ids, execution_mode, saved)
+            
+            if best is None:
+                print(f"   ⚠️  Cannot reduce time further")
+                break
+            
+            _, description, index, worker_ids, execution_mode, saved = best
+            step = plan.steps[index]
+            step.worker_ids = worker_ids
+            step.execution_mode = execution_mode
+            step.estimated_cost = self._known_cost(worker_ids)
+            step.estimated_time_seconds = self._step_time(
+                [wid for wid in worker_ids if self.registry.get_worker(wid)], execution_mode
+            )
+            plan.estimated_total_cost = sum(s.estimated_cost for s in plan.steps)
+            current -= saved
+            print(f"   {description} (-{saved:.0f}s)")
         
         # Recalculate total time
-        plan.estimated_total_time = sum(
-            step.estimated_time_seconds for step in plan.steps
-        )
+        plan.estimated_total_time = max(1, math.ceil(current))
+        length, path = critical_path(plan.steps, self._task_time)
+        print(f"   Predicted makespan: {plan.estimated_total_time}s")
+        print(f"   Critical path: {' → '.join(path)} ({length:.0f}s)")
         
         return plan
     
+    def _time_moves(
+        self,
+        plan: Plan,
+        required: FrozenSet[str] = frozenset()
+    ) -> List[Tuple[str, int, List[str], str]]:
+        """
+        Candidate transformations for shortening a plan.
+        
+        Required workers are never swapped or dropped, and the parts of
+        a split writer stay together: dropping one would leave the
+        article without its introduction, body or conclusion.
+        
+        Args:
+            plan: Plan to transform
+            required: Worker IDs the brief requires
+            
+        Returns:
+            (description, step index, new worker IDs, new execution mode)
+        """
+        moves = []
+        for index, step in enumerate(plan.steps):
+            ids = list(step.worker_ids)
+            workers = [self.registry.get_worker(wid) for wid in ids]
+            split_parts = {
+                wid
+                for writer in self.registry.list_all_workers()
+                if writer.split_into and writer.id not in ids and all(wid in ids for wid in writer.split_into)
+                for wid in writer.split_into
+            }
+            
+            if step.execution_mode == ExecutionMode.SEQUENTIAL and len(ids) > 1:
+                if all(w.can_run_parallel for w in workers if w):
+                    moves.append((f"Parallelized {step.phase}", index, ids, ExecutionMode.PARALLEL.value))
+            
+            for position, worker in enumerate(workers):
+                if worker is None:
+                    continue
+                rest = ids[:position] + ids[position + 1:]
+                
+                parts = [wid for wid in worker.split_into if self.registry.get_worker(wid) and wid not in ids]
+                if parts:
+                    split_ids = ids[:position] + parts + ids[position + 1:]
+                    parallel = all(w.can_run_parallel for w in map(self.registry.get_worker, split_ids) if w)
+                    moves.append((
+                        f"Split {worker.id} into {', '.join(parts)}",
+                        index, split_ids, ExecutionMode.PARALLEL.value if parallel else step.execution_mode,
+                    ))
+                
+                if worker.id in required or worker.id in split_parts:
+                    continue
+                
+                for alternative in worker.alternatives:
+                    # A lone split part doesn't replace the whole writer
+                    if alternative in worker.split_into:
+                        continue
+                    if self.registry.get_worker(alternative) and alternative not in ids:
+                        moves.append((
+                            f"Swapped {worker.id} for {alternative}",
+                            index, ids[:position] + [alternative] + ids[position + 1:], step.execution_mode,
+                        ))
+                
+                if any(self.registry.get_worker(wid) for wid in rest):
+                    moves.append((f"Dropped {worker.id}", index, rest, step.execution_mode))
+        
+        return moves
+    
+    def _known_cost(self, worker_ids: List[str]) -> float:
+        """Planning cost of the registered workers in a list."""
+        return self.registry.estimate_total_cost(worker_ids, self.percentile)
+    
+    def _known_value(self, worker_ids: List[str]) -> float:
+        """Quality value of the registered workers in a list."""
+        return sum(
+            self.registry.estimate_worker_value(wid)
+            for wid in worker_ids
+            if self.registry.get_worker(wid)
+        )
+    
     def _generate_optimization_notes(self, original: Plan, optimized: Plan) -> str:
         """
         Generate notes about optimizations applied.
@@ -322,6 +687,13 @@ class StrategyAgent:
         # Calculate time efficiency (workers per second)
         time_efficiency = total_workers / plan.estimated_total_time if plan.estimated_total_time > 0 else 0
         
+        # Predicted wall time and the steps that bound it
+        predicted_makespan = makespan(plan.steps, self._task_time, self.max_concurrency)
+        path_length, path = critical_path(plan.steps, self._task_time)
+        
+        # Latency/cost distribution from Monte Carlo replays
+        simulated = self.simulator.simulate(plan)
+        
         metrics = {
             "total_steps": plan.total_steps,
             "parallel_steps": parallel_steps,
@@ -332,6 +704,11 @@ class StrategyAgent:
             "estimated_time": plan.estimated_total_time,
             "cost_efficiency": cost_efficiency,
             "time_efficiency": time_efficiency,
+            "makespan": predicted_makespan,
+            "critical_path": path,
+            "critical_path_length": path_length,
+            "simulated_latency": simulated["latency"],
+            "simulated_cost": simulated["cost"],
         }
         
         print(f"   Total steps: {metrics['total_steps']}")
@@ -339,6 +716,9 @@ class StrategyAgent:
         print(f"   Parallelization ratio: {metrics['parallelization_ratio']:.1%}")
         print(f"   Cost efficiency: {metrics['cost_efficiency']:.2f} workers/$")
         print(f"   Time efficiency: {metrics['time_efficiency']:.3f} workers/s")
+        print(f"   Predicted makespan: {metrics['makespan']:.0f}s (critical path: {' → '.join(path)})")
+        print(f"   Simulated latency: p50 {simulated['latency']['p50']:.0f}s, p95 {simulated['latency']['p95']:.0f}s")
+        print(f"   Simulated cost: p50 ${simulated['cost']['p50']:.3f}, p95 ${simulated['cost']['p95']:.3f}")
         
         return metrics
     
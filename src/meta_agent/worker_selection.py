@@ -0,0 +1,163 @@
+"""
+Worker Selection - Highest-value set of workers within a budget.
+
+Each plan step is a list of worker slots. A slot is filled by its
+worker, by one of the worker's cheaper alternatives, or left empty
+(unless the slot is required), and every step keeps at least one worker. Picking one choice per slot to
+maximize total quality value under a cost limit is a multiple-choice
+knapsack.
+
+It is solved by dynamic programming over a cost grid: for every cost
+the best value reachable so far, vectorized with NumPy, with per-slot
+back-pointers to recover the selection. Costs are rounded up to the
+grid resolution ($0.0001 by default), so the selection never exceeds
+the budget; solving takes milliseconds even for large registries.
+"""
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# (worker_id, cost, value) of filling a slot
+Choice = Tuple[str, float, float]
+
+# (total cost, total value, worker IDs per step)
+Selection = Tuple[float, float, List[List[str]]]
+
+# Cost grid resolution (USD) and maximum grid size
+RESOLUTION = 0.0001
+MAX_CELLS = 1 << 16
+
+
+def select_workers(
+    steps: Sequence[Sequence[Sequence[Choice]]],
+    max_cost: float,
+    resolution: float = RESOLUTION,
+    required: Optional[Sequence[Sequence[bool]]] = None,
+) -> Optional[Selection]:
+    """
+    Most valuable worker selection within a budget.
+
+    Args:
+        steps: Per step, per slot, the choices that can fill the slot
+            (leaving it empty is allowed unless the slot is required).
+            Steps without slots are kept empty.
+        max_cost: Cost limit
+        resolution: Cost grid resolution; coarsened automatically so the
+            grid has at most MAX_CELLS cells
+        required: Per step, per slot, whether the slot must be filled
+            (default: none)
+
+    Returns:
+        Highest-value selection (cheapest among equals), or None if even
+        the cheapest selection exceeds max_cost
+    """
+    most = sum(max(cost for _, cost, _ in slot) for slots in steps for slot in slots if slot)
+    resolution = max(resolution, min(max_cost, most) / (MAX_CELLS - 1))
+
+    def units(cost: float) -> int:
+        return math.ceil(cost / resolution - 1e-9)
+
+    # No selection costs more than the priciest choice of every slot
+    most_units = sum(max(units(cost) for _, cost, _ in slot) for slots in steps for slot in slots if slot)
+    cells = int(min(max_cost / resolution + 1e-9, most_units)) + 1
+
+    # best[x]: highest value at exactly x cost units (-inf if unreachable)
+    best = np.full(cells, -np.inf)
+    best[0] = 0.0
+    pointers = []
+    for index, slots in enumerate(steps):
+        empty, filled = best, np.full(cells, -np.inf)
+        step_pointers = []
+        for position, slot in enumerate(slots):
+            must_fill = bool(required and required[index][position])
+            source_filled = filled >= empty
+            previous = np.maximum(empty, filled)
+            chosen = np.zeros(cells, dtype=np.int16)
+            source = np.zeros(cells, dtype=bool)
+            # A required slot can't be skipped: only its choices carry over
+            updated = np.full(cells, -np.inf) if must_fill else filled.copy()
+            for k, (_, cost, value) in enumerate(slot, start=1):
+                shift = units(cost)
+                if shift >= cells:
+                    continue
+                candidate = np.full(cells, -np.inf)
+                candidate[shift:] = previous[:cells - shift] + value
+                better = candidate > updated
+                updated[better] = candidate[better]
+                chosen[better] = k
+                source[shift:][better[shift:]] = source_filled[:cells - shift][better[shift:]]
+            filled = updated
+            if must_fill:
+                empty = np.full(cells, -np.inf)
+            step_pointers.append((chosen, source))
+        if slots:
+            best = filled
+        pointers.append(step_pointers)
+
+    if not np.isfinite(best).any():
+        return None
+
+    # Walk the back-pointers from the cheapest best cell (rounded so float
+    # noise in value sums does not pick a costlier equal selection)
+    x = int(np.argmax(np.round(best, 9)))
+    selected: List[List[str]] = [[] for _ in steps]
+    for index in range(len(steps) - 1, -1, -1):
+        slots = steps[index]
+        for slot, (chosen, source) in zip(reversed(slots), reversed(pointers[index]), strict=True):
+            k = int(chosen[x])
+            if k == 0:
+                continue
+            selected[index].append(slot[k - 1][0])
+            filled_before = bool(source[x])
+            x -= units(slot[k - 1][1])
+            if not filled_before:
+                break
+        selected[index].reverse()
+
+    return _totals(steps, selected)
+
+
+def cheapest_selection(
+    steps: Sequence[Sequence[Sequence[Choice]]],
+    required: Optional[Sequence[Sequence[bool]]] = None,
+) -> Selection:
+    """
+    Cheapest valid selection: the cheapest choice of every required slot,
+    or of every step without required slots.
+
+    Args:
+        steps: Per step, per slot, the choices that can fill the slot
+        required: Per step, per slot, whether the slot must be filled
+
+    Returns:
+        Cheapest selection (most valuable among equally cheap choices)
+    """
+    def cheapest(choices: Sequence[Choice]) -> str:
+        return min(choices, key=lambda choice: (choice[1], -choice[2]))[0]
+
+    selected = []
+    for index, slots in enumerate(steps):
+        must_fill = [slot for position, slot in enumerate(slots) if required and required[index][position] and slot]
+        if must_fill:
+            selected.append([cheapest(slot) for slot in must_fill])
+            continue
+        choices = [choice for slot in slots for choice in slot]
+        selected.append([cheapest(choices)] if choices else [])
+    return _totals(steps, selected)
+
+
+def _totals(steps: Sequence[Sequence[Sequence[Choice]]], selected: List[List[str]]) -> Selection:
+    """Exact cost and value of a selection."""
+    lookup = {
+        choice[0]: choice
+        for slots in steps for slot in slots for choice in slot
+    }
+    picks = [lookup[worker_id] for workers in selected for worker_id in workers]
+    return (
+        sum(cost for _, cost, _ in picks),
+        sum(value for _, _, value in picks),
+        selected,
+    )
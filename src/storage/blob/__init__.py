@@ -0,0 +1,21 @@
+"""
+Blob storage package - Content-addressed storage for large payloads.
+"""
+
+from .blob_store import (
+    BlobStore,
+    BlobRef,
+    BlobStoreFullError,
+    is_blob_ref,
+    get_blob_store,
+    resolve_blob,
+)
+
+__all__ = [
+    "BlobStore",
+    "BlobRef",
+    "BlobStoreFullError",
+    "is_blob_ref",
+    "get_blob_store",
+    "resolve_blob",
+]
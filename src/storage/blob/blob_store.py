@@ -0,0 +1,420 @@
+"""
+Blob Store - Content-addressed storage for large worker outputs.
+
+Large payloads (article text, scraped page content) are stored once,
+keyed by their SHA-256 digest, and AgentState carries a small BlobRef
+instead of the full content. Content is resolved lazily where needed.
+
+Storage tiers:
+1. In-memory LRU (bounded by total bytes)
+2. Optional on-disk directory (zstd-compressed, sharded by digest prefix)
+
+Without a directory the memory tier is the only copy, so nothing can be
+evicted: once it is full, put() raises BlobStoreFullError and offload()
+keeps values inline instead of growing without bound. Blobs offloaded
+on behalf of a run are owned by it and dropped from memory when the
+run is released, so a long-lived memory-only store does not fill up.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Union
+
+from pydantic import BaseModel, Field
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None
+
+from config.settings import get_settings
+
+
+# Marker key identifying a serialized BlobRef inside result dicts
+BLOB_REF_KEY = "__blob_ref__"
+
+
+class BlobStoreFullError(Exception):
+    """A memory-only blob store has no room for another blob."""
+
+
+class BlobRef(BaseModel):
+    """
+    Reference to content held in the blob store.
+
+    This is what AgentState carries instead of the full payload.
+    """
+
+    digest: str = Field(..., description="SHA-256 hex digest of the raw content")
+    size: int = Field(..., ge=0, description="Uncompressed size in bytes")
+    media_type: str = Field(default="text/plain", description="text/plain or application/json")
+
+    def to_marker(self) -> Dict[str, Any]:
+        """Serialize as a dict marker for embedding in result dicts."""
+        return {BLOB_REF_KEY: self.digest, "size": self.size, "media_type": self.media_type}
+
+    @classmethod
+    def from_marker(cls, marker: Dict[str, Any]) -> "BlobRef":
+        """Rebuild a reference from its dict marker."""
+        return cls(
+            digest=marker[BLOB_REF_KEY],
+            size=marker.get("size", 0),
+            media_type=marker.get("media_type", "text/plain"),
+        )
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Check if a value is a BlobRef or a BlobRef dict marker."""
+    return isinstance(value, BlobRef) or (isinstance(value, dict) and BLOB_REF_KEY in value)
+
+
+def compress(data: bytes) -> bytes:
+    """Compress bytes with zstd (zlib fallback if zstandard is not installed)."""
+    if zstandard is not None:
+        return b"Z" + zstandard.ZstdCompressor(level=3).compress(data)
+    return b"L" + zlib.compress(data, 6)
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress bytes produced by compress()."""
+    codec, payload = data[:1], data[1:]
+    if codec == b"Z":
+        if zstandard is None:
+            raise ValueError("zstandard is required to read zstd-compressed blobs")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    if codec == b"L":
+        return zlib.decompress(payload)
+    raise ValueError(f"Unknown blob codec: {codec!r}")
+
+
+class BlobStore:
+    """
+    Content-addressed blob store with in-memory and on-disk tiers.
+
+    Identical content is stored only once. Writes go to memory and,
+    if a directory is configured, to disk. Reads check memory first
+    and promote disk hits back into memory.
+
+    Blobs stored with an owner (a run) are reference-counted per owner;
+    release(owner) drops the memory copy of every blob no other owner
+    still holds. Blobs stored without an owner are never released.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        offload_threshold: int = 4096,
+    ):
+        """
+        Initialize blob store.
+
+        Args:
+            directory: On-disk directory (None = memory only)
+            max_memory_bytes: Memory tier capacity before LRU eviction
+            offload_threshold: Minimum size in bytes for values to be offloaded
+        """
+        self.directory = Path(directory) if directory else None
+        self.max_memory_bytes = max_memory_bytes
+        self.offload_threshold = offload_threshold
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._owned: Dict[str, Set[str]] = {}
+        self._refs: Dict[str, int] = {}
+        self._pinned: Set[str] = set()
+        self._lock = threading.Lock()
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    # =========================================================================
+    # CORE API
+    # =========================================================================
+
+    def put(self, content: Union[str, bytes, Any], owner: Optional[str] = None) -> BlobRef:
+        """
+        Store content and return its reference.
+
+        Args:
+            content: str, bytes, or JSON-serializable object
+            owner: Run holding the blob until release(owner)
+                (None = keep for the store's lifetime)
+
+        Returns:
+            BlobRef for the stored content
+
+        Raises:
+            BlobStoreFullError: If the store is memory-only and full
+        """
+        if isinstance(content, bytes):
+            data, media_type = content, "application/octet-stream"
+        elif isinstance(content, str):
+            data, media_type = content.encode("utf-8"), "text/plain"
+        else:
+            data = json.dumps(content, separators=(",", ":"), default=str).encode("utf-8")
+            media_type = "application/json"
+
+        digest = hashlib.sha256(data).hexdigest()
+
+        if not self.contains(digest):
+            self._memory_put(digest, data)
+            if self.directory:
+                self._disk_put(digest, data)
+        self._hold(digest, owner)
+
+        return BlobRef(digest=digest, size=len(data), media_type=media_type)
+
+    def get_bytes(self, ref: Union[BlobRef, Dict[str, Any], str]) -> bytes:
+        """
+        Get raw bytes for a reference.
+
+        Args:
+            ref: BlobRef, dict marker, or digest string
+
+        Returns:
+            Raw content bytes
+
+        Raises:
+            KeyError: If the blob is not in any tier
+        """
+        digest = self._digest_of(ref)
+
+        with self._lock:
+            data = self._memory.get(digest)
+            if data is not None:
+                self._memory.move_to_end(digest)
+                return data
+
+        if self.directory:
+            path = self._disk_path(digest)
+            if path.exists():
+                data = decompress(path.read_bytes())
+                self._memory_put(digest, data)
+                return data
+
+        raise KeyError(f"Blob not found: {digest}")
+
+    def get(self, ref: Union[BlobRef, Dict[str, Any]]) -> Any:
+        """
+        Get decoded content for a reference.
+
+        Returns str for text, parsed object for JSON, bytes otherwise.
+        """
+        if isinstance(ref, dict):
+            ref = BlobRef.from_marker(ref)
+        data = self.get_bytes(ref)
+
+        if ref.media_type == "text/plain":
+            return data.decode("utf-8")
+        if ref.media_type == "application/json":
+            return json.loads(data)
+        return data
+
+    def contains(self, ref: Union[BlobRef, Dict[str, Any], str]) -> bool:
+        """Check if a blob exists in any tier."""
+        digest = self._digest_of(ref)
+        with self._lock:
+            if digest in self._memory:
+                return True
+        return bool(self.directory and self._disk_path(digest).exists())
+
+    def delete(self, ref: Union[BlobRef, Dict[str, Any], str]) -> None:
+        """Remove a blob from all tiers."""
+        digest = self._digest_of(ref)
+        with self._lock:
+            data = self._memory.pop(digest, None)
+            if data is not None:
+                self._memory_bytes -= len(data)
+        if self.directory:
+            self._disk_path(digest).unlink(missing_ok=True)
+
+    def release(self, owner: str) -> int:
+        """
+        Release every blob held by an owner.
+
+        Blobs no other owner holds are dropped from memory; with a
+        directory configured the disk copy stays readable.
+
+        Args:
+            owner: Run whose blobs to release
+
+        Returns:
+            Number of blobs dropped from memory
+        """
+        dropped = 0
+        with self._lock:
+            for digest in self._owned.pop(owner, ()):
+                self._refs[digest] -= 1
+                if self._refs[digest] > 0:
+                    continue
+                del self._refs[digest]
+                if digest in self._pinned:
+                    continue
+                data = self._memory.pop(digest, None)
+                if data is not None:
+                    self._memory_bytes -= len(data)
+                    dropped += 1
+        return dropped
+
+    # =========================================================================
+    # OFFLOAD / RESOLVE HELPERS
+    # =========================================================================
+
+    def offload(self, value: Any, owner: Optional[str] = None) -> Any:
+        """
+        Replace large strings in a value with BlobRef markers.
+
+        Walks dicts and lists recursively. Strings at or above
+        offload_threshold bytes (UTF-8) are stored and replaced;
+        everything else, and anything a full memory-only store cannot
+        take, is returned unchanged.
+
+        Args:
+            value: Worker output (typically a result dict)
+            owner: Run the stored blobs belong to (see release())
+
+        Returns:
+            Value with large strings replaced by markers
+        """
+        if isinstance(value, str):
+            # A string has at least as many UTF-8 bytes as characters
+            if len(value) < self.offload_threshold and len(value.encode("utf-8")) < self.offload_threshold:
+                return value
+            try:
+                return self.put(value, owner).to_marker()
+            except BlobStoreFullError:
+                return value
+        if isinstance(value, dict):
+            if BLOB_REF_KEY in value:
+                return value
+            return {k: self.offload(v, owner) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.offload(v, owner) for v in value]
+        return value
+
+    def resolve(self, value: Any) -> Any:
+        """
+        Resolve a single value if it is a BlobRef marker.
+
+        Only the top-level value is resolved; nested markers are left
+        in place so callers pay only for the content they read.
+        """
+        if is_blob_ref(value):
+            return self.get(value)
+        return value
+
+    def resolve_deep(self, value: Any) -> Any:
+        """Resolve all BlobRef markers in a value recursively."""
+        if is_blob_ref(value):
+            return self.get(value)
+        if isinstance(value, dict):
+            return {k: self.resolve_deep(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.resolve_deep(v) for v in value]
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            memory_blobs = len(self._memory)
+            memory_bytes = self._memory_bytes
+            owners = len(self._owned)
+        return {
+            "memory_blobs": memory_blobs,
+            "memory_bytes": memory_bytes,
+            "owners": owners,
+            "max_memory_bytes": self.max_memory_bytes,
+            "directory": str(self.directory) if self.directory else None,
+            "compression": "zstd" if zstandard is not None else "zlib",
+        }
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _digest_of(self, ref: Union[BlobRef, Dict[str, Any], str]) -> str:
+        """Extract digest from any reference form."""
+        if isinstance(ref, BlobRef):
+            return ref.digest
+        if isinstance(ref, dict):
+            return ref[BLOB_REF_KEY]
+        return ref
+
+    def _hold(self, digest: str, owner: Optional[str]) -> None:
+        """Record that an owner (or the store itself, for None) holds a blob."""
+        with self._lock:
+            if owner is None:
+                self._pinned.add(digest)
+                return
+            held = self._owned.setdefault(owner, set())
+            if digest not in held:
+                held.add(digest)
+                self._refs[digest] = self._refs.get(digest, 0) + 1
+
+    def _memory_put(self, digest: str, data: bytes) -> None:
+        """
+        Insert into memory tier, evicting least recently used blobs.
+
+        Raises:
+            BlobStoreFullError: If the store is memory-only and the blob
+                does not fit
+        """
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                return
+            if not self.directory and self._memory_bytes + len(data) > self.max_memory_bytes:
+                raise BlobStoreFullError(
+                    f"Memory-only blob store is full ({self._memory_bytes} of "
+                    f"{self.max_memory_bytes} bytes); set BLOB_STORE_DIR for a disk tier"
+                )
+            self._memory[digest] = data
+            self._memory_bytes += len(data)
+
+            # Only evict when disk holds a copy; memory-only blobs must survive
+            if self.directory:
+                while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+                    _, evicted = self._memory.popitem(last=False)
+                    self._memory_bytes -= len(evicted)
+
+    def _disk_path(self, digest: str) -> Path:
+        """Get on-disk path for a digest (sharded by 2-char prefix)."""
+        return self.directory / digest[:2] / f"{digest}.blob"
+
+    def _disk_put(self, digest: str, data: bytes) -> None:
+        """Write blob to disk atomically."""
+        path = self._disk_path(digest)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".tmp{os.getpid()}_{threading.get_ident()}")
+        tmp_path.write_bytes(compress(data))
+        os.replace(tmp_path, path)
+
+
+# Global instance
+_settings = get_settings()
+blob_store = BlobStore(
+    directory=_settings.blob_store_dir,
+    offload_threshold=_settings.blob_offload_threshold,
+)
+
+
+# Helper functions
+def get_blob_store() -> BlobStore:
+    """Get the blob store instance."""
+    return blob_store
+
+
+def resolve_blob(value: Any) -> Any:
+    """Resolve a value if it is a BlobRef marker, using the global store."""
+    return blob_store.resolve(value)
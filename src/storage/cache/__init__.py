@@ -0,0 +1,21 @@
+"""
+Cache package - Caches for embeddings and workflow results.
+"""
+
+from .embedding_cache import (
+    EmbeddingCache,
+    DiskVectorStore,
+    text_hash,
+)
+from .result_cache import (
+    ResultCache,
+    create_result_cache,
+)
+
+__all__ = [
+    "EmbeddingCache",
+    "DiskVectorStore",
+    "text_hash",
+    "ResultCache",
+    "create_result_cache",
+]
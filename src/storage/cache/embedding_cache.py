@@ -0,0 +1,238 @@
+"""
+Embedding Cache - Two-tier cache for text embeddings.
+
+Key schema (from the architecture doc):
+    embedding:{text_hash} → float32 vector bytes
+
+Tiers:
+1. In-process LRU (bounded by entry count)
+2. Shared second tier: Redis (multi-node) or an on-disk memory-mapped
+   file (single node, survives restarts)
+
+L2 hits are promoted into L1.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+KEY_PREFIX = "embedding"
+
+
+def text_hash(text: str, model: str = "") -> str:
+    """
+    Hash text (and the model that embeds it) into a cache key suffix.
+
+    Args:
+        text: Input text
+        model: Embedder name, so different models never share entries
+
+    Returns:
+        Hex digest
+    """
+    return hashlib.sha256(f"{model}\x00{text}".encode("utf-8")).hexdigest()
+
+
+class DiskVectorStore:
+    """
+    Append-only on-disk vector store.
+
+    Vectors are appended as float32 rows to one file and read through a
+    memory map; keys are appended one per line to a sidecar file, so the
+    row of a key is its line number.
+    """
+
+    def __init__(self, directory: str, dim: int):
+        """
+        Initialize store.
+
+        Args:
+            directory: Storage directory
+            dim: Vector dimensionality
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self._vectors_path = self.directory / f"vectors_{dim}.f32"
+        self._keys_path = self.directory / f"keys_{dim}.txt"
+        self._lock = threading.Lock()
+        self._rows: Dict[str, int] = {}
+        self._map: Optional[np.memmap] = None
+        self._load()
+
+    def _load(self) -> None:
+        """Rebuild the key index, dropping rows from an interrupted append."""
+        keys = self._keys_path.read_text().split("\n")[:-1] if self._keys_path.exists() else []
+        rows_on_disk = (
+            self._vectors_path.stat().st_size // (4 * self.dim) if self._vectors_path.exists() else 0
+        )
+        count = min(len(keys), rows_on_disk)
+
+        with open(self._vectors_path, "ab") as f:
+            f.truncate(count * 4 * self.dim)
+        self._keys_path.write_text("".join(k + "\n" for k in keys[:count]))
+        self._rows = {key: row for row, key in enumerate(keys[:count])}
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Get vectors for the keys present."""
+        with self._lock:
+            rows = {key: self._rows[key] for key in keys if key in self._rows}
+            if not rows:
+                return {}
+            if self._map is None or self._map.shape[0] < len(self._rows):
+                self._map = np.memmap(
+                    self._vectors_path, dtype=np.float32, mode="r", shape=(len(self._rows), self.dim)
+                )
+            return {key: np.array(self._map[row]) for key, row in rows.items()}
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """Append vectors for new keys."""
+        with self._lock:
+            new = {key: vector for key, vector in items.items() if key not in self._rows}
+            if not new:
+                return
+            matrix = np.asarray(list(new.values()), dtype=np.float32).reshape(len(new), self.dim)
+            with open(self._vectors_path, "ab") as f:
+                f.write(matrix.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            with open(self._keys_path, "a") as f:
+                f.write("".join(key + "\n" for key in new))
+            for key in new:
+                self._rows[key] = len(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache.
+
+    L1 is an in-process LRU; L2 is Redis or a DiskVectorStore (or none).
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        max_memory_items: int = 50000,
+        redis_client: Optional[Any] = None,
+        directory: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            dim: Vector dimensionality
+            max_memory_items: L1 capacity before LRU eviction
+            redis_client: redis.Redis-compatible client for L2
+            directory: Directory for on-disk L2 (ignored if redis_client is set)
+            ttl_seconds: Redis entry TTL (None = no expiry)
+        """
+        self.dim = dim
+        self.max_memory_items = max_memory_items
+        self.redis = redis_client
+        self.disk = DiskVectorStore(directory, dim) if directory and redis_client is None else None
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "l2_hits": 0, "misses": 0}
+
+    def key(self, digest: str) -> str:
+        """Cache key for a text hash."""
+        return f"{KEY_PREFIX}:{digest}"
+
+    def get_many(self, digests: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up vectors by text hash.
+
+        Args:
+            digests: Text hashes
+
+        Returns:
+            Vectors for the hashes found in either tier
+        """
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for digest in digests:
+                vector = self._memory.get(digest)
+                if vector is not None:
+                    self._memory.move_to_end(digest)
+                    found[digest] = vector
+            self.stats["memory_hits"] += len(found)
+
+        missing = [d for d in digests if d not in found]
+        if missing:
+            l2 = self._l2_get(missing)
+            self._remember(l2)
+            found.update(l2)
+            self.stats["l2_hits"] += len(l2)
+            self.stats["misses"] += len(missing) - len(l2)
+
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """
+        Store vectors in both tiers.
+
+        Args:
+            items: Vectors by text hash
+        """
+        if not items:
+            return
+        self._remember(items)
+        if self.redis is not None:
+            pipe = self.redis.pipeline(transaction=False)
+            for digest, vector in items.items():
+                pipe.set(self.key(digest), np.asarray(vector, dtype=np.float32).tobytes(), ex=self.ttl_seconds)
+            pipe.execute()
+        elif self.disk is not None:
+            self.disk.put_many(items)
+
+    def _l2_get(self, digests: List[str]) -> Dict[str, np.ndarray]:
+        """Read from the second tier."""
+        if self.redis is not None:
+            values = self.redis.mget([self.key(d) for d in digests])
+            return {
+                digest: np.frombuffer(value, dtype=np.float32).copy()
+                for digest, value in zip(digests, values, strict=True)
+                if value is not None and len(value) == 4 * self.dim
+            }
+        if self.disk is not None:
+            return self.disk.get_many(digests)
+        return {}
+
+    def _remember(self, items: Dict[str, np.ndarray]) -> None:
+        """Insert into L1, evicting least recently used entries."""
+        with self._lock:
+            for digest, vector in items.items():
+                self._memory[digest] = vector
+                self._memory.move_to_end(digest)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit counts, L1 size and L2 backend
+        """
+        lookups = sum(self.stats.values())
+        return {
+            **self.stats,
+            "hit_rate": (self.stats["memory_hits"] + self.stats["l2_hits"]) / lookups if lookups else 0.0,
+            "memory_items": len(self._memory),
+            "l2_backend": "redis" if self.redis is not None else ("disk" if self.disk else None),
+        }
@@ -0,0 +1,287 @@
+"""
+Result Cache - Final outputs keyed by brief fingerprint.
+
+Identical and near-identical briefs (same topic, content type, tone,
+length bucket and flags) recur constantly, and each run costs dollars
+and tens of seconds. The cache serves them from earlier runs.
+
+Key schema:
+    result:{brief fingerprint} → FinalOutput JSON + store time
+
+Freshness, per content type:
+- fresh (age < TTL): served as is
+- stale (TTL <= age < TTL + stale window): served instantly while one
+  background run refreshes the entry (stale-while-revalidate)
+- expired: recomputed before answering
+
+Stampede protection: misses and refreshes for a key go through one
+SingleFlight, so a burst of identical briefs triggers one run.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.meta_agent.schemas import Brief, FinalOutput
+from src.utils.singleflight import SingleFlight
+from config.settings import get_settings
+
+
+KEY_PREFIX = "result"
+
+# Fresh lifetime per content type (seconds)
+DEFAULT_TTL_SECONDS: Dict[str, int] = {
+    "summary": 6 * 3600,
+    "article": 24 * 3600,
+    "blog_post": 24 * 3600,
+    "analysis": 3 * 24 * 3600,
+    "report": 7 * 24 * 3600,
+    "research_paper": 7 * 24 * 3600,
+}
+
+# Lookup outcomes
+HIT = "hit"
+STALE = "stale"
+MISS = "miss"
+SHARED = "shared"
+
+
+class ResultCache:
+    """
+    Final-output cache with stale-while-revalidate.
+
+    L1 is an in-process LRU; an optional Redis client adds a tier shared
+    across nodes.
+    """
+
+    def __init__(
+        self,
+        ttl_by_content_type: Optional[Dict[str, int]] = None,
+        default_ttl_seconds: int = 3600,
+        stale_seconds: int = 3600,
+        max_entries: int = 1000,
+        length_bucket: int = 500,
+        redis_client: Optional[Any] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_by_content_type: Fresh lifetime per content type
+                (default: DEFAULT_TTL_SECONDS)
+            default_ttl_seconds: Fresh lifetime of other content types
+            stale_seconds: How long past its TTL an entry may still be
+                served while it is refreshed
+            max_entries: L1 capacity before LRU eviction
+            length_bucket: Target-length granularity of the key (words)
+            redis_client: redis.Redis-compatible client for the shared tier
+        """
+        self.ttl_by_content_type = dict(DEFAULT_TTL_SECONDS if ttl_by_content_type is None else ttl_by_content_type)
+        self.default_ttl_seconds = default_ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.length_bucket = length_bucket
+        self.redis = redis_client
+
+        self._entries: "OrderedDict[str, Tuple[FinalOutput, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.flight = SingleFlight()
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "shared": 0, "refreshes": 0, "refresh_errors": 0}
+
+    def key(self, brief: Brief) -> str:
+        """Cache key for a brief."""
+        return f"{KEY_PREFIX}:{brief.fingerprint(self.length_bucket)}"
+
+    def ttl(self, brief: Brief) -> int:
+        """Fresh lifetime for a brief's content type."""
+        content_type = getattr(brief.content_type, "value", brief.content_type)
+        return self.ttl_by_content_type.get(content_type, self.default_ttl_seconds)
+
+    # =========================================================================
+    # LOOKUP
+    # =========================================================================
+
+    def get_or_compute(
+        self,
+        brief: Brief,
+        compute: Callable[[], FinalOutput],
+        refresh: Optional[Callable[[], FinalOutput]] = None,
+    ) -> Tuple[FinalOutput, str]:
+        """
+        Serve a brief from cache, computing it at most once per key.
+
+        Args:
+            brief: User brief
+            compute: Runs the workflow for this caller on a miss
+            refresh: Runs the workflow for a background refresh
+                (default: compute)
+
+        Returns:
+            (output, outcome) where outcome is HIT, STALE, MISS (this
+            caller computed it) or SHARED (another caller's run)
+
+        Raises:
+            Exception: Whatever compute raised
+        """
+        key = self.key(brief)
+        entry = self.get_entry(key)
+        if entry is not None:
+            output, stored_at = entry
+            age = time.time() - stored_at
+            ttl = self.ttl(brief)
+            if age < ttl:
+                self.stats["hits"] += 1
+                return output, HIT
+            if age < ttl + self.stale_seconds:
+                self.stats["stale_hits"] += 1
+                self.refresh_in_background(brief, refresh or compute)
+                return output, STALE
+
+        output, shared = self.flight.do_shared(key, self._compute_and_store, key, compute, self.ttl(brief))
+        self.stats["shared" if shared else "misses"] += 1
+        return output, SHARED if shared else MISS
+
+    def refresh_in_background(self, brief: Brief, compute: Callable[[], FinalOutput]) -> bool:
+        """
+        Recompute an entry on a background thread.
+
+        Args:
+            brief: Brief whose entry to refresh
+            compute: Runs the workflow
+
+        Returns:
+            True if a refresh was started (False if one is already running)
+        """
+        key = self.key(brief)
+        if self.flight.in_flight(key):
+            return False
+
+        def run() -> None:
+            try:
+                self.flight.do(key, self._compute_and_store, key, compute, self.ttl(brief))
+                self.stats["refreshes"] += 1
+            except Exception as e:
+                # Keep serving the stale entry; the next stale hit retries
+                self.stats["refresh_errors"] += 1
+                print(f"   ⚠️  Result cache refresh failed: {e}")
+
+        threading.Thread(target=run, name=f"result-refresh-{key[-8:]}", daemon=True).start()
+        return True
+
+    def _compute_and_store(self, key: str, compute: Callable[[], FinalOutput], ttl: int) -> FinalOutput:
+        output = compute()
+        self.put_entry(key, output, ttl)
+        return output
+
+    # =========================================================================
+    # STORAGE
+    # =========================================================================
+
+    def get_entry(self, key: str) -> Optional[Tuple[FinalOutput, float]]:
+        """
+        Look up an entry in either tier.
+
+        Returns:
+            (output, store time) or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if self.redis is None:
+            return None
+        raw = self.redis.get(key)
+        if raw is None:
+            return None
+        record = json.loads(raw)
+        entry = (FinalOutput.model_validate(record["output"]), record["stored_at"])
+        self._remember(key, entry)
+        return entry
+
+    def put_entry(
+        self,
+        key: str,
+        output: FinalOutput,
+        ttl_seconds: Optional[int] = None,
+        stored_at: Optional[float] = None,
+    ) -> None:
+        """
+        Store an output in both tiers.
+
+        Args:
+            key: Cache key
+            output: Final output
+            ttl_seconds: Fresh lifetime (sets the Redis expiry)
+            stored_at: Store time (default: now)
+        """
+        entry = (output, time.time() if stored_at is None else stored_at)
+        self._remember(key, entry)
+        if self.redis is not None:
+            record = {"stored_at": entry[1], "output": output.model_dump(mode="json")}
+            ttl = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+            self.redis.set(key, json.dumps(record), ex=ttl + self.stale_seconds)
+
+    def put(self, brief: Brief, output: FinalOutput) -> None:
+        """Store the output of a brief."""
+        self.put_entry(self.key(brief), output, self.ttl(brief))
+
+    def invalidate(self, brief: Brief) -> None:
+        """Drop a brief's entry from both tiers."""
+        key = self.key(brief)
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.redis is not None:
+            self.redis.delete(key)
+
+    def _remember(self, key: str, entry: Tuple[FinalOutput, float]) -> None:
+        """Insert into L1, evicting least-recently-used entries."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit/miss counters, hit rate and entry count
+        """
+        served = self.stats["hits"] + self.stats["stale_hits"]
+        lookups = served + self.stats["misses"] + self.stats["shared"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "hit_rate": served / lookups if lookups else 0.0,
+            "refreshing": self.flight.get_stats()["in_flight"],
+        }
+
+
+def create_result_cache() -> ResultCache:
+    """Create the result cache from settings."""
+    settings = get_settings()
+
+    redis_client = None
+    if settings.result_cache_backend == "redis":
+        import redis
+        redis_client = redis.Redis.from_url(settings.redis_url)
+
+    return ResultCache(
+        default_ttl_seconds=settings.cache_ttl,
+        stale_seconds=settings.result_cache_stale_seconds,
+        max_entries=settings.result_cache_size,
+        length_bucket=settings.result_cache_length_bucket,
+        redis_client=redis_client,
+    )
@@ -0,0 +1,32 @@
+"""
+Database package - Async persistence for runs, tasks, events and outputs.
+"""
+
+from .backends import (
+    DatabaseBackend,
+    PostgresBackend,
+    SQLiteBackend,
+    create_backend,
+)
+
+from .write_buffer import WriteBehindBuffer
+
+from .repository import (
+    RunRepository,
+    create_repository,
+)
+
+__all__ = [
+    # Backends
+    "DatabaseBackend",
+    "PostgresBackend",
+    "SQLiteBackend",
+    "create_backend",
+
+    # Buffering
+    "WriteBehindBuffer",
+
+    # Repository
+    "RunRepository",
+    "create_repository",
+]
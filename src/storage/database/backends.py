@@ -0,0 +1,374 @@
+"""
+Database Backends - Async storage drivers for the persistence layer.
+
+Two backends share one interface:
+1. PostgresBackend - asyncpg connection pool, bulk writes via COPY
+2. SQLiteBackend   - stdlib sqlite3, local stand-in for tests and dev
+
+Tables are declared once in TABLES with portable column types and
+rendered per dialect.
+"""
+
+import asyncio
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import asyncpg
+except ImportError:  # pragma: no cover - exercised only without asyncpg
+    asyncpg = None
+
+
+# =============================================================================
+# SCHEMA
+# =============================================================================
+
+# Portable type -> (postgres type, sqlite type)
+COLUMN_TYPES: Dict[str, Tuple[str, str]] = {
+    "text": ("TEXT", "TEXT"),
+    "int": ("BIGINT", "INTEGER"),
+    "float": ("DOUBLE PRECISION", "REAL"),
+    "bytes": ("BYTEA", "BLOB"),
+    "timestamp": ("TIMESTAMP", "TEXT"),
+    "json": ("JSONB", "TEXT"),
+}
+
+# Table -> (columns [(name, portable type)], primary key columns)
+TABLES: Dict[str, Tuple[List[Tuple[str, str]], List[str]]] = {
+    "runs": (
+        [
+            ("run_id", "text"),
+            ("topic", "text"),
+            ("content_type", "text"),
+            ("status", "text"),
+            ("iteration", "int"),
+            ("total_cost", "float"),
+            ("total_tokens", "int"),
+            ("started_at", "timestamp"),
+            ("completed_at", "timestamp"),
+        ],
+        ["run_id"],
+    ),
+    "tasks": (
+        [
+            ("run_id", "text"),
+            ("task_id", "text"),
+            ("worker_id", "text"),
+            ("step_id", "text"),
+            ("plan_id", "text"),
+            ("status", "text"),
+            ("duration_seconds", "float"),
+            ("cost", "float"),
+            ("tokens_used", "int"),
+            ("created_at", "timestamp"),
+        ],
+        [],
+    ),
+    "agent_events": (
+        [
+            ("run_id", "text"),
+            ("seq", "int"),
+            ("agent", "text"),
+            ("action", "text"),
+            ("phase", "text"),
+            ("details", "json"),
+            ("created_at", "timestamp"),
+        ],
+        [],
+    ),
+    "cost_records": (
+        [
+            ("run_id", "text"),
+            ("worker_id", "text"),
+            ("cost", "float"),
+            ("recorded_at", "timestamp"),
+        ],
+        [],
+    ),
+    "final_outputs": (
+        [
+            ("run_id", "text"),
+            ("codec", "text"),
+            ("payload", "bytes"),
+            ("size_bytes", "int"),
+            ("created_at", "timestamp"),
+        ],
+        ["run_id"],
+    ),
+}
+
+INDEXES: List[Tuple[str, str, List[str]]] = [
+    ("idx_tasks_run", "tasks", ["run_id"]),
+    ("idx_agent_events_run", "agent_events", ["run_id", "seq"]),
+    ("idx_cost_records_run", "cost_records", ["run_id"]),
+]
+
+
+def table_columns(table: str) -> List[str]:
+    """Get ordered column names for a table."""
+    return [name for name, _ in TABLES[table][0]]
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class DatabaseBackend(ABC):
+    """Interface implemented by all storage backends."""
+
+    dialect_index = 0  # Index into COLUMN_TYPES tuples
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Open connections."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close connections."""
+
+    @abstractmethod
+    async def insert_many(self, table: str, rows: Sequence[Sequence[Any]]) -> None:
+        """Bulk insert rows (full column order) into a table."""
+
+    @abstractmethod
+    async def upsert(self, table: str, row: Sequence[Any]) -> None:
+        """Insert or replace a row keyed by the table's primary key."""
+
+    @abstractmethod
+    async def fetch_one(self, table: str, key: str, value: Any) -> Optional[Dict[str, Any]]:
+        """Fetch a single row by column value."""
+
+    @abstractmethod
+    async def fetch_all(self, table: str, key: str, value: Any) -> List[Dict[str, Any]]:
+        """Fetch all rows matching a column value."""
+
+    def schema_statements(self) -> List[str]:
+        """Render CREATE TABLE / INDEX statements for this dialect."""
+        statements = []
+        for table, (columns, primary_key) in TABLES.items():
+            cols = [
+                f"{name} {COLUMN_TYPES[col_type][self.dialect_index]}"
+                for name, col_type in columns
+            ]
+            if primary_key:
+                cols.append(f"PRIMARY KEY ({', '.join(primary_key)})")
+            statements.append(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(cols)})")
+
+        for name, table, columns in INDEXES:
+            statements.append(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+        return statements
+
+    def _upsert_sql(self, table: str, placeholders: List[str]) -> str:
+        """Build INSERT ... ON CONFLICT DO UPDATE (valid for both dialects)."""
+        columns = table_columns(table)
+        primary_key = TABLES[table][1]
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in columns if c not in primary_key)
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(placeholders)}) "
+            f"ON CONFLICT ({', '.join(primary_key)}) DO UPDATE SET {updates}"
+        )
+
+
+class PostgresBackend(DatabaseBackend):
+    """
+    PostgreSQL backend on an asyncpg connection pool.
+
+    Bulk inserts use COPY (copy_records_to_table), which is far cheaper
+    than row-by-row INSERTs for task/event/cost batches.
+    """
+
+    dialect_index = 0
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 10):
+        """
+        Initialize backend.
+
+        Args:
+            dsn: postgresql:// DSN (SQLAlchemy-style +asyncpg suffix is accepted)
+            min_size: Minimum pool size
+            max_size: Maximum pool size
+        """
+        self.dsn = dsn.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.pool = None
+
+    async def connect(self) -> None:
+        """Create the pool and ensure schema exists."""
+        if asyncpg is None:
+            raise ImportError("asyncpg is required for the PostgreSQL backend")
+        self.pool = await asyncpg.create_pool(
+            self.dsn, min_size=self.min_size, max_size=self.max_size
+        )
+        async with self.pool.acquire() as conn:
+            for statement in self.schema_statements():
+                await conn.execute(statement)
+
+    async def close(self) -> None:
+        """Close the pool."""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    async def insert_many(self, table: str, rows: Sequence[Sequence[Any]]) -> None:
+        """Bulk insert with COPY."""
+        if not rows:
+            return
+        async with self.pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                table,
+                records=[self._adapt_row(table, row) for row in rows],
+                columns=table_columns(table),
+            )
+
+    async def upsert(self, table: str, row: Sequence[Any]) -> None:
+        """Insert or update a row."""
+        placeholders = [f"${i}" for i in range(1, len(row) + 1)]
+        async with self.pool.acquire() as conn:
+            await conn.execute(self._upsert_sql(table, placeholders), *self._adapt_row(table, row))
+
+    async def fetch_one(self, table: str, key: str, value: Any) -> Optional[Dict[str, Any]]:
+        """Fetch a single row."""
+        async with self.pool.acquire() as conn:
+            record = await conn.fetchrow(f"SELECT * FROM {table} WHERE {key} = $1", value)
+        return dict(record) if record else None
+
+    async def fetch_all(self, table: str, key: str, value: Any) -> List[Dict[str, Any]]:
+        """Fetch all matching rows."""
+        async with self.pool.acquire() as conn:
+            records = await conn.fetch(f"SELECT * FROM {table} WHERE {key} = $1", value)
+        return [dict(r) for r in records]
+
+    def _adapt_row(self, table: str, row: Sequence[Any]) -> Tuple[Any, ...]:
+        """Convert JSON columns to text for asyncpg."""
+        types = [col_type for _, col_type in TABLES[table][0]]
+        return tuple(
+            json.dumps(v, default=str) if t == "json" and v is not None and not isinstance(v, str) else v
+            for v, t in zip(row, types, strict=True)
+        )
+
+
+class SQLiteBackend(DatabaseBackend):
+    """
+    SQLite backend - local stand-in for PostgreSQL.
+
+    Uses stdlib sqlite3 on a worker thread; bulk inserts use executemany
+    inside a single transaction.
+    """
+
+    dialect_index = 1
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Initialize backend.
+
+        Args:
+            path: Database file path or ":memory:"
+        """
+        self.path = path
+        self.conn: Optional[sqlite3.Connection] = None
+        self._lock = asyncio.Lock()
+
+    async def connect(self) -> None:
+        """Open the database and ensure schema exists."""
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        if self.path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        await self._run(self._executescript, self.schema_statements())
+
+    async def close(self) -> None:
+        """Close the database."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    async def insert_many(self, table: str, rows: Sequence[Sequence[Any]]) -> None:
+        """Bulk insert with executemany."""
+        if not rows:
+            return
+        columns = table_columns(table)
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        await self._run(self._executemany, sql, [self._adapt_row(table, r) for r in rows])
+
+    async def upsert(self, table: str, row: Sequence[Any]) -> None:
+        """Insert or update a row."""
+        sql = self._upsert_sql(table, ["?"] * len(row))
+        await self._run(self._executemany, sql, [self._adapt_row(table, row)])
+
+    async def fetch_one(self, table: str, key: str, value: Any) -> Optional[Dict[str, Any]]:
+        """Fetch a single row."""
+        rows = await self.fetch_all(table, key, value)
+        return rows[0] if rows else None
+
+    async def fetch_all(self, table: str, key: str, value: Any) -> List[Dict[str, Any]]:
+        """Fetch all matching rows."""
+        sql = f"SELECT * FROM {table} WHERE {key} = ?"
+        rows = await self._run(lambda: self.conn.execute(sql, (value,)).fetchall())
+        return [self._restore_row(table, dict(r)) for r in rows]
+
+    # Internals ---------------------------------------------------------------
+
+    async def _run(self, fn, *args):
+        """Run a blocking sqlite call on a thread, one at a time."""
+        async with self._lock:
+            return await asyncio.to_thread(fn, *args)
+
+    def _executescript(self, statements: List[str]) -> None:
+        """Execute schema statements."""
+        with self.conn:
+            for statement in statements:
+                self.conn.execute(statement)
+
+    def _executemany(self, sql: str, rows: List[Tuple[Any, ...]]) -> None:
+        """Execute many rows in one transaction."""
+        with self.conn:
+            self.conn.executemany(sql, rows)
+
+    def _adapt_row(self, table: str, row: Sequence[Any]) -> Tuple[Any, ...]:
+        """Convert datetimes to ISO text and JSON columns to text."""
+        types = [col_type for _, col_type in TABLES[table][0]]
+        adapted = []
+        for value, col_type in zip(row, types, strict=True):
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif col_type == "json" and value is not None and not isinstance(value, str):
+                value = json.dumps(value, default=str)
+            adapted.append(value)
+        return tuple(adapted)
+
+    def _restore_row(self, table: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert ISO text back to datetimes to match the Postgres backend."""
+        for name, col_type in TABLES[table][0]:
+            if col_type == "timestamp" and row.get(name):
+                row[name] = datetime.fromisoformat(row[name])
+        return row
+
+
+def create_backend(
+    database_url: str,
+    min_pool_size: int = 1,
+    max_pool_size: int = 10,
+) -> DatabaseBackend:
+    """
+    Create a backend from a database URL.
+
+    Args:
+        database_url: postgresql[+asyncpg]://... or sqlite:///path (sqlite:///:memory:)
+        min_pool_size: Postgres pool minimum
+        max_pool_size: Postgres pool maximum
+
+    Returns:
+        Unconnected backend
+    """
+    if database_url.startswith(("postgresql://", "postgresql+asyncpg://", "postgres://")):
+        return PostgresBackend(database_url, min_size=min_pool_size, max_size=max_pool_size)
+    if database_url.startswith("sqlite:///"):
+        return SQLiteBackend(database_url[len("sqlite:///"):] or ":memory:")
+    raise ValueError(f"Unsupported database URL: {database_url}")
@@ -0,0 +1,248 @@
+"""
+Run Repository - Persistence for runs, tasks, events, costs and outputs.
+
+High-level API used by the meta agents. Run rows and final outputs are
+written directly (upsert); per-run tasks, agent events and cost records
+go through the write-behind buffer and are persisted in batches.
+
+Final outputs are encoded with the schema-versioned codec and stored
+zstd-compressed.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.meta_agent.schemas import AgentState, FinalOutput, Task, WorkflowPhase
+from src.storage.blob.blob_store import compress, decompress
+from src.utils.codec import get_codec
+from config.settings import get_settings
+
+from .backends import DatabaseBackend, create_backend
+from .write_buffer import WriteBehindBuffer
+
+
+class RunRepository:
+    """
+    Repository for workflow run data.
+
+    Tracks how much of each run's agent history has already been
+    buffered so persist_state() can be called repeatedly (e.g. after
+    every phase) without duplicating events. Offsets are dropped once a
+    run reaches a terminal phase.
+    """
+
+    def __init__(
+        self,
+        backend: DatabaseBackend,
+        max_batch_size: int = 500,
+        flush_interval_seconds: float = 1.0,
+    ):
+        """
+        Initialize repository.
+
+        Args:
+            backend: Database backend (connected in connect())
+            max_batch_size: Write-behind batch size
+            flush_interval_seconds: Write-behind flush period
+        """
+        self.backend = backend
+        self.buffer = WriteBehindBuffer(
+            backend,
+            max_batch_size=max_batch_size,
+            flush_interval_seconds=flush_interval_seconds,
+        )
+        self.codec = get_codec()
+        # Outputs are compressed, where msgpack is no smaller than JSON
+        self.output_format = self.codec.default_format
+
+        self._event_offsets: Dict[str, int] = {}
+        self._task_offsets: Dict[str, int] = {}
+
+    async def connect(self) -> None:
+        """Connect backend and start background flushing."""
+        await self.backend.connect()
+        self.buffer.start()
+
+    async def close(self) -> None:
+        """Flush pending writes and close the backend."""
+        await self.buffer.close()
+        await self.backend.close()
+
+    async def flush(self) -> int:
+        """Flush buffered rows now."""
+        return await self.buffer.flush()
+
+    # =========================================================================
+    # RUNS
+    # =========================================================================
+
+    async def record_run(self, state: AgentState) -> None:
+        """
+        Insert or update the run row for a state.
+
+        Args:
+            state: Current workflow state
+        """
+        run_id = self._run_id(state)
+        await self.backend.upsert("runs", (
+            run_id,
+            state.brief.topic,
+            state.brief.content_type,
+            state.current_phase,
+            state.iteration,
+            state.total_cost,
+            state.total_tokens_used,
+            state.started_at,
+            state.completed_at,
+        ))
+
+    async def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Get a run row."""
+        return await self.backend.fetch_one("runs", "run_id", run_id)
+
+    # =========================================================================
+    # BUFFERED WRITES
+    # =========================================================================
+
+    async def record_tasks(self, run_id: str, tasks: List[Task]) -> None:
+        """Buffer task rows."""
+        await self.buffer.add_many("tasks", [
+            (
+                run_id,
+                t.task_id,
+                t.worker_id,
+                t.step_id,
+                t.plan_id,
+                t.status,
+                t.duration_seconds,
+                t.cost,
+                t.tokens_used,
+                t.created_at,
+            )
+            for t in tasks
+        ])
+
+    async def record_events(self, run_id: str, events: List[Dict[str, Any]], start_seq: int = 0) -> None:
+        """Buffer agent history events."""
+        await self.buffer.add_many("agent_events", [
+            (
+                run_id,
+                start_seq + i,
+                e.get("agent"),
+                e.get("action"),
+                e.get("phase"),
+                e.get("details", {}),
+                self._parse_timestamp(e.get("timestamp")),
+            )
+            for i, e in enumerate(events)
+        ])
+
+    async def record_cost(self, run_id: str, worker_id: str, cost: float) -> None:
+        """Buffer a single cost record."""
+        await self.buffer.add("cost_records", (run_id, worker_id, cost, datetime.utcnow()))
+
+    async def persist_state(self, state: AgentState) -> None:
+        """
+        Persist a state incrementally.
+
+        Upserts the run row and buffers only tasks and events added
+        since the previous call for this run. Once the run is completed
+        or failed its offsets are forgotten, so a long-lived repository
+        doesn't grow with every run it has seen.
+        """
+        run_id = self._run_id(state)
+        await self.record_run(state)
+
+        task_offset = self._task_offsets.get(run_id, 0)
+        await self.record_tasks(run_id, state.all_tasks[task_offset:])
+        self._task_offsets[run_id] = len(state.all_tasks)
+
+        event_offset = self._event_offsets.get(run_id, 0)
+        await self.record_events(run_id, state.agent_history[event_offset:], start_seq=event_offset)
+        self._event_offsets[run_id] = len(state.agent_history)
+
+        if state.current_phase in (WorkflowPhase.COMPLETED, WorkflowPhase.FAILED):
+            self._task_offsets.pop(run_id, None)
+            self._event_offsets.pop(run_id, None)
+
+    async def get_tasks(self, run_id: str) -> List[Dict[str, Any]]:
+        """Get persisted task rows for a run."""
+        return await self.backend.fetch_all("tasks", "run_id", run_id)
+
+    async def get_events(self, run_id: str) -> List[Dict[str, Any]]:
+        """Get persisted agent events for a run, in order."""
+        rows = await self.backend.fetch_all("agent_events", "run_id", run_id)
+        return sorted(rows, key=lambda r: r["seq"])
+
+    async def get_costs(self, run_id: str) -> List[Dict[str, Any]]:
+        """Get persisted cost records for a run."""
+        return await self.backend.fetch_all("cost_records", "run_id", run_id)
+
+    # =========================================================================
+    # FINAL OUTPUTS
+    # =========================================================================
+
+    async def save_final_output(self, run_id: str, output: FinalOutput) -> int:
+        """
+        Store a final output (codec-encoded, compressed).
+
+        Returns:
+            Stored payload size in bytes
+        """
+        payload = compress(self.codec.encode(output, self.output_format))
+        await self.backend.upsert("final_outputs", (
+            run_id,
+            self.output_format,
+            payload,
+            len(payload),
+            datetime.utcnow(),
+        ))
+        return len(payload)
+
+    async def load_final_output(self, run_id: str) -> Optional[FinalOutput]:
+        """Load and decode a stored final output."""
+        row = await self.backend.fetch_one("final_outputs", "run_id", run_id)
+        if row is None:
+            return None
+        return self.codec.decode(decompress(bytes(row["payload"])), expected=FinalOutput)
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    def _run_id(self, state: AgentState) -> str:
+        """Get run ID for a state."""
+        return state.brief.request_id or "unknown"
+
+    def _parse_timestamp(self, value: Any) -> Optional[datetime]:
+        """Parse an ISO timestamp from agent history."""
+        if isinstance(value, datetime) or value is None:
+            return value
+        return datetime.fromisoformat(value)
+
+
+def create_repository(database_url: Optional[str] = None) -> RunRepository:
+    """
+    Create a repository from settings (or an explicit URL).
+
+    Args:
+        database_url: Override settings.database_url (e.g. sqlite:///runs.db)
+
+    Returns:
+        Unconnected repository; call `await repo.connect()`
+    """
+    settings = get_settings()
+    backend = create_backend(
+        database_url or settings.database_url,
+        min_pool_size=settings.database_pool_min_size,
+        max_pool_size=settings.database_pool_max_size,
+    )
+    return RunRepository(
+        backend,
+        max_batch_size=settings.database_write_batch_size,
+        flush_interval_seconds=settings.database_flush_interval_seconds,
+    )
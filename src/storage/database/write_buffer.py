@@ -0,0 +1,124 @@
+"""
+Write-Behind Buffer - Batches row writes for the persistence layer.
+
+Callers append rows without waiting on the database. Rows are flushed
+per table in one bulk call (COPY / executemany) when a table's batch
+is full, on a periodic timer, or on explicit flush/close.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+
+from .backends import DatabaseBackend
+
+
+class WriteBehindBuffer:
+    """
+    Per-table write-behind buffer in front of a DatabaseBackend.
+
+    Failed flushes put rows back at the front of the queue so nothing
+    is lost; the error is re-raised to the caller that triggered it.
+    """
+
+    def __init__(
+        self,
+        backend: DatabaseBackend,
+        max_batch_size: int = 500,
+        flush_interval_seconds: float = 1.0,
+    ):
+        """
+        Initialize buffer.
+
+        Args:
+            backend: Connected database backend
+            max_batch_size: Rows per table that trigger an immediate flush
+            flush_interval_seconds: Period of the background flusher
+        """
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+
+        self._pending: Dict[str, List[Sequence[Any]]] = defaultdict(list)
+        self._lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+
+        # Stats
+        self.rows_written = 0
+        self.flush_count = 0
+
+    def start(self) -> None:
+        """Start the periodic background flusher."""
+        if self._flusher is None and self.flush_interval_seconds > 0:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def add(self, table: str, row: Sequence[Any]) -> None:
+        """Buffer a row; flushes the table if its batch is full."""
+        await self.add_many(table, [row])
+
+    async def add_many(self, table: str, rows: Sequence[Sequence[Any]]) -> None:
+        """Buffer several rows for one table."""
+        if not rows:
+            return
+        self._pending[table].extend(rows)
+        if len(self._pending[table]) >= self.max_batch_size:
+            await self.flush(table)
+
+    def pending_count(self, table: Optional[str] = None) -> int:
+        """Number of buffered rows (for one table or all)."""
+        if table is not None:
+            return len(self._pending.get(table, []))
+        return sum(len(rows) for rows in self._pending.values())
+
+    async def flush(self, table: Optional[str] = None) -> int:
+        """
+        Write buffered rows to the backend.
+
+        Args:
+            table: Table to flush (None = all tables)
+
+        Returns:
+            Number of rows written
+        """
+        async with self._lock:
+            tables = [table] if table is not None else list(self._pending.keys())
+            written = 0
+
+            for name in tables:
+                rows = self._pending.get(name)
+                if not rows:
+                    continue
+                self._pending[name] = []
+                try:
+                    await self.backend.insert_many(name, rows)
+                except Exception:
+                    # Re-queue ahead of anything added meanwhile
+                    self._pending[name] = rows + self._pending[name]
+                    raise
+                written += len(rows)
+
+            if written:
+                self.rows_written += written
+                self.flush_count += 1
+            return written
+
+    async def close(self) -> None:
+        """Stop the background flusher and flush everything."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+
+    async def _flush_periodically(self) -> None:
+        """Background loop flushing on a timer."""
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                # Rows stay buffered; retry on next tick
+                print(f"⚠️  Write buffer flush failed: {e}")
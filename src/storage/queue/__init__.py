@@ -0,0 +1,27 @@
+"""
+Queue package - Job and task queues for distributed execution.
+"""
+
+from .job_queue import (
+    SQLiteJobQueue,
+    JobWorker,
+    Job,
+    JobStatus,
+)
+from .redis_streams import (
+    RedisTaskQueue,
+    StreamWorker,
+    CONSUMER_GROUP,
+)
+
+__all__ = [
+    # Local job queue
+    "SQLiteJobQueue",
+    "JobWorker",
+    "Job",
+    "JobStatus",
+    # Distributed task queue
+    "RedisTaskQueue",
+    "StreamWorker",
+    "CONSUMER_GROUP",
+]
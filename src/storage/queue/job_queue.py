@@ -0,0 +1,440 @@
+"""
+Job Queue - Durable SQLite-WAL queue for briefs on a single node.
+
+Lets several worker processes on one machine pull briefs and run them
+through ControllerAgent.execute in parallel without an external broker.
+
+Semantics:
+- claim() atomically leases the oldest available job (BEGIN IMMEDIATE)
+- A lease expires after the visibility timeout unless heartbeated
+- Expired leases are re-claimable (retry) until max_attempts is reached,
+  after which the job is marked dead
+- complete()/fail() require the lease token, so a worker whose lease
+  expired cannot overwrite the result of the worker that took over
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from src.meta_agent.schemas import Brief
+from config.settings import get_settings
+
+
+class JobStatus(str, Enum):
+    """Status of a queued job."""
+    PENDING = "pending"
+    LEASED = "leased"
+    COMPLETED = "completed"
+    DEAD = "dead"
+
+
+class Job(BaseModel):
+    """A queued job."""
+
+    job_id: str = Field(..., description="Unique job ID")
+    payload: Dict[str, Any] = Field(..., description="Job payload (e.g. serialized Brief)")
+    status: JobStatus = Field(default=JobStatus.PENDING)
+    priority: int = Field(default=0, description="Higher runs first")
+
+    attempts: int = Field(default=0, ge=0, description="Times this job has been claimed")
+    max_attempts: int = Field(default=3, ge=1)
+
+    lease_owner: Optional[str] = Field(default=None, description="Worker holding the lease")
+    lease_token: Optional[str] = Field(default=None, description="Token required to ack the lease")
+    lease_expires_at: Optional[float] = Field(default=None, description="Epoch seconds")
+    available_at: float = Field(..., description="Epoch seconds when job may be claimed")
+
+    result: Optional[bytes] = Field(default=None, description="Encoded result")
+    error: Optional[str] = Field(default=None)
+
+    created_at: float = Field(..., description="Epoch seconds")
+    updated_at: float = Field(..., description="Epoch seconds")
+
+    class Config:
+        use_enum_values = True
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_token TEXT,
+    lease_expires_at REAL,
+    available_at REAL NOT NULL,
+    result BLOB,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority DESC, available_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs (status, lease_expires_at);
+"""
+
+
+class SQLiteJobQueue:
+    """
+    Durable job queue on SQLite in WAL mode.
+
+    Each process (or thread) should use its own instance; instances
+    pointing at the same file coordinate through SQLite locking.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        visibility_timeout: float = 300.0,
+        max_attempts: int = 3,
+    ):
+        """
+        Initialize queue.
+
+        Args:
+            path: SQLite database file
+            visibility_timeout: Lease duration in seconds
+            max_attempts: Claims allowed before a job is marked dead
+        """
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.conn.close()
+
+    # =========================================================================
+    # PRODUCER API
+    # =========================================================================
+
+    def enqueue(
+        self,
+        payload: Dict[str, Any],
+        priority: int = 0,
+        delay_seconds: float = 0.0,
+        max_attempts: Optional[int] = None,
+    ) -> str:
+        """
+        Add a job.
+
+        Args:
+            payload: JSON-serializable payload
+            priority: Higher values are claimed first
+            delay_seconds: Delay before the job becomes claimable
+            max_attempts: Override queue default
+
+        Returns:
+            Job ID
+        """
+        job_id = f"job_{uuid.uuid4().hex}"
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO jobs (job_id, payload, status, priority, max_attempts, "
+                "available_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    json.dumps(payload, default=str),
+                    JobStatus.PENDING.value,
+                    priority,
+                    max_attempts or self.max_attempts,
+                    now + delay_seconds,
+                    now,
+                    now,
+                ),
+            )
+        return job_id
+
+    def enqueue_brief(self, brief: Brief, priority: int = 0) -> str:
+        """Enqueue a brief for execution."""
+        return self.enqueue({"brief": brief.model_dump(mode="json")}, priority=priority)
+
+    # =========================================================================
+    # CONSUMER API
+    # =========================================================================
+
+    def claim(self, worker_id: str, lease_seconds: Optional[float] = None) -> Optional[Job]:
+        """
+        Atomically lease the next available job.
+
+        A job is available if it is pending and due, or if its lease
+        expired and it still has attempts left.
+
+        Args:
+            worker_id: Identity of the claiming worker
+            lease_seconds: Lease duration (defaults to visibility timeout)
+
+        Returns:
+            Leased job, or None if nothing is available
+        """
+        now = time.time()
+        lease_seconds = lease_seconds if lease_seconds is not None else self.visibility_timeout
+        token = uuid.uuid4().hex
+
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Expired leases that are out of attempts are dead
+                self.conn.execute(
+                    "UPDATE jobs SET status = ?, error = COALESCE(error, 'lease expired'), "
+                    "lease_token = NULL, updated_at = ? "
+                    "WHERE status = ? AND lease_expires_at < ? AND attempts >= max_attempts",
+                    (JobStatus.DEAD.value, now, JobStatus.LEASED.value, now),
+                )
+                row = self.conn.execute(
+                    "UPDATE jobs SET status = ?, lease_owner = ?, lease_token = ?, "
+                    "lease_expires_at = ?, attempts = attempts + 1, updated_at = ? "
+                    "WHERE job_id = ("
+                    "  SELECT job_id FROM jobs "
+                    "  WHERE (status = ? AND available_at <= ?) "
+                    "     OR (status = ? AND lease_expires_at < ?) "
+                    "  ORDER BY priority DESC, available_at LIMIT 1"
+                    ") RETURNING *",
+                    (
+                        JobStatus.LEASED.value, worker_id, token, now + lease_seconds, now,
+                        JobStatus.PENDING.value, now,
+                        JobStatus.LEASED.value, now,
+                    ),
+                ).fetchone()
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+        return self._row_to_job(row) if row else None
+
+    def heartbeat(self, job: Job, lease_seconds: Optional[float] = None) -> bool:
+        """
+        Extend a lease.
+
+        Returns:
+            False if the lease was lost (expired and re-claimed)
+        """
+        lease_seconds = lease_seconds if lease_seconds is not None else self.visibility_timeout
+        now = time.time()
+        with self._lock:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET lease_expires_at = ?, updated_at = ? "
+                "WHERE job_id = ? AND lease_token = ? AND status = ?",
+                (now + lease_seconds, now, job.job_id, job.lease_token, JobStatus.LEASED.value),
+            )
+        if cursor.rowcount:
+            job.lease_expires_at = now + lease_seconds
+        return cursor.rowcount == 1
+
+    def complete(self, job: Job, result: Optional[bytes] = None) -> bool:
+        """
+        Mark a leased job completed.
+
+        Returns:
+            False if the lease was lost
+        """
+        with self._lock:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, lease_token = NULL, "
+                "lease_expires_at = NULL, updated_at = ? "
+                "WHERE job_id = ? AND lease_token = ? AND status = ?",
+                (
+                    JobStatus.COMPLETED.value, result, time.time(),
+                    job.job_id, job.lease_token, JobStatus.LEASED.value,
+                ),
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job: Job, error: str, retry_delay_seconds: float = 0.0) -> bool:
+        """
+        Release a leased job after a failure.
+
+        The job is retried after `retry_delay_seconds` if it has attempts
+        left, otherwise it is marked dead.
+
+        Returns:
+            False if the lease was lost
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET "
+                "status = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END, "
+                "error = ?, available_at = ?, lease_owner = NULL, lease_token = NULL, "
+                "lease_expires_at = NULL, updated_at = ? "
+                "WHERE job_id = ? AND lease_token = ? AND status = ?",
+                (
+                    JobStatus.DEAD.value, JobStatus.PENDING.value,
+                    error, now + retry_delay_seconds, now,
+                    job.job_id, job.lease_token, JobStatus.LEASED.value,
+                ),
+            )
+        return cursor.rowcount == 1
+
+    # =========================================================================
+    # INSPECTION
+    # =========================================================================
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """Get a job by ID."""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Count jobs by status."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"
+            ).fetchall()
+        stats = {status.value: 0 for status in JobStatus}
+        stats.update({row["status"]: row["n"] for row in rows})
+        return stats
+
+    def _row_to_job(self, row: sqlite3.Row) -> Job:
+        """Convert a row to a Job."""
+        data = dict(row)
+        data["payload"] = json.loads(data["payload"])
+        return Job(**data)
+
+
+class JobWorker:
+    """
+    Worker loop that executes queued briefs.
+
+    Claims a job, runs the brief through the controller while a
+    background thread heartbeats the lease, and stores the encoded
+    FinalOutput as the job result.
+    """
+
+    def __init__(
+        self,
+        queue: SQLiteJobQueue,
+        controller: Optional[Any] = None,
+        worker_id: Optional[str] = None,
+        retry_delay_seconds: float = 5.0,
+    ):
+        """
+        Initialize worker.
+
+        Args:
+            queue: Job queue
+            controller: Object with execute(brief) -> FinalOutput (defaults to ControllerAgent)
+            worker_id: Worker identity (defaults to host:pid)
+            retry_delay_seconds: Delay before a failed job is retried
+        """
+        if controller is None:
+            from src.meta_agent.controller import ControllerAgent
+            controller = ControllerAgent()
+
+        self.queue = queue
+        self.controller = controller
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.retry_delay_seconds = retry_delay_seconds
+        self.jobs_processed = 0
+
+    def run_once(self) -> Optional[Job]:
+        """
+        Claim and process a single job.
+
+        Returns:
+            The processed job, or None if the queue was empty
+        """
+        from src.utils.codec import get_codec
+
+        job = self.queue.claim(self.worker_id)
+        if job is None:
+            return None
+
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat_loop, args=(job, stop), daemon=True)
+        heartbeat.start()
+
+        try:
+            brief = Brief.model_validate(job.payload["brief"])
+            output = self.controller.execute(brief)
+            self.queue.complete(job, get_codec().encode(output))
+        except Exception as e:
+            self.queue.fail(job, f"{type(e).__name__}: {e}", self.retry_delay_seconds)
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        self.jobs_processed += 1
+        return job
+
+    def run_forever(self, poll_interval: float = 1.0, max_jobs: Optional[int] = None) -> None:
+        """
+        Process jobs until max_jobs is reached (or forever).
+
+        Args:
+            poll_interval: Sleep when the queue is empty
+            max_jobs: Stop after this many jobs (None = never)
+        """
+        while max_jobs is None or self.jobs_processed < max_jobs:
+            if self.run_once() is None:
+                time.sleep(poll_interval)
+
+    def _heartbeat_loop(self, job: Job, stop: threading.Event) -> None:
+        """Extend the lease at a third of the visibility timeout."""
+        interval = max(self.queue.visibility_timeout / 3, 0.01)
+        while not stop.wait(interval):
+            if not self.queue.heartbeat(job):
+                return
+
+
+def _worker_process(path: str, poll_interval: float) -> None:
+    """Entry point for a worker process."""
+    settings = get_settings()
+    queue = SQLiteJobQueue(
+        path,
+        visibility_timeout=settings.job_visibility_timeout_seconds,
+        max_attempts=settings.job_max_attempts,
+    )
+    JobWorker(queue).run_forever(poll_interval=poll_interval)
+
+
+def main() -> None:
+    """Run one or more worker processes against a queue file."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Run SQLite job queue workers")
+    parser.add_argument("--db", default=settings.job_queue_path, help="Queue database path")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Idle poll interval")
+    args = parser.parse_args()
+
+    print(f"🚀 Starting {args.processes} queue worker(s) on {args.db}")
+    processes = [
+        multiprocessing.Process(target=_worker_process, args=(args.db, args.poll_interval))
+        for _ in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
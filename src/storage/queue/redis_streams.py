@@ -0,0 +1,403 @@
+"""
+Redis Streams Task Queue - Distributed worker execution across nodes.
+
+The Orchestrator enqueues Tasks onto per-category streams; stateless
+worker processes on any node consume them through a consumer group,
+execute them, and publish TaskResults to a per-plan reply stream.
+
+Streams:
+- {ns}:tasks:{category}  Task streams (research, analysis, writing, quality)
+- {ns}:replies:{plan_id} Reply stream read by the waiting Orchestrator,
+                         expiring reply_ttl_seconds after its last reply
+- {ns}:tasks:dead        Dead-letter stream for poison messages
+
+Delivery:
+- Messages are acked only after the reply is published
+- Messages idle longer than claim_idle_ms (crashed consumer) are
+  reclaimed with XAUTOCLAIM and redelivered
+- After max_deliveries a message is dead-lettered and a failure reply
+  is sent so the Orchestrator never waits on it forever
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import argparse
+import os
+import socket
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.meta_agent.schemas import Task, TaskResult
+from src.utils.codec import get_codec
+from config.settings import get_settings
+from config.worker_registry import get_worker_registry, WorkerCategory
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - exercised only without redis
+    redis = None
+
+
+CONSUMER_GROUP = "workers"
+
+
+class RedisTaskQueue:
+    """
+    Task queue on Redis Streams.
+
+    Shared by producers (Orchestrator) and consumers (StreamWorker).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        namespace: str = "autoresearch",
+        max_deliveries: int = 3,
+        claim_idle_ms: int = 60000,
+        reply_ttl_seconds: int = 3600,
+    ):
+        """
+        Initialize queue.
+
+        Args:
+            client: redis.Redis-compatible client (decode_responses=False)
+            namespace: Key prefix
+            max_deliveries: Deliveries before a message is dead-lettered
+            claim_idle_ms: Idle time before a pending message is reclaimed
+            reply_ttl_seconds: Lifetime of a reply stream after its last
+                reply, so streams nobody deletes (timed-out waits, late
+                replies) cannot leak
+        """
+        self.client = client
+        self.namespace = namespace
+        self.max_deliveries = max_deliveries
+        self.claim_idle_ms = claim_idle_ms
+        self.reply_ttl_seconds = reply_ttl_seconds
+        self.codec = get_codec()
+        self.registry = get_worker_registry()
+        self._groups_ready: set = set()
+
+    @classmethod
+    def from_url(cls, url: Optional[str] = None, **kwargs: Any) -> "RedisTaskQueue":
+        """Create a queue from a Redis URL (defaults to settings.redis_url)."""
+        if redis is None:
+            raise ImportError("redis is required for the Redis task queue")
+        return cls(redis.Redis.from_url(url or get_settings().redis_url), **kwargs)
+
+    # =========================================================================
+    # KEYS
+    # =========================================================================
+
+    def task_stream(self, category: str) -> str:
+        """Stream name for a worker category."""
+        return f"{self.namespace}:tasks:{category}"
+
+    def reply_stream(self, plan_id: str) -> str:
+        """Reply stream name for a plan."""
+        return f"{self.namespace}:replies:{plan_id}"
+
+    @property
+    def dead_letter_stream(self) -> str:
+        """Dead-letter stream name."""
+        return f"{self.namespace}:tasks:dead"
+
+    def category_for(self, worker_id: str) -> str:
+        """Route a worker to its category stream."""
+        worker_def = self.registry.get_worker(worker_id)
+        return worker_def.category if worker_def else "default"
+
+    def ensure_group(self, stream: str) -> None:
+        """Create the consumer group for a stream if missing."""
+        if stream in self._groups_ready:
+            return
+        try:
+            self.client.xgroup_create(stream, CONSUMER_GROUP, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._groups_ready.add(stream)
+
+    # =========================================================================
+    # PRODUCER API
+    # =========================================================================
+
+    def enqueue(self, task: Task, reply_to: str) -> str:
+        """
+        Enqueue a task.
+
+        Args:
+            task: Task to execute
+            reply_to: Reply stream for the result
+
+        Returns:
+            Stream message ID
+        """
+        stream = self.task_stream(self.category_for(task.worker_id))
+        self.ensure_group(stream)
+        message_id = self.client.xadd(stream, {
+            b"task": self.codec.encode(task),
+            b"reply_to": reply_to.encode(),
+        })
+        return self._str(message_id)
+
+    def wait_for_results(
+        self,
+        reply_to: str,
+        task_ids: Iterable[str],
+        timeout_seconds: float,
+    ) -> Dict[str, TaskResult]:
+        """
+        Block until results for all task IDs arrive or timeout.
+
+        Args:
+            reply_to: Reply stream
+            task_ids: Tasks to wait for
+            timeout_seconds: Overall deadline
+
+        Returns:
+            Results by task ID (missing tasks timed out)
+        """
+        waiting = set(task_ids)
+        results: Dict[str, TaskResult] = {}
+        deadline = time.time() + timeout_seconds
+        last_id = "0"
+
+        while waiting and time.time() < deadline:
+            block_ms = max(1, int(min(deadline - time.time(), 1.0) * 1000))
+            response = self.client.xread({reply_to: last_id}, count=100, block=block_ms)
+            for _, messages in response or []:
+                for message_id, fields in messages:
+                    last_id = self._str(message_id)
+                    result = self.codec.decode(fields[b"result"], expected=TaskResult)
+                    if result.task_id in waiting:
+                        waiting.discard(result.task_id)
+                        results[result.task_id] = result
+
+        return results
+
+    def delete_reply_stream(self, reply_to: str) -> None:
+        """Remove a reply stream once all results are collected."""
+        self.client.delete(reply_to)
+
+    # =========================================================================
+    # CONSUMER API
+    # =========================================================================
+
+    def consume(
+        self,
+        consumer: str,
+        categories: List[str],
+        count: int = 10,
+        block_ms: int = 1000,
+    ) -> List[Tuple[str, str, Task, str]]:
+        """
+        Fetch tasks for a consumer.
+
+        Reclaims stale pending messages first, then reads new ones.
+
+        Args:
+            consumer: Consumer name (unique per worker process)
+            categories: Categories this worker serves
+            count: Max messages to return
+            block_ms: Block time when no new messages
+
+        Returns:
+            List of (stream, message_id, task, reply_to)
+        """
+        streams = [self.task_stream(c) for c in categories]
+        for stream in streams:
+            self.ensure_group(stream)
+
+        deliveries: List[Tuple[str, str, Task, str]] = []
+        for stream in streams:
+            deliveries.extend(self._reclaim(stream, consumer, count - len(deliveries)))
+            if len(deliveries) >= count:
+                return deliveries
+
+        response = self.client.xreadgroup(
+            CONSUMER_GROUP,
+            consumer,
+            {stream: ">" for stream in streams},
+            count=count - len(deliveries),
+            block=block_ms,
+        )
+        for stream, messages in response or []:
+            for message_id, fields in messages:
+                deliveries.append(self._parse(self._str(stream), message_id, fields))
+
+        return deliveries
+
+    def reply(self, reply_to: str, result: TaskResult) -> None:
+        """Publish a result to a reply stream (refreshing its expiry)."""
+        pipe = self.client.pipeline()
+        pipe.xadd(reply_to, {b"result": self.codec.encode(result)})
+        pipe.expire(reply_to, self.reply_ttl_seconds)
+        pipe.execute()
+
+    def ack(self, stream: str, message_id: str) -> None:
+        """Acknowledge a processed message."""
+        self.client.xack(stream, CONSUMER_GROUP, message_id)
+
+    def get_dead_letters(self, count: int = 100) -> List[Dict[str, Any]]:
+        """Read dead-lettered messages."""
+        entries = self.client.xrange(self.dead_letter_stream, count=count)
+        return [
+            {
+                "message_id": self._str(message_id),
+                "source_stream": self._str(fields.get(b"source_stream", b"")),
+                "reason": self._str(fields.get(b"reason", b"")),
+                "task": self.codec.decode(fields[b"task"], expected=Task),
+            }
+            for message_id, fields in entries
+        ]
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _reclaim(self, stream: str, consumer: str, count: int) -> List[Tuple[str, str, Task, str]]:
+        """Reclaim idle pending messages; dead-letter those over max_deliveries."""
+        if count <= 0:
+            return []
+
+        response = self.client.xautoclaim(
+            stream, CONSUMER_GROUP, consumer,
+            min_idle_time=self.claim_idle_ms, start_id="0-0", count=count,
+        )
+        messages = response[1] if response else []
+        if not messages:
+            return []
+
+        delivery_counts = {
+            self._str(p["message_id"]): p["times_delivered"]
+            for p in self.client.xpending_range(
+                stream, CONSUMER_GROUP, min="-", max="+", count=1000, consumername=consumer,
+            )
+        }
+
+        deliveries = []
+        for message_id, fields in messages:
+            message_id = self._str(message_id)
+            # times_delivered includes this reclaim
+            if delivery_counts.get(message_id, 0) > self.max_deliveries:
+                self._dead_letter(stream, message_id, fields)
+            else:
+                deliveries.append(self._parse(stream, message_id, fields))
+        return deliveries
+
+    def _dead_letter(self, stream: str, message_id: str, fields: Dict[bytes, bytes]) -> None:
+        """Move a message to the dead-letter stream and fail its task."""
+        reason = f"exceeded {self.max_deliveries} deliveries"
+        self.client.xadd(self.dead_letter_stream, {
+            b"task": fields[b"task"],
+            b"source_stream": stream.encode(),
+            b"reason": reason.encode(),
+        })
+        task = self.codec.decode(fields[b"task"], expected=Task)
+        self.reply(self._str(fields[b"reply_to"]), TaskResult(
+            task_id=task.task_id,
+            worker_id=task.worker_id,
+            success=False,
+            output={"status": "failed", "error": f"Dead-lettered: {reason}"},
+            error=f"Dead-lettered: {reason}",
+            duration_seconds=0.0,
+        ))
+        self.ack(stream, message_id)
+
+    def _parse(self, stream: str, message_id: Any, fields: Dict[bytes, bytes]) -> Tuple[str, str, Task, str]:
+        """Decode a stream message."""
+        task = self.codec.decode(fields[b"task"], expected=Task)
+        return stream, self._str(message_id), task, self._str(fields[b"reply_to"])
+
+    def _str(self, value: Any) -> str:
+        """Decode bytes from redis."""
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class StreamWorker:
+    """
+    Stateless worker process consuming tasks from Redis Streams.
+
+    Any number of these can run on any node; the consumer group
+    spreads tasks across them.
+    """
+
+    def __init__(
+        self,
+        queue: RedisTaskQueue,
+        categories: Optional[List[str]] = None,
+        consumer_name: Optional[str] = None,
+        executor: Optional[Any] = None,
+    ):
+        """
+        Initialize worker.
+
+        Args:
+            queue: Redis task queue
+            categories: Categories to serve (default: all)
+            consumer_name: Unique consumer name (default: host:pid)
+            executor: Object with execute(task) -> TaskResult (default: WorkerExecutor)
+        """
+        if executor is None:
+            from src.workers.executor import get_worker_executor
+            executor = get_worker_executor()
+
+        self.queue = queue
+        self.categories = categories or [c.value for c in WorkerCategory]
+        self.consumer_name = consumer_name or f"{socket.gethostname()}:{os.getpid()}"
+        self.executor = executor
+        self.tasks_processed = 0
+
+    def run_once(self, count: int = 10, block_ms: int = 1000) -> int:
+        """
+        Process one batch of tasks.
+
+        A task whose execution raises is left unacked so it is
+        redelivered (and eventually dead-lettered).
+
+        Returns:
+            Number of tasks completed
+        """
+        completed = 0
+        for stream, message_id, task, reply_to in self.queue.consume(
+            self.consumer_name, self.categories, count=count, block_ms=block_ms
+        ):
+            try:
+                result = self.executor.execute(task)
+            except Exception as e:
+                print(f"❌ StreamWorker: {task.task_id} failed: {e}")
+                continue
+            self.queue.reply(reply_to, result)
+            self.queue.ack(stream, message_id)
+            completed += 1
+
+        self.tasks_processed += completed
+        return completed
+
+    def run_forever(self, max_tasks: Optional[int] = None) -> None:
+        """Process tasks until max_tasks is reached (or forever)."""
+        while max_tasks is None or self.tasks_processed < max_tasks:
+            self.run_once()
+
+
+def main() -> None:
+    """Run a stream worker process."""
+    parser = argparse.ArgumentParser(description="Run a Redis Streams task worker")
+    parser.add_argument("--redis-url", default=None, help="Redis URL (default: settings)")
+    parser.add_argument(
+        "--categories",
+        default=",".join(c.value for c in WorkerCategory),
+        help="Comma-separated worker categories to serve",
+    )
+    args = parser.parse_args()
+
+    queue = RedisTaskQueue.from_url(args.redis_url)
+    worker = StreamWorker(queue, categories=args.categories.split(","))
+    print(f"🚀 Stream worker {worker.consumer_name} serving: {', '.join(worker.categories)}")
+    worker.run_forever()
+
+
+if __name__ == "__main__":
+    main()
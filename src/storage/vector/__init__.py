@@ -0,0 +1,28 @@
+"""
+Vector storage package - Embedded vector index, source retrieval and
+the cross-run knowledge base.
+"""
+
+from .vector_store import (
+    VectorIndex,
+    normalize,
+)
+from .retriever import (
+    SourceRetriever,
+    chunk_text,
+    source_text,
+)
+from .knowledge_base import (
+    KnowledgeBase,
+    get_knowledge_base,
+)
+
+__all__ = [
+    "VectorIndex",
+    "normalize",
+    "SourceRetriever",
+    "chunk_text",
+    "source_text",
+    "KnowledgeBase",
+    "get_knowledge_base",
+]
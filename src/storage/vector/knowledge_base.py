@@ -0,0 +1,324 @@
+"""
+Knowledge Base - Persistent source corpus shared across runs.
+
+Every research run deposits its sources here (text, metadata and
+embedding). Research workers query it first and only go to external
+providers for the gap, so recurring topics get faster and cheaper.
+
+Storage:
+- SQLite table for source text and metadata
+- VectorIndex for embeddings (memory-mapped next to the database)
+
+Freshness:
+Each source type has a max age; stale sources are not served but are
+refreshed in place when a provider returns them again.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.utils.text import source_content, source_text
+from src.storage.vector.vector_store import VectorIndex
+from src.tools.llm.embeddings import EmbeddingService, get_embedding_service
+from config.settings import get_settings
+
+
+# Max age in seconds before a source must be re-fetched
+DEFAULT_FRESHNESS_SECONDS: Dict[str, float] = {
+    "news": 24 * 3600,
+    "social": 6 * 3600,
+    "web": 7 * 24 * 3600,
+    "academic": 180 * 24 * 3600,
+}
+
+# Source type produced by each research worker
+WORKER_SOURCE_TYPES: Dict[str, str] = {
+    "web_search_worker": "web",
+    "web_scraping_worker": "web",
+    "academic_search_worker": "academic",
+    "news_search_worker": "news",
+    "social_media_worker": "social",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    source_id TEXT PRIMARY KEY,
+    url TEXT,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    source_type TEXT NOT NULL,
+    worker_id TEXT,
+    topic TEXT,
+    fetched_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_sources_type_fetched ON sources (source_type, fetched_at);
+"""
+
+
+class KnowledgeBase:
+    """
+    Cross-request source knowledge base.
+
+    Sources are keyed by URL (or content hash when there is no URL),
+    so re-ingesting a source refreshes it instead of duplicating it.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        embedding_service: Optional[EmbeddingService] = None,
+        freshness_seconds: Optional[Dict[str, float]] = None,
+        min_score: float = 0.5,
+    ):
+        """
+        Initialize knowledge base.
+
+        Args:
+            directory: Storage directory (None = in-memory, per process)
+            embedding_service: Embedding service (default: global service)
+            freshness_seconds: Max age per source type (merged over defaults)
+            min_score: Minimum cosine similarity for a source to count as relevant
+        """
+        self.directory = Path(directory) if directory else None
+        self.embeddings = embedding_service or get_embedding_service()
+        self.freshness_seconds = {**DEFAULT_FRESHNESS_SECONDS, **(freshness_seconds or {})}
+        self.min_score = min_score
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.index = VectorIndex.load(str(self.directory / "vectors"), dim=self.embeddings.dim)
+            db_path = str(self.directory / "sources.db")
+        else:
+            self.index = VectorIndex(dim=self.embeddings.dim)
+            db_path = ":memory:"
+
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        if self.directory:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self.stats = {"queries": 0, "served": 0, "stale_skipped": 0, "ingested": 0}
+
+    # =========================================================================
+    # INGEST
+    # =========================================================================
+
+    def add_sources(
+        self,
+        sources: List[Any],
+        source_type: str = "web",
+        worker_id: Optional[str] = None,
+        topic: Optional[str] = None,
+    ) -> int:
+        """
+        Add or refresh sources.
+
+        Args:
+            sources: Source strings or dicts (title/content/snippet/url)
+            source_type: web, academic, news, social
+            worker_id: Worker that produced the sources
+            topic: Brief topic the sources were fetched for
+
+        Returns:
+            Number of sources written
+        """
+        now = time.time()
+        rows = []
+        texts = []
+        for source in sources:
+            text = source_text(source)
+            if not text.strip():
+                continue
+            url = source.get("url") if isinstance(source, dict) else None
+            title = (source.get("title") if isinstance(source, dict) else None) or text[:200]
+            source_id = hashlib.sha1((url or text).encode("utf-8")).hexdigest()
+            # The body alone is stored; title + body is only embedded
+            content = source_content(source) or text
+            rows.append((source_id, url, title, content, source_type, worker_id, topic, now))
+            texts.append(text)
+
+        if not rows:
+            return 0
+
+        vectors = self.embeddings.embed(texts)
+        with self._lock:
+            self.conn.executemany(
+                """
+                INSERT INTO sources (source_id, url, title, content, source_type, worker_id, topic, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source_id) DO UPDATE SET
+                    title = excluded.title, content = excluded.content,
+                    fetched_at = excluded.fetched_at, topic = excluded.topic
+                """,
+                rows,
+            )
+            self.conn.commit()
+            self.index.add([r[0] for r in rows], vectors, [{"source_type": r[4]} for r in rows])
+            self.stats["ingested"] += len(rows)
+
+        return len(rows)
+
+    # =========================================================================
+    # QUERY
+    # =========================================================================
+
+    def query(
+        self,
+        query: str,
+        k: int = 5,
+        source_type: Optional[str] = None,
+        max_age_seconds: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find fresh, relevant sources.
+
+        Args:
+            query: Query text (topic, key points)
+            k: Max sources
+            source_type: Restrict to one source type
+            max_age_seconds: Override freshness (default: policy for source_type)
+
+        Returns:
+            Source dicts (source_id, url, title, content, source_type,
+            fetched_at, score), best first
+        """
+        if k <= 0 or len(self.index) == 0:
+            return []
+
+        # Over-fetch: type and freshness filters are applied after search
+        candidates = [
+            (source_id, score)
+            for source_id, score, metadata in self.index.search(self.embeddings.embed_one(query), k * 5)
+            if score >= self.min_score and (source_type is None or metadata.get("source_type") == source_type)
+        ]
+
+        with self._lock:
+            self.stats["queries"] += 1
+            if not candidates:
+                return []
+
+            placeholders = ",".join("?" * len(candidates))
+            rows = {
+                row["source_id"]: dict(row)
+                for row in self.conn.execute(
+                    f"SELECT * FROM sources WHERE source_id IN ({placeholders})",
+                    [c[0] for c in candidates],
+                )
+            }
+
+            now = time.time()
+            results = []
+            for source_id, score in candidates:
+                row = rows.get(source_id)
+                if row is None:
+                    continue
+                max_age = max_age_seconds if max_age_seconds is not None else self.freshness_seconds.get(
+                    row["source_type"], DEFAULT_FRESHNESS_SECONDS["web"]
+                )
+                if now - row["fetched_at"] > max_age:
+                    self.stats["stale_skipped"] += 1
+                    continue
+                row["score"] = round(score, 4)
+                results.append(row)
+                if len(results) == k:
+                    break
+
+            if results:
+                self.conn.executemany(
+                    "UPDATE sources SET hits = hits + 1 WHERE source_id = ?",
+                    [(r["source_id"],) for r in results],
+                )
+                self.conn.commit()
+            self.stats["served"] += len(results)
+
+        return results
+
+    # =========================================================================
+    # MAINTENANCE
+    # =========================================================================
+
+    def purge_stale(self, grace_factor: float = 4.0) -> int:
+        """
+        Delete sources older than grace_factor x their freshness window.
+
+        Returns:
+            Number of sources deleted
+        """
+        now = time.time()
+        with self._lock:
+            stale = [
+                row["source_id"]
+                for row in self.conn.execute("SELECT source_id, source_type, fetched_at FROM sources")
+                if now - row["fetched_at"] > grace_factor * self.freshness_seconds.get(
+                    row["source_type"], DEFAULT_FRESHNESS_SECONDS["web"]
+                )
+            ]
+            if stale:
+                self.conn.executemany("DELETE FROM sources WHERE source_id = ?", [(s,) for s in stale])
+                self.conn.commit()
+                self.index.delete(stale)
+        return len(stale)
+
+    def save(self) -> None:
+        """Persist the vector index (the database commits on write)."""
+        if self.directory:
+            with self._lock:
+                self.index.save()
+
+    def close(self) -> None:
+        """Persist and close."""
+        self.save()
+        self.conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get knowledge base statistics.
+
+        Returns:
+            Dict with source counts by type and query/serve counters
+        """
+        with self._lock:
+            by_type = {
+                row["source_type"]: row["n"]
+                for row in self.conn.execute("SELECT source_type, COUNT(*) AS n FROM sources GROUP BY source_type")
+            }
+            return {"sources": sum(by_type.values()), "by_type": by_type, **self.stats}
+
+
+def create_knowledge_base() -> KnowledgeBase:
+    """Create the knowledge base from settings."""
+    settings = get_settings()
+    return KnowledgeBase(
+        directory=settings.knowledge_base_dir,
+        min_score=settings.knowledge_base_min_score,
+    )
+
+
+# Global instance, created on first use: the feature is opt-in, so
+# importing this module shouldn't open a database or build an index
+knowledge_base: Optional[KnowledgeBase] = None
+_knowledge_base_lock = threading.Lock()
+
+
+# Helper functions
+def get_knowledge_base() -> KnowledgeBase:
+    """Get the knowledge base instance (created from settings on first call)."""
+    global knowledge_base
+    if knowledge_base is None:
+        with _knowledge_base_lock:
+            if knowledge_base is None:
+                knowledge_base = create_knowledge_base()
+    return knowledge_base
@@ -0,0 +1,116 @@
+"""
+Source Retriever - Chunk, embed and retrieve research sources.
+
+Workers that reason over evidence (fact checker, synthesizer) get the
+top-k relevant chunks for their query instead of every source. Chunks
+are also kept in a BM25 index, so the context packer can score them
+against an outline without re-chunking or re-embedding the sources.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from src.storage.vector.vector_store import VectorIndex
+from src.utils.text import chunk_text, source_text
+from src.tools.llm.embeddings import EmbeddingService, get_embedding_service
+from src.tools.search.bm25 import BM25Index
+
+
+class SourceRetriever:
+    """
+    Retrieves relevant source chunks with a vector index (plus a BM25
+    index over the same chunks for lexical scoring).
+
+    Chunk IDs are content hashes, so re-indexing the same source is a
+    no-op overwrite.
+    """
+
+    def __init__(
+        self,
+        index: Optional[VectorIndex] = None,
+        embedding_service: Optional[EmbeddingService] = None,
+        max_words: int = 120,
+        overlap: int = 20,
+    ):
+        """
+        Initialize retriever.
+
+        Args:
+            index: Vector index (default: new in-memory index)
+            embedding_service: Embedding service (default: global service)
+            max_words: Words per chunk
+            overlap: Overlapping words between chunks
+        """
+        self.embeddings = embedding_service or get_embedding_service()
+        self.index = index or VectorIndex(dim=self.embeddings.dim)
+        self.lexical = BM25Index()
+        self._chunks: List[Dict[str, Any]] = []
+        self.max_words = max_words
+        self.overlap = overlap
+
+    def index_sources(self, sources: List[Any]) -> int:
+        """
+        Chunk and index sources.
+
+        Args:
+            sources: Source strings or dicts (title/content/url)
+
+        Returns:
+            Number of chunks indexed
+        """
+        ids: List[str] = []
+        texts: List[str] = []
+        metadata: List[Dict[str, Any]] = []
+        seen = set()
+
+        for position, source in enumerate(sources):
+            url = source.get("url") if isinstance(source, dict) else None
+            for chunk in chunk_text(source_text(source), self.max_words, self.overlap):
+                chunk_id = hashlib.sha1(chunk.encode("utf-8")).hexdigest()
+                if chunk_id in self.index or chunk_id in seen:
+                    continue
+                seen.add(chunk_id)
+                ids.append(chunk_id)
+                texts.append(chunk)
+                metadata.append({"text": chunk, "source_index": position, "url": url})
+
+        if ids:
+            self.index.add(ids, self.embeddings.embed(texts), metadata)
+            for chunk_id, meta in zip(ids, metadata, strict=True):
+                self.lexical.add(chunk_id, meta["text"])
+                self._chunks.append({"chunk_id": chunk_id, **meta})
+        return len(ids)
+
+    def chunks(self) -> List[Dict[str, Any]]:
+        """
+        All indexed chunks in indexing order.
+
+        Returns:
+            Chunks with chunk_id, text, url and source_index
+        """
+        return list(self._chunks)
+
+    def retrieve(self, query: str, k: int = 5, min_score: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Retrieve the chunks most relevant to a query.
+
+        Args:
+            query: Query text (claim, topic, section heading)
+            k: Max chunks
+            min_score: Minimum cosine similarity
+
+        Returns:
+            Chunks with text, url, source_index and score, best first
+        """
+        if len(self.index) == 0:
+            return []
+        query_vector = self.embeddings.embed_one(query)
+        return [
+            {**metadata, "chunk_id": chunk_id, "score": round(score, 4)}
+            for chunk_id, score, metadata in self.index.search(query_vector, k)
+            if score >= min_score
+        ]
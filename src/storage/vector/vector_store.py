@@ -0,0 +1,431 @@
+"""
+Vector Store - Embedded vector index for source chunks.
+
+Vectors are L2-normalized float32 rows in a single matrix, so cosine
+similarity is one matrix-vector product. The matrix lives in a
+memory-mapped file when a directory is configured.
+
+Search strategies:
+1. Exact: vectorized brute force over all rows (small collections)
+2. IVF: k-means coarse quantizer; only the n_probe closest lists are
+   scanned (large collections, built automatically past ivf_threshold)
+
+Deletes are tombstones; rows are reclaimed by compact().
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import json
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+VECTORS_FILE = "vectors.f32"
+CENTROIDS_FILE = "centroids.npy"
+META_FILE = "index.json"
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero rows stay zero)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class VectorIndex:
+    """
+    Cosine-similarity vector index with exact and IVF search.
+
+    Each vector has a string ID and optional metadata dict. Adding an
+    existing ID overwrites its vector in place.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        directory: Optional[str] = None,
+        initial_capacity: int = 1024,
+        ivf_threshold: int = 20000,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            dim: Vector dimensionality
+            directory: Directory for the memory-mapped matrix and metadata
+                (None = in-memory only)
+            initial_capacity: Rows allocated up front (grows by doubling)
+            ivf_threshold: Live vectors before IVF search is used
+            n_lists: IVF list count (None = ~sqrt(n) at build time)
+            n_probe: IVF lists scanned per query
+        """
+        self.dim = dim
+        self.directory = Path(directory) if directory else None
+        self.ivf_threshold = ivf_threshold
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+
+        self._lock = threading.RLock()
+        self._count = 0
+        self._ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self._alive = np.zeros(initial_capacity, dtype=bool)
+
+        # IVF state
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.full(initial_capacity, -1, dtype=np.int32)
+        self._lists: List[List[int]] = []
+        self._built_at = 0
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._vectors = self._allocate(initial_capacity)
+
+    # =========================================================================
+    # WRITE API
+    # =========================================================================
+
+    def add(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        metadata: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        """
+        Add or overwrite vectors.
+
+        Args:
+            ids: Vector IDs
+            vectors: Array of shape (len(ids), dim)
+            metadata: Optional metadata per vector
+
+        Raises:
+            ValueError: If shapes don't match
+        """
+        vectors = normalize(np.atleast_2d(vectors))
+        if vectors.shape != (len(ids), self.dim):
+            raise ValueError(f"Expected vectors of shape ({len(ids)}, {self.dim}), got {vectors.shape}")
+
+        with self._lock:
+            new_ids = [i for i in dict.fromkeys(ids) if i not in self._rows]
+            self._ensure_capacity(self._count + len(new_ids))
+
+            rows = np.empty(len(ids), dtype=np.int64)
+            for pos, vector_id in enumerate(ids):
+                row = self._rows.get(vector_id)
+                if row is None:
+                    row = self._count
+                    self._count += 1
+                    self._ids.append(vector_id)
+                    self._rows[vector_id] = row
+                rows[pos] = row
+                if metadata is not None and metadata[pos] is not None:
+                    self._metadata[vector_id] = dict(metadata[pos])
+
+            self._vectors[rows] = vectors
+            self._alive[rows] = True
+
+            if self._centroids is not None:
+                self._assign(rows)
+
+    def delete(self, ids: Sequence[str]) -> int:
+        """
+        Delete vectors by ID.
+
+        Returns:
+            Number of vectors deleted
+        """
+        deleted = 0
+        with self._lock:
+            for vector_id in ids:
+                row = self._rows.pop(vector_id, None)
+                if row is None:
+                    continue
+                self._alive[row] = False
+                self._ids[row] = None
+                self._metadata.pop(vector_id, None)
+                deleted += 1
+        return deleted
+
+    def compact(self) -> None:
+        """Drop deleted rows and rebuild the IVF index if one exists."""
+        with self._lock:
+            live = np.flatnonzero(self._alive[:self._count])
+            vectors = np.array(self._vectors[live])
+            ids = [self._ids[row] for row in live]
+            had_ivf = self._centroids is not None
+
+            self._count = 0
+            self._ids = []
+            self._rows = {}
+            self._alive[:] = False
+            self._centroids = None
+            self._lists = []
+            self._assignments[:] = -1
+
+            if ids:
+                self.add(ids, vectors)
+            if had_ivf and len(ids) >= self.ivf_threshold:
+                self.build_ivf()
+
+    # =========================================================================
+    # SEARCH
+    # =========================================================================
+
+    def search(self, query: np.ndarray, k: int = 5) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """
+        Find the k most similar vectors.
+
+        Args:
+            query: Query vector of shape (dim,)
+            k: Number of results
+
+        Returns:
+            List of (id, cosine similarity, metadata), best first
+        """
+        query = normalize(np.asarray(query).reshape(self.dim))
+
+        with self._lock:
+            if k <= 0 or not self._rows:
+                return []
+
+            if len(self._rows) >= self.ivf_threshold and (
+                self._centroids is None or len(self._rows) > 2 * self._built_at
+            ):
+                self.build_ivf()
+
+            if self._centroids is not None:
+                candidates = self._probe(query)
+            else:
+                candidates = np.flatnonzero(self._alive[:self._count])
+
+            if candidates.size == 0:
+                return []
+
+            scores = self._vectors[candidates] @ query
+            top = self._top_k(scores, k)
+            return [
+                (self._ids[candidates[i]], float(scores[i]), self._metadata.get(self._ids[candidates[i]], {}))
+                for i in top
+            ]
+
+    def search_exact(self, query: np.ndarray, k: int = 5) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """Brute-force search regardless of IVF state (used for recall checks)."""
+        query = normalize(np.asarray(query).reshape(self.dim))
+        with self._lock:
+            candidates = np.flatnonzero(self._alive[:self._count])
+            if k <= 0 or candidates.size == 0:
+                return []
+            scores = self._vectors[candidates] @ query
+            return [
+                (self._ids[candidates[i]], float(scores[i]), self._metadata.get(self._ids[candidates[i]], {}))
+                for i in self._top_k(scores, k)
+            ]
+
+    def _top_k(self, scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k highest scores, sorted descending."""
+        if k < scores.size:
+            top = np.argpartition(-scores, k)[:k]
+        else:
+            top = np.arange(scores.size)
+        return top[np.argsort(-scores[top])]
+
+    # =========================================================================
+    # IVF
+    # =========================================================================
+
+    def build_ivf(self, n_lists: Optional[int] = None, iterations: int = 10, seed: int = 0) -> None:
+        """
+        Train the coarse quantizer with spherical k-means and assign rows.
+
+        Args:
+            n_lists: List count (None = configured or ~sqrt(n))
+            iterations: k-means iterations
+            seed: Random seed for centroid initialisation and sampling
+        """
+        with self._lock:
+            live = np.flatnonzero(self._alive[:self._count])
+            if live.size == 0:
+                return
+
+            n_lists = min(n_lists or self.n_lists or max(1, int(np.sqrt(live.size))), live.size)
+            rng = np.random.default_rng(seed)
+
+            # Train on a sample; assignment covers every row afterwards
+            sample = live if live.size <= 50 * n_lists else rng.choice(live, 50 * n_lists, replace=False)
+            data = np.array(self._vectors[sample])
+            centroids = data[rng.choice(len(data), n_lists, replace=False)]
+
+            for _ in range(iterations):
+                labels = np.argmax(data @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, labels, data)
+                counts = np.bincount(labels, minlength=n_lists)
+                empty = counts == 0
+                sums[empty] = centroids[empty]
+                centroids = normalize(sums)
+
+            self._centroids = centroids.astype(np.float32)
+            self._lists = [[] for _ in range(n_lists)]
+            self._assignments[:] = -1
+            self._assign(live)
+            self._built_at = live.size
+
+    def _assign(self, rows: np.ndarray) -> None:
+        """Assign rows to their nearest IVF list."""
+        labels = np.argmax(self._vectors[rows] @ self._centroids.T, axis=1)
+        for row, label in zip(rows.tolist(), labels.tolist(), strict=True):
+            if self._assignments[row] != label:
+                self._assignments[row] = label
+                self._lists[label].append(row)
+
+    def _probe(self, query: np.ndarray) -> np.ndarray:
+        """Candidate rows from the n_probe lists closest to the query."""
+        n_probe = min(self.n_probe, len(self._lists))
+        nearest = np.argpartition(-(self._centroids @ query), n_probe - 1)[:n_probe]
+        rows = np.unique(np.concatenate([np.asarray(self._lists[i], dtype=np.int64) for i in nearest]))
+        # Lists keep stale entries after overwrite/delete; filter them here
+        return rows[self._alive[rows] & np.isin(self._assignments[rows], nearest)]
+
+    # =========================================================================
+    # STORAGE
+    # =========================================================================
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        """Allocate the vector matrix (memory-mapped if persistent)."""
+        if self.directory is None:
+            return np.zeros((capacity, self.dim), dtype=np.float32)
+        path = self.directory / VECTORS_FILE
+        mode = "r+" if path.exists() and path.stat().st_size >= capacity * self.dim * 4 else "w+"
+        if mode == "w+" and path.exists():
+            # Grow the file in place, keeping existing rows
+            with open(path, "r+b") as f:
+                f.truncate(capacity * self.dim * 4)
+            mode = "r+"
+        return np.memmap(path, dtype=np.float32, mode=mode, shape=(capacity, self.dim))
+
+    def _ensure_capacity(self, needed: int) -> None:
+        """Grow storage by doubling when needed."""
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+
+        if self.directory is None:
+            grown = np.zeros((new_capacity, self.dim), dtype=np.float32)
+            grown[:capacity] = self._vectors
+            self._vectors = grown
+        else:
+            self._vectors.flush()
+            del self._vectors
+            self._vectors = self._allocate(new_capacity)
+
+        self._alive = np.concatenate([self._alive, np.zeros(new_capacity - capacity, dtype=bool)])
+        self._assignments = np.concatenate(
+            [self._assignments, np.full(new_capacity - capacity, -1, dtype=np.int32)]
+        )
+
+    def save(self) -> None:
+        """
+        Persist the index to its directory.
+
+        Raises:
+            ValueError: If the index has no directory
+        """
+        if self.directory is None:
+            raise ValueError("Cannot save an in-memory index")
+
+        with self._lock:
+            self._vectors.flush()
+            if self._centroids is not None:
+                np.save(self.directory / CENTROIDS_FILE, self._centroids)
+            elif (self.directory / CENTROIDS_FILE).exists():
+                (self.directory / CENTROIDS_FILE).unlink()
+
+            meta = {
+                "dim": self.dim,
+                "count": self._count,
+                "capacity": int(self._vectors.shape[0]),
+                "ids": self._ids,
+                "metadata": self._metadata,
+                "assignments": self._assignments[:self._count].tolist(),
+                "built_at": self._built_at,
+            }
+            tmp = self.directory / (META_FILE + ".tmp")
+            tmp.write_text(json.dumps(meta))
+            tmp.replace(self.directory / META_FILE)
+
+    @classmethod
+    def load(cls, directory: str, **kwargs: Any) -> "VectorIndex":
+        """
+        Open a persisted index (or create an empty one).
+
+        Args:
+            directory: Index directory
+            **kwargs: Constructor options (dim required if the index is new)
+
+        Returns:
+            Vector index
+        """
+        meta_path = Path(directory) / META_FILE
+        if not meta_path.exists():
+            return cls(directory=directory, **kwargs)
+
+        meta = json.loads(meta_path.read_text())
+        kwargs["dim"] = meta["dim"]
+        kwargs["initial_capacity"] = meta["capacity"]
+        index = cls(directory=directory, **kwargs)
+
+        index._count = meta["count"]
+        index._ids = meta["ids"]
+        index._rows = {vector_id: row for row, vector_id in enumerate(index._ids) if vector_id is not None}
+        index._metadata = meta["metadata"]
+        index._alive[:index._count] = [vector_id is not None for vector_id in index._ids]
+
+        centroids_path = Path(directory) / CENTROIDS_FILE
+        if centroids_path.exists():
+            index._centroids = np.load(centroids_path)
+            index._lists = [[] for _ in range(len(index._centroids))]
+            index._assignments[:index._count] = meta["assignments"]
+            for row in np.flatnonzero(index._alive[:index._count]).tolist():
+                index._lists[index._assignments[row]].append(row)
+            index._built_at = meta["built_at"]
+
+        return index
+
+    # =========================================================================
+    # INTROSPECTION
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, vector_id: str) -> bool:
+        return vector_id in self._rows
+
+    def get_metadata(self, vector_id: str) -> Dict[str, Any]:
+        """Get metadata stored with a vector."""
+        return self._metadata.get(vector_id, {})
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict with vector counts, capacity and IVF state
+        """
+        return {
+            "vectors": len(self._rows),
+            "deleted": self._count - len(self._rows),
+            "capacity": int(self._vectors.shape[0]),
+            "dim": self.dim,
+            "ivf_lists": len(self._lists),
+            "persistent": self.directory is not None,
+        }
@@ -0,0 +1,51 @@
+"""
+LLM tools package - Token counting, model routing, embeddings and context packing.
+"""
+
+from .token_counter import (
+    TokenCounter,
+    get_token_counter,
+    count_tokens,
+)
+from .embeddings import (
+    Embedder,
+    HashingEmbedder,
+    EmbeddingService,
+    get_embedding_service,
+)
+from .model_router import (
+    ModelChoice,
+    ModelRouter,
+    get_model_router,
+)
+from .batch import (
+    BatchBackend,
+    BatchCollector,
+    BatchRequestError,
+    LocalBatchServer,
+)
+from .context_packer import (
+    ContextPacker,
+    PackedContext,
+    get_context_packer,
+)
+
+__all__ = [
+    "TokenCounter",
+    "get_token_counter",
+    "count_tokens",
+    "Embedder",
+    "HashingEmbedder",
+    "EmbeddingService",
+    "get_embedding_service",
+    "ModelChoice",
+    "ModelRouter",
+    "get_model_router",
+    "BatchBackend",
+    "BatchCollector",
+    "BatchRequestError",
+    "LocalBatchServer",
+    "ContextPacker",
+    "PackedContext",
+    "get_context_packer",
+]
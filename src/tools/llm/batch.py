@@ -0,0 +1,390 @@
+"""
+LLM Batch Mode - Collect calls into Message Batches for bulk jobs.
+
+Overnight bulk runs care about cost and throughput, not latency. In
+batch mode, worker LLM calls from every concurrently running brief are
+collected into one Message Batch (half the per-token price on the
+Anthropic Batches API) instead of being sent one at a time:
+
+1. Workers call BatchCollector.create_message() and block on a future
+2. The collector flushes pending calls as a batch when it is full or
+   the flush interval has passed
+3. It polls submitted batches and, when one ends, fans each result back
+   to the future of the worker that asked for it
+
+Backends:
+- AnthropicBatchBackend: the Message Batches API
+- LocalBatchServer: in-process stand-in for tests and offline runs
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from config.settings import get_settings
+
+
+class BatchRequestError(Exception):
+    """A request inside a batch errored, expired or was canceled."""
+
+
+class BatchBackend(ABC):
+    """Message-Batches-style submission interface."""
+
+    @abstractmethod
+    def create(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Submit a batch.
+
+        Args:
+            requests: [{"custom_id": str, "params": create_message params}]
+
+        Returns:
+            Batch ID
+        """
+
+    @abstractmethod
+    def is_ended(self, batch_id: str) -> bool:
+        """Check if a batch has finished processing."""
+
+    @abstractmethod
+    def results(self, batch_id: str) -> Iterable[Dict[str, Any]]:
+        """
+        Results of an ended batch.
+
+        Returns:
+            Iterable of {"custom_id", "type": succeeded|errored|canceled|expired,
+            "message" or "error"}
+        """
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches API."""
+
+    def __init__(self, client: Any):
+        """
+        Initialize backend.
+
+        Args:
+            client: anthropic.Anthropic client
+        """
+        self.batches = client.messages.batches
+
+    def create(self, requests: List[Dict[str, Any]]) -> str:
+        return self.batches.create(requests=requests).id
+
+    def is_ended(self, batch_id: str) -> bool:
+        return self.batches.retrieve(batch_id).processing_status == "ended"
+
+    def results(self, batch_id: str) -> Iterable[Dict[str, Any]]:
+        for entry in self.batches.results(batch_id):
+            result = entry.result
+            yield {
+                "custom_id": entry.custom_id,
+                "type": result.type,
+                "message": getattr(result, "message", None),
+                "error": getattr(result, "error", None),
+            }
+
+
+class LocalBatchServer(BatchBackend):
+    """
+    In-process stand-in for the Message Batches API.
+
+    A batch "processes" for processing_seconds after submission, then
+    every request is answered by the responder. Requests matching
+    fail_if come back errored.
+    """
+
+    def __init__(
+        self,
+        responder: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        processing_seconds: float = 0.0,
+        fail_if: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ):
+        """
+        Initialize server.
+
+        Args:
+            responder: Maps request params to a message (default: LLMConfig mock response)
+            processing_seconds: Time before a batch ends
+            fail_if: Predicate on request params selecting requests to error
+        """
+        self.responder = responder or _mock_responder
+        self.processing_seconds = processing_seconds
+        self.fail_if = fail_if
+        self._lock = threading.Lock()
+        self._batches: Dict[str, Dict[str, Any]] = {}
+
+    def create(self, requests: List[Dict[str, Any]]) -> str:
+        batch_id = f"msgbatch_local_{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self._batches[batch_id] = {"requests": list(requests), "ends_at": time.time() + self.processing_seconds}
+        return batch_id
+
+    def is_ended(self, batch_id: str) -> bool:
+        with self._lock:
+            return time.time() >= self._batches[batch_id]["ends_at"]
+
+    def results(self, batch_id: str) -> Iterable[Dict[str, Any]]:
+        with self._lock:
+            requests = self._batches.pop(batch_id)["requests"]
+        for request in requests:
+            if self.fail_if is not None and self.fail_if(request["params"]):
+                yield {"custom_id": request["custom_id"], "type": "errored", "error": "invalid_request_error"}
+            else:
+                yield {"custom_id": request["custom_id"], "type": "succeeded", "message": self.responder(request["params"])}
+
+
+class BatchCollector:
+    """
+    Collects LLM calls into batches and fans results back to callers.
+
+    Thread-safe: any number of workers may block in create_message()
+    while one background thread flushes and polls.
+    """
+
+    def __init__(
+        self,
+        backend: BatchBackend,
+        max_batch_size: int = 10000,
+        flush_interval_seconds: float = 5.0,
+        poll_interval_seconds: float = 30.0,
+        default_params: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize collector.
+
+        Args:
+            backend: Batch submission backend
+            max_batch_size: Flush as soon as this many calls are pending
+            flush_interval_seconds: Max time a call waits before its batch is sent
+            poll_interval_seconds: Time between status checks of open batches
+            default_params: Params merged under each call (model, max_tokens, ...)
+        """
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.default_params = default_params or {}
+
+        self._cond = threading.Condition()
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_since: Optional[float] = None
+        self._open: Dict[str, Dict[str, Future]] = {}
+        self._closed = False
+        self.stats = {"requests": 0, "batches": 0, "succeeded": 0, "errored": 0}
+
+        self._thread = threading.Thread(target=self._run, name="batch-collector", daemon=True)
+        self._thread.start()
+
+    # =========================================================================
+    # CALLER SIDE
+    # =========================================================================
+
+    def submit(self, params: Dict[str, Any]) -> Future:
+        """
+        Queue a call for the next batch.
+
+        Args:
+            params: create_message params (messages, system, model, ...)
+
+        Returns:
+            Future resolving to the response message
+
+        Raises:
+            RuntimeError: If the collector is closed
+        """
+        future: Future = Future()
+        request = {"custom_id": uuid.uuid4().hex, "params": {**self.default_params, **params}}
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BatchCollector is closed")
+            now = time.time()
+            self._pending.append({"request": request, "future": future, "arrived": now})
+            if self._pending_since is None:
+                self._pending_since = now
+            self.stats["requests"] += 1
+            self._cond.notify()
+        return future
+
+    def create_message(
+        self,
+        messages: list,
+        system: Optional[Any] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Batched drop-in for LLMConfig.create_message (blocks until the batch ends).
+
+        Args:
+            messages: List of message dicts
+            system: System prompt
+            timeout: Max seconds to wait (None = until the batch ends)
+            **kwargs: Additional parameters
+
+        Returns:
+            Response message
+
+        Raises:
+            BatchRequestError: If the request errored inside the batch
+        """
+        params = {"messages": messages, **kwargs}
+        if system:
+            params["system"] = system
+        return self.submit(params).result(timeout)
+
+    def flush(self) -> None:
+        """Submit pending calls now instead of waiting for the interval."""
+        with self._cond:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush, wait for open batches to finish, and stop the thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    # =========================================================================
+    # BACKGROUND
+    # =========================================================================
+
+    def _run(self) -> None:
+        """Flush full or due batches and poll open ones."""
+        last_poll = 0.0
+        while True:
+            with self._cond:
+                if self._closed:
+                    self._flush_locked()
+                    if not self._open:
+                        return
+                if self._flush_due():
+                    # Before the interval, only full batches go out
+                    self._flush_locked(
+                        full_only=time.time() - self._pending_since < self.flush_interval_seconds
+                    )
+                open_batches = list(self._open)
+
+            now = time.time()
+            if open_batches and now - last_poll >= self.poll_interval_seconds:
+                last_poll = now
+                for batch_id in open_batches:
+                    self._collect(batch_id)
+
+            with self._cond:
+                # A batch may have filled while we were polling
+                if not self._closed and not self._flush_due():
+                    self._cond.wait(self._next_wakeup(last_poll))
+
+    def _flush_due(self) -> bool:
+        """Check if pending calls should be sent (caller holds the lock)."""
+        return self._pending_since is not None and (
+            len(self._pending) >= self.max_batch_size
+            or time.time() - self._pending_since >= self.flush_interval_seconds
+        )
+
+    def _next_wakeup(self, last_poll: float) -> float:
+        """Seconds until the next flush or poll is due."""
+        waits = [self.poll_interval_seconds - (time.time() - last_poll)] if self._open else []
+        if self._pending_since is not None:
+            waits.append(self.flush_interval_seconds - (time.time() - self._pending_since))
+        return max(0.01, min(waits)) if waits else 1.0
+
+    def _flush_locked(self, full_only: bool = False) -> None:
+        """
+        Submit pending calls as batches (caller holds the lock).
+
+        Args:
+            full_only: Keep a trailing partial batch pending
+        """
+        while self._pending and (not full_only or len(self._pending) >= self.max_batch_size):
+            chunk, self._pending = self._pending[:self.max_batch_size], self._pending[self.max_batch_size:]
+            try:
+                batch_id = self.backend.create([item["request"] for item in chunk])
+            except Exception as e:
+                for item in chunk:
+                    item["future"].set_exception(e)
+                continue
+            self._open[batch_id] = {item["request"]["custom_id"]: item["future"] for item in chunk}
+            self.stats["batches"] += 1
+        # The interval runs from the oldest call still waiting
+        self._pending_since = self._pending[0]["arrived"] if self._pending else None
+
+    def _collect(self, batch_id: str) -> None:
+        """Fan an ended batch's results back to its callers."""
+        try:
+            if not self.backend.is_ended(batch_id):
+                return
+            results = list(self.backend.results(batch_id))
+        except Exception as e:
+            with self._cond:
+                futures = self._open.pop(batch_id, {})
+            for future in futures.values():
+                future.set_exception(e)
+            return
+
+        with self._cond:
+            futures = self._open.pop(batch_id, {})
+        for result in results:
+            future = futures.pop(result["custom_id"], None)
+            if future is None:
+                continue
+            if result["type"] == "succeeded":
+                self.stats["succeeded"] += 1
+                future.set_result(result["message"])
+            else:
+                self.stats["errored"] += 1
+                future.set_exception(BatchRequestError(f"{result['type']}: {result.get('error')}"))
+        for future in futures.values():
+            future.set_exception(BatchRequestError(f"No result in batch {batch_id}"))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get collector statistics.
+
+        Returns:
+            Dict with request/batch counters, pending calls and open batches
+        """
+        with self._cond:
+            return {**self.stats, "pending": len(self._pending), "open_batches": len(self._open)}
+
+
+def _mock_responder(params: Dict[str, Any]) -> Any:
+    """Answer a batched request like LLMConfig's mock mode."""
+    from config.llm_config import get_llm_config
+    return get_llm_config()._mock_response(params["messages"], params.get("system"))
+
+
+def create_batch_collector(backend: Optional[BatchBackend] = None) -> BatchCollector:
+    """
+    Create a batch collector from settings.
+
+    Args:
+        backend: Batch backend (default: Anthropic API, or the local
+            server in mock mode)
+
+    Returns:
+        Batch collector
+    """
+    from config.llm_config import get_llm_config
+
+    settings = get_settings()
+    llm = get_llm_config()
+    if backend is None:
+        backend = LocalBatchServer() if llm.is_mock else AnthropicBatchBackend(llm.client)
+    return BatchCollector(
+        backend,
+        max_batch_size=settings.llm_batch_max_size,
+        flush_interval_seconds=settings.llm_batch_flush_seconds,
+        poll_interval_seconds=settings.llm_batch_poll_seconds,
+        default_params=llm.get_default_params(),
+    )
@@ -0,0 +1,219 @@
+"""
+Context Packer - Fit research into a worker's input-token budget.
+
+Writing and analysis workers used to receive research_data wholesale,
+so prompt size grew with source count. The packer instead:
+
+1. Chunks all sources into passages
+2. Scores each chunk against the outline/section queries
+   (BM25 for exact terms + embedding cosine for paraphrases)
+3. Drops exact and near-duplicate chunks
+4. Greedily fills the budget with the highest-scoring chunks
+
+Prompt tokens per call therefore stay flat as research depth grows.
+Given the plan's SourceRetriever, the packer reuses its chunks, BM25
+index and embeddings instead of rebuilding them on every call.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import hashlib
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from src.utils.text import chunk_text, source_text
+from src.tools.llm.embeddings import EmbeddingService, get_embedding_service
+from src.tools.llm.token_counter import get_token_counter
+from src.tools.search.bm25 import BM25Index
+from src.tools.search.dedup import SourceDeduplicator
+
+
+class PackedContext(BaseModel):
+    """Result of packing sources into a token budget."""
+
+    chunks: List[Dict[str, Any]] = Field(default_factory=list, description="Selected chunks, best first")
+    tokens_used: int = Field(default=0, ge=0, description="Tokens of the selected chunks")
+    budget_tokens: int = Field(..., ge=0, description="Budget the chunks were packed into")
+    candidate_chunks: int = Field(default=0, ge=0, description="Chunks considered")
+    duplicates_dropped: int = Field(default=0, ge=0, description="Chunks dropped as duplicates")
+
+    @property
+    def text(self) -> str:
+        """Selected chunks joined for a prompt."""
+        return "\n\n".join(c["text"] for c in self.chunks)
+
+
+class ContextPacker:
+    """
+    Token-budgeted context packer.
+    """
+
+    def __init__(
+        self,
+        count_tokens: Optional[Callable[[str], int]] = None,
+        embedding_service: Optional[EmbeddingService] = None,
+        chunk_words: int = 120,
+        overlap: int = 20,
+        lexical_weight: float = 0.5,
+        dedup_threshold: float = 0.8,
+    ):
+        """
+        Initialize packer.
+
+        Args:
+            count_tokens: Token counter (default: global calibrated counter)
+            embedding_service: Embeddings for semantic scoring (default: global)
+            chunk_words: Words per chunk
+            overlap: Words shared between consecutive chunks
+            lexical_weight: BM25 share of the score (rest is cosine)
+            dedup_threshold: Estimated Jaccard at which chunks are duplicates
+        """
+        self.count_tokens = count_tokens or get_token_counter().count
+        self.embeddings = embedding_service or get_embedding_service()
+        self.chunk_words = chunk_words
+        self.overlap = overlap
+        self.lexical_weight = lexical_weight
+        self.dedup_threshold = dedup_threshold
+
+    def pack(
+        self,
+        sources: List[Any],
+        queries: List[str],
+        budget_tokens: int,
+        retriever: Optional[Any] = None,
+    ) -> PackedContext:
+        """
+        Pack the most relevant source chunks into a budget.
+
+        Args:
+            sources: Source strings or dicts (title/content/url)
+            queries: Outline headings, section titles or topic text
+            budget_tokens: Max tokens of packed context
+            retriever: SourceRetriever that has already indexed the
+                sources; its chunks and indexes are used and sources
+                is ignored
+
+        Returns:
+            Packed context
+        """
+        if retriever is not None:
+            chunks = [{**c, "tokens": self.count_tokens(c["text"])} for c in retriever.chunks()]
+        else:
+            chunks = self._chunk(sources)
+        if not chunks or budget_tokens <= 0:
+            return PackedContext(budget_tokens=max(0, budget_tokens), candidate_chunks=len(chunks))
+
+        scores = self._score(chunks, [q for q in queries if q and q.strip()], retriever)
+        order = np.argsort(-scores, kind="stable")
+
+        deduplicator = SourceDeduplicator(threshold=self.dedup_threshold)
+        selected: List[Dict[str, Any]] = []
+        used = 0
+        duplicates = 0
+        for i in order.tolist():
+            chunk = chunks[i]
+            if used + chunk["tokens"] > budget_tokens:
+                # Greedy: a smaller, lower-scoring chunk may still fit
+                continue
+            if deduplicator.check(chunk["chunk_id"], chunk["text"], None) is not None:
+                duplicates += 1
+                continue
+            selected.append({**chunk, "score": round(float(scores[i]), 4)})
+            used += chunk["tokens"]
+            if budget_tokens - used < 16:
+                break
+
+        return PackedContext(
+            chunks=selected,
+            tokens_used=used,
+            budget_tokens=budget_tokens,
+            candidate_chunks=len(chunks),
+            duplicates_dropped=duplicates,
+        )
+
+    def _chunk(self, sources: List[Any]) -> List[Dict[str, Any]]:
+        """Split sources into chunks with token counts."""
+        chunks = []
+        for position, source in enumerate(sources):
+            url = source.get("url") if isinstance(source, dict) else None
+            for text in chunk_text(source_text(source), self.chunk_words, self.overlap):
+                chunks.append({
+                    "chunk_id": hashlib.sha1(text.encode("utf-8")).hexdigest(),
+                    "text": text,
+                    "url": url,
+                    "source_index": position,
+                    "tokens": self.count_tokens(text),
+                })
+        return chunks
+
+    def _score(
+        self,
+        chunks: List[Dict[str, Any]],
+        queries: List[str],
+        retriever: Optional[Any] = None,
+    ) -> np.ndarray:
+        """
+        Score chunks by their best match against any query.
+
+        Args:
+            chunks: Candidate chunks
+            queries: Query texts
+            retriever: Retriever the chunks came from (its indexes are searched)
+
+        Returns:
+            Scores in [0, 1] per chunk
+        """
+        if not queries:
+            # No outline: keep source order
+            return np.linspace(1.0, 0.0, len(chunks), endpoint=False, dtype=np.float32)
+
+        if retriever is not None:
+            index = retriever.lexical
+            positions = {c["chunk_id"]: i for i, c in enumerate(chunks)}
+        else:
+            index = BM25Index()
+            positions = {}
+            for position, chunk in enumerate(chunks):
+                index.add(str(position), chunk["text"])
+                positions[str(position)] = position
+
+        lexical = np.zeros((len(queries), len(chunks)), dtype=np.float32)
+        for q, query in enumerate(queries):
+            for key, score, _ in index.search(query, k=len(chunks)):
+                lexical[q, positions[key]] = score
+        peak = lexical.max(axis=1, keepdims=True)
+        lexical = np.divide(lexical, peak, out=np.zeros_like(lexical), where=peak > 0)
+
+        if retriever is not None:
+            # Chunks are already embedded: search the vector index per query
+            semantic = np.zeros_like(lexical)
+            for q, vector in enumerate(retriever.embeddings.embed(queries)):
+                for chunk_id, score, _ in retriever.index.search(vector, k=len(chunks)):
+                    if chunk_id in positions:
+                        semantic[q, positions[chunk_id]] = score
+            semantic = np.clip(semantic, 0.0, 1.0)
+        else:
+            chunk_vectors = self._normalize(self.embeddings.embed([c["text"] for c in chunks]))
+            query_vectors = self._normalize(self.embeddings.embed(queries))
+            semantic = np.clip(query_vectors @ chunk_vectors.T, 0.0, 1.0)
+
+        combined = self.lexical_weight * lexical + (1 - self.lexical_weight) * semantic
+        return combined.max(axis=0)
+
+    def _normalize(self, vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+# Global instance
+context_packer = ContextPacker()
+
+
+# Helper functions
+def get_context_packer() -> ContextPacker:
+    """Get the context packer instance."""
+    return context_packer
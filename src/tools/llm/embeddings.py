@@ -0,0 +1,194 @@
+"""
+Embedding Service - Batched, deduplicated, cached text embeddings.
+
+Texts are hashed; identical texts within a call are embedded once,
+and texts seen by earlier calls are served from the EmbeddingCache.
+Only the remaining misses reach the embedder, in batches of batch_size.
+
+Embedders are pluggable. HashingEmbedder is local and deterministic,
+so tests and offline runs need no network.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import hashlib
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.storage.cache.embedding_cache import EmbeddingCache, text_hash
+from config.settings import get_settings
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class Embedder(ABC):
+    """Base class for embedding backends."""
+
+    #: Name used to namespace cache entries
+    model_name: str = "embedder"
+    #: Output dimensionality
+    dim: int = 0
+
+    @abstractmethod
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Array of shape (len(texts), dim)
+        """
+
+
+class HashingEmbedder(Embedder):
+    """
+    Local embedder using the hashing trick.
+
+    Word unigrams and bigrams are hashed into dim signed buckets, so
+    texts that share wording get similar vectors.
+    """
+
+    def __init__(self, dim: int = 256):
+        """
+        Initialize embedder.
+
+        Args:
+            dim: Output dimensionality
+        """
+        self.dim = dim
+        self.model_name = f"hashing-{dim}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts into hashed feature vectors."""
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = _TOKEN_RE.findall(text.lower())
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens[:-1], tokens[1:], strict=True)]
+            for feature in features:
+                value = int.from_bytes(
+                    hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+                )
+                vectors[row, value % self.dim] += 1.0 if (value >> 63) & 1 else -1.0
+        return vectors
+
+
+class EmbeddingService:
+    """
+    Embedding service with batching, dedup and two-tier caching.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        cache: Optional[EmbeddingCache] = None,
+        batch_size: int = 128,
+    ):
+        """
+        Initialize service.
+
+        Args:
+            embedder: Embedding backend (default: HashingEmbedder)
+            cache: Embedding cache (default: in-memory only)
+            batch_size: Max texts per embedder call
+        """
+        self.embedder = embedder or HashingEmbedder()
+        self.cache = cache or EmbeddingCache(dim=self.embedder.dim)
+        self.batch_size = batch_size
+
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "texts": 0, "unique_texts": 0, "embedded": 0, "batches": 0}
+
+    @property
+    def dim(self) -> int:
+        """Embedding dimensionality."""
+        return self.embedder.dim
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts.
+
+        Args:
+            texts: Texts to embed (duplicates allowed)
+
+        Returns:
+            Array of shape (len(texts), dim), rows in input order
+        """
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+
+        digests = [text_hash(text, self.embedder.model_name) for text in texts]
+        unique = dict(zip(digests, texts, strict=True))
+
+        vectors = self.cache.get_many(list(unique))
+        misses = [digest for digest in unique if digest not in vectors]
+
+        batches = 0
+        for start in range(0, len(misses), self.batch_size):
+            batch = misses[start:start + self.batch_size]
+            embedded = np.asarray(self.embedder.embed([unique[d] for d in batch]), dtype=np.float32)
+            new = dict(zip(batch, embedded, strict=True))
+            self.cache.put_many(new)
+            vectors.update(new)
+            batches += 1
+
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["texts"] += len(texts)
+            self.stats["unique_texts"] += len(unique)
+            self.stats["embedded"] += len(misses)
+            self.stats["batches"] += batches
+
+        return np.stack([vectors[digest] for digest in digests])
+
+    def embed_one(self, text: str) -> np.ndarray:
+        """Embed a single text."""
+        return self.embed([text])[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get service statistics.
+
+        Returns:
+            Dict with request/text/batch counts and cache stats
+        """
+        return {**self.stats, "model": self.embedder.model_name, "cache": self.cache.get_stats()}
+
+
+def create_embedding_service() -> EmbeddingService:
+    """Create the embedding service from settings."""
+    settings = get_settings()
+    embedder = HashingEmbedder(dim=settings.embedding_dim)
+
+    redis_client = None
+    if settings.embedding_cache_backend == "redis":
+        import redis
+        redis_client = redis.Redis.from_url(settings.redis_url)
+
+    cache = EmbeddingCache(
+        dim=embedder.dim,
+        max_memory_items=settings.embedding_cache_size,
+        redis_client=redis_client,
+        directory=settings.embedding_cache_dir if settings.embedding_cache_backend == "disk" else None,
+        ttl_seconds=settings.cache_ttl or None,
+    )
+    return EmbeddingService(embedder, cache, batch_size=settings.embedding_batch_size)
+
+
+# Global instance
+embedding_service = create_embedding_service()
+
+
+# Helper functions
+def get_embedding_service() -> EmbeddingService:
+    """Get the embedding service instance."""
+    return embedding_service
@@ -0,0 +1,311 @@
+"""
+Model Router - Pick a model per worker call.
+
+One model for every worker overpays for simple calls (a 500-token search
+summary) and can underdeliver on hard ones (synthesis, long-form
+writing). The router starts from the worker's tier hint, then:
+
+1. Upgrades one tier when the hinted model's observed quality for the
+   worker is below target and the budget allows
+2. Downgrades while the call would exceed the brief's per-worker share
+   of the remaining budget or deadline
+3. Swaps in the fallback model while the chosen model is overloaded
+
+Latency estimates start from per-tier priors; latency and quality then
+follow observed outcomes (EWMA per model and worker).
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from config.settings import get_settings
+from src.tools.llm.token_counter import TokenCounter, get_token_counter
+
+
+TIERS = ["fast", "balanced", "strong"]
+
+# Latency priors: (seconds to first token, output tokens per second)
+TIER_PRIORS: Dict[str, Tuple[float, float]] = {
+    "fast": (0.5, 150.0),
+    "balanced": (1.0, 70.0),
+    "strong": (2.0, 40.0),
+}
+
+# HTTP statuses meaning "try another model"
+OVERLOAD_STATUS_CODES = {429, 529}
+
+
+class ModelChoice(BaseModel):
+    """Model selected for one worker call."""
+
+    model: str = Field(..., description="Model ID to call")
+    tier: str = Field(..., description="Tier of the model")
+    reason: str = Field(..., description="Why this model was chosen")
+    estimated_cost: float = Field(..., ge=0.0, description="Estimated USD cost of the call")
+    estimated_latency_seconds: float = Field(..., ge=0.0, description="Estimated call latency")
+    fallback_model: Optional[str] = Field(default=None, description="Model to use if this one is overloaded")
+
+
+class ModelRouter:
+    """
+    Per-worker model router.
+    """
+
+    def __init__(
+        self,
+        models: Optional[Dict[str, str]] = None,
+        fallback_model: Optional[str] = None,
+        min_quality: float = 0.8,
+        overload_cooldown_seconds: float = 30.0,
+        alpha: float = 0.3,
+        token_counter: Optional[TokenCounter] = None,
+    ):
+        """
+        Initialize router.
+
+        Args:
+            models: Model ID per tier (default: settings fast/default/strong models)
+            fallback_model: Model used while the chosen one is overloaded
+                (default: settings.llm_fallback_model)
+            min_quality: Observed quality below which a worker is upgraded
+            overload_cooldown_seconds: How long an overloaded model is avoided
+            alpha: EWMA weight of each observed outcome
+            token_counter: Cost estimator (default: global counter)
+        """
+        settings = get_settings()
+        self.models = models or {
+            "fast": settings.llm_fast_model,
+            "balanced": settings.llm_model,
+            "strong": settings.llm_strong_model,
+        }
+        self.fallback_model = fallback_model or settings.llm_fallback_model
+        self.min_quality = min_quality
+        self.overload_cooldown_seconds = overload_cooldown_seconds
+        self.alpha = alpha
+        self.token_counter = token_counter or get_token_counter()
+
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str], float] = {}
+        self._quality: Dict[Tuple[str, str], float] = {}
+        self._overloaded_until: Dict[str, float] = {}
+        self.stats = {"routed": 0, "upgraded": 0, "downgraded": 0, "fallbacks": 0}
+
+    # =========================================================================
+    # ROUTING
+    # =========================================================================
+
+    def route(
+        self,
+        worker_def: Any,
+        brief: Any = None,
+        spent_cost: float = 0.0,
+        elapsed_seconds: float = 0.0,
+        remaining_workers: int = 1,
+    ) -> ModelChoice:
+        """
+        Choose a model for a worker call.
+
+        Args:
+            worker_def: Worker definition (model_tier, token limits)
+            brief: Brief with optional max_budget / max_time_seconds
+            spent_cost: Cost spent on the request so far
+            elapsed_seconds: Time spent on the request so far
+            remaining_workers: Worker calls left, including this one
+
+        Returns:
+            Model choice
+        """
+        share = max(1, remaining_workers)
+        max_budget = getattr(brief, "max_budget", None)
+        max_time = getattr(brief, "max_time_seconds", None)
+        cost_allowance = (max_budget - spent_cost) / share if max_budget else float("inf")
+        time_allowance = (max_time - elapsed_seconds) / share if max_time else float("inf")
+
+        index = TIERS.index(self._hint_tier(worker_def))
+        reason = "worker hint"
+
+        # Upgrade when the hinted model underperforms for this worker
+        observed = self._quality.get((self.models[TIERS[index]], worker_def.id))
+        if observed is not None and observed < self.min_quality and index + 1 < len(TIERS):
+            cost, latency = self._estimate(worker_def, TIERS[index + 1])
+            if cost <= cost_allowance and latency <= time_allowance:
+                index += 1
+                reason = f"upgraded: observed quality {observed:.2f} < {self.min_quality}"
+                self.stats["upgraded"] += 1
+
+        # Downgrade while over the per-worker budget or deadline share
+        cost, latency = self._estimate(worker_def, TIERS[index])
+        while index > 0 and (cost > cost_allowance or latency > time_allowance):
+            reason = "downgraded: budget" if cost > cost_allowance else "downgraded: deadline"
+            index -= 1
+            cost, latency = self._estimate(worker_def, TIERS[index])
+            self.stats["downgraded"] += 1
+
+        tier = TIERS[index]
+        model = self.models[tier]
+        fallback = self.fallback_model if self.fallback_model != model else None
+        if self.is_overloaded(model) and fallback:
+            model, fallback, reason = fallback, None, f"fallback: {model} overloaded"
+            self.stats["fallbacks"] += 1
+
+        self.stats["routed"] += 1
+        return ModelChoice(
+            model=model,
+            tier=tier,
+            reason=reason,
+            estimated_cost=round(cost, 6),
+            estimated_latency_seconds=round(latency, 3),
+            fallback_model=fallback,
+        )
+
+    def _hint_tier(self, worker_def: Any) -> str:
+        """Tier from the worker's hint, or from its output size."""
+        hint = getattr(worker_def, "model_tier", None)
+        if hint in TIERS:
+            return hint
+        return "fast" if worker_def.default_max_tokens <= 1000 else "balanced"
+
+    def _estimate(self, worker_def: Any, tier: str) -> Tuple[float, float]:
+        """(cost, latency) of a worker call on a tier's model."""
+        model = self.models[tier]
+        input_tokens, output_tokens = self._expected_tokens(worker_def)
+        cost = self.token_counter.estimate_cost(input_tokens, output_tokens, model)
+
+        latency = self._latency.get((model, worker_def.id))
+        if latency is None:
+            first_token, tokens_per_second = TIER_PRIORS[tier]
+            latency = first_token + output_tokens / tokens_per_second
+        return cost, latency
+
+    def _expected_tokens(self, worker_def: Any) -> Tuple[int, int]:
+        """(input, output) tokens a worker call is expected to use."""
+        return worker_def.max_input_tokens or 1000, worker_def.default_max_tokens
+
+    # =========================================================================
+    # FEEDBACK
+    # =========================================================================
+
+    def record_outcome(
+        self,
+        model: str,
+        worker_id: str,
+        latency_seconds: float,
+        quality: Optional[float] = None,
+    ) -> None:
+        """
+        Record an observed call.
+
+        Args:
+            model: Model that served the call
+            worker_id: Worker that made it
+            latency_seconds: Observed latency
+            quality: Observed quality (0-1), if known
+        """
+        key = (model, worker_id)
+        with self._lock:
+            previous = self._latency.get(key)
+            self._latency[key] = latency_seconds if previous is None else (
+                (1 - self.alpha) * previous + self.alpha * latency_seconds
+            )
+            if quality is not None:
+                previous = self._quality.get(key)
+                self._quality[key] = quality if previous is None else (
+                    (1 - self.alpha) * previous + self.alpha * quality
+                )
+
+    def mark_overloaded(self, model: str) -> None:
+        """Avoid a model for the cooldown period."""
+        with self._lock:
+            self._overloaded_until[model] = time.time() + self.overload_cooldown_seconds
+
+    def is_overloaded(self, model: str) -> bool:
+        """Check if a model is in overload cooldown."""
+        return self._overloaded_until.get(model, 0.0) > time.time()
+
+    # =========================================================================
+    # EXECUTION
+    # =========================================================================
+
+    def call(self, create: Callable[..., Any], choice: ModelChoice, **request: Any) -> Any:
+        """
+        Call a model, retrying once on the fallback if it is overloaded.
+
+        Args:
+            create: LLM call taking model= (e.g. LLMConfig.create_message)
+            choice: Routing decision
+            **request: Other call arguments (messages, system, ...)
+
+        Returns:
+            Response of whichever model served the call
+
+        Raises:
+            Exception: Non-overload errors, or the fallback's error
+        """
+        try:
+            return create(model=choice.model, **request)
+        except Exception as e:
+            if not is_overload_error(e) or not choice.fallback_model:
+                raise
+            self.mark_overloaded(choice.model)
+            self.stats["fallbacks"] += 1
+            return create(model=choice.fallback_model, **request)
+
+    def cost_multiplier(self, model: str, worker_def: Any) -> float:
+        """
+        Cost of a worker call on a model relative to the balanced (default) model.
+
+        Worker cost estimates assume the default model; multiply by this
+        to cost a call routed elsewhere. Input and output prices are
+        weighted by the worker's expected input and output tokens.
+
+        Args:
+            model: Model that served the call
+            worker_def: Worker that made it
+
+        Returns:
+            Cost ratio (1.0 for the balanced model)
+        """
+        input_tokens, output_tokens = self._expected_tokens(worker_def)
+        baseline = self.token_counter.estimate_cost(input_tokens, output_tokens, self.models["balanced"])
+        cost = self.token_counter.estimate_cost(input_tokens, output_tokens, model)
+        return cost / baseline if baseline else 1.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get router statistics.
+
+        Returns:
+            Dict with routing counters, models and overloaded models
+        """
+        return {
+            **self.stats,
+            "models": dict(self.models),
+            "fallback_model": self.fallback_model,
+            "overloaded": [m for m in self._overloaded_until if self.is_overloaded(m)],
+        }
+
+
+def is_overload_error(error: Exception) -> bool:
+    """Check if an API error means the model is overloaded or rate limited."""
+    return (
+        getattr(error, "status_code", None) in OVERLOAD_STATUS_CODES
+        or "overloaded" in str(error).lower()
+        or type(error).__name__ in ("RateLimitError", "OverloadedError")
+    )
+
+
+# Global instance
+model_router = ModelRouter()
+
+
+# Helper functions
+def get_model_router() -> ModelRouter:
+    """Get the model router instance."""
+    return model_router
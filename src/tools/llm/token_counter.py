@@ -0,0 +1,291 @@
+"""
+Token Counter - Fast local token estimates, calibrated on real usage.
+
+Text is pre-tokenized the way BPE tokenizers split it (words, digit
+groups, punctuation runs, non-Latin characters) and each piece is
+costed by length. A per-model scale factor is then learned from the
+`usage.input_tokens` the API reports, so estimates converge on the
+real tokenizer without shipping one.
+
+Repeated strings (system prompts, templates, sources) hit a memo cache.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from config.settings import get_settings
+
+
+# USD per million tokens (input, output)
+MODEL_PRICING: Dict[str, tuple] = {
+    "claude-opus-4": (15.0, 75.0),
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-3-7-sonnet": (3.0, 15.0),
+    "claude-3-5-sonnet": (3.0, 15.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+    "claude-3-haiku": (0.25, 1.25),
+}
+DEFAULT_PRICING = (3.0, 15.0)
+
+# Price of prompt-cache reads relative to regular input tokens
+CACHE_READ_MULTIPLIER = 0.1
+
+# Tokens added per message / per request by the chat format
+MESSAGE_OVERHEAD_TOKENS = 4
+REQUEST_OVERHEAD_TOKENS = 3
+
+_PIECE_RE = re.compile(
+    r" ?[A-Za-z]+"             # words (with leading space, as BPE merges it)
+    r"| ?\d{1,3}"              # digits in groups of up to 3
+    r"| ?[^\sA-Za-z\d]"        # single punctuation / symbol / non-Latin char
+    r"|\s+"                    # whitespace runs
+)
+
+
+def split_tokens(text: str) -> List[str]:
+    """Split text into token-like pieces that join back to the original."""
+    return _PIECE_RE.findall(text)
+
+
+def _raw_count(text: str) -> int:
+    """Uncalibrated token estimate."""
+    tokens = 0
+    for piece in _PIECE_RE.findall(text):
+        stripped = piece.strip()
+        if not stripped:
+            # Newlines and indentation merge into few tokens
+            tokens += 1 if "\n" in piece or len(piece) > 1 else 0
+        elif stripped.isalpha() and stripped.isascii():
+            # Common words are one token; long words split every ~4-5 chars
+            tokens += 1 if len(stripped) <= 6 else math.ceil(len(stripped) / 4.5)
+        else:
+            tokens += 1
+    return tokens
+
+
+class TokenCounter:
+    """
+    Memoized, calibrated token counter.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = 20000,
+        max_cached_chars: int = 50000,
+        calibration_alpha: float = 0.1,
+        model: Optional[str] = None,
+    ):
+        """
+        Initialize counter.
+
+        Args:
+            cache_size: Memo cache entries
+            max_cached_chars: Longer texts are cached by digest, not by value
+            calibration_alpha: EWMA weight of each new usage observation
+            model: Default model (default: settings.llm_model)
+        """
+        self.cache_size = cache_size
+        self.max_cached_chars = max_cached_chars
+        self.calibration_alpha = calibration_alpha
+        self.model = model or get_settings().llm_model
+
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._scales: Dict[str, float] = {}
+        self._observations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    # =========================================================================
+    # COUNTING
+    # =========================================================================
+
+    def count(self, text: str, model: Optional[str] = None) -> int:
+        """
+        Estimate tokens in a text.
+
+        Args:
+            text: Text to count
+            model: Model whose calibration to apply (default: counter model)
+
+        Returns:
+            Estimated token count (0 for empty text)
+        """
+        if not text:
+            return 0
+        return max(1, round(self._raw(text) * self.get_scale(model)))
+
+    def count_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        system: Optional[Any] = None,
+        model: Optional[str] = None,
+    ) -> int:
+        """
+        Estimate input tokens of a Messages API request.
+
+        Args:
+            messages: Message dicts (content as string or content blocks)
+            system: System prompt (string or content blocks)
+            model: Model whose calibration to apply
+
+        Returns:
+            Estimated input tokens
+        """
+        raw = REQUEST_OVERHEAD_TOKENS + self._raw(_content_text(system))
+        for message in messages:
+            raw += MESSAGE_OVERHEAD_TOKENS + self._raw(_content_text(message.get("content")))
+        return max(1, round(raw * self.get_scale(model)))
+
+    def tokens_for_words(self, words: int, model: Optional[str] = None) -> int:
+        """Estimate tokens for a given number of English words."""
+        return round(words * 1.3 * self.get_scale(model))
+
+    def _raw(self, text: str) -> int:
+        """Memoized uncalibrated count."""
+        if not text:
+            return 0
+        key = text if len(text) <= self.max_cached_chars else hashlib.blake2b(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return cached
+
+        raw = _raw_count(text)
+        with self._lock:
+            self.stats["misses"] += 1
+            self._cache[key] = raw
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return raw
+
+    # =========================================================================
+    # CALIBRATION
+    # =========================================================================
+
+    def get_scale(self, model: Optional[str] = None) -> float:
+        """Calibration factor (actual / raw) for a model."""
+        return self._scales.get(model or self.model, 1.0)
+
+    def calibrate(
+        self,
+        messages: List[Dict[str, Any]],
+        system: Optional[Any],
+        actual_input_tokens: int,
+        model: Optional[str] = None,
+    ) -> float:
+        """
+        Update calibration from a request's reported usage.
+
+        Args:
+            messages: Request messages
+            system: Request system prompt
+            actual_input_tokens: usage.input_tokens from the API
+            model: Model that served the request
+
+        Returns:
+            Updated scale factor
+        """
+        model = model or self.model
+        raw = REQUEST_OVERHEAD_TOKENS + self._raw(_content_text(system)) + sum(
+            MESSAGE_OVERHEAD_TOKENS + self._raw(_content_text(m.get("content"))) for m in messages
+        )
+        if raw <= 0 or actual_input_tokens <= 0:
+            return self.get_scale(model)
+
+        ratio = actual_input_tokens / raw
+        with self._lock:
+            seen = self._observations.get(model, 0)
+            # First observations move fast; later ones smooth noise
+            alpha = max(self.calibration_alpha, 1.0 / (seen + 1))
+            self._scales[model] = (1 - alpha) * self._scales.get(model, 1.0) + alpha * ratio
+            self._observations[model] = seen + 1
+            return self._scales[model]
+
+    # =========================================================================
+    # COST
+    # =========================================================================
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: Optional[str] = None,
+        cached_input_tokens: int = 0,
+    ) -> float:
+        """
+        Estimate USD cost of a call.
+
+        Args:
+            input_tokens: Prompt tokens (including cached ones)
+            output_tokens: Completion tokens
+            model: Model ID (matched by prefix against MODEL_PRICING)
+            cached_input_tokens: Prompt tokens read from the prompt cache
+
+        Returns:
+            Cost in USD
+        """
+        input_price, output_price = get_pricing(model or self.model)
+        cached = min(cached_input_tokens, input_tokens)
+        billed_input = input_tokens - cached + cached * CACHE_READ_MULTIPLIER
+        return (billed_input * input_price + output_tokens * output_price) / 1_000_000
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get counter statistics.
+
+        Returns:
+            Dict with cache hits/misses and per-model calibration
+        """
+        return {
+            **self.stats,
+            "cached": len(self._cache),
+            "scales": dict(self._scales),
+            "observations": dict(self._observations),
+        }
+
+
+def get_pricing(model: str) -> tuple:
+    """(input, output) USD per million tokens for a model ID."""
+    for prefix, pricing in MODEL_PRICING.items():
+        if model.startswith(prefix):
+            return pricing
+    return DEFAULT_PRICING
+
+
+def _content_text(content: Any) -> str:
+    """Flatten string or content-block message content to text."""
+    if content is None:
+        return ""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(
+            block.get("text", "") if isinstance(block, dict) else str(getattr(block, "text", block))
+            for block in content
+        )
+    return str(content)
+
+
+# Global instance
+token_counter = TokenCounter()
+
+
+# Helper functions
+def get_token_counter() -> TokenCounter:
+    """Get the token counter instance."""
+    return token_counter
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with the global counter."""
+    return token_counter.count(text)
@@ -0,0 +1,31 @@
+"""
+Search tools package - Source deduplication and BM25 evidence search.
+"""
+
+from .dedup import (
+    SourceDeduplicator,
+    MinHasher,
+    LSHIndex,
+    canonicalize_url,
+    shingles,
+    estimate_jaccard,
+)
+from .bm25 import (
+    BM25Index,
+    EvidenceIndex,
+    tokenize,
+    split_claims,
+)
+
+__all__ = [
+    "SourceDeduplicator",
+    "MinHasher",
+    "LSHIndex",
+    "canonicalize_url",
+    "shingles",
+    "estimate_jaccard",
+    "BM25Index",
+    "EvidenceIndex",
+    "tokenize",
+    "split_claims",
+]
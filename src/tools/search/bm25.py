@@ -0,0 +1,252 @@
+"""
+BM25 Index - In-memory inverted index for claim-to-evidence lookups.
+
+Passages are added incrementally as sources arrive. Each term's
+postings are two compact arrays (doc ids as uint32, term frequencies as
+uint16) that NumPy reads without copying, so scoring a query is a few
+vectorized scatter-adds over only the postings of its terms.
+
+Used by the fact checker and citation manager: every claim gets its
+top passages in milliseconds, and only those go to the LLM.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import hashlib
+import math
+import re
+import threading
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.text import chunk_text, source_text
+
+
+_TOKEN_RE = re.compile(r"\w+")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the their this "
+    "to was were will with which who what when where how not but than then so such".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords or single characters."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def split_claims(text: str, max_claims: int = 20, min_words: int = 4) -> List[str]:
+    """
+    Split content into checkable claims (sentences).
+
+    Args:
+        text: Draft content
+        max_claims: Max claims returned
+        min_words: Shorter sentences are skipped
+
+    Returns:
+        Claim sentences in document order
+    """
+    claims = [s.strip() for s in _SENTENCE_RE.split(text or "") if len(s.split()) >= min_words]
+    return claims[:max_claims]
+
+
+class BM25Index:
+    """
+    Incremental BM25 inverted index.
+
+    Documents are passages with a key and optional metadata.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize index.
+
+        Args:
+            k1: Term-frequency saturation
+            b: Length normalization
+        """
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.Lock()
+        self._vocab: Dict[str, int] = {}
+        self._postings_docs: List[array] = []
+        self._postings_tfs: List[array] = []
+        self._doc_lengths = array("I")
+        self._total_length = 0
+        self._keys: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._key_set: set = set()
+
+    def add(self, key: str, text: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Add a passage.
+
+        Args:
+            key: Unique passage key (re-adding a key is ignored)
+            text: Passage text
+            metadata: Returned with search results
+
+        Returns:
+            True if the passage was added
+        """
+        tokens = tokenize(text)
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+
+        with self._lock:
+            if key in self._key_set:
+                return False
+            doc_id = len(self._keys)
+            self._keys.append(key)
+            self._key_set.add(key)
+            self._metadata.append(metadata or {})
+            self._doc_lengths.append(len(tokens))
+            self._total_length += len(tokens)
+
+            for term, tf in counts.items():
+                term_id = self._vocab.get(term)
+                if term_id is None:
+                    term_id = len(self._postings_docs)
+                    self._vocab[term] = term_id
+                    self._postings_docs.append(array("I"))
+                    self._postings_tfs.append(array("H"))
+                self._postings_docs[term_id].append(doc_id)
+                self._postings_tfs[term_id].append(min(tf, 0xFFFF))
+        return True
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """
+        Rank passages for a query.
+
+        Args:
+            query: Query text (e.g. a claim)
+            k: Max results
+
+        Returns:
+            List of (key, score, metadata), best first; passages sharing
+            no terms with the query are never returned
+        """
+        terms = [t for t in dict.fromkeys(tokenize(query)) if t in self._vocab]
+
+        with self._lock:
+            n_docs = len(self._keys)
+            if not terms or n_docs == 0 or k <= 0:
+                return []
+
+            lengths = np.frombuffer(self._doc_lengths, dtype=np.uint32).astype(np.float32)
+            avgdl = self._total_length / n_docs or 1.0
+            norm = self.k1 * (1 - self.b + self.b * lengths / avgdl)
+            scores = np.zeros(n_docs, dtype=np.float32)
+
+            for term in terms:
+                term_id = self._vocab[term]
+                docs = np.frombuffer(self._postings_docs[term_id], dtype=np.uint32)
+                tfs = np.frombuffer(self._postings_tfs[term_id], dtype=np.uint16).astype(np.float32)
+                idf = math.log(1 + (n_docs - docs.size + 0.5) / (docs.size + 0.5))
+                scores[docs] += idf * tfs * (self.k1 + 1) / (tfs + norm[docs])
+                # Release buffer views so later appends can resize the arrays
+                del docs, tfs
+
+            matched = np.flatnonzero(scores > 0)
+            if matched.size > k:
+                matched = matched[np.argpartition(-scores[matched], k)[:k]]
+            ranked = matched[np.argsort(-scores[matched])]
+            return [(self._keys[i], float(scores[i]), self._metadata[i]) for i in ranked]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_set
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict with passage, term and postings counts and postings size
+        """
+        postings = sum(len(p) for p in self._postings_docs)
+        return {
+            "passages": len(self._keys),
+            "terms": len(self._vocab),
+            "postings": postings,
+            "postings_bytes": postings * 6,
+            "avg_passage_length": self._total_length / len(self._keys) if self._keys else 0.0,
+        }
+
+
+class EvidenceIndex:
+    """
+    BM25 index over source passages, queried claim by claim.
+    """
+
+    def __init__(self, passage_words: int = 60, overlap: int = 15):
+        """
+        Initialize evidence index.
+
+        Args:
+            passage_words: Words per passage
+            overlap: Words shared between consecutive passages
+        """
+        self.index = BM25Index()
+        self.passage_words = passage_words
+        self.overlap = overlap
+
+    def add_sources(self, sources: List[Any]) -> int:
+        """
+        Split sources into passages and index them.
+
+        Args:
+            sources: Source strings or dicts (title/content/url)
+
+        Returns:
+            Number of new passages
+        """
+        added = 0
+        for position, source in enumerate(sources):
+            url = source.get("url") if isinstance(source, dict) else None
+            for passage in chunk_text(source_text(source), self.passage_words, self.overlap):
+                key = hashlib.sha1(passage.encode("utf-8")).hexdigest()
+                if self.index.add(key, passage, {"text": passage, "url": url, "source_index": position}):
+                    added += 1
+        return added
+
+    def find_evidence(self, claim: str, k: int = 3) -> List[Dict[str, Any]]:
+        """
+        Top passages supporting or contradicting a claim.
+
+        Args:
+            claim: Claim sentence
+            k: Max passages
+
+        Returns:
+            Passages with text, url, source_index, passage_id and score
+        """
+        return [
+            {**metadata, "passage_id": key, "score": round(score, 4)}
+            for key, score, metadata in self.index.search(claim, k)
+        ]
+
+    def evidence_for(self, content: str, k_per_claim: int = 3, max_claims: int = 20) -> List[Dict[str, Any]]:
+        """
+        Evidence for every claim in a draft.
+
+        Args:
+            content: Draft content
+            k_per_claim: Passages per claim
+            max_claims: Claims checked
+
+        Returns:
+            List of {"claim", "passages"} in document order
+        """
+        claims = split_claims(content, max_claims) or ([content.strip()] if content.strip() else [])
+        return [{"claim": claim, "passages": self.find_evidence(claim, k_per_claim)} for claim in claims]
@@ -0,0 +1,299 @@
+"""
+Source Deduplication - Canonical URLs plus MinHash/LSH near-duplicates.
+
+The same article often comes back from several research workers
+(syndicated news, mirrors, AMP pages, tracking-parameter variants).
+Dedup happens in three stages, each a constant-time lookup per source:
+
+1. Canonical URL match
+2. Exact content hash match
+3. Near-duplicate content: MinHash signatures over word shingles,
+   bucketed with LSH banding; only bucket collisions are compared
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import hashlib
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+from src.utils.text import source_text
+
+
+# Query parameters that never change the document
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid",
+    "ref", "ref_src", "cmpid", "ncid", "spm", "_ga", "_hsenc", "_hsmi",
+}
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_WORD_RE = re.compile(r"\w+")
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so variants of the same page compare equal.
+
+    Lowercases scheme and host, drops "www.", "amp." and "m." hosts,
+    default ports, fragments, tracking parameters and trailing slashes,
+    strips AMP path suffixes, and sorts the remaining query parameters.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Canonical URL (empty string for empty input)
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    if "://" not in url:
+        url = "http://" + url
+
+    parts = urlsplit(url)
+    scheme = "https" if parts.scheme.lower() in ("http", "https") else parts.scheme.lower()
+
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "amp.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = re.sub(r"/+", "/", parts.path or "/")
+    path = re.sub(r"(/amp|\.amp|/amp\.html)$", "", path)
+    path = path.rstrip("/") or "/"
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def shingles(text: str, k: int = 5) -> np.ndarray:
+    """
+    Hash word k-shingles of a text to 32-bit integers.
+
+    Texts shorter than k words yield a single shingle.
+
+    Args:
+        text: Text to shingle
+        k: Words per shingle
+
+    Returns:
+        Unique shingle hashes (uint64 array of 32-bit values)
+    """
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return np.zeros(0, dtype=np.uint64)
+    grams = [" ".join(words[i:i + k]) for i in range(max(1, len(words) - k + 1))]
+    return np.unique(np.fromiter(
+        (int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=4).digest(), "little") for g in grams),
+        dtype=np.uint64,
+        count=len(grams),
+    ))
+
+
+class MinHasher:
+    """
+    MinHash signatures with universal hashing, vectorized over shingles.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        """
+        Initialize hasher.
+
+        Args:
+            num_perm: Signature length
+            seed: Seed for the hash permutations
+        """
+        self.num_perm = num_perm
+        rng = np.random.default_rng(seed)
+        # a < 2^31 and x < 2^32 keep a*x + b inside uint64
+        self._a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingle_hashes: np.ndarray) -> np.ndarray:
+        """
+        Compute the MinHash signature of a shingle set.
+
+        Args:
+            shingle_hashes: Output of shingles()
+
+        Returns:
+            uint32 array of length num_perm
+        """
+        if shingle_hashes.size == 0:
+            return np.full(self.num_perm, 0xFFFFFFFF, dtype=np.uint32)
+        hashed = (np.outer(shingle_hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return hashed.min(axis=0).astype(np.uint32)
+
+
+def estimate_jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    return float(np.mean(sig_a == sig_b))
+
+
+class LSHIndex:
+    """
+    Locality-sensitive hashing over MinHash signatures.
+
+    Signatures are split into `bands` bands of `rows` values; documents
+    sharing any whole band land in the same bucket. With b bands of r
+    rows, pairs are likely to collide above a Jaccard of ~(1/b)^(1/r).
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16):
+        """
+        Initialize index.
+
+        Args:
+            num_perm: Signature length
+            bands: Number of bands (must divide num_perm)
+
+        Raises:
+            ValueError: If bands doesn't divide num_perm
+        """
+        if num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, List[str]]] = [defaultdict(list) for _ in range(bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def insert(self, key: str, signature: np.ndarray) -> None:
+        """Add a signature under a key."""
+        self._signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band][band_key].append(key)
+
+    def query(self, signature: np.ndarray) -> List[str]:
+        """Keys sharing at least one band with the signature."""
+        candidates: Dict[str, None] = {}
+        for band, band_key in enumerate(self._band_keys(signature)):
+            for key in self._buckets[band].get(band_key, ()):
+                candidates[key] = None
+        return list(candidates)
+
+    def get_signature(self, key: str) -> np.ndarray:
+        """Signature stored for a key."""
+        return self._signatures[key]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+class SourceDeduplicator:
+    """
+    Streaming source deduplicator.
+
+    Feed sources one at a time with check(); each is compared only
+    against documents in its URL, hash or LSH buckets.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+    ):
+        """
+        Initialize deduplicator.
+
+        Args:
+            threshold: Estimated Jaccard at or above which sources are duplicates
+            num_perm: MinHash signature length
+            bands: LSH bands
+            shingle_size: Words per shingle
+        """
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm)
+        self.lsh = LSHIndex(num_perm, bands)
+
+        self._by_url: Dict[str, str] = {}
+        self._by_hash: Dict[str, str] = {}
+        self.stats = {"checked": 0, "url_duplicates": 0, "exact_duplicates": 0, "near_duplicates": 0}
+
+    def check(self, key: str, text: str, url: Optional[str] = None) -> Optional[str]:
+        """
+        Check a source and remember it if it is new.
+
+        Args:
+            key: Identifier for the source
+            text: Source text
+            url: Source URL, if any
+
+        Returns:
+            Key of the source it duplicates, or None if it is unique
+        """
+        self.stats["checked"] += 1
+
+        canonical = canonicalize_url(url) if url else ""
+        if canonical and canonical in self._by_url:
+            self.stats["url_duplicates"] += 1
+            return self._by_url[canonical]
+
+        normalized = " ".join(_WORD_RE.findall(text.lower()))
+        if not normalized:
+            # No content to compare (URL-only or empty source): URL only
+            self._remember_url(canonical, key)
+            return None
+
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        if digest in self._by_hash:
+            self.stats["exact_duplicates"] += 1
+            return self._remember_url(canonical, self._by_hash[digest])
+
+        signature = self.hasher.signature(shingles(normalized, self.shingle_size))
+        for candidate in self.lsh.query(signature):
+            if estimate_jaccard(signature, self.lsh.get_signature(candidate)) >= self.threshold:
+                self.stats["near_duplicates"] += 1
+                return self._remember_url(canonical, candidate)
+
+        self._by_hash[digest] = key
+        self.lsh.insert(key, signature)
+        self._remember_url(canonical, key)
+        return None
+
+    def _remember_url(self, canonical: str, key: str) -> str:
+        """Map a canonical URL to the surviving source."""
+        if canonical:
+            self._by_url.setdefault(canonical, key)
+        return key
+
+    def dedupe(self, sources: List[Any]) -> Tuple[List[Any], Dict[int, int]]:
+        """
+        Remove duplicate sources, keeping the first occurrence.
+
+        Positions are used as keys, so use a fresh deduplicator per batch.
+
+        Args:
+            sources: Source strings or dicts (title/content/snippet/url)
+
+        Returns:
+            (unique sources, {duplicate position: kept position})
+        """
+        unique: List[Any] = []
+        duplicates: Dict[int, int] = {}
+        for position, source in enumerate(sources):
+            url = source.get("url") if isinstance(source, dict) else None
+            original = self.check(str(position), source_text(source), url)
+            if original is None:
+                unique.append(source)
+            else:
+                duplicates[position] = int(original)
+        return unique, duplicates
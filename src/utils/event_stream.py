@@ -0,0 +1,227 @@
+"""
+Event Stream - In-process pub/sub for live progress events.
+
+Producers (the Orchestrator, streaming workers) publish events on a
+channel per request; consumers (tests, downstream workers, and a future
+SSE/WebSocket endpoint; there is no HTTP API yet) subscribe and receive
+them as they happen. Each channel keeps a bounded history, so a
+subscriber that connects mid-run first receives what it missed and then
+follows live.
+
+History is dropped when a channel is closed, or once nothing has been
+published on it for idle_ttl_seconds, so channels whose owner never
+closes them cannot leak.
+
+Publishing never blocks: each subscriber has its own queue.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional
+
+
+# Event closing a channel; subscriptions end after receiving it
+DONE_EVENT = "done"
+
+
+class Subscription:
+    """
+    A subscriber's view of one channel.
+    """
+
+    def __init__(self, stream: "EventStream", channel: str, backlog: List[Dict[str, Any]]):
+        self.stream = stream
+        self.channel = channel
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.closed = False
+        for event in backlog:
+            self._queue.put(event)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Next event.
+
+        Args:
+            timeout: Max wait in seconds (None = wait forever)
+
+        Returns:
+            Event dict, or None on timeout or after the channel closed
+        """
+        if self.closed and self._queue.empty():
+            return None
+        try:
+            event = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if event["event"] == DONE_EVENT:
+            self.close()
+        return event
+
+    def events(self, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate events until the channel closes (or a wait times out)."""
+        while True:
+            event = self.get(timeout)
+            if event is None:
+                return
+            yield event
+            if event["event"] == DONE_EVENT:
+                return
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        """Async iteration until the channel closes."""
+        loop = asyncio.get_running_loop()
+        while True:
+            event = await loop.run_in_executor(None, self.get)
+            if event is None:
+                return
+            yield event
+            if event["event"] == DONE_EVENT:
+                return
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        if not self.closed:
+            self.closed = True
+            self.stream._unsubscribe(self)
+
+
+class EventStream:
+    """
+    Channel-based event bus with per-channel replay history.
+    """
+
+    def __init__(self, history_size: int = 1000, idle_ttl_seconds: float = 600.0):
+        """
+        Initialize event stream.
+
+        Args:
+            history_size: Events kept per channel for late subscribers
+            idle_ttl_seconds: Idle time after which a channel's history
+                is dropped
+        """
+        self.history_size = history_size
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._lock = threading.Lock()
+        self._history: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._last_published: Dict[str, float] = {}
+        self._last_sweep = time.time()
+        self._subscribers: Dict[str, List[Subscription]] = {}
+        self._seq = itertools.count(1)
+        self.stats = {"published": 0, "channels_closed": 0, "channels_expired": 0}
+
+    def publish(self, channel: str, event: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Publish an event.
+
+        Args:
+            channel: Channel (usually the request ID)
+            event: Event type (e.g. "partial_output", "worker_completed")
+            data: Event payload
+
+        Returns:
+            The published event
+        """
+        record = {
+            "channel": channel,
+            "event": event,
+            "data": data or {},
+            "seq": next(self._seq),
+            "timestamp": time.time(),
+        }
+        with self._lock:
+            self._history.setdefault(channel, deque(maxlen=self.history_size)).append(record)
+            self._last_published[channel] = record["timestamp"]
+            subscribers = list(self._subscribers.get(channel, ()))
+            self.stats["published"] += 1
+            if record["timestamp"] - self._last_sweep >= self.idle_ttl_seconds / 10:
+                self._expire_idle(record["timestamp"])
+        for subscription in subscribers:
+            subscription._queue.put(record)
+        return record
+
+    def subscribe(self, channel: str, replay: bool = True) -> Subscription:
+        """
+        Subscribe to a channel.
+
+        Args:
+            channel: Channel to follow
+            replay: Deliver the channel's history first
+
+        Returns:
+            Subscription
+        """
+        with self._lock:
+            backlog = list(self._history.get(channel, ())) if replay else []
+            subscription = Subscription(self, channel, backlog)
+            self._subscribers.setdefault(channel, []).append(subscription)
+        return subscription
+
+    def close_channel(self, channel: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Publish the final event and drop the channel's history.
+
+        Args:
+            channel: Channel to close
+            data: Payload of the done event
+        """
+        self.publish(channel, DONE_EVENT, data)
+        with self._lock:
+            self._history.pop(channel, None)
+            self._last_published.pop(channel, None)
+            # Subscribers still drain their queues up to the done event
+            self._subscribers.pop(channel, None)
+            self.stats["channels_closed"] += 1
+
+    def history(self, channel: str) -> List[Dict[str, Any]]:
+        """Events currently kept for a channel."""
+        with self._lock:
+            return list(self._history.get(channel, ()))
+
+    def _expire_idle(self, now: float) -> None:
+        """Drop the history of idle channels (lock held)."""
+        self._last_sweep = now
+        for channel, last in list(self._last_published.items()):
+            if now - last >= self.idle_ttl_seconds:
+                self._history.pop(channel, None)
+                del self._last_published[channel]
+                self.stats["channels_expired"] += 1
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if not subscribers:
+                self._subscribers.pop(subscription.channel, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get stream statistics.
+
+        Returns:
+            Dict with open channels, subscribers and event counters
+        """
+        with self._lock:
+            return {
+                "channels": len(self._history),
+                "subscribers": sum(len(s) for s in self._subscribers.values()),
+                **self.stats,
+            }
+
+
+# Global instance
+event_stream = EventStream()
+
+
+# Helper functions
+def get_event_stream() -> EventStream:
+    """Get the event stream instance."""
+    return event_stream
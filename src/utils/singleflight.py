@@ -0,0 +1,137 @@
+"""
+Singleflight - Coalesce concurrent identical calls into one execution.
+
+The first caller for a key runs the function; callers arriving while it
+is in flight wait for it and receive the same result (or exception).
+Once the call finishes the key is released, so later calls run afresh;
+singleflight deduplicates concurrent work, it is not a cache.
+
+Used at two levels:
+- Controller: keyed by Brief.fingerprint(), so identical briefs
+  submitted at the same time share one workflow run
+- Tools: keyed by (tool, normalized query), so workers issuing the same
+  search at the same time share one provider call
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import re
+import threading
+import unicodedata
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+_PUNCT_RE = re.compile(r"[^\w\s\"'-]+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    Canonical form of a search query.
+
+    Unicode-normalizes, lowercases, drops punctuation (keeping quotes
+    and hyphens, which change search meaning) and collapses whitespace.
+
+    Args:
+        query: Raw query
+
+    Returns:
+        Normalized query
+    """
+    query = unicodedata.normalize("NFKC", query or "").lower()
+    return _SPACE_RE.sub(" ", _PUNCT_RE.sub(" ", query)).strip()
+
+
+class _Call:
+    """An in-flight call."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Thread-safe call coalescer.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.stats = {"executions": 0, "shared": 0}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run fn once per key among concurrent callers.
+
+        Args:
+            key: Coalescing key
+            fn: Function to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's result (shared with concurrent callers of the same key)
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every caller
+        """
+        result, _ = self.do_shared(key, fn, *args, **kwargs)
+        return result
+
+    def do_shared(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, bool]:
+        """
+        Like do(), also reporting whether the result came from another caller.
+
+        Returns:
+            (result, shared) where shared is True for callers that waited
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.stats["shared"] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.stats["executions"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Check if a call for key is running."""
+        with self._lock:
+            return key in self._calls
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dict with executions, shared results and calls in flight
+        """
+        with self._lock:
+            return {**self.stats, "in_flight": len(self._calls)}
@@ -0,0 +1,46 @@
+"""
+Text utilities - Chunking and text extraction shared by retrieval,
+evidence search and context packing.
+"""
+
+from typing import Any, List
+
+
+def chunk_text(text: str, max_words: int = 120, overlap: int = 20) -> List[str]:
+    """
+    Split text into overlapping word windows.
+
+    Args:
+        text: Text to split
+        max_words: Words per chunk
+        overlap: Words shared between consecutive chunks
+
+    Returns:
+        Chunks (a single chunk for short texts)
+    """
+    words = text.split()
+    if len(words) <= max_words:
+        return [text.strip()] if text.strip() else []
+
+    step = max(1, max_words - overlap)
+    return [
+        " ".join(words[start:start + max_words])
+        for start in range(0, len(words) - overlap, step)
+    ]
+
+
+def source_content(source: Any) -> str:
+    """Body of a source: the string itself, or a dict's content/snippet/summary."""
+    if isinstance(source, dict):
+        return str(source.get("content") or source.get("snippet") or source.get("summary") or "")
+    return source if isinstance(source, str) else str(source)
+
+
+def source_text(source: Any) -> str:
+    """Extract indexable text from a source (string or dict)."""
+    if isinstance(source, str):
+        return source
+    if isinstance(source, dict):
+        parts = [source.get("title"), source.get("content") or source.get("snippet") or source.get("summary")]
+        return "\n".join(str(p) for p in parts if p)
+    return str(source)
@@ -0,0 +1,321 @@
+"""
+Worker Executor - Runs a single worker for a task.
+
+Stateless: everything needed is carried in the Task (phase and brief
+in input_data), so the same executor runs in-process under the
+Orchestrator or in a standalone worker process consuming a queue.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import copy
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from src.meta_agent.schemas import Brief, Task, TaskResult
+from config.worker_registry import get_worker_registry
+from config.prompts import get_prompt_registry
+from config.llm_config import get_llm_config
+from src.tools.llm.token_counter import get_token_counter
+from src.utils.singleflight import SingleFlight, normalize_query
+
+
+# Results a research worker asks its provider for by default
+DEFAULT_MAX_RESULTS = 10
+
+
+class WorkerExecutor:
+    """
+    Worker Executor - Executes worker tasks.
+
+    In Sprint 1 workers are mocked; results mirror the shape real
+    workers will return for each phase.
+    """
+
+    def __init__(self, simulated_latency_seconds: float = 0.1):
+        """
+        Initialize executor.
+
+        Args:
+            simulated_latency_seconds: Mock execution time per worker
+        """
+        self.registry = get_worker_registry()
+        self.prompts = get_prompt_registry()
+        self.token_counter = get_token_counter()
+        self.simulated_latency_seconds = simulated_latency_seconds
+        self.search_flight = SingleFlight()
+
+    def execute(self, task: Task) -> TaskResult:
+        """
+        Execute a task.
+
+        Args:
+            task: Task with input_data containing "phase" and "brief"
+                (and optionally "context" and "max_results")
+
+        Returns:
+            Task result (never raises for unknown workers)
+        """
+        start = time.time()
+        worker_def = self.registry.get_worker(task.worker_id)
+        if not worker_def:
+            return TaskResult(
+                task_id=task.task_id,
+                worker_id=task.worker_id,
+                success=False,
+                output={"status": "failed", "error": f"Worker {task.worker_id} not found"},
+                error=f"Worker {task.worker_id} not found",
+                duration_seconds=0.0,
+            )
+
+        brief = self._brief_from_input(task.input_data)
+        phase = task.input_data.get("phase", "")
+        context = task.input_data.get("context")
+        max_results = task.input_data.get("max_results")
+
+        if phase == "research" and context is None:
+            # Identical searches in flight (same tool, same query, same depth) share one call
+            key = (worker_def.id, normalize_query(brief.topic), max_results)
+            output = copy.deepcopy(
+                self.search_flight.do(key, self._run, worker_def, phase, brief, context, max_results)
+            )
+        else:
+            output = self._run(worker_def, phase, brief, context, max_results)
+
+        return TaskResult(
+            task_id=task.task_id,
+            worker_id=task.worker_id,
+            success=output.get("status") == "success",
+            output=output,
+            duration_seconds=time.time() - start,
+            cost=self.call_cost(worker_def, max_results),
+        )
+
+    def call_cost(self, worker_def: Any, max_results: Optional[int] = None) -> float:
+        """
+        Cost of one worker call.
+
+        A research call asked for fewer than DEFAULT_MAX_RESULTS
+        results costs proportionally less than its estimate.
+
+        Args:
+            worker_def: Worker definition
+            max_results: Requested research depth (None = default)
+
+        Returns:
+            Cost in dollars
+        """
+        if max_results is None or max_results >= DEFAULT_MAX_RESULTS:
+            return worker_def.estimated_cost
+        return worker_def.estimated_cost * max(0, max_results) / DEFAULT_MAX_RESULTS
+
+    def _run(
+        self,
+        worker_def: Any,
+        phase: str,
+        brief: Brief,
+        context: Optional[List[Dict[str, Any]]],
+        max_results: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Run a worker call (simulated latency plus mock result)."""
+        time.sleep(self.simulated_latency_seconds)
+        return self.create_result(worker_def, phase, brief, context, max_results)
+
+    def create_result(
+        self,
+        worker_def: Any,
+        phase: str,
+        brief: Brief,
+        context: Optional[List[Dict[str, Any]]] = None,
+        max_results: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create mock result for Sprint 1.
+
+        Args:
+            worker_def: Worker definition
+            phase: Current phase
+            brief: User brief
+            context: Retrieved source chunks, if the worker takes evidence
+            max_results: Sources a research worker asks for (None = default)
+
+        Returns:
+            Mock result
+        """
+        result = self._create_phase_result(worker_def, phase, brief, max_results)
+        if context is not None:
+            result["evidence"] = [
+                {
+                    "chunk_id": c["chunk_id"],
+                    "url": c.get("url"),
+                    "score": c["score"],
+                    **({"claim": c["claim"]} if "claim" in c else {}),
+                }
+                for c in context
+            ]
+            if any("tokens" in c for c in context):
+                result["context_tokens"] = sum(c.get("tokens", 0) for c in context)
+
+        if self.prompts.has(worker_def.id):
+            request = self.build_request(worker_def, brief, context, max_results=max_results)
+            result["prompt_tokens"] = self.token_counter.count_messages(request["messages"], request["system"])
+            result["cached_prompt_tokens"] = request["cacheable_tokens"]
+        return result
+
+    def stream_result(
+        self,
+        worker_def: Any,
+        phase: str,
+        brief: Brief,
+        context: Optional[List[Dict[str, Any]]] = None,
+        on_text: Optional[Callable[[str], Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a result, streaming its content as it is written.
+
+        Mock workers replay their content through the LLM config's mock
+        streamer, at its configured token rate.
+
+        Args:
+            worker_def: Worker definition
+            phase: Current phase
+            brief: User brief
+            context: Source chunks for the worker, if any
+            on_text: Called with each text delta
+
+        Returns:
+            Same result as create_result()
+        """
+        result = self.create_result(worker_def, phase, brief, context)
+        content = result.get("content")
+        if isinstance(content, str):
+            get_llm_config().mock_streamer.stream(content, on_text)
+        return result
+
+    def build_request(
+        self,
+        worker_def: Any,
+        brief: Brief,
+        context: Optional[List[Dict[str, Any]]] = None,
+        draft: str = "",
+        max_results: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the LLM request for a worker from its registered prompt.
+
+        Source context goes in the cacheable system prefix, so workers
+        given the same context share one cached prompt prefix.
+
+        Args:
+            worker_def: Worker definition
+            brief: User brief
+            context: Source chunks for the worker, if any
+            draft: Draft under review (quality workers)
+            max_results: Sources a research worker asks for (None = default)
+
+        Returns:
+            PromptRegistry.build_request() output
+        """
+        section_length = max(100, (brief.target_length or 2000) // 4)
+        variables = {
+            "topic": brief.topic,
+            "content_type": brief.content_type,
+            "tone": brief.tone,
+            "target_audience": brief.target_audience or "a general audience",
+            "target_length": brief.target_length or 2000,
+            "key_points": brief.key_points,
+            "keywords": brief.keywords,
+            "sources_to_include": brief.sources_to_include,
+            "citation_style": brief.citation_style or "APA",
+            "max_results": max_results or DEFAULT_MAX_RESULTS,
+            "summary_words": section_length,
+            "section_title": "Main Content",
+            "section_length": section_length,
+            "draft": draft,
+        }
+        shared_context = "\n\n".join(c["text"] for c in context if c.get("text")) if context else None
+        return self.prompts.build_request(worker_def.id, variables, shared_context)
+
+    def _create_phase_result(
+        self,
+        worker_def: Any,
+        phase: str,
+        brief: Brief,
+        max_results: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Build the mock result shape for a phase."""
+        topic = brief.topic
+
+        if phase == "research":
+            return {
+                "status": "success",
+                "worker_id": worker_def.id,
+                "sources": [
+                    f"Source 1 about {topic}",
+                    f"Source 2 about {topic}",
+                    f"Source 3 about {topic}",
+                ][:max_results],
+                "summary": f"Research findings about {topic}...",
+                "confidence": 0.85,
+            }
+
+        elif phase == "analysis":
+            return {
+                "status": "success",
+                "worker_id": worker_def.id,
+                "key_insights": [
+                    f"Insight 1 about {topic}",
+                    f"Insight 2 about {topic}",
+                ],
+                "themes": ["theme1", "theme2"],
+                "confidence": 0.88,
+            }
+
+        elif phase == "writing":
+            return {
+                "status": "success",
+                "worker_id": worker_def.id,
+                "content": f"Article content about {topic}...",
+                "word_count": brief.target_length or 2000,
+                "sections": ["Introduction", "Main Content", "Conclusion"],
+            }
+
+        elif phase == "quality":
+            return {
+                "status": "success",
+                "worker_id": worker_def.id,
+                "quality_score": 88.0,
+                "issues_found": 2,
+                "suggestions": [
+                    "Add more examples",
+                    "Improve transitions"
+                ],
+            }
+
+        else:
+            return {
+                "status": "success",
+                "worker_id": worker_def.id,
+                "result": f"Result from {phase}",
+            }
+
+    def _brief_from_input(self, input_data: Dict[str, Any]) -> Brief:
+        """Rebuild the brief from task input (full dump or topic only)."""
+        brief = input_data.get("brief")
+        if isinstance(brief, Brief):
+            return brief
+        if isinstance(brief, dict):
+            return Brief.model_validate(brief)
+        return Brief(topic=brief or "unknown")
+
+
+# Global instance
+worker_executor = WorkerExecutor()
+
+
+# Helper functions
+def get_worker_executor() -> WorkerExecutor:
+    """Get the worker executor instance."""
+    return worker_executor
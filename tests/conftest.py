@@ -0,0 +1,37 @@
+"""Shared test fixtures."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.meta_agent.metrics_store as metrics_store_module
+from src.meta_agent.schemas import PlanStep, ExecutionMode
+from config.worker_registry import get_worker_registry
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics(monkeypatch):
+    """
+    Give every test an empty global metrics store.
+
+    Orchestrators record executions into the global store, and the
+    global registry learns its estimates from it, so without this one
+    test's runs would change another test's plans.
+    """
+    store = metrics_store_module.create_metrics_store()
+    monkeypatch.setattr(metrics_store_module, "metrics_store", store)
+    # Re-resolved lazily from the patched global (respects learned_estimates_enabled)
+    monkeypatch.setattr(get_worker_registry(), "_metrics_store", None)
+    return store
+
+
+@pytest.fixture
+def make_step():
+    """Factory for minimal plan steps."""
+    def make(step_id, worker_ids, mode=ExecutionMode.PARALLEL, depends_on=None):
+        return PlanStep(step_id=step_id, phase=step_id, description=step_id, worker_ids=worker_ids,
+                        execution_mode=mode, depends_on=depends_on or [])
+    return make
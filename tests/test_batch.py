@@ -0,0 +1,124 @@
+"""Test offline LLM batch mode."""
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.llm_config import LLMConfig
+from src.tools.llm.batch import BatchCollector, BatchRequestError, LocalBatchServer
+
+
+def echo(params):
+    """Responder echoing the prompt back."""
+    return {"text": params["messages"][0]["content"], "model": params.get("model")}
+
+
+def test_concurrent_calls_share_one_batch():
+    """Test calls from many workers are collected into one batch and fanned back."""
+    collector = BatchCollector(LocalBatchServer(echo), flush_interval_seconds=0.2, poll_interval_seconds=0.05,
+                               default_params={"model": "m", "max_tokens": 10})
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        responses = list(pool.map(
+            lambda i: collector.create_message([{"role": "user", "content": f"brief {i}"}], timeout=5),
+            range(20),
+        ))
+    collector.close()
+
+    assert [r["text"] for r in responses] == [f"brief {i}" for i in range(20)]
+    assert all(r["model"] == "m" for r in responses)
+    assert collector.get_stats()["batches"] == 1
+    print(f"✅ 20 calls in {collector.get_stats()['batches']} batch")
+
+
+def test_full_batch_flushes_early():
+    """Test reaching max_batch_size submits without waiting for the interval."""
+    collector = BatchCollector(LocalBatchServer(echo), max_batch_size=5, flush_interval_seconds=60,
+                               poll_interval_seconds=0.05)
+
+    start = time.time()
+    futures = [collector.submit({"messages": [{"role": "user", "content": str(i)}]}) for i in range(10)]
+    results = [f.result(timeout=5) for f in futures]
+    collector.close()
+
+    assert time.time() - start < 5
+    assert [r["text"] for r in results] == [str(i) for i in range(10)]
+    assert collector.get_stats()["batches"] == 2
+    print("✅ Full batches flushed early")
+
+
+def test_leftover_call_waits_its_own_interval():
+    """Test the interval restarts from the oldest call left after a full batch is sent."""
+    collector = BatchCollector(LocalBatchServer(echo), max_batch_size=5, flush_interval_seconds=1.0,
+                               poll_interval_seconds=0.05)
+
+    first = collector.submit({"messages": [{"role": "user", "content": "0"}]})
+    time.sleep(0.5)
+    arrived = time.time()
+    futures = [collector.submit({"messages": [{"role": "user", "content": str(i)}]}) for i in range(1, 6)]
+
+    # Past the first call's deadline, but not the leftover call's
+    time.sleep(0.7)
+    assert collector.get_stats()["batches"] == 1
+    assert collector.get_stats()["pending"] == 1
+
+    assert futures[-1].result(timeout=5)["text"] == "5"
+    assert time.time() - arrived >= 1.0
+    assert first.result(timeout=5)["text"] == "0"
+    collector.close()
+    print("✅ Leftover call kept its own flush interval")
+
+
+def test_errored_requests_fail_only_their_caller():
+    """Test a failed request raises for its caller and not for the rest."""
+    server = LocalBatchServer(echo, processing_seconds=0.1, fail_if=lambda p: p["messages"][0]["content"] == "bad")
+    collector = BatchCollector(server, flush_interval_seconds=0.05, poll_interval_seconds=0.05)
+
+    good = collector.submit({"messages": [{"role": "user", "content": "good"}]})
+    bad = collector.submit({"messages": [{"role": "user", "content": "bad"}]})
+
+    assert good.result(timeout=5)["text"] == "good"
+    with pytest.raises(BatchRequestError):
+        bad.result(timeout=5)
+    collector.close()
+    assert collector.get_stats()["errored"] == 1
+    print("✅ Errors fanned back to the right caller")
+
+
+def test_llm_config_batch_mode():
+    """Test LLMConfig.create_message goes through the collector in batch mode."""
+    config = LLMConfig()
+    collector = BatchCollector(LocalBatchServer(), flush_interval_seconds=0.05, poll_interval_seconds=0.05)
+    config.enable_batch_mode(collector)
+
+    response = config.create_message([{"role": "user", "content": "Bulk brief"}])
+    config.disable_batch_mode()
+
+    assert "Bulk brief" in response.content[0].text
+    assert collector.get_stats()["succeeded"] == 1
+    with pytest.raises(RuntimeError):
+        collector.submit({"messages": []})
+    print("✅ LLMConfig batch mode")
+
+
+async def test_llm_config_async_batch_mode():
+    """Test LLMConfig.acreate_message also goes through the collector in batch mode."""
+    config = LLMConfig()
+    collector = BatchCollector(LocalBatchServer(), flush_interval_seconds=0.2, poll_interval_seconds=0.05)
+    config.enable_batch_mode(collector)
+
+    responses = await asyncio.gather(*(
+        config.acreate_message([{"role": "user", "content": f"Async brief {i}"}]) for i in range(3)
+    ))
+    config.disable_batch_mode()
+
+    assert all(f"Async brief {i}" in r.content[0].text for i, r in enumerate(responses))
+    assert collector.get_stats()["succeeded"] == 3
+    assert collector.get_stats()["batches"] == 1
+    print("✅ LLMConfig async batch mode")
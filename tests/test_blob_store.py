@@ -0,0 +1,180 @@
+"""Test Blob Store."""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.storage.blob import BlobStore, BlobRef, BlobStoreFullError, is_blob_ref
+from src.meta_agent.merger import MergerAgent
+from src.meta_agent.schemas import Brief, ContentType, AgentState
+
+
+def test_put_and_get_text():
+    """Test storing and retrieving text."""
+    store = BlobStore()
+
+    ref = store.put("Hello blob store")
+
+    assert isinstance(ref, BlobRef)
+    assert ref.size == len("Hello blob store")
+    assert store.get(ref) == "Hello blob store"
+    print(f"✅ Stored blob {ref.digest[:12]}")
+
+
+def test_content_addressing_dedupes():
+    """Test identical content is stored once."""
+    store = BlobStore()
+
+    ref1 = store.put("same content" * 100)
+    ref2 = store.put("same content" * 100)
+
+    assert ref1.digest == ref2.digest
+    assert store.get_stats()["memory_blobs"] == 1
+    print("✅ Identical content deduplicated")
+
+
+def test_json_round_trip():
+    """Test storing JSON-serializable objects."""
+    store = BlobStore()
+
+    payload = {"sources": [{"title": "A", "content": "x" * 50}]}
+    ref = store.put(payload)
+
+    assert ref.media_type == "application/json"
+    assert store.get(ref) == payload
+    print("✅ JSON payload round-trips")
+
+
+def test_disk_tier_persists(tmp_path):
+    """Test on-disk tier survives a new store instance."""
+    store = BlobStore(directory=str(tmp_path))
+    ref = store.put("persisted article " * 500)
+
+    # New instance with empty memory tier
+    reopened = BlobStore(directory=str(tmp_path))
+
+    assert reopened.contains(ref)
+    assert reopened.get(ref) == "persisted article " * 500
+
+    # Stored compressed
+    blob_file = next(tmp_path.rglob("*.blob"))
+    assert blob_file.stat().st_size < ref.size
+    print(f"✅ Disk tier persisted ({blob_file.stat().st_size} of {ref.size} bytes)")
+
+
+def test_memory_eviction_falls_back_to_disk(tmp_path):
+    """Test LRU eviction keeps blobs readable from disk."""
+    store = BlobStore(directory=str(tmp_path), max_memory_bytes=1000)
+
+    refs = [store.put(f"blob {i} " * 100) for i in range(5)]
+
+    assert store.get_stats()["memory_bytes"] <= 1000
+    assert all(store.get(ref).startswith(f"blob {i}") for i, ref in enumerate(refs))
+    print("✅ Evicted blobs read back from disk")
+
+
+def test_offload_replaces_large_strings():
+    """Test offload only replaces values above threshold."""
+    store = BlobStore(offload_threshold=100)
+
+    result = {
+        "status": "success",
+        "content": "long article text " * 50,
+        "sources": [{"title": "Short", "content": "scraped page " * 50}],
+    }
+
+    offloaded = store.offload(result)
+
+    assert offloaded["status"] == "success"
+    assert is_blob_ref(offloaded["content"])
+    assert offloaded["sources"][0]["title"] == "Short"
+    assert is_blob_ref(offloaded["sources"][0]["content"])
+    assert store.resolve_deep(offloaded) == result
+    print("✅ Large values offloaded and resolved")
+
+
+def test_memory_only_store_is_capped():
+    """Test a memory-only store refuses blobs past capacity and offload keeps them inline."""
+    store = BlobStore(max_memory_bytes=1000, offload_threshold=100)
+
+    kept = store.put("a" * 600)
+    with pytest.raises(BlobStoreFullError):
+        store.put("b" * 600)
+
+    value = {"content": "c" * 600}
+    assert store.offload(value) == value
+    assert store.get(kept) == "a" * 600
+    assert store.get_stats()["memory_bytes"] == 600
+    print("✅ Memory-only store capped")
+
+
+def test_released_runs_free_memory_only_store():
+    """Test a finished run's blobs are released so later runs can still offload."""
+    store = BlobStore(max_memory_bytes=1000, offload_threshold=100)
+
+    for run in range(5):
+        offloaded = store.offload({"content": str(run) * 600}, owner=f"run_{run}")
+        assert is_blob_ref(offloaded["content"])
+        store.release(f"run_{run}")
+
+    stats = store.get_stats()
+    assert stats["memory_bytes"] == 0 and stats["owners"] == 0
+    print("✅ Released runs free the memory tier")
+
+
+def test_release_keeps_blobs_other_runs_hold():
+    """Test shared and unowned blobs survive one owner's release."""
+    store = BlobStore(offload_threshold=100)
+
+    shared = store.offload("s" * 200, owner="run_a")
+    assert store.offload("s" * 200, owner="run_b") == shared
+    pinned = store.put("p" * 200)
+    store.offload("p" * 200, owner="run_a")
+
+    assert store.release("run_a") == 0
+    assert store.get(shared) == "s" * 200
+    assert store.get(pinned) == "p" * 200
+
+    assert store.release("run_b") == 1
+    assert not store.contains(shared)
+    print("✅ Shared blobs released only by their last owner")
+
+
+def test_offload_threshold_counts_bytes():
+    """Test the offload threshold is measured in UTF-8 bytes, not characters."""
+    store = BlobStore(offload_threshold=100)
+
+    offloaded = store.offload({"ascii": "a" * 60, "multibyte": "é" * 60})
+
+    assert offloaded["ascii"] == "a" * 60
+    assert is_blob_ref(offloaded["multibyte"])
+    print("✅ Threshold counts bytes")
+
+
+def test_merger_resolves_article_content():
+    """Test merger resolves blob-backed article content."""
+    merger = MergerAgent()
+
+    brief = Brief(topic="Blob Storage", content_type=ContentType.ARTICLE)
+    state = AgentState(brief=brief)
+
+    content = "Full article body. " * 500
+    ref = merger.blob_store.put(content)
+    state.writing_results = {"content": ref.to_marker(), "word_count": 1500}
+
+    article = merger._create_article(state)
+
+    assert article.content == content
+    print("✅ Merger resolved article content lazily")
+
+
+if __name__ == "__main__":
+    test_put_and_get_text()
+    test_content_addressing_dedupes()
+    test_json_round_trip()
+    test_offload_replaces_large_strings()
+    test_merger_resolves_article_content()
+    print("\n✅ All blob store tests passed!")
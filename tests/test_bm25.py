@@ -0,0 +1,88 @@
+"""Test BM25 evidence index."""
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.search import BM25Index, EvidenceIndex, split_claims
+from src.meta_agent.schemas import Brief, AgentState
+from src.meta_agent.orchestrator import OrchestratorAgent
+from src.meta_agent.planner import PlannerAgent
+
+
+def test_ranks_matching_passage_first():
+    """Test BM25 prefers passages with rarer matching terms."""
+    index = BM25Index()
+    index.add("p1", "Solar panels convert sunlight into electricity.", {"n": 1})
+    index.add("p2", "Wind turbines convert moving air into electricity.", {"n": 2})
+    index.add("p3", "Bread needs flour, water and salt.", {"n": 3})
+
+    results = index.search("how do solar panels produce electricity", k=3)
+
+    assert results[0][0] == "p1"
+    assert results[0][2] == {"n": 1}
+    assert "p3" not in [r[0] for r in results]
+    print("✅ Matching passage ranked first")
+
+
+def test_incremental_add_and_duplicate_keys():
+    """Test passages can be added after searching; keys are unique."""
+    index = BM25Index()
+    index.add("a", "graph databases store relationships")
+    index.search("graph", k=1)
+
+    assert index.add("b", "graph neural networks learn on graphs")
+    assert not index.add("a", "ignored")
+    assert len(index) == 2
+    assert {r[0] for r in index.search("graph", k=5)} == {"a", "b"}
+    print("✅ Incremental adds after search")
+
+
+def test_lookup_is_fast_on_large_corpus():
+    """Test claim lookups over 20k passages stay in milliseconds."""
+    index = BM25Index()
+    for i in range(20000):
+        index.add(str(i), f"passage {i} topic{i % 500} detail{i % 37} shared words here")
+
+    start = time.perf_counter()
+    for i in range(50):
+        index.search(f"topic{i} detail{i % 37}", k=5)
+    per_query_ms = (time.perf_counter() - start) * 1000 / 50
+
+    assert index.get_stats()["postings_bytes"] > 0
+    assert per_query_ms < 50
+    print(f"✅ {per_query_ms:.2f}ms per lookup")
+
+
+def test_evidence_per_claim():
+    """Test each claim gets its own passages."""
+    evidence = EvidenceIndex()
+    evidence.add_sources([
+        {"content": "The Eiffel Tower was completed in 1889 for the World's Fair.", "url": "https://paris"},
+        {"content": "Mount Everest is the highest mountain above sea level.", "url": "https://everest"},
+    ])
+
+    results = evidence.evidence_for(
+        "The Eiffel Tower opened in 1889 in Paris. Everest is the highest mountain on Earth."
+    )
+
+    assert [r["passages"][0]["url"] for r in results] == ["https://paris", "https://everest"]
+    assert len(split_claims("Too short. This sentence is long enough.")) == 1
+    print("✅ Evidence found per claim")
+
+
+def test_fact_checker_receives_claim_evidence():
+    """Test the orchestrator hands the fact checker per-claim passages."""
+    state = AgentState(brief=Brief(topic="Evidence lookup", enable_fact_checking=True))
+    state.plan = PlannerAgent().create_plan(state)
+
+    state = OrchestratorAgent(evidence_per_claim=2).execute_plan(state, state.plan)
+
+    checker = next(
+        r for r in state.quality_results["results"] if r.get("worker_id") == "fact_checker_worker"
+    )
+    assert checker["evidence"]
+    assert all("claim" in e for e in checker["evidence"])
+    print("✅ Fact checker received per-claim evidence")
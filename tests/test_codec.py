@@ -0,0 +1,167 @@
+"""Test schema-versioned codec."""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.utils.codec import SchemaCodec, FORMAT_JSON, FORMAT_MSGPACK, msgpack
+from src.meta_agent.merger import MergerAgent
+from src.meta_agent.schemas import (
+    Brief,
+    ContentType,
+    AgentState,
+    Plan,
+    PlanStep,
+    ExecutionMode,
+    Task,
+    FinalOutput,
+    WorkflowPhase,
+)
+
+
+AVAILABLE_FORMATS = [FORMAT_JSON]
+if msgpack is not None:
+    AVAILABLE_FORMATS.append(FORMAT_MSGPACK)
+
+
+def _make_plan() -> Plan:
+    """Create a small plan."""
+    step = PlanStep(
+        step_id="step_1",
+        phase="research",
+        description="Research",
+        worker_ids=["web_search_worker", "news_search_worker"],
+        execution_mode=ExecutionMode.PARALLEL,
+        estimated_cost=0.03,
+        estimated_time_seconds=15,
+    )
+    return Plan(
+        plan_id="plan_test",
+        brief_id="brief_test",
+        steps=[step],
+        total_steps=1,
+        estimated_total_cost=0.03,
+        estimated_total_time=15,
+    )
+
+
+def _make_state() -> AgentState:
+    """Create a populated state."""
+    brief = Brief(topic="Codec testing", content_type=ContentType.REPORT, keywords=["codec"])
+    state = AgentState(brief=brief, plan=_make_plan())
+    state.current_phase = WorkflowPhase.EXECUTING
+    state.research_results = {"all_sources": ["Source 1", "Source 2"], "total_sources": 2}
+    state.writing_results = {"content": "Body text", "word_count": 1200}
+    state.add_cost("web_search_worker", 0.02)
+    state.add_agent_action("Test", "populate", {"n": 1})
+    state.quality_score = 0.9
+    return state
+
+
+@pytest.mark.parametrize("fmt", AVAILABLE_FORMATS)
+def test_agent_state_round_trip(fmt):
+    """Test AgentState round-trips in every available format."""
+    codec = SchemaCodec(default_format=fmt)
+    state = _make_state()
+
+    decoded = codec.decode(codec.encode(state), expected=AgentState)
+
+    assert decoded.model_dump() == state.model_dump()
+    print(f"✅ AgentState round-trips via {fmt}")
+
+
+@pytest.mark.parametrize("fmt", AVAILABLE_FORMATS)
+def test_plan_task_and_output_round_trip(fmt):
+    """Test Plan, Task and FinalOutput round-trip."""
+    codec = SchemaCodec(default_format=fmt)
+    state = _make_state()
+
+    task = Task(
+        task_id="task_1",
+        worker_id="web_search_worker",
+        step_id="step_1",
+        plan_id="plan_test",
+        input_data={"query": "codec", "max_results": 5},
+    )
+    output = MergerAgent().merge(state)
+
+    for model in (state.plan, task, output):
+        decoded = codec.decode(codec.encode(model))
+        assert type(decoded) is type(model)
+        assert decoded.model_dump() == model.model_dump()
+
+    print(f"✅ Plan, Task and FinalOutput round-trip via {fmt}")
+
+
+def test_decode_autodetects_format():
+    """Test decode works regardless of the codec's default format."""
+    writer = SchemaCodec(default_format=AVAILABLE_FORMATS[-1])
+    reader = SchemaCodec(default_format=FORMAT_JSON)
+
+    plan = _make_plan()
+    decoded = reader.decode(writer.encode(plan))
+
+    assert decoded.plan_id == plan.plan_id
+    print("✅ Format detected from payload tag")
+
+
+def test_expected_type_mismatch():
+    """Test decoding into the wrong type fails."""
+    codec = SchemaCodec(default_format=FORMAT_JSON)
+    payload = codec.encode(_make_plan())
+
+    with pytest.raises(ValueError):
+        codec.decode(payload, expected=FinalOutput)
+    print("✅ Type mismatch rejected")
+
+
+def test_migration_applied():
+    """Test old payloads are migrated to the current version."""
+    old_codec = SchemaCodec(default_format=FORMAT_JSON)
+    payload = old_codec.encode(_make_plan())
+
+    new_codec = SchemaCodec(default_format=FORMAT_JSON)
+    new_codec.register_schema("Plan", Plan, version=2)
+
+    @new_codec.register_migration("Plan", from_version=1)
+    def plan_v1_to_v2(data):
+        data["optimization_notes"] = "migrated"
+        return data
+
+    decoded = new_codec.decode(payload)
+
+    assert decoded.optimization_notes == "migrated"
+    print("✅ Migration applied on decode")
+
+
+def test_json_payload_is_pydantic_json():
+    """Test the JSON envelope embeds model_dump_json() and reads legacy orjson tags."""
+    codec = SchemaCodec(default_format=FORMAT_JSON)
+    plan = _make_plan()
+    payload = codec.encode(plan)
+
+    assert payload.endswith(plan.model_dump_json().encode("utf-8") + b"}")
+    assert codec.decode(b"\x01" + payload[1:]).model_dump() == plan.model_dump()
+    print("✅ JSON envelope wraps model_dump_json()")
+
+
+def test_newer_version_rejected():
+    """Test payloads from a newer schema version are rejected."""
+    new_codec = SchemaCodec(default_format=FORMAT_JSON)
+    new_codec.register_schema("Plan", Plan, version=3)
+    payload = new_codec.encode(_make_plan())
+
+    with pytest.raises(ValueError):
+        SchemaCodec(default_format=FORMAT_JSON).decode(payload)
+    print("✅ Newer schema version rejected")
+
+
+if __name__ == "__main__":
+    for fmt in AVAILABLE_FORMATS:
+        test_agent_state_round_trip(fmt)
+    test_decode_autodetects_format()
+    test_migration_applied()
+    print("\n✅ All codec tests passed!")
@@ -0,0 +1,101 @@
+"""Test token-budgeted context packing."""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.llm import ContextPacker
+from src.storage.vector import SourceRetriever
+from src.meta_agent.schemas import Brief, AgentState
+from src.meta_agent.orchestrator import OrchestratorAgent
+from src.meta_agent.planner import PlannerAgent
+
+
+def filler(i, words=100):
+    """Off-topic source text."""
+    return " ".join(f"filler{i}_{j}" for j in range(words))
+
+
+RELEVANT = (
+    "Heat pumps move heat instead of generating it, which makes them three to four times more "
+    "efficient than resistance heating in moderate climates."
+)
+
+
+def test_budget_is_respected():
+    """Test packed tokens never exceed the budget."""
+    packed = ContextPacker().pack([filler(i) for i in range(50)], ["anything"], budget_tokens=500)
+
+    assert packed.tokens_used <= 500
+    assert packed.candidate_chunks == 50
+    assert 0 < len(packed.chunks) < 50
+    print(f"✅ Packed {packed.tokens_used}/500 tokens")
+
+
+def test_relevant_chunk_selected_first():
+    """Test the chunk matching the outline wins under a tight budget."""
+    sources = [filler(i) for i in range(10)] + [{"content": RELEVANT, "url": "https://heat"}]
+
+    packed = ContextPacker().pack(sources, ["heat pump efficiency", "resistance heating"], budget_tokens=60)
+
+    assert packed.chunks[0]["url"] == "https://heat"
+    print("✅ Relevant chunk packed first")
+
+
+def test_duplicates_dropped():
+    """Test repeated chunks are packed once."""
+    packed = ContextPacker().pack([RELEVANT, RELEVANT + " ", RELEVANT.upper()], ["heat pumps"], 1000)
+
+    assert len(packed.chunks) == 1
+    print("✅ Duplicate chunks dropped")
+
+
+def test_tokens_flat_as_sources_grow():
+    """Test context size stays bounded regardless of research depth."""
+    packer = ContextPacker()
+    small = packer.pack([filler(i) for i in range(5)], ["topic"], budget_tokens=4000)
+    large = packer.pack([filler(i) for i in range(200)], ["topic"], budget_tokens=4000)
+
+    assert small.tokens_used < 4000
+    assert large.tokens_used <= 4000
+    assert large.candidate_chunks == 200
+    print("✅ Context tokens bounded as sources grow")
+
+
+def test_packs_from_retriever_without_reembedding(monkeypatch):
+    """Test packing reuses an indexed retriever's chunks and only embeds the queries."""
+    sources = [filler(i) for i in range(10)] + [{"content": RELEVANT, "url": "https://heat"}]
+    queries = ["heat pump efficiency", "resistance heating"]
+    retriever = SourceRetriever()
+    retriever.index_sources(sources)
+
+    embedded = []
+    embed = retriever.embeddings.embed
+    monkeypatch.setattr(retriever.embeddings, "embed", lambda texts: embedded.append(list(texts)) or embed(texts))
+
+    packer = ContextPacker()
+    packed = packer.pack([], queries, budget_tokens=60, retriever=retriever)
+
+    assert embedded == [queries]
+    assert packed.candidate_chunks == len(retriever.chunks())
+    assert packed.chunks[0]["url"] == "https://heat"
+    assert [c["chunk_id"] for c in packed.chunks] == [
+        c["chunk_id"] for c in packer.pack(sources, queries, budget_tokens=60).chunks
+    ]
+    print("✅ Packed from the retriever's indexes")
+
+
+def test_writer_receives_packed_research():
+    """Test the article writer is given budgeted research data."""
+    state = AgentState(brief=Brief(topic="Heat pumps", key_points=["efficiency"]))
+    state.plan = PlannerAgent().create_plan(state)
+
+    orchestrator = OrchestratorAgent()
+    state = orchestrator.execute_plan(state, state.plan)
+
+    writer = next(r for r in state.writing_results["results"] if r["worker_id"] == "article_writer_worker")
+    budget = orchestrator.registry.get_worker("article_writer_worker").max_input_tokens
+    assert writer["evidence"]
+    assert 0 < writer["context_tokens"] <= budget
+    print("✅ Article writer received packed research")
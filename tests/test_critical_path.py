@@ -0,0 +1,145 @@
+"""Test critical-path and makespan analysis."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.meta_agent.critical_path import critical_path, makespan, topological_order
+from src.meta_agent.planner import PlannerAgent
+from src.meta_agent.strategy import StrategyAgent
+from src.meta_agent.schemas import AgentState, Brief, Plan, PlanStep, ExecutionMode
+from config.worker_registry import get_worker_registry
+
+
+def test_independent_steps_overlap(make_step):
+    """Test only dependent steps add up and the critical path follows the longest chain."""
+    times = {"a": 10.0, "b": 30.0, "c": 5.0, "d": 7.0}
+    steps = [
+        make_step("s1", ["a"]),
+        make_step("s2", ["b"]),
+        make_step("s3", ["c", "d"], ExecutionMode.SEQUENTIAL, depends_on=["s1", "s2"]),
+    ]
+
+    assert makespan(steps, times.get, max_concurrency=5) == 42.0
+    assert critical_path(steps, times.get) == (42.0, ["s2", "s3"])
+    # One slot: everything runs back to back
+    assert makespan(steps, times.get, max_concurrency=1) == 52.0
+    print("✅ Makespan 42s, critical path s2 → s3")
+
+
+def test_concurrency_limit_waves(make_step):
+    """Test a wide parallel step runs in waves under the limit."""
+    steps = [make_step("wide", [f"w{i}" for i in range(6)])]
+    assert makespan(steps, lambda _: 10.0, max_concurrency=5) == 20.0
+    assert makespan(steps, lambda _: 10.0, max_concurrency=6) == 10.0
+    assert critical_path(steps, lambda _: 10.0)[0] == 10.0
+    print("✅ Concurrency limit respected")
+
+
+def test_cycle_rejected(make_step):
+    """Test dependency cycles are reported."""
+    steps = [make_step("s1", ["a"], depends_on=["s2"]), make_step("s2", ["b"], depends_on=["s1"])]
+    with pytest.raises(ValueError):
+        topological_order(steps)
+    print("✅ Cycle rejected")
+
+
+def _chain_plan():
+    registry = get_worker_registry()
+    phases = [
+        ("research", ["web_search_worker"]),
+        ("analysis", ["summarization_worker"]),
+        ("writing", ["article_writer_worker"]),
+        ("quality", ["editor_worker"]),
+    ]
+    steps = []
+    for i, (phase, worker_ids) in enumerate(phases, 1):
+        steps.append(PlanStep(
+            step_id=f"step_{i}", phase=phase, description=phase, worker_ids=worker_ids,
+            execution_mode=ExecutionMode.SEQUENTIAL,
+            depends_on=[f"step_{i - 1}"] if i > 1 else [],
+            estimated_cost=registry.estimate_total_cost(worker_ids),
+            estimated_time_seconds=registry.estimate_total_time(worker_ids),
+        ))
+    return Plan(plan_id="p", brief_id="b", steps=steps, total_steps=len(steps),
+                estimated_total_cost=sum(s.estimated_cost for s in steps),
+                estimated_total_time=sum(s.estimated_time_seconds for s in steps))
+
+
+def test_time_optimizer_splits_writing():
+    """Test the optimizer splits the writer into parallel sections to meet a deadline."""
+    plan = StrategyAgent()._optimize_for_time(_chain_plan(), max_time=130)
+
+    writing = plan.steps[2]
+    assert writing.worker_ids == ["introduction_writer_worker", "section_writer_worker", "conclusion_writer_worker"]
+    assert writing.execution_mode == ExecutionMode.PARALLEL
+    assert plan.estimated_total_time == 125  # 15 + 30 + 40 + 40
+    print(f"✅ Predicted makespan {plan.estimated_total_time}s")
+
+
+def test_time_optimizer_best_effort():
+    """Test an unreachable deadline still gets the fastest plan found."""
+    plan = StrategyAgent()._optimize_for_time(_chain_plan(), max_time=60)
+
+    assert plan.estimated_total_time == 125  # split writing; its parts are never dropped
+    assert plan.steps[2].worker_ids == [
+        "introduction_writer_worker", "section_writer_worker", "conclusion_writer_worker"
+    ]
+    assert all(step.worker_ids for step in plan.steps)
+    print(f"✅ Best effort: {plan.estimated_total_time}s")
+
+
+def test_time_optimizer_keeps_required_workers():
+    """Test deadline moves never drop a worker the brief requires."""
+    state = AgentState(brief=Brief(topic="Required fact checking", enable_fact_checking=True,
+                                   enable_seo_optimization=False, max_time_seconds=60))
+    plan = PlannerAgent().create_plan(state)
+
+    optimized = StrategyAgent().optimize_plan(state, plan)
+
+    worker_ids = [wid for step in optimized.steps for wid in step.worker_ids]
+    assert "fact_checker_worker" in worker_ids
+    assert "section_writer_worker" in worker_ids or "article_writer_worker" in worker_ids
+    # Stored as plain values, like validated steps
+    assert all(type(step.execution_mode) is str for step in optimized.steps)
+    print(f"✅ Kept fact checker: {[s.worker_ids for s in optimized.steps]}")
+
+
+def test_split_keeps_sequential_mode_for_serial_workers():
+    """Test a split only parallelizes the step if every worker in it can run in parallel."""
+    strategy = StrategyAgent()
+    plan = _chain_plan()
+    serial = next(w for w in strategy.registry.list_all_workers() if not w.can_run_parallel)
+    plan.steps[2].worker_ids = ["article_writer_worker", serial.id]
+
+    moves = [m for m in strategy._time_moves(plan) if m[0].startswith("Split")]
+
+    assert moves and all(mode == ExecutionMode.SEQUENTIAL.value for _, _, _, mode in moves)
+    print(f"✅ Split kept sequential mode next to {serial.id}")
+
+
+def test_optimize_plan_uses_makespan_over_concurrency_limit():
+    """Test a parallel step wider than the limit is timed as waves and optimized for time."""
+    research = ["web_search_worker", "academic_search_worker", "news_search_worker",
+                "web_scraping_worker", "social_media_worker"]
+    registry = get_worker_registry()
+    step = PlanStep(step_id="step_1", phase="research", description="Research", worker_ids=research,
+                    execution_mode=ExecutionMode.SEQUENTIAL,
+                    estimated_cost=registry.estimate_total_cost(research),
+                    estimated_time_seconds=registry.estimate_total_time(research))
+    plan = Plan(plan_id="p", brief_id="b", steps=[step], total_steps=1,
+                estimated_total_cost=step.estimated_cost, estimated_total_time=step.estimated_time_seconds)
+    strategy = StrategyAgent()
+    strategy.max_concurrency = 1
+
+    state = AgentState(brief=Brief(topic="Concurrency-limited research", max_time_seconds=60))
+    optimized = strategy.optimize_plan(state, plan)
+
+    span = makespan(optimized.steps, strategy._task_time, 1)
+    assert optimized.estimated_total_time == span
+    assert span <= 60
+    assert len(optimized.steps[0].worker_ids) < len(research)
+    print(f"✅ Makespan {span}s with {optimized.steps[0].worker_ids}")
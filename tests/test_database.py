@@ -0,0 +1,158 @@
+"""Test persistence layer (SQLite backend)."""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.storage.database import (
+    RunRepository,
+    SQLiteBackend,
+    PostgresBackend,
+    WriteBehindBuffer,
+    create_backend,
+)
+from src.meta_agent.merger import MergerAgent
+from src.meta_agent.schemas import Brief, ContentType, AgentState, Task, TaskStatus, WorkflowPhase
+
+
+def _make_state(request_id: str = "req_db_1") -> AgentState:
+    """Create a state with tasks, events and costs."""
+    brief = Brief(topic="Persistence", content_type=ContentType.ARTICLE, request_id=request_id)
+    state = AgentState(brief=brief)
+    for i in range(3):
+        state.all_tasks.append(Task(
+            task_id=f"task_{i}",
+            worker_id="web_search_worker",
+            step_id="step_1",
+            plan_id="plan_1",
+            input_data={"query": "q"},
+            status=TaskStatus.COMPLETED,
+            cost=0.01,
+        ))
+        state.add_agent_action("Orchestrator", f"action_{i}", {"i": i})
+    state.add_cost("web_search_worker", 0.03)
+    return state
+
+
+def test_create_backend_from_url():
+    """Test backend selection from URL."""
+    assert isinstance(create_backend("sqlite:///:memory:"), SQLiteBackend)
+    assert isinstance(
+        create_backend("postgresql+asyncpg://u:p@localhost:5432/db"), PostgresBackend
+    )
+    with pytest.raises(ValueError):
+        create_backend("mysql://localhost/db")
+    print("✅ Backend selected from URL")
+
+
+async def test_write_buffer_batches_rows():
+    """Test rows are written in batches, not one by one."""
+    backend = SQLiteBackend()
+    await backend.connect()
+
+    calls = []
+    original = backend.insert_many
+
+    async def counting_insert(table, rows):
+        calls.append(len(rows))
+        await original(table, rows)
+
+    backend.insert_many = counting_insert
+    buffer = WriteBehindBuffer(backend, max_batch_size=10, flush_interval_seconds=0)
+
+    for _ in range(25):
+        await buffer.add("cost_records", ("run_1", "w", 0.01, None))
+
+    assert calls == [10, 10]
+    assert buffer.pending_count() == 5
+
+    await buffer.close()
+    assert calls == [10, 10, 5]
+    assert len(await backend.fetch_all("cost_records", "run_id", "run_1")) == 25
+
+    await backend.close()
+    print(f"✅ 25 rows written in {len(calls)} batches")
+
+
+async def test_persist_state_is_incremental(tmp_path):
+    """Test repeated persist_state calls don't duplicate rows."""
+    repo = RunRepository(SQLiteBackend(str(tmp_path / "runs.db")), flush_interval_seconds=0)
+    await repo.connect()
+
+    state = _make_state()
+    await repo.persist_state(state)
+    state.add_agent_action("Supervisor", "evaluate", {})
+    await repo.persist_state(state)
+    await repo.flush()
+
+    run = await repo.get_run("req_db_1")
+    events = await repo.get_events("req_db_1")
+    tasks = await repo.get_tasks("req_db_1")
+
+    assert run["topic"] == "Persistence"
+    assert abs(run["total_cost"] - 0.03) < 1e-9
+    assert len(tasks) == 3
+    assert [e["seq"] for e in events] == [0, 1, 2, 3]
+    assert events[-1]["action"] == "evaluate"
+
+    await repo.close()
+    print(f"✅ Persisted run with {len(tasks)} tasks and {len(events)} events")
+
+
+async def test_offsets_dropped_when_run_ends(tmp_path):
+    """Test a finished run's offsets are released after its last persist."""
+    repo = RunRepository(SQLiteBackend(str(tmp_path / "runs.db")), flush_interval_seconds=0)
+    await repo.connect()
+
+    state = _make_state()
+    await repo.persist_state(state)
+    assert "req_db_1" in repo._event_offsets
+
+    state.add_agent_action("Merger", "merge", {})
+    state.current_phase = WorkflowPhase.COMPLETED
+    await repo.persist_state(state)
+    await repo.flush()
+
+    assert repo._event_offsets == {} and repo._task_offsets == {}
+    assert [e["seq"] for e in await repo.get_events("req_db_1")] == [0, 1, 2, 3]
+    await repo.close()
+    print("✅ Offsets released at run end")
+
+
+async def test_final_output_compressed_round_trip():
+    """Test final outputs are stored compressed and decode correctly."""
+    repo = RunRepository(SQLiteBackend(), flush_interval_seconds=0)
+    await repo.connect()
+
+    state = _make_state("req_db_2")
+    state.writing_results = {"content": "Compressible article text. " * 400, "word_count": 1600}
+    output = MergerAgent().merge(state)
+
+    stored_size = await repo.save_final_output("req_db_2", output)
+    loaded = await repo.load_final_output("req_db_2")
+
+    assert loaded.model_dump() == output.model_dump()
+    assert stored_size < len(output.model_dump_json())
+    assert await repo.load_final_output("missing") is None
+
+    await repo.close()
+    print(f"✅ Final output stored in {stored_size} bytes")
+
+
+async def test_record_cost_flushed_on_close():
+    """Test buffered cost records are flushed on close."""
+    backend = SQLiteBackend()
+    repo = RunRepository(backend, flush_interval_seconds=0)
+    await repo.connect()
+
+    await repo.record_cost("run_c", "article_writer_worker", 0.08)
+    assert repo.buffer.pending_count("cost_records") == 1
+
+    await repo.buffer.close()
+    costs = await repo.get_costs("run_c")
+    assert len(costs) == 1
+    await backend.close()
+    print("✅ Cost records flushed on close")
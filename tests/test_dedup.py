@@ -0,0 +1,112 @@
+"""Test source deduplication."""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.search import SourceDeduplicator, MinHasher, LSHIndex, canonicalize_url, shingles
+from src.meta_agent.orchestrator import OrchestratorAgent
+
+
+ARTICLE = (
+    "The central bank raised interest rates by a quarter point on Wednesday, citing persistent "
+    "inflation in services and a tight labour market. Officials signalled that further increases "
+    "remain possible if price pressures do not ease over the coming months, while markets had "
+    "largely priced in the move ahead of the announcement."
+)
+
+
+def test_canonicalize_url_variants():
+    """Test URL variants collapse to one canonical form."""
+    canonical = canonicalize_url("https://example.com/news/rates")
+    variants = [
+        "http://www.example.com/news/rates/",
+        "https://EXAMPLE.com/news/rates?utm_source=x&utm_medium=y#top",
+        "https://amp.example.com/news/rates/amp",
+        "https://example.com:443/news//rates?fbclid=abc",
+    ]
+
+    assert all(canonicalize_url(v) == canonical for v in variants)
+    assert canonicalize_url("https://example.com/news/rates?page=2") != canonical
+    assert canonicalize_url("https://example.com/a?b=2&a=1") == canonicalize_url("https://example.com/a?a=1&b=2")
+    print("✅ URL variants canonicalized")
+
+
+def test_near_duplicate_detected():
+    """Test syndicated copies with small edits are duplicates."""
+    syndicated = ARTICLE.replace("Wednesday", "Wednesday afternoon") + " Reporting by Staff."
+    different = "A new species of frog was discovered in the rainforest canopy by a team of biologists."
+
+    dedup = SourceDeduplicator(threshold=0.7)
+    assert dedup.check("a", ARTICLE) is None
+    assert dedup.check("b", syndicated) == "a"
+    assert dedup.check("c", different) is None
+    assert dedup.stats["near_duplicates"] == 1
+    print("✅ Near-duplicate detected")
+
+
+def test_url_and_exact_duplicates():
+    """Test URL and normalized-content matches."""
+    sources = [
+        {"url": "https://news.com/story?utm_campaign=x", "content": "Story one"},
+        {"url": "https://www.news.com/story", "content": "Story one, slightly reformatted"},
+        "Identical   TEXT!",
+        "identical text",
+    ]
+
+    unique, duplicates = SourceDeduplicator().dedupe(sources)
+
+    assert len(unique) == 2
+    assert duplicates == {1: 0, 3: 2}
+    print("✅ URL and exact duplicates removed")
+
+
+def test_sources_without_text_match_by_url_only():
+    """Test URL-only and empty sources are not exact duplicates of each other."""
+    sources = [
+        {"url": "https://a.com/one"},
+        {"url": "https://b.com/two", "content": ""},
+        {"url": "https://www.a.com/one/"},
+        "",
+        "",
+    ]
+
+    unique, duplicates = SourceDeduplicator().dedupe(sources)
+
+    assert duplicates == {2: 0}
+    assert len(unique) == 4
+    print("✅ Empty sources matched by URL only")
+
+
+def test_lsh_candidates_are_sparse():
+    """Test queries only touch colliding buckets, not every document."""
+    hasher = MinHasher()
+    lsh = LSHIndex()
+    for i in range(500):
+        text = f"document {i} " + " ".join(f"word{(i * 7 + j) % 997}" for j in range(40))
+        lsh.insert(str(i), hasher.signature(shingles(text)))
+
+    candidates = lsh.query(hasher.signature(shingles("a completely unrelated query about gardening tools")))
+
+    assert len(lsh) == 500
+    assert len(candidates) < 5
+    print(f"✅ LSH returned {len(candidates)} candidates out of 500")
+
+
+def test_aggregate_results_dedupes_sources():
+    """Test research aggregation keeps one copy per document."""
+    results = [
+        {"status": "success", "sources": [{"url": "https://a.com/x", "content": ARTICLE}]},
+        {"status": "success", "sources": [
+            {"url": "https://mirror.net/x", "content": ARTICLE + " Copyright 2024."},
+            {"url": "https://a.com/x/?utm_source=feed", "content": "teaser"},
+            {"url": "https://b.com/y", "content": "An unrelated piece about astronomy and telescopes."},
+        ]},
+    ]
+
+    aggregated = OrchestratorAgent()._aggregate_results(results, "research")
+
+    assert aggregated["total_sources"] == 2
+    assert aggregated["duplicates_removed"] == 2
+    print("✅ Aggregation removed duplicate sources")
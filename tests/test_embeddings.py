@@ -0,0 +1,109 @@
+"""Test embedding service and cache."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.llm.embeddings import Embedder, HashingEmbedder, EmbeddingService
+from src.storage.cache import EmbeddingCache
+
+
+class CountingEmbedder(Embedder):
+    """Embedder that records every batch it is asked for."""
+
+    model_name = "counting"
+    dim = 16
+
+    def __init__(self):
+        self.batches = []
+        self.inner = HashingEmbedder(dim=16)
+
+    def embed(self, texts):
+        self.batches.append(list(texts))
+        return self.inner.embed(texts)
+
+
+def test_hashing_embedder_is_deterministic():
+    """Test same text gives same vector and similar text scores higher."""
+    embedder = HashingEmbedder(dim=128)
+    a, b, c = embedder.embed(["solar panel energy", "solar panel energy output", "chocolate cake recipe"])
+
+    assert np.array_equal(a, embedder.embed(["solar panel energy"])[0])
+
+    def cos(x, y):
+        return float(x @ y / (np.linalg.norm(x) * np.linalg.norm(y)))
+
+    assert cos(a, b) > cos(a, c)
+    print("✅ Hashing embedder deterministic")
+
+
+def test_dedup_and_batching():
+    """Test duplicates are embedded once and misses are batched."""
+    embedder = CountingEmbedder()
+    service = EmbeddingService(embedder, batch_size=3)
+
+    texts = ["a", "b", "a", "c", "d", "b", "e"]
+    vectors = service.embed(texts)
+
+    assert vectors.shape == (7, 16)
+    assert np.array_equal(vectors[0], vectors[2])
+    assert [len(b) for b in embedder.batches] == [3, 2]
+    print("✅ Within-request dedup and batching")
+
+
+def test_cross_request_cache():
+    """Test texts from earlier requests are served from cache."""
+    embedder = CountingEmbedder()
+    service = EmbeddingService(embedder)
+
+    service.embed(["alpha", "beta"])
+    service.embed(["beta", "gamma"])
+
+    assert embedder.batches[1] == ["gamma"]
+    assert service.get_stats()["embedded"] == 3
+    print("✅ Cross-request dedup via cache")
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    """Test on-disk tier serves vectors to a fresh process."""
+    first = EmbeddingService(CountingEmbedder(), EmbeddingCache(dim=16, directory=str(tmp_path)))
+    expected = first.embed(["persisted text"])
+
+    embedder = CountingEmbedder()
+    second = EmbeddingService(embedder, EmbeddingCache(dim=16, directory=str(tmp_path)))
+
+    assert np.array_equal(second.embed(["persisted text"]), expected)
+    assert embedder.batches == []
+    assert second.cache.get_stats()["l2_hits"] == 1
+    print("✅ Disk tier reused after restart")
+
+
+def test_lru_eviction_falls_back_to_l2(tmp_path):
+    """Test evicted L1 entries are reloaded from L2."""
+    cache = EmbeddingCache(dim=16, max_memory_items=2, directory=str(tmp_path))
+    cache.put_many({k: np.full(16, i, dtype=np.float32) for i, k in enumerate("xyz")})
+
+    assert cache.get_stats()["memory_items"] == 2
+    assert cache.get_many(["x"])["x"][0] == 0
+    assert cache.stats["l2_hits"] == 1
+    print("✅ LRU eviction backed by L2")
+
+
+def test_redis_tier_uses_embedding_keys():
+    """Test Redis tier stores vectors under embedding:{text_hash}."""
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis()
+    service = EmbeddingService(CountingEmbedder(), EmbeddingCache(dim=16, redis_client=client))
+
+    service.embed(["shared across nodes"])
+    keys = client.keys("embedding:*")
+
+    assert len(keys) == 1
+    other = EmbeddingService(CountingEmbedder(), EmbeddingCache(dim=16, redis_client=client))
+    other.embed(["shared across nodes"])
+    assert other.embedder.batches == []
+    print("✅ Redis tier shared between services")
@@ -0,0 +1,140 @@
+"""Test SQLite-WAL job queue."""
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage.queue import SQLiteJobQueue, JobWorker, JobStatus
+from src.meta_agent.schemas import Brief, ContentType, FinalOutput
+from src.utils.codec import get_codec
+
+
+def test_enqueue_claim_complete(tmp_path):
+    """Test basic job lifecycle."""
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"))
+
+    job_id = queue.enqueue({"n": 1})
+    job = queue.claim("worker_a")
+
+    assert job.job_id == job_id
+    assert job.status == JobStatus.LEASED
+    assert job.attempts == 1
+    assert queue.claim("worker_b") is None
+
+    assert queue.complete(job, b"done")
+    assert queue.get_job(job_id).status == JobStatus.COMPLETED
+    assert queue.get_job(job_id).result == b"done"
+    print("✅ Job enqueued, claimed and completed")
+
+
+def test_priority_order(tmp_path):
+    """Test higher priority jobs are claimed first."""
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"))
+
+    queue.enqueue({"name": "low"}, priority=0)
+    queue.enqueue({"name": "high"}, priority=5)
+
+    assert queue.claim("w").payload["name"] == "high"
+    print("✅ Priority respected")
+
+
+def test_concurrent_claims_are_exclusive(tmp_path):
+    """Test no job is leased to two workers."""
+    path = str(tmp_path / "jobs.db")
+    producer = SQLiteJobQueue(path)
+    for i in range(40):
+        producer.enqueue({"n": i})
+
+    claimed = []
+    lock = threading.Lock()
+
+    def consume(name):
+        queue = SQLiteJobQueue(path)
+        while True:
+            job = queue.claim(name)
+            if job is None:
+                return
+            with lock:
+                claimed.append(job.job_id)
+            queue.complete(job)
+
+    threads = [threading.Thread(target=consume, args=(f"w{i}",)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(claimed) == 40
+    assert len(set(claimed)) == 40
+    assert producer.get_stats()["completed"] == 40
+    print(f"✅ 40 jobs claimed exactly once by 4 workers")
+
+
+def test_lease_expiry_retries_then_dead(tmp_path):
+    """Test expired leases are re-claimed, then dead-lettered."""
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"), visibility_timeout=0.05, max_attempts=2)
+    job_id = queue.enqueue({"n": 1})
+
+    first = queue.claim("crashed_worker")
+    time.sleep(0.1)
+    second = queue.claim("other_worker")
+
+    assert second.job_id == job_id
+    assert second.attempts == 2
+
+    # Stale worker can no longer ack
+    assert not queue.complete(first)
+
+    time.sleep(0.1)
+    assert queue.claim("third_worker") is None
+    assert queue.get_job(job_id).status == JobStatus.DEAD
+    print("✅ Lease expiry retried, then dead-lettered")
+
+
+def test_heartbeat_keeps_lease(tmp_path):
+    """Test heartbeats prevent lease expiry."""
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"), visibility_timeout=0.1)
+    queue.enqueue({"n": 1})
+
+    job = queue.claim("w")
+    for _ in range(3):
+        time.sleep(0.05)
+        assert queue.heartbeat(job)
+
+    assert queue.claim("other") is None
+    print("✅ Heartbeat extended lease")
+
+
+def test_fail_requeues_with_delay(tmp_path):
+    """Test failed jobs are retried after delay."""
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"), max_attempts=3)
+    job_id = queue.enqueue({"n": 1})
+
+    queue.fail(queue.claim("w"), "boom", retry_delay_seconds=0.05)
+
+    assert queue.claim("w") is None
+    time.sleep(0.1)
+    retry = queue.claim("w")
+    assert retry.job_id == job_id
+    assert retry.error == "boom"
+    print("✅ Failed job retried after delay")
+
+
+def test_job_worker_executes_brief(tmp_path):
+    """Test worker runs a brief through the controller."""
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"))
+    brief = Brief(topic="Queued research", content_type=ContentType.ARTICLE)
+    job_id = queue.enqueue_brief(brief)
+
+    worker = JobWorker(queue, worker_id="test_worker")
+    worker.run_forever(poll_interval=0.01, max_jobs=1)
+
+    job = queue.get_job(job_id)
+    output = get_codec().decode(job.result, expected=FinalOutput)
+
+    assert job.status == JobStatus.COMPLETED
+    assert output.brief_topic == "Queued research"
+    print("✅ Worker executed queued brief")
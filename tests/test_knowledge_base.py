@@ -0,0 +1,138 @@
+"""Test cross-run knowledge base."""
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.storage.vector import KnowledgeBase
+from src.meta_agent.schemas import Brief, AgentState
+from src.meta_agent.orchestrator import OrchestratorAgent
+from src.meta_agent.planner import PlannerAgent
+
+
+SOURCES = [
+    {"title": "Battery chemistry", "content": "Lithium iron phosphate battery chemistry", "url": "https://a"},
+    {"title": "Grid storage", "content": "Battery storage for the electricity grid", "url": "https://b"},
+    "Unrelated note about medieval castles",
+]
+
+
+def test_query_returns_relevant_sources():
+    """Test relevant sources are served, unrelated ones are not."""
+    kb = KnowledgeBase(min_score=0.3)
+    assert kb.add_sources(SOURCES, source_type="web", topic="batteries") == 3
+
+    results = kb.query("battery chemistry and grid storage", k=5, source_type="web")
+
+    assert {r["url"] for r in results} == {"https://a", "https://b"}
+    assert kb.query("battery storage", source_type="news") == []
+    print("✅ Relevant sources served by type")
+
+
+def test_served_content_is_the_source_body():
+    """Test stored content is the body alone, not title + body."""
+    kb = KnowledgeBase(min_score=0.3)
+    kb.add_sources(SOURCES[:1], source_type="web")
+
+    served = kb.query("battery chemistry", source_type="web")
+
+    assert served[0]["title"] == "Battery chemistry"
+    assert served[0]["content"] == "Lithium iron phosphate battery chemistry"
+    print("✅ Body served without its title")
+
+
+def test_global_knowledge_base_is_lazy(monkeypatch):
+    """Test the global knowledge base is only built on first use."""
+    import src.storage.vector.knowledge_base as kb_module
+
+    monkeypatch.setattr(kb_module, "knowledge_base", None)
+    assert OrchestratorAgent().knowledge_base is None  # disabled by default
+    assert kb_module.knowledge_base is None
+
+    first = kb_module.get_knowledge_base()
+    assert isinstance(first, KnowledgeBase) and kb_module.get_knowledge_base() is first
+    print("✅ Global knowledge base created on demand")
+
+
+def test_reingest_refreshes_instead_of_duplicating():
+    """Test sources are keyed by URL."""
+    kb = KnowledgeBase()
+    kb.add_sources(SOURCES[:1])
+    kb.add_sources([{**SOURCES[0], "content": "Updated battery chemistry text"}])
+
+    assert len(kb) == 1
+    print("✅ Re-ingest refreshed source")
+
+
+def test_stale_sources_not_served():
+    """Test freshness policy hides old sources until re-fetched."""
+    kb = KnowledgeBase(freshness_seconds={"news": 0.05}, min_score=0.3)
+    kb.add_sources(SOURCES[:2], source_type="news")
+    time.sleep(0.1)
+
+    assert kb.query("battery chemistry and grid storage", source_type="news") == []
+    assert kb.stats["stale_skipped"] == 2
+    assert kb.purge_stale(grace_factor=1.0) == 2
+    print("✅ Stale sources skipped and purged")
+
+
+def test_persists_across_instances(tmp_path):
+    """Test a new instance sees sources from a previous one."""
+    kb = KnowledgeBase(directory=str(tmp_path), min_score=0.3)
+    kb.add_sources(SOURCES, source_type="academic")
+    kb.close()
+
+    reopened = KnowledgeBase(directory=str(tmp_path), min_score=0.3)
+
+    assert len(reopened) == 3
+    assert reopened.query("lithium battery chemistry", k=1)[0]["url"] == "https://a"
+    print("✅ Knowledge base persisted")
+
+
+def test_second_run_served_from_knowledge_base():
+    """Test repeat topics skip research providers."""
+    kb = KnowledgeBase()
+    orchestrator = OrchestratorAgent(knowledge_base=kb)
+
+    def run():
+        state = AgentState(brief=Brief(topic="Knowledge base reuse"))
+        state.plan = PlannerAgent().create_plan(state)
+        return orchestrator.execute_plan(state, state.plan)
+
+    first = run()
+    second = run()
+
+    research = first.plan.steps[0].worker_ids
+    assert all(first.cost_by_worker.get(w, 0) > 0 for w in research)
+    assert all(second.cost_by_worker.get(w, 0) == 0 for w in research)
+    assert all(r.get("from_knowledge_base") for r in second.research_results["results"])
+    assert second.research_results["total_sources"] == first.research_results["total_sources"]
+    print("✅ Second run answered from knowledge base")
+
+
+def test_partial_coverage_fetches_only_the_gap():
+    """Test a partly covered worker asks its provider only for the missing sources."""
+    kb = KnowledgeBase(min_score=0.0)
+    kb.add_sources(["Source 1 about Partial coverage"], source_type="news", topic="Partial coverage")
+    orchestrator = OrchestratorAgent(knowledge_base=kb)
+    worker = orchestrator.registry.get_worker("news_search_worker")
+
+    state = AgentState(brief=Brief(topic="Partial coverage"))
+    result = orchestrator._execute_worker(state, "news_search_worker", "research", "step_1", "plan_partial")
+
+    gap = orchestrator.kb_min_sources - 1
+    multiplier = orchestrator.model_router.cost_multiplier(result["model"], worker) if "model" in result else 1.0
+    assert state.cost_by_worker["news_search_worker"] == pytest.approx(
+        orchestrator.executor.call_cost(worker, gap) * multiplier
+    )
+    assert orchestrator.executor.call_cost(worker, gap) < worker.estimated_cost
+    # Known source first, then the fetched one it didn't already have
+    assert [s["content"] if isinstance(s, dict) else s for s in result["sources"]] == [
+        "Source 1 about Partial coverage",
+        "Source 2 about Partial coverage",
+    ]
+    print(f"✅ Partial coverage fetched {gap} sources")
@@ -0,0 +1,99 @@
+"""Test learned worker metrics."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.meta_agent.metrics_store import Histogram, MetricsStore, LATENCY_BUCKETS
+from src.meta_agent.strategy import StrategyAgent
+from src.meta_agent.orchestrator import OrchestratorAgent
+from src.meta_agent.planner import PlannerAgent
+from src.meta_agent.schemas import AgentState, Brief, Plan, PlanStep, ExecutionMode
+from config.worker_registry import WorkerRegistry, get_worker_registry
+
+
+def test_histogram_percentiles():
+    """Test histogram percentiles track the distribution."""
+    histogram = Histogram(LATENCY_BUCKETS)
+    for i in range(1, 101):
+        histogram.observe(float(i))
+
+    assert histogram.percentile(50) == pytest.approx(50, abs=8)
+    assert histogram.percentile(95) == pytest.approx(95, abs=8)
+    assert histogram.percentile(100) == 100.0
+    assert histogram.mean == 50.5
+    assert Histogram(LATENCY_BUCKETS).percentile(95) is None
+    print(f"✅ p50={histogram.percentile(50):.1f}, p95={histogram.percentile(95):.1f}")
+
+
+def test_record_wires_worker_metrics():
+    """Test recording updates WorkerMetrics, EWMA and the version."""
+    store = MetricsStore(alpha=0.5, min_samples=3)
+    store.record("editor_worker", 10.0, 0.02, confidence=0.9)
+    store.record("editor_worker", 20.0, 0.04, success=False)
+
+    metrics = store.get_metrics("editor_worker")
+    assert metrics.total_executions == 2 and metrics.failed_executions == 1
+    assert metrics.average_duration_seconds == 15.0
+    assert store.latency("editor_worker") is None  # below min_samples
+
+    store.record("editor_worker", 20.0, 0.04)
+    assert store.latency("editor_worker") == 17.5
+    assert store.cost("editor_worker") == pytest.approx(0.035)
+    assert store.version == 3
+    assert store.summary("editor_worker")["samples"] == 3
+    print(f"✅ Summary: {store.summary('editor_worker')}")
+
+
+def test_registry_estimates_learn_from_executions():
+    """Test registry estimates switch from static to learned values."""
+    store = MetricsStore(min_samples=5)
+    registry = WorkerRegistry(metrics_store=store)
+    static_time = registry.get_worker("web_search_worker").estimated_time_seconds
+
+    assert registry.estimate_total_time(["web_search_worker"]) == static_time
+
+    for seconds in [40.0] * 18 + [90.0, 95.0]:
+        store.record("web_search_worker", seconds, 0.01)
+
+    assert registry.estimate_worker_time("web_search_worker") > static_time
+    assert registry.estimate_total_time(["web_search_worker"], percentile=95) > 60
+    assert registry.estimate_total_time(["web_search_worker"], percentile=50) <= 45
+    assert registry.estimate_total_cost(["web_search_worker"], percentile=95) == pytest.approx(0.01)
+    print("✅ Registry estimates learned")
+
+
+def test_strategy_plans_against_p95(monkeypatch):
+    """Test the strategy re-estimates steps with observed p95 latency."""
+    store = MetricsStore(min_samples=5)
+    monkeypatch.setattr(get_worker_registry(), "_metrics_store", store)
+    for _ in range(20):
+        store.record("article_writer_worker", 200.0, 0.3)
+
+    step = PlanStep(step_id="step_1", phase="writing", description="Write",
+                    worker_ids=["article_writer_worker"], execution_mode=ExecutionMode.SEQUENTIAL,
+                    estimated_cost=0.08, estimated_time_seconds=60)
+    plan = Plan(plan_id="p", brief_id="b", steps=[step], total_steps=1,
+                estimated_total_cost=0.08, estimated_total_time=60)
+
+    optimized = StrategyAgent().optimize_plan(AgentState(brief=Brief(topic="Tidal energy")), plan)
+    assert optimized.estimated_total_time == 200
+    assert optimized.estimated_total_cost == pytest.approx(0.3)
+    print("✅ Strategy uses p95")
+
+
+def test_orchestrator_records_executions():
+    """Test executed workers are recorded in the store."""
+    store = MetricsStore()
+    state = AgentState(brief=Brief(topic="Geothermal"))
+    state.plan = PlannerAgent().create_plan(state)
+
+    OrchestratorAgent(metrics_store=store).execute_plan(state, state.plan)
+
+    writer = store.get_metrics("article_writer_worker")
+    assert writer.total_executions == 1 and writer.successful_executions == 1
+    assert store.get_stats()["executions"] >= len(state.plan.steps)
+    print(f"✅ Recorded: {store.get_stats()}")
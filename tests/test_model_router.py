@@ -0,0 +1,144 @@
+"""Test per-worker model routing."""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.llm_config import LLMConfig
+from config.worker_registry import get_worker
+from src.tools.llm import token_counter
+from src.tools.llm.model_router import ModelRouter
+from src.meta_agent.schemas import Brief, AgentState
+from src.meta_agent.orchestrator import OrchestratorAgent
+from src.meta_agent.planner import PlannerAgent
+
+
+MODELS = {"fast": "claude-3-5-haiku-20241022", "balanced": "claude-sonnet-4-20250514", "strong": "claude-opus-4-20250514"}
+
+
+def make_router(**kwargs):
+    return ModelRouter(models=MODELS, fallback_model=MODELS["fast"], **kwargs)
+
+
+def test_worker_hints_pick_models():
+    """Test light workers get the fast model and heavy ones the strong model."""
+    router = make_router()
+
+    assert router.route(get_worker("summarization_worker")).model == MODELS["fast"]
+    assert router.route(get_worker("web_search_worker")).model == MODELS["fast"]
+    assert router.route(get_worker("fact_checker_worker")).model == MODELS["balanced"]
+    assert router.route(get_worker("article_writer_worker")).model == MODELS["strong"]
+    print("✅ Worker hints respected")
+
+
+def test_tight_budget_and_deadline_downgrade():
+    """Test the brief's remaining budget and deadline push calls down a tier."""
+    router = make_router()
+    writer = get_worker("article_writer_worker")
+
+    cheap = router.route(writer, Brief(topic="Solar", max_budget=0.5), spent_cost=0.45, remaining_workers=2)
+    assert cheap.model != MODELS["strong"]
+    assert cheap.reason.startswith("downgraded: budget")
+
+    rushed = router.route(writer, Brief(topic="Solar", max_time_seconds=60), elapsed_seconds=50)
+    assert rushed.model == MODELS["fast"]
+    assert "deadline" in rushed.reason
+    print(f"✅ Downgraded to {cheap.model} (budget) and {rushed.model} (deadline)")
+
+
+def test_low_observed_quality_upgrades():
+    """Test a model underperforming for a worker gets upgraded."""
+    router = make_router(min_quality=0.8)
+    summarizer = get_worker("summarization_worker")
+
+    for _ in range(3):
+        router.record_outcome(MODELS["fast"], summarizer.id, latency_seconds=2.0, quality=0.6)
+
+    choice = router.route(summarizer)
+    assert choice.model == MODELS["balanced"]
+    assert choice.reason.startswith("upgraded")
+    print("✅ Upgraded after low observed quality")
+
+
+def test_overload_falls_back():
+    """Test overloaded models are retried on, then routed to, the fallback."""
+    router = make_router()
+    choice = router.route(get_worker("fact_checker_worker"))
+    calls = []
+
+    class Overloaded(Exception):
+        status_code = 529
+
+    def create(model, **request):
+        calls.append(model)
+        if model == MODELS["balanced"]:
+            raise Overloaded("overloaded_error")
+        return {"model": model, **request}
+
+    response = router.call(create, choice, messages=[])
+    assert response["model"] == MODELS["fast"]
+    assert calls == [MODELS["balanced"], MODELS["fast"]]
+    assert router.route(get_worker("fact_checker_worker")).reason.startswith("fallback")
+
+    with pytest.raises(ValueError):
+        router.call(lambda model, **r: (_ for _ in ()).throw(ValueError("bad request")), choice)
+    print("✅ Overload falls back")
+
+
+def test_cost_multiplier_weights_expected_tokens(monkeypatch):
+    """Test input and output prices are weighted by the worker's expected tokens."""
+    monkeypatch.setitem(token_counter.MODEL_PRICING, "claude-test-reader", (1.0, 30.0))
+    router = make_router()
+    reader = SimpleNamespace(max_input_tokens=9000, default_max_tokens=100)
+    writer = SimpleNamespace(max_input_tokens=1000, default_max_tokens=3000)
+
+    # Sonnet baseline: $3/M input, $15/M output
+    assert router.cost_multiplier("claude-test-reader", reader) == pytest.approx(12000 / 28500)
+    assert router.cost_multiplier("claude-test-reader", writer) == pytest.approx(91000 / 48000)
+    assert router.cost_multiplier(MODELS["balanced"], writer) == 1.0
+    print("✅ Cost multiplier weighted by expected tokens")
+
+
+def test_llm_config_retries_routed_call_on_fallback():
+    """Test LLMConfig.create_message sends routed calls through ModelRouter.call."""
+    router = make_router()
+    choice = router.route(get_worker("fact_checker_worker"))
+    calls = []
+
+    class Overloaded(Exception):
+        status_code = 529
+
+    def create(model, messages, **params):
+        calls.append(model)
+        if model == MODELS["balanced"]:
+            raise Overloaded("overloaded_error")
+        return SimpleNamespace(model=model, content=[])
+
+    config = LLMConfig()
+    config.is_mock = False
+    config._model_router = router
+    config._client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    response = config.create_message([{"role": "user", "content": "Check this"}], choice=choice)
+
+    assert response.model == MODELS["fast"]
+    assert calls == [MODELS["balanced"], MODELS["fast"]]
+    assert router.is_overloaded(MODELS["balanced"])
+    print("✅ LLMConfig routed call fell back")
+
+
+def test_orchestrator_records_routed_models():
+    """Test worker results carry their model and cheaper models cost less."""
+    state = AgentState(brief=Brief(topic="Heat pumps", key_points=["efficiency"]))
+    state.plan = PlannerAgent().create_plan(state)
+
+    state = OrchestratorAgent(model_router=make_router()).execute_plan(state, state.plan)
+
+    models = {r.worker_id: r.output.get("model") for r in state.completed_tasks}
+    assert models["web_search_worker"] == MODELS["fast"]
+    assert state.cost_by_worker["web_search_worker"] < get_worker("web_search_worker").estimated_cost
+    print(f"✅ Routed models: {models}")
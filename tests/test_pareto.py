@@ -0,0 +1,101 @@
+"""Test Pareto-front plan tiers."""
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.meta_agent.pareto import PlanCandidate, pareto_front, pick_tier, FASTEST, CHEAPEST, BEST
+from src.meta_agent.strategy import StrategyAgent
+from src.meta_agent.planner import PlannerAgent
+from src.meta_agent.schemas import AgentState, Brief
+
+
+def _state(**fields):
+    state = AgentState(brief=Brief(topic="Tidal energy and grid integration", **fields))
+    state.plan = PlannerAgent(plan_cache=None).create_plan(state)
+    return state
+
+
+def test_pareto_front_drops_dominated():
+    """Test dominated items are dropped and trade-offs kept."""
+    items = [
+        (1.0, 10.0, 1.0, "cheap"),
+        (2.0, 5.0, 1.0, "fast"),
+        (3.0, 20.0, 3.0, "good"),
+        (3.0, 20.0, 2.0, "worse than good"),
+        (2.5, 12.0, 0.5, "dominated by fast"),
+    ]
+    assert [item for *_, item in pareto_front(items)] == ["cheap", "fast", "good"]
+    print("✅ Pareto front")
+
+
+def test_pick_tier_prefers_fitting_candidates():
+    """Test tiers pick within limits when possible and reject unknown tiers."""
+    candidates = [
+        PlanCandidate("cheap", 0.1, 200, 2.0),
+        PlanCandidate("fast", 0.3, 60, 3.0),
+        PlanCandidate("best", 0.8, 300, 9.0),
+    ]
+    assert pick_tier(candidates, FASTEST).plan == "fast"
+    assert pick_tier(candidates, CHEAPEST).plan == "cheap"
+    assert pick_tier(candidates, BEST).plan == "best"
+    assert pick_tier(candidates, BEST, max_cost=0.5).plan == "fast"
+    assert pick_tier(candidates, BEST, max_cost=0.01).plan == "best"
+    with pytest.raises(ValueError):
+        pick_tier(candidates, "premium")
+    print("✅ Tier picking")
+
+
+def test_plan_tiers_span_the_front():
+    """Test tiers are the extremes of a non-dominated frontier, fast on the full registry."""
+    state = _state(target_length=4000, enable_seo_optimization=True)
+    strategy = StrategyAgent()
+
+    start = time.perf_counter()
+    frontier = strategy.plan_frontier(state, state.plan)
+    elapsed = time.perf_counter() - start
+    tiers = strategy.plan_tiers(state, state.plan)
+
+    points = [(c.cost, c.makespan, c.quality) for c in frontier]
+    for cost, span, quality in points:
+        assert not any(
+            (o_cost, o_span, o_quality) != (cost, span, quality)
+            and o_cost <= cost and o_span <= span and o_quality >= quality
+            for o_cost, o_span, o_quality in points
+        )
+    assert tiers[CHEAPEST].estimated_total_cost == pytest.approx(min(c.cost for c in frontier))
+    assert tiers[FASTEST].estimated_total_time == min(c.plan.estimated_total_time for c in frontier)
+    assert "Best tier" in tiers[BEST].optimization_notes
+    assert elapsed < 1.0
+
+    # Writing always keeps a full writer, its alternative or all its sections
+    for plan in tiers.values():
+        writers = set(next(s for s in plan.steps if s.phase == "writing").worker_ids)
+        assert writers & {"article_writer_worker", "section_writer_worker"}
+    print(f"✅ {len(frontier)} plans in {elapsed * 1000:.0f}ms")
+
+
+def test_plan_tiers_respect_budget():
+    """Test every tier stays within the brief's budget when possible."""
+    state = _state(max_budget=0.2)
+    tiers = StrategyAgent().plan_tiers(state, state.plan)
+
+    assert all(plan.estimated_total_cost <= 0.2 for plan in tiers.values())
+    assert tiers[BEST].estimated_total_cost >= tiers[CHEAPEST].estimated_total_cost
+    print(f"✅ Tiers: {[(t, round(p.estimated_total_cost, 2)) for t, p in tiers.items()]}")
+
+
+def test_plan_tiers_keep_required_workers():
+    """Test every tier keeps the quality workers the brief asks for."""
+    state = _state(enable_fact_checking=True, enable_seo_optimization=True,
+                   max_budget=0.3, max_time_seconds=150)
+    tiers = StrategyAgent().plan_tiers(state, state.plan)
+
+    for tier, plan in tiers.items():
+        quality = set(next(s for s in plan.steps if s.phase == "quality").worker_ids)
+        assert {"fact_checker_worker", "seo_optimizer_worker"} <= quality, tier
+    print(f"✅ Required workers kept: {[s.worker_ids for s in tiers[CHEAPEST].steps]}")
@@ -0,0 +1,102 @@
+"""Test the plan template cache."""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.meta_agent.plan_cache import PlanCache, brief_shape, clone_plan
+from src.meta_agent.planner import PlannerAgent
+from src.meta_agent.metrics_store import MetricsStore
+from src.meta_agent.schemas import Brief, ContentType, AgentState
+from config.worker_registry import WorkerRegistry
+
+
+def test_brief_shape():
+    """Test shape ignores topic text but tracks what planning reads."""
+    base = brief_shape(Brief(topic="Solar power", key_points=["cost"]))
+
+    assert brief_shape(Brief(topic="Wind farms", key_points=["output"])) == base
+    assert brief_shape(Brief(topic="Wind farms", target_length=1500, key_points=["a"])) == base
+    assert brief_shape(Brief(topic="Solar power", target_length=3001, key_points=["cost"])) != base
+    assert brief_shape(Brief(topic="Solar power", content_type=ContentType.REPORT, key_points=["cost"])) != base
+    assert brief_shape(Brief(topic="Solar power", enable_seo_optimization=False, key_points=["cost"])) != base
+    assert brief_shape(Brief(topic="Solar power", max_budget=0.2, key_points=["cost"])) != base
+    print("✅ Brief shapes")
+
+
+def test_same_shape_reuses_optimized_plan():
+    """Test a second brief of the same shape gets a clone of the first plan."""
+    planner = PlannerAgent(plan_cache=PlanCache())
+
+    first_state = AgentState(brief=Brief(topic="Solar power", key_points=["cost"], request_id="r1"))
+    first = planner.create_optimized_plan(first_state)
+    second_state = AgentState(brief=Brief(topic="Wind farms", key_points=["output"], request_id="r2"))
+    second = planner.create_optimized_plan(second_state)
+
+    assert [s.worker_ids for s in second.steps] == [s.worker_ids for s in first.steps]
+    assert second.plan_id != first.plan_id
+    assert second.brief_id == "r2"
+    assert second.optimization_notes == first.optimization_notes
+    assert second_state.brief_analysis.sub_topics == ["output"]
+    assert second_state.brief_analysis.brief_id == "r2"
+
+    stats = planner.plan_cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["hit_rate_by_content_type"] == {"article": 0.5}
+    print(f"✅ Plan cache stats: {stats}")
+
+
+def test_clones_are_independent():
+    """Test executing a served plan cannot change the cached template."""
+    planner = PlannerAgent(plan_cache=PlanCache())
+    brief = Brief(topic="Heat pumps")
+
+    plan = planner.create_optimized_plan(AgentState(brief=brief))
+    plan.steps[0].worker_ids.append("extra_worker")
+    plan.steps[0].status = "completed"
+
+    again = planner.create_optimized_plan(AgentState(brief=brief))
+    assert "extra_worker" not in again.steps[0].worker_ids
+    assert again.steps[0].status == "pending"
+
+    copy = clone_plan(again, plan_id="p2")
+    copy.steps.pop()
+    assert copy.plan_id == "p2" and len(again.steps) == again.total_steps
+    print("✅ Clones independent")
+
+
+def test_plan_over_limit_not_served():
+    """Test a cached plan that exceeds the brief's own budget is not served."""
+    cache = PlanCache()
+    state = AgentState(brief=Brief(topic="Heat pumps", max_budget=0.9))
+    plan = PlannerAgent(plan_cache=None).create_plan(state)
+    cache.put(state.brief, plan.model_copy(update={"estimated_total_cost": 0.8}), state.brief_analysis)
+
+    tight = Brief(topic="Heat pumps", max_budget=0.6)
+    assert brief_shape(tight) == brief_shape(state.brief)
+    assert cache.get(tight, "p1") is None
+    assert cache.get(state.brief, "p2") is not None
+    assert cache.get_stats()["rejected"] == 1
+    print("✅ Over-limit plans not served")
+
+
+def test_estimate_changes_invalidate_plans():
+    """Test unregistering a worker or learning from an execution turns cached plans into misses."""
+    store = MetricsStore()
+    registry = WorkerRegistry(metrics_store=store)
+    cache = PlanCache(registry=registry)
+    state = AgentState(brief=Brief(topic="Heat pumps"))
+    plan = PlannerAgent(plan_cache=None).create_plan(state)
+
+    cache.put(state.brief, plan, state.brief_analysis)
+    assert cache.get(state.brief, "p1") is not None
+    registry.unregister("seo_optimizer_worker")
+    assert cache.get(state.brief, "p2") is None
+
+    cache.put(state.brief, plan, state.brief_analysis)
+    store.record("web_search_worker", 30.0, 0.02)
+    assert cache.get(state.brief, "p3") is None
+    assert cache.get_stats()["stale"] == 2 and len(cache) == 0
+    print("✅ Stale plans dropped")
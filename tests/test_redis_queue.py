@@ -0,0 +1,169 @@
+"""Test Redis Streams task queue."""
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from src.storage.queue import RedisTaskQueue, StreamWorker
+from src.meta_agent.schemas import Brief, Task, TaskResult, TaskStatus, AgentState
+from src.storage.blob import BlobStore, is_blob_ref
+from src.meta_agent.orchestrator import OrchestratorAgent
+from src.meta_agent.planner import PlannerAgent
+from src.workers.executor import WorkerExecutor
+
+
+def make_task(worker_id="web_search_worker", task_id="task_1"):
+    """Build a research task."""
+    return Task(
+        task_id=task_id,
+        step_id="step_1",
+        plan_id="plan_test",
+        worker_id=worker_id,
+        input_data={"phase": "research", "brief": {"topic": "Streams"}},
+        status=TaskStatus.PENDING,
+    )
+
+
+@pytest.fixture
+def queue():
+    """Queue on an in-memory fake Redis."""
+    return RedisTaskQueue(fakeredis.FakeRedis(), namespace="test", claim_idle_ms=50)
+
+
+def test_enqueue_consume_reply(queue):
+    """Test a task round-trips through a worker to the reply stream."""
+    reply_to = queue.reply_stream("plan_test")
+    queue.enqueue(make_task(), reply_to)
+
+    worker = StreamWorker(queue, consumer_name="w1", executor=WorkerExecutor(0.0))
+    assert worker.run_once(block_ms=10) == 1
+
+    results = queue.wait_for_results(reply_to, ["task_1"], timeout_seconds=1.0)
+    assert results["task_1"].success
+    assert "Streams" in results["task_1"].output["summary"]
+
+    # Acked: nothing pending, nothing to redeliver
+    assert queue.client.xpending(queue.task_stream("research"), "workers")["pending"] == 0
+    print("✅ Task consumed and result replied")
+
+
+def test_routes_by_category(queue):
+    """Test tasks land on their worker category stream."""
+    queue.enqueue(make_task("fact_checker_worker"), queue.reply_stream("p"))
+
+    assert queue.client.xlen(queue.task_stream("quality")) == 1
+    assert queue.consume("w", ["research"], block_ms=10) == []
+    print("✅ Tasks routed by category")
+
+
+def test_crashed_consumer_is_reclaimed(queue):
+    """Test a message left unacked is redelivered to another consumer."""
+    queue.enqueue(make_task(), queue.reply_stream("p"))
+
+    assert len(queue.consume("crashed", ["research"], block_ms=10)) == 1
+    time.sleep(0.1)
+
+    deliveries = queue.consume("healthy", ["research"], block_ms=10)
+    assert len(deliveries) == 1
+    assert deliveries[0][2].task_id == "task_1"
+    print("✅ Idle message reclaimed")
+
+
+def test_poison_message_dead_lettered(queue):
+    """Test a message exceeding max deliveries is dead-lettered and failed."""
+    queue.max_deliveries = 2
+    reply_to = queue.reply_stream("p")
+    queue.enqueue(make_task(), reply_to)
+
+    queue.consume("c1", ["research"], block_ms=10)
+    for _ in range(2):
+        time.sleep(0.1)
+        queue.consume("c2", ["research"], block_ms=10)
+
+    dead = queue.get_dead_letters()
+    assert len(dead) == 1
+    assert dead[0]["task"].task_id == "task_1"
+
+    result = queue.wait_for_results(reply_to, ["task_1"], timeout_seconds=1.0)["task_1"]
+    assert not result.success
+    assert "Dead-lettered" in result.error
+    print("✅ Poison message dead-lettered")
+
+
+def test_orchestrator_distributed_execution():
+    """Test orchestrator runs a plan through remote stream workers."""
+    server = fakeredis.FakeServer()
+    producer = RedisTaskQueue(fakeredis.FakeRedis(server=server), namespace="dist")
+    consumer = RedisTaskQueue(fakeredis.FakeRedis(server=server), namespace="dist")
+
+    stop = threading.Event()
+    worker = StreamWorker(consumer, consumer_name="node_a", executor=WorkerExecutor(0.0))
+
+    def serve():
+        while not stop.is_set():
+            worker.run_once(block_ms=20)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        state = AgentState(brief=Brief(topic="Distributed AI"))
+        state.plan = PlannerAgent().create_plan(state)
+
+        orchestrator = OrchestratorAgent(task_queue=producer, remote_timeout_seconds=5.0)
+        state = orchestrator.execute_plan(state, state.plan)
+    finally:
+        stop.set()
+        thread.join(timeout=2)
+
+    expected = sum(len(step.worker_ids) for step in state.plan.steps)
+    assert worker.tasks_processed == expected
+    assert len(state.completed_tasks) == expected
+    assert state.research_results
+    assert state.total_cost > 0
+    print(f"✅ {expected} tasks executed remotely")
+
+
+def test_reply_stream_expires(queue):
+    """Test reply streams get an expiry so abandoned ones cannot leak."""
+    reply_to = queue.reply_stream("abandoned")
+    queue.reply(reply_to, TaskResult(task_id="t", worker_id="web_search_worker", success=True,
+                                      duration_seconds=0.0))
+
+    assert 0 < queue.client.ttl(reply_to) <= queue.reply_ttl_seconds
+    print("✅ Reply stream expires")
+
+
+def test_remote_results_are_offloaded_and_routed():
+    """Test remote outputs are stored offloaded in state, with routed models and costs."""
+    server = fakeredis.FakeServer()
+    producer = RedisTaskQueue(fakeredis.FakeRedis(server=server), namespace="off")
+    consumer = RedisTaskQueue(fakeredis.FakeRedis(server=server), namespace="off")
+    worker = StreamWorker(consumer, consumer_name="node_b", executor=WorkerExecutor(0.0))
+
+    stop = threading.Event()
+    thread = threading.Thread(target=lambda: [worker.run_once(block_ms=20) for _ in iter(stop.is_set, True)],
+                              daemon=True)
+    thread.start()
+    try:
+        state = AgentState(brief=Brief(topic="Offloaded remote output"))
+        state.plan = PlannerAgent().create_plan(state)
+        orchestrator = OrchestratorAgent(task_queue=producer, remote_timeout_seconds=5.0)
+        orchestrator.blob_store = BlobStore(offload_threshold=20)
+        state = orchestrator.execute_plan(state, state.plan)
+    finally:
+        stop.set()
+        thread.join(timeout=2)
+
+    writer = next(r for r in state.completed_tasks if r.worker_id == "article_writer_worker")
+    assert is_blob_ref(writer.output["content"])
+    assert writer.output["model"]
+    assert sum(r.cost for r in state.completed_tasks) == pytest.approx(state.total_cost)
+    assert not producer.client.exists(producer.reply_stream(state.plan.plan_id))
+    print("✅ Remote outputs offloaded")
@@ -0,0 +1,100 @@
+"""Test the final-output result cache."""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage.cache.result_cache import ResultCache, HIT, STALE, MISS, SHARED
+from src.meta_agent.schemas import Brief, ContentType
+from src.meta_agent.controller import ControllerAgent
+
+
+@pytest.fixture(scope="module")
+def output():
+    """A real final output to cache."""
+    return ControllerAgent(result_cache=ResultCache())._run(Brief(topic="Grid batteries"), "req_seed")
+
+
+def test_hits_misses_and_ttl_per_content_type(output):
+    """Test fresh entries hit, near-identical briefs share keys, and TTLs differ by type."""
+    cache = ResultCache(ttl_by_content_type={"summary": 60, "report": 3600}, stale_seconds=0, length_bucket=500)
+    summary = Brief(topic="Grid batteries", content_type=ContentType.SUMMARY, target_length=1200)
+
+    assert cache.get_or_compute(summary, lambda: output)[1] == MISS
+    near = Brief(topic="grid  BATTERIES", content_type=ContentType.SUMMARY, target_length=1400, user_id="u2")
+    assert cache.get_or_compute(near, lambda: pytest.fail("recomputed"))[1] == HIT
+    assert cache.key(summary) != cache.key(Brief(topic="Grid batteries", content_type=ContentType.REPORT))
+
+    # Summaries expire after a minute, reports are still fresh
+    report = Brief(topic="Grid batteries", content_type=ContentType.REPORT)
+    cache.put_entry(cache.key(summary), output, stored_at=time.time() - 120)
+    cache.put_entry(cache.key(report), output, stored_at=time.time() - 120)
+    assert cache.get_or_compute(summary, lambda: output)[1] == MISS
+    assert cache.get_or_compute(report, lambda: pytest.fail("recomputed"))[1] == HIT
+    assert cache.get_stats()["hit_rate"] == 0.5
+    print(f"✅ Cache stats: {cache.get_stats()}")
+
+
+def test_stale_served_while_refreshing(output):
+    """Test stale entries are served instantly and refreshed once in the background."""
+    cache = ResultCache(ttl_by_content_type={"article": 60}, stale_seconds=600)
+    brief = Brief(topic="Grid batteries")
+    cache.put_entry(cache.key(brief), output, stored_at=time.time() - 120)
+    fresh = output.model_copy(update={"request_id": "req_refreshed"})
+    refreshes = []
+
+    def slow_refresh():
+        refreshes.append(1)
+        time.sleep(0.3)
+        return fresh
+
+    start = time.time()
+    served = [cache.get_or_compute(brief, lambda: pytest.fail("blocked"), refresh=slow_refresh) for _ in range(5)]
+    assert time.time() - start < 0.2
+    assert all(outcome == STALE and o.request_id == output.request_id for o, outcome in served)
+
+    deadline = time.time() + 5
+    while cache.get_stats()["refreshes"] == 0 and time.time() < deadline:
+        time.sleep(0.05)
+
+    assert refreshes == [1]
+    result, outcome = cache.get_or_compute(brief, lambda: pytest.fail("recomputed"))
+    assert outcome == HIT and result.request_id == "req_refreshed"
+    print("✅ Stale-while-revalidate")
+
+
+def test_stampede_computes_once(output):
+    """Test a burst of misses for one key runs the workflow once."""
+    cache = ResultCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.3)
+        return output
+
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        outcomes = list(pool.map(lambda _: cache.get_or_compute(Brief(topic="Grid batteries"), compute)[1], range(10)))
+
+    assert len(calls) == 1
+    assert sorted(outcomes).count(SHARED) == 9 and MISS in outcomes
+    print("✅ 10 concurrent misses, 1 computation")
+
+
+def test_controller_serves_repeats_from_cache():
+    """Test a repeated brief is answered from cache under its own request ID."""
+    controller = ControllerAgent(result_cache=ResultCache())
+    first = controller.execute(Brief(topic="Offshore wind"))
+    second = controller.execute(Brief(topic="offshore wind"))
+
+    assert second.request_id != first.request_id
+    assert second.article.content == first.article.content
+    assert any("Served from cache" in note for note in second.system_notes)
+    assert not any("Served from cache" in note for note in first.system_notes)
+    assert controller.result_cache.get_stats()["hits"] == 1
+    print("✅ Controller served repeat from cache")
@@ -0,0 +1,107 @@
+"""Test the Monte Carlo plan simulator."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.meta_agent.simulator import PlanSimulator, WorkerDistribution
+from src.meta_agent.critical_path import makespan
+from src.meta_agent.strategy import StrategyAgent
+from src.meta_agent.metrics_store import MetricsStore
+from src.meta_agent.schemas import Plan, ExecutionMode
+from config.worker_registry import WorkerRegistry
+
+
+def _plan(*steps):
+    return Plan(plan_id="p", brief_id="b", steps=list(steps), total_steps=len(steps),
+                estimated_total_cost=0.1, estimated_total_time=60)
+
+
+def test_fixed_distributions_match_makespan(make_step):
+    """Test deterministic workers replay to the scheduled makespan and exact cost."""
+    times = {"a": 10.0, "b": 30.0, "c": 5.0, "d": 7.0}
+    plan = _plan(
+        make_step("s1", ["a"]),
+        make_step("s2", ["b"]),
+        make_step("s3", ["c", "d"], ExecutionMode.SEQUENTIAL, depends_on=["s1", "s2"]),
+    )
+    simulator = PlanSimulator(
+        distributions={wid: WorkerDistribution.fixed(t, 0.01) for wid, t in times.items()},
+        max_concurrency=5, runs=100,
+    )
+
+    result = simulator.simulate(plan)
+    assert result["latency"]["p50"] == result["latency"]["p99"] == makespan(plan.steps, times.get, 5) == 42.0
+    assert result["cost"]["mean"] == pytest.approx(0.04)
+    print(f"✅ Replayed makespan {result['latency']['p50']}s")
+
+
+def test_concurrency_limit(make_step):
+    """Test replays respect the concurrency limit."""
+    plan = _plan(make_step("wide", [f"w{i}" for i in range(6)]))
+    distributions = {f"w{i}": WorkerDistribution.fixed(10.0, 0.0) for i in range(6)}
+
+    assert PlanSimulator(distributions, max_concurrency=5, runs=100).simulate(plan)["latency"]["p50"] == 20.0
+    assert PlanSimulator(distributions, max_concurrency=6, runs=100).simulate(plan)["latency"]["p50"] == 10.0
+    print("✅ Concurrency limit respected")
+
+
+def test_free_slot_takes_a_ready_run(make_step):
+    """Test a free slot runs whatever is ready instead of idling for the next run in priority order."""
+    times = {"a": 20.0, "b": 20.0, "c": 10.0, "d": 20.0}
+    plan = _plan(
+        make_step("s1", ["a", "b"], ExecutionMode.SEQUENTIAL),
+        make_step("s2", ["c", "d"]),
+    )
+    simulator = PlanSimulator(
+        distributions={wid: WorkerDistribution.fixed(t, 0.0) for wid, t in times.items()},
+        max_concurrency=2, runs=10,
+    )
+
+    # a+b on one slot, d then c on the other
+    assert simulator.simulate(plan)["latency"]["p50"] == makespan(plan.steps, times.get, 2) == 40.0
+    print("✅ Idle slot filled by a ready run")
+
+
+def test_static_estimates_spread(make_step):
+    """Test static estimates give a seeded spread around their sum."""
+    plan = _plan(
+        make_step("s1", ["web_search_worker"]),
+        make_step("s2", ["article_writer_worker"], ExecutionMode.SEQUENTIAL, depends_on=["s1"]),
+    )
+    simulator = PlanSimulator(max_concurrency=5, runs=5000, seed=1)
+    result = simulator.simulate(plan)
+
+    assert result["latency"]["mean"] == pytest.approx(75.0, rel=0.03)
+    assert result["latency"]["p50"] < result["latency"]["p95"] < result["latency"]["p99"]
+    assert result["cost"]["mean"] == pytest.approx(0.10, rel=0.03)
+    assert simulator.simulate(plan) == result
+    print(f"✅ Latency p50={result['latency']['p50']:.1f}s, p95={result['latency']['p95']:.1f}s")
+
+
+def test_learned_histograms_drive_replays(make_step):
+    """Test workers with recorded executions replay from their histograms."""
+    store = MetricsStore(min_samples=5)
+    for seconds in [100.0] * 19 + [200.0]:
+        store.record("editor_worker", seconds, 0.05)
+    simulator = PlanSimulator(max_concurrency=5, runs=4000, seed=2,
+                              registry=WorkerRegistry(metrics_store=store))
+
+    result = simulator.simulate(_plan(make_step("q", ["editor_worker"])))
+    assert 90.0 <= result["latency"]["p50"] <= 120.0
+    assert result["latency"]["p99"] > 150.0
+    assert result["cost"]["p50"] == pytest.approx(0.05)
+    print(f"✅ Learned: p50={result['latency']['p50']:.1f}s, p99={result['latency']['p99']:.1f}s")
+
+
+def test_strategy_reports_simulated_percentiles(make_step):
+    """Test efficiency analysis includes simulated percentiles."""
+    plan = _plan(make_step("s1", ["web_search_worker", "news_search_worker"]))
+    metrics = StrategyAgent().analyze_plan_efficiency(plan)
+
+    assert metrics["simulated_latency"]["p95"] >= metrics["simulated_latency"]["p50"] > 0
+    assert metrics["simulated_cost"]["p50"] > 0
+    print(f"✅ Simulated: {metrics['simulated_latency']}")
@@ -0,0 +1,124 @@
+"""Test request coalescing for identical in-flight work."""
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.singleflight import SingleFlight, normalize_query
+from src.meta_agent.schemas import Brief, Task
+from src.meta_agent.controller import ControllerAgent
+from src.workers.executor import WorkerExecutor
+
+
+def test_concurrent_calls_execute_once():
+    """Test concurrent callers of one key share a single execution."""
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"value": 42}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: flight.do("key", slow), range(8)))
+
+    assert len(calls) == 1
+    assert all(r == {"value": 42} for r in results)
+    assert flight.get_stats() == {"executions": 1, "shared": 7, "in_flight": 0}
+
+    # Finished keys are released, not cached
+    flight.do("key", slow)
+    assert len(calls) == 2
+    print("✅ 8 callers, 1 execution")
+
+
+def test_errors_shared_with_waiters():
+    """Test every concurrent caller sees the leader's exception."""
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("provider down")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("key", failing)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert errors == ["provider down", "provider down"]
+    assert not flight.in_flight("key")
+    print("✅ Errors shared")
+
+
+def test_fingerprint_and_query_normalization():
+    """Test near-identical briefs and queries map to the same key."""
+    a = Brief(topic="AI  trends in Healthcare", keywords=["ml", "AI"], user_id="alice")
+    b = Brief(topic="ai trends in healthcare", keywords=["ai", "ml"], user_id="bob", max_budget=2.0)
+    c = Brief(topic="AI trends in finance")
+
+    assert a.fingerprint() == b.fingerprint()
+    assert a.fingerprint() != c.fingerprint()
+    assert normalize_query("  Solar Panels, efficiency?") == normalize_query("solar panels efficiency")
+    assert normalize_query('"heat pump" cost') != normalize_query("heat pump cost")
+    print("✅ Fingerprints and queries normalized")
+
+
+def test_controller_coalesces_identical_briefs(monkeypatch):
+    """Test identical concurrent briefs run the workflow once with their own request IDs."""
+    controller = ControllerAgent()
+    original = controller._execute_workflow
+    runs = []
+
+    def slow_workflow(state):
+        runs.append(state.brief.request_id)
+        time.sleep(0.3)
+        return original(state)
+
+    monkeypatch.setattr(controller, "_execute_workflow", slow_workflow)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        outputs = list(pool.map(controller.execute, [Brief(topic="Quantum networking") for _ in range(3)]))
+
+    assert len(runs) == 1
+    assert len({o.request_id for o in outputs}) == 3
+    assert len({o.article.content for o in outputs}) == 1
+    print(f"✅ 3 briefs, {len(runs)} workflow run")
+
+
+def test_executor_coalesces_identical_searches():
+    """Test the same search issued concurrently hits the tool once."""
+    executor = WorkerExecutor(simulated_latency_seconds=0.3)
+    tasks = [
+        Task(task_id=f"t{i}", worker_id="web_search_worker", step_id="s1", plan_id="p1",
+             input_data={"phase": "research", "brief": topic})
+        for i, topic in enumerate(["Solar storage", "solar  storage!", "Wind power"])
+    ]
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(executor.execute, tasks))
+
+    assert all(r.success for r in results)
+    assert executor.search_flight.get_stats()["executions"] == 2
+    assert executor.search_flight.get_stats()["shared"] == 1
+    # Shared outputs are independent copies
+    results[0].output["sources"].append("extra")
+    assert "extra" not in results[1].output["sources"]
+    print("✅ Identical searches coalesced")
@@ -0,0 +1,113 @@
+"""Test token streaming and the progress event stream."""
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.llm_config import LLMConfig, MockStreamer
+from src.utils.event_stream import EventStream
+from src.meta_agent.schemas import Brief, AgentState
+from src.meta_agent.orchestrator import OrchestratorAgent
+from src.meta_agent.planner import PlannerAgent
+
+
+def test_mock_streamer_rate_and_reassembly():
+    """Test streamed deltas rebuild the text at the configured rate."""
+    text = "Heat pumps move heat rather than generating it, saving 60% of energy."
+    deltas = []
+
+    start = time.time()
+    assert MockStreamer(tokens_per_second=100, tokens_per_chunk=2).stream(text, deltas.append) == text
+    elapsed = time.time() - start
+
+    assert "".join(deltas) == text
+    assert len(deltas) > 5
+    # ~2 tokens per 20ms
+    assert elapsed >= len(deltas) * 0.02 * 0.8
+    print(f"✅ {len(deltas)} deltas in {elapsed:.2f}s")
+
+
+async def test_llm_stream_message_mock():
+    """Test sync and async streaming return the same final message shape."""
+    config = LLMConfig()
+    config.is_mock = True
+    config.mock_streamer = MockStreamer(tokens_per_second=0)
+    messages = [{"role": "user", "content": "Write about solar power"}]
+
+    deltas = []
+    response = config.stream_message(messages, on_text=deltas.append)
+    assert "".join(deltas) == response.content[0].text
+    assert response.usage.output_tokens > 0
+
+    adeltas = []
+    aresponse = await config.astream_message(messages, on_text=adeltas.append)
+    assert "".join(adeltas) == aresponse.content[0].text
+    print("✅ stream_message and astream_message replay the mock response")
+
+
+def test_event_stream_replays_history_then_follows_live():
+    """Test late subscribers get history and live events until done."""
+    stream = EventStream()
+    stream.publish("req", "partial_output", {"text": "Hello"})
+
+    subscription = stream.subscribe("req")
+    publisher = threading.Thread(target=lambda: (
+        stream.publish("req", "partial_output", {"text": " world"}),
+        stream.close_channel("req", {"status": "completed"}),
+    ))
+    publisher.start()
+    events = list(subscription.events(timeout=2.0))
+    publisher.join()
+
+    assert [e["event"] for e in events] == ["partial_output", "partial_output", "done"]
+    assert "".join(e["data"].get("text", "") for e in events) == "Hello world"
+    assert subscription.closed
+    assert stream.get_stats()["channels"] == 0
+    print("✅ Event stream replays history then follows live")
+
+
+def test_writing_workers_stream_partial_output():
+    """Test writing workers publish partial text while they run."""
+    stream = EventStream()
+    brief = Brief(topic="Heat pumps", key_points=["efficiency"], request_id="req_stream")
+    state = AgentState(brief=brief)
+    state.plan = PlannerAgent().create_plan(state)
+    subscription = stream.subscribe("req_stream")
+
+    state = OrchestratorAgent(event_stream=stream).execute_plan(state, state.plan)
+
+    events = stream.history("req_stream")
+    partials = [e for e in events if e["event"] == "partial_output"]
+    assert partials and all(e["data"]["phase"] == "writing" for e in partials)
+
+    writer = partials[0]["data"]["worker_id"]
+    streamed = "".join(e["data"]["text"] for e in partials if e["data"]["worker_id"] == writer)
+    completed = [e for e in events if e["event"] == "worker_completed" and e["data"]["worker_id"] == writer]
+    assert streamed.startswith("Article content about Heat pumps")
+    last_partial = max(e["seq"] for e in partials if e["data"]["worker_id"] == writer)
+    assert completed and completed[0]["seq"] > last_partial
+    assert state.partial_outputs == {}
+    assert subscription.get(timeout=0.1) is not None
+    print(f"✅ {len(partials)} partial outputs streamed")
+
+
+def test_unclosed_channels_do_not_leak():
+    """Test plan-keyed channels close after execution and idle channels expire."""
+    stream = EventStream(idle_ttl_seconds=0.05)
+    state = AgentState(brief=Brief(topic="Heat pumps"))
+    state.plan = PlannerAgent().create_plan(state)
+    subscription = stream.subscribe(state.plan.plan_id)
+
+    OrchestratorAgent(event_stream=stream).execute_plan(state, state.plan)
+    assert [e["event"] for e in subscription.events(timeout=0.1)][-1] == "done"
+    assert stream.get_stats()["channels"] == 0
+
+    stream.publish("abandoned", "partial_output", {"text": "x"})
+    time.sleep(0.06)
+    stream.publish("other", "partial_output", {"text": "y"})
+    assert stream.history("abandoned") == []
+    assert stream.get_stats()["channels_expired"] == 1
+    print("✅ Channels closed or expired")
@@ -0,0 +1,120 @@
+"""Test vector index and source retrieval."""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage.vector import VectorIndex, SourceRetriever, chunk_text
+from src.meta_agent.schemas import Brief, AgentState, ContentType
+from src.meta_agent.orchestrator import OrchestratorAgent
+from src.meta_agent.planner import PlannerAgent
+
+
+def random_vectors(n, dim=32, seed=0):
+    """Random test vectors."""
+    return np.random.default_rng(seed).standard_normal((n, dim)).astype(np.float32)
+
+
+def test_exact_search_finds_nearest():
+    """Test exact search ranks the query vector first."""
+    vectors = random_vectors(100)
+    index = VectorIndex(dim=32, initial_capacity=8)
+    index.add([f"v{i}" for i in range(100)], vectors, [{"n": i} for i in range(100)])
+
+    results = index.search(vectors[42], k=3)
+
+    assert results[0][0] == "v42"
+    assert results[0][1] > 0.999
+    assert results[0][2] == {"n": 42}
+    assert len(index) == 100
+    print("✅ Exact search returns nearest vector")
+
+
+def test_delete_and_compact():
+    """Test deleted vectors disappear and compaction keeps the rest."""
+    vectors = random_vectors(20)
+    index = VectorIndex(dim=32)
+    index.add([f"v{i}" for i in range(20)], vectors)
+
+    assert index.delete(["v3", "missing"]) == 1
+    assert all(r[0] != "v3" for r in index.search(vectors[3], k=20))
+
+    index.compact()
+    assert index.get_stats()["deleted"] == 0
+    assert index.search(vectors[7], k=1)[0][0] == "v7"
+    print("✅ Delete and compact work")
+
+
+def test_ivf_recall_against_exact():
+    """Test IVF search agrees with exact search on clustered data."""
+    rng = np.random.default_rng(1)
+    centers = rng.standard_normal((20, 32))
+    vectors = (np.repeat(centers, 200, axis=0) + 0.1 * rng.standard_normal((4000, 32))).astype(np.float32)
+
+    index = VectorIndex(dim=32, ivf_threshold=1000, n_probe=4)
+    index.add([f"v{i}" for i in range(4000)], vectors)
+
+    hits = 0
+    for q in range(0, 4000, 97):
+        ivf = {r[0] for r in index.search(vectors[q], k=10)}
+        exact = {r[0] for r in index.search_exact(vectors[q], k=10)}
+        hits += len(ivf & exact)
+
+    assert index.get_stats()["ivf_lists"] > 0
+    assert hits / (10 * len(range(0, 4000, 97))) >= 0.9
+    print("✅ IVF recall ≥ 0.9")
+
+
+def test_persistence_round_trip(tmp_path):
+    """Test a memory-mapped index reloads with vectors, metadata and IVF."""
+    vectors = random_vectors(300)
+    index = VectorIndex(dim=32, directory=str(tmp_path), initial_capacity=16, ivf_threshold=100)
+    index.add([f"v{i}" for i in range(300)], vectors, [{"n": i} for i in range(300)])
+    index.delete(["v0"])
+    index.search(vectors[1], k=1)
+    index.save()
+
+    loaded = VectorIndex.load(str(tmp_path))
+
+    assert len(loaded) == 299
+    assert "v0" not in loaded
+    assert loaded.get_stats()["ivf_lists"] == index.get_stats()["ivf_lists"]
+    assert loaded.search(vectors[5], k=1)[0][:1] == ("v5",)
+    assert loaded.get_metadata("v5") == {"n": 5}
+    print("✅ Index persisted and reloaded")
+
+
+def test_retriever_ranks_relevant_chunks():
+    """Test retriever returns chunks matching the query."""
+    retriever = SourceRetriever()
+    retriever.index_sources([
+        {"title": "Solar power", "content": "Photovoltaic panels convert sunlight into electricity.", "url": "a"},
+        {"title": "Baking", "content": "Sourdough bread needs a starter and a long rise.", "url": "b"},
+        "Wind turbines generate electricity from moving air.",
+    ])
+
+    results = retriever.retrieve("how do solar panels make electricity from sunlight", k=2)
+
+    assert results[0]["url"] == "a"
+    assert len(chunk_text("word " * 300, max_words=120, overlap=20)) == 3
+    print("✅ Retriever ranks relevant chunk first")
+
+
+def test_orchestrator_attaches_evidence():
+    """Test the synthesizer receives top-k retrieved chunks."""
+    brief = Brief(topic="Vector search", content_type=ContentType.RESEARCH_PAPER)
+    state = AgentState(brief=brief)
+    state.plan = PlannerAgent().create_plan(state)
+
+    state = OrchestratorAgent(evidence_top_k=2).execute_plan(state, state.plan)
+
+    synthesized = [
+        r for r in state.analysis_results.get("results", [])
+        if r.get("worker_id") == "content_synthesizer_worker"
+    ]
+    assert synthesized, "plan should include the content synthesizer"
+    assert 0 < len(synthesized[0]["evidence"]) <= 2
+    print("✅ Synthesizer received top-k evidence")
@@ -5,13 +5,18 @@ from pathlib import Path
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import pytest
+
 from config.worker_registry import (
     worker_registry,
+    WorkerRegistry,
+    WorkerDefinition,
     WorkerCategory,
     WorkerCapability,
     get_worker,
     list_workers
 )
+from src.meta_agent.metrics_store import MetricsStore
 
 
 def test_registry_initialized():
@@ -101,6 +106,70 @@ def test_list_all_workers():
     print("\n✅ All workers listed")
 
 
+
+def test_indexes_match_scan():
+    """Test the indexes return what a full scan would."""
+    workers = list_workers()
+    for category in WorkerCategory:
+        expected = [w.id for w in workers if w.category == category]
+        assert [w.id for w in worker_registry.get_workers_by_category(category)] == expected
+    for capability in WorkerCapability:
+        expected = [w.id for w in workers if capability in w.capabilities]
+        assert [w.id for w in worker_registry.get_workers_by_capability(capability)] == expected
+    assert [w.id for w in worker_registry.get_workers_by_tool("news_api")] == ["news_search_worker"]
+    assert worker_registry.is_parallel("web_search_worker")
+    assert not worker_registry.is_parallel("article_writer_worker")
+    print("✅ Indexes match a full scan")
+
+
+def test_register_plugin_worker():
+    """Test workers registered later show up in every index."""
+    registry = WorkerRegistry(metrics_store=MetricsStore())
+    plugin = WorkerDefinition(
+        id="patent_search_worker",
+        name="Patent Search Worker",
+        category=WorkerCategory.RESEARCH,
+        description="Search patent databases",
+        capabilities=[WorkerCapability.ACADEMIC_SEARCH],
+        output_format="List of patents",
+        can_run_parallel=True,
+        tools_required=["patent_api"],
+    )
+    version = registry.version
+    registry.register(plugin)
+
+    assert registry.version == version + 1
+    assert plugin in registry.get_workers_by_category(WorkerCategory.RESEARCH)
+    assert plugin in registry.get_workers_by_capability(WorkerCapability.ACADEMIC_SEARCH)
+    assert registry.get_workers_by_tool("patent_api") == [plugin]
+    assert registry.is_parallel("patent_search_worker")
+    with pytest.raises(ValueError):
+        registry.register(plugin)
+
+    assert registry.unregister("patent_search_worker")
+    assert registry.get_workers_by_tool("patent_api") == []
+    assert not registry.unregister("patent_search_worker")
+    # The global registry is untouched
+    assert worker_registry.get_worker("patent_search_worker") is None
+    print("✅ Plugin worker registered and indexed")
+
+
+def test_estimates_memoized_until_metrics_change():
+    """Test estimates are cached and recomputed after new executions or re-registration."""
+    store = MetricsStore(min_samples=1)
+    registry = WorkerRegistry(metrics_store=store)
+    assert registry.estimate_worker_time("editor_worker") == 40.0
+
+    store.record("editor_worker", 12.0, 0.02)
+    assert registry.estimate_worker_time("editor_worker") == 12.0
+    assert registry.estimate_worker_cost("editor_worker") == 0.02
+
+    updated = get_worker("editor_worker").model_copy(update={"quality_contribution": 3.0})
+    registry.register(updated, replace=True)
+    assert registry.estimate_worker_value("editor_worker") == 3.0
+    print("✅ Memoized estimates invalidated")
+
+
 if __name__ == "__main__":
     test_registry_initialized()
     test_get_worker_by_id()
@@ -110,4 +179,7 @@ if __name__ == "__main__":
     test_cost_estimation()
     test_time_estimation()
     test_list_all_workers()
+    test_indexes_match_scan()
+    test_register_plugin_worker()
+    test_estimates_memoized_until_metrics_change()
     print("\n✅ All worker registry tests passed!")
\ No newline at end of file
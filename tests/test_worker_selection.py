@@ -0,0 +1,147 @@
+"""Test budget-constrained worker selection."""
+import sys
+import random
+import time
+from itertools import product
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.meta_agent.worker_selection import cheapest_selection, select_workers
+from src.meta_agent.planner import PlannerAgent
+from src.meta_agent.strategy import StrategyAgent
+from src.meta_agent.metrics_store import MetricsStore
+from src.meta_agent.schemas import AgentState, Brief, Plan, PlanStep, ExecutionMode
+from config.worker_registry import WorkerRegistry
+
+
+def _brute_force(steps, max_cost):
+    """Best value by trying every selection."""
+    best = None
+    for step_choices in product(*[
+        [combo for combo in product(*[[None] + slot for slot in slots]) if any(combo)]
+        for slots in steps
+    ]):
+        picks = [choice for combo in step_choices for choice in combo if choice]
+        cost = sum(c for _, c, _ in picks)
+        value = sum(v for _, _, v in picks)
+        if cost <= max_cost + 1e-9 and (best is None or value > best + 1e-9):
+            best = value
+    return best
+
+
+def test_matches_brute_force():
+    """Test the DP finds the optimal value on random instances."""
+    rng = random.Random(7)
+    for _ in range(30):
+        steps = [
+            [
+                [(f"w{s}{i}{j}", round(rng.uniform(0.01, 0.1), 3), round(rng.uniform(0.1, 2), 2))
+                 for j in range(rng.randint(1, 2))]
+                for i in range(rng.randint(1, 3))
+            ]
+            for s in range(3)
+        ]
+        budget = rng.uniform(0.05, 0.4)
+        selection = select_workers(steps, budget)
+        expected = _brute_force(steps, budget)
+        if expected is None:
+            assert selection is None
+        else:
+            assert selection[0] <= budget + 1e-9
+            assert selection[1] == pytest.approx(expected)
+            assert all(selection[2])
+    print("✅ DP matches brute force")
+
+
+def test_cheapest_fallback():
+    """Test infeasible budgets return None and the cheapest plan is one worker per step."""
+    steps = [[[("a", 0.05, 1.0)], [("b", 0.03, 0.4)]], [[("c", 0.08, 2.0), ("d", 0.04, 1.2)]]]
+    assert select_workers(steps, 0.06) is None
+    cost, value, selected = cheapest_selection(steps)
+    assert selected == [["b"], ["d"]]
+    assert cost == pytest.approx(0.07) and value == pytest.approx(1.6)
+    assert select_workers(steps, 1.0)[2] == [["a", "b"], ["c"]]
+    print("✅ Cheapest fallback")
+
+
+def test_required_slots_are_always_filled():
+    """Test required slots are kept or swapped, never left empty, even when that costs value."""
+    steps = [[[("a", 0.05, 1.0)], [("b", 0.04, 0.1), ("b_alt", 0.02, 0.05)]]]
+
+    assert select_workers(steps, 0.05)[2] == [["a"]]
+    assert select_workers(steps, 0.05, required=[[False, True]])[2] == [["b"]]
+    assert select_workers(steps, 0.01, required=[[False, True]]) is None
+    assert cheapest_selection(steps, [[False, True]])[2] == [["b_alt"]]
+    print("✅ Required slots filled")
+
+
+def test_strategy_keeps_most_valuable_workers():
+    """Test the strategy keeps the writer whole and the most valuable check."""
+    steps = [
+        PlanStep(step_id="step_1", phase="writing", description="Write",
+                 worker_ids=["article_writer_worker"], execution_mode=ExecutionMode.SEQUENTIAL,
+                 estimated_cost=0.08, estimated_time_seconds=60),
+        PlanStep(step_id="step_2", phase="quality", description="Quality",
+                 worker_ids=["fact_checker_worker", "editor_worker", "seo_optimizer_worker"],
+                 execution_mode=ExecutionMode.PARALLEL, estimated_cost=0.12, estimated_time_seconds=30),
+    ]
+    plan = Plan(plan_id="p", brief_id="b", steps=steps, total_steps=2,
+                estimated_total_cost=0.20, estimated_total_time=90)
+
+    optimized = StrategyAgent()._optimize_for_cost(plan, 0.13)
+
+    assert optimized.estimated_total_cost <= 0.13
+    assert optimized.steps[0].worker_ids == ["article_writer_worker"]
+    assert optimized.steps[1].worker_ids == ["editor_worker"]
+    print(f"✅ Selected: {[s.worker_ids for s in optimized.steps]}")
+
+
+def test_tight_budget_keeps_required_workers():
+    """Test a brief's fact checking survives a budget cut and writing keeps its writer."""
+    state = AgentState(brief=Brief(topic="Required fact checking", enable_fact_checking=True,
+                                   enable_seo_optimization=False, max_budget=0.05))
+    plan = PlannerAgent().create_plan(state)
+
+    optimized = StrategyAgent().optimize_plan(state, plan)
+
+    worker_ids = {wid for step in optimized.steps for wid in step.worker_ids}
+    writing = next(step for step in optimized.steps if step.phase == "writing")
+    assert "fact_checker_worker" in worker_ids
+    assert "seo_optimizer_worker" not in worker_ids
+    assert writing.worker_ids == ["article_writer_worker"]
+    print(f"✅ Kept required workers: {[s.worker_ids for s in optimized.steps]}")
+
+
+def test_values_learn_success_rate():
+    """Test worker values drop with observed failures."""
+    store = MetricsStore(min_samples=2)
+    registry = WorkerRegistry(metrics_store=store)
+    assert registry.estimate_worker_value("editor_worker") == 1.0
+
+    store.record("editor_worker", 10.0, 0.04)
+    store.record("editor_worker", 10.0, 0.04, success=False)
+    assert registry.estimate_worker_value("editor_worker") == 0.5
+    print("✅ Values scaled by success rate")
+
+
+def test_large_registry_is_fast():
+    """Test a large instance solves in milliseconds."""
+    rng = random.Random(3)
+    steps = [
+        [
+            [(f"w{s}_{i}_{j}", round(rng.uniform(0.005, 0.1), 3), rng.uniform(0.1, 2)) for j in range(3)]
+            for i in range(8)
+        ]
+        for s in range(10)
+    ]
+    start = time.perf_counter()
+    selection = select_workers(steps, 2.0)
+    elapsed = time.perf_counter() - start
+
+    assert selection is not None and selection[0] <= 2.0 + 1e-9
+    assert elapsed < 0.25
+    print(f"✅ 80 slots x 3 choices solved in {elapsed * 1000:.1f}ms")